@@ -36,6 +36,8 @@ import logging
 from ._utils import *  # noqa: F403,F401
 from .cim_types import *  # noqa: F403,F401
 from .cim_constants import *  # noqa: F403,F401
+from ._adaptive_pull import *  # noqa: F403,F401
+from ._class_cache import *  # noqa: F403,F401
 from .cim_operations import *  # noqa: F403,F401
 from ._nocasedict import *  # noqa: F403,F401
 from .cim_obj import *  # noqa: F403,F401
@@ -45,12 +47,15 @@ from .exceptions import *  # noqa: F403,F401
 from .mof_compiler import *  # noqa: F403,F401
 from ._valuemapping import *  # noqa: F403,F401
 from ._server import *  # noqa: F403,F401
+from ._server_pool import *  # noqa: F403,F401
 from ._subscription_manager import *  # noqa: F403,F401
 from ._listener import *  # noqa: F403,F401
 from ._recorder import *  # noqa: F403,F401
 from .config import *  # noqa: F403,F401
 from ._statistics import *  # noqa: F403,F401
 from ._logging import *  # noqa: F403,F401
+if sys.version_info[0:2] >= (3, 6):
+    from ._async_operations import *  # noqa: F403,F401
 
 from ._version import __version__  # noqa: F401
 
@@ -0,0 +1,270 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+*New in pywbem 0.13 as experimental.*
+
+An :class:`~pywbem.AdaptiveMaxObjectCount` object can be specified as the
+`MaxObjectCount` argument of the ``Iter...()`` methods of
+:class:`~pywbem.WBEMConnection` that use pull operations. Instead of using the
+same `MaxObjectCount` for every open and pull operation, the batch size then
+starts small to get the first result quickly, and is then adjusted after each
+operation based on its measured round-trip time, reply size and WBEM server
+response time, in order to approach a target time (and optionally a target
+reply size) per operation.
+
+Example::
+
+    adaptive = pywbem.AdaptiveMaxObjectCount(target_time=0.5)
+    for inst in conn.IterEnumerateInstances('CIM_ComputerSystem',
+                                            MaxObjectCount=adaptive):
+        print(inst.path)
+
+    print(adaptive.history)
+
+If statistics are enabled on the connection, the `MaxObjectCount` values
+of the open and pull operations are also shown in the statistics (see
+:attr:`~pywbem.OperationStatistic.avg_max_object_count`).
+"""
+
+from __future__ import absolute_import
+
+__all__ = ['AdaptiveMaxObjectCount']
+
+
+class AdaptiveMaxObjectCount(object):
+    # pylint: disable=too-many-instance-attributes
+    """
+    *New in pywbem 0.13 as experimental.*
+
+    Adaptive `MaxObjectCount` for the ``Iter...()`` methods of
+    :class:`~pywbem.WBEMConnection`.
+
+    The time of an operation is modeled as a fixed part that does not depend
+    on the number of returned objects (network latency, HTTP overhead), plus
+    a part that is proportional to the number of returned objects. If the WBEM
+    server returns its response time, the fixed part is estimated as the
+    difference between round-trip time and server response time. Otherwise,
+    the round-trip time is treated as proportional to the number of objects,
+    which underestimates the best batch size, so that it is approached from
+    below.
+
+    The per-object time and size are smoothed across operations. The batch
+    size changes by at most `max_factor` per operation, and remains within
+    `minimum` and `maximum`.
+
+    An object of this class keeps the state of one enumeration at a time;
+    it is reset when an ``Iter...()`` method starts using it. It should not
+    be used by concurrent enumerations.
+    """
+
+    def __init__(self, target_time=1.0, target_reply_len=None, initial=10,
+                 minimum=1, maximum=10000, max_factor=4):
+        # pylint: disable=too-many-arguments
+        """
+        Parameters:
+
+          target_time (:term:`number`):
+            Target round-trip time of an open or pull operation, in seconds.
+
+          target_reply_len (:term:`integer`):
+            Target size of the HTTP body of the response of an open or pull
+            operation, in Bytes. `None` means that the batch size is not
+            limited by the reply size.
+
+          initial (:term:`integer`):
+            `MaxObjectCount` for the open operation.
+
+          minimum (:term:`integer`):
+            Minimum `MaxObjectCount` for the pull operations.
+
+          maximum (:term:`integer`):
+            Maximum `MaxObjectCount` for the pull operations.
+
+          max_factor (:term:`number`):
+            Maximum factor by which the `MaxObjectCount` grows or shrinks
+            from one operation to the next.
+
+        Raises:
+
+          ValueError: Invalid parameter values.
+        """
+        if target_time <= 0:
+            raise ValueError('target_time must be > 0 but is %s' %
+                             target_time)
+        if target_reply_len is not None and target_reply_len <= 0:
+            raise ValueError('target_reply_len must be > 0 but is %s' %
+                             target_reply_len)
+        if minimum < 1 or maximum < minimum:
+            raise ValueError('minimum and maximum must satisfy '
+                             '1 <= minimum <= maximum but are %s and %s' %
+                             (minimum, maximum))
+        if initial < minimum or initial > maximum:
+            raise ValueError('initial must be between minimum and maximum '
+                             'but is %s' % initial)
+        if max_factor <= 1:
+            raise ValueError('max_factor must be > 1 but is %s' %
+                             max_factor)
+        self._target_time = target_time
+        self._target_reply_len = target_reply_len
+        self._initial = initial
+        self._minimum = minimum
+        self._maximum = maximum
+        self._max_factor = max_factor
+        self.reset()
+
+    @property
+    def target_time(self):
+        """
+        :term:`number`: Target round-trip time of an operation, in seconds.
+        """
+        return self._target_time
+
+    @property
+    def target_reply_len(self):
+        """
+        :term:`integer`: Target size of the response of an operation, in
+        Bytes, or `None`.
+        """
+        return self._target_reply_len
+
+    @property
+    def initial(self):
+        """
+        :term:`integer`: `MaxObjectCount` for the open operation.
+        """
+        return self._initial
+
+    @property
+    def minimum(self):
+        """
+        :term:`integer`: Minimum `MaxObjectCount`.
+        """
+        return self._minimum
+
+    @property
+    def maximum(self):
+        """
+        :term:`integer`: Maximum `MaxObjectCount`.
+        """
+        return self._maximum
+
+    @property
+    def max_object_count(self):
+        """
+        :term:`integer`: `MaxObjectCount` for the next operation.
+        """
+        return self._count
+
+    @property
+    def history(self):
+        """
+        :class:`py:list` of :term:`integer`: The `MaxObjectCount` values
+        used for the operations of the current (or last) enumeration, in
+        order.
+        """
+        return list(self._history)
+
+    def __repr__(self):
+        """
+        Return a representation of the :class:`~pywbem.AdaptiveMaxObjectCount`
+        object with all attributes, that is suitable for debugging.
+        """
+        return "%s(target_time=%r, target_reply_len=%r, initial=%r, " \
+            "minimum=%r, maximum=%r, max_object_count=%r)" % \
+            (self.__class__.__name__, self._target_time,
+             self._target_reply_len, self._initial, self._minimum,
+             self._maximum, self._count)
+
+    def reset(self):
+        """
+        Start a new enumeration, with the initial `MaxObjectCount`.
+
+        This method is called by the ``Iter...()`` methods.
+        """
+        self._count = self._initial
+        self._history = []
+        self._obj_time = None
+        self._obj_len = None
+
+    def update(self, object_count, duration, reply_len, server_time=None):
+        """
+        Adjust the `MaxObjectCount` for the next operation, based on the
+        measurements of an operation that has used the current
+        `MaxObjectCount`.
+
+        This method is called by the ``Iter...()`` methods.
+
+        Parameters:
+
+          object_count (:term:`integer`):
+            Number of objects returned by the operation.
+
+          duration (:term:`number`):
+            Round-trip time of the operation, in seconds.
+
+          reply_len (:term:`integer`):
+            Size of the HTTP body of the response, in Bytes.
+
+          server_time (:term:`number`):
+            Response time returned by the WBEM server, in seconds, or `None`.
+
+        Returns:
+
+          :term:`integer`: The `MaxObjectCount` for the next operation.
+        """
+        self._history.append(self._count)
+
+        if object_count <= 0:
+            # No information about the cost per object; the server may just
+            # not have had objects ready within its time limit.
+            next_count = self._count * self._max_factor
+        else:
+            fixed_time = 0.0
+            var_time = duration
+            if server_time is not None and 0 < server_time <= duration:
+                fixed_time = duration - server_time
+                var_time = server_time
+            self._obj_time = self._smooth(self._obj_time,
+                                          float(var_time) / object_count)
+            self._obj_len = self._smooth(self._obj_len,
+                                         float(reply_len) / object_count)
+
+            if self._obj_time > 0 and fixed_time < self._target_time:
+                next_count = (self._target_time - fixed_time) / \
+                    self._obj_time
+            else:
+                # The fixed time already exceeds the target, so larger
+                # batches are the only way to reduce the overall time.
+                next_count = self._count * self._max_factor
+            if self._target_reply_len is not None and self._obj_len > 0:
+                next_count = min(next_count,
+                                 self._target_reply_len / self._obj_len)
+
+        next_count = min(next_count, self._count * self._max_factor)
+        next_count = max(next_count, self._count / self._max_factor)
+        next_count = max(self._minimum, min(self._maximum, int(next_count)))
+        self._count = next_count
+        return next_count
+
+    @staticmethod
+    def _smooth(previous, value):
+        """
+        Return the exponentially smoothed value.
+        """
+        if previous is None:
+            return value
+        return (previous + value) / 2.0
@@ -0,0 +1,1704 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+*New in pywbem 0.13 as experimental.*
+
+The :class:`~pywbem.AsyncWBEMConnection` class performs WBEM operations
+using :mod:`py:asyncio`, so that a single thread can have many WBEM
+operations in flight at the same time, e.g. against a large number of WBEM
+servers, or many operations against the same WBEM server.
+
+The operation methods of :class:`~pywbem.AsyncWBEMConnection` have the same
+names, parameters and results as those of :class:`~pywbem.WBEMConnection`,
+but are :term:`py:coroutine` functions that need to be awaited. The
+``Iter...()`` methods (except for ``IterQueryInstances()``) return an
+:term:`py:asynchronous generator` that is iterated with ``async for``.
+
+Example::
+
+    import asyncio
+    import pywbem
+
+    async def count_instances(url, classname):
+        conn = pywbem.AsyncWBEMConnection(url, ('user', 'password'))
+        instances = await conn.EnumerateInstances(classname)
+        return url, len(instances)
+
+    loop = asyncio.get_event_loop()
+    results = loop.run_until_complete(asyncio.gather(
+        count_instances('https://server1', 'CIM_ComputerSystem'),
+        count_instances('https://server2', 'CIM_ComputerSystem')))
+
+This support requires Python 3.6 or higher, and is not available on older
+Python versions.
+"""
+
+import asyncio
+import base64
+import io
+import os
+import ssl
+from http import client as httplib
+from stat import S_ISSOCK
+import time
+from urllib.parse import quote, unquote
+
+from .config import DEFAULT_ITER_MAXOBJECTCOUNT
+from .cim_constants import DEFAULT_NAMESPACE, CIM_ERR_INVALID_PARAMETER, \
+    CIM_ERR_NOT_SUPPORTED
+from .cim_obj import CIMClass, CIMClassName, CIMInstanceName
+from .cim_http import parse_url, get_default_ca_certs, gzip_content, \
+    _content_decoder, ACCEPT_ENCODING
+from .cim_operations import WBEMConnection, pull_path_result_tuple, \
+    pull_inst_result_tuple, pull_query_result_tuple, _parse_reply, \
+    _to_pretty_xml, _iparam_propertylist, _validateIterCommonParams, \
+    _validatePullParams
+from .exceptions import ConnectionError, AuthError, TimeoutError, \
+    HTTPError, CIMError
+from ._adaptive_pull import AdaptiveMaxObjectCount
+from ._utils import _ensure_unicode, _ensure_bytes
+
+__all__ = ['AsyncWBEMConnection']
+
+
+def _ssl_context(x509, ca_certs):
+    """
+    Create the SSL context for an HTTPS connection, with the same
+    certificate handling as in :func:`~pywbem.cim_http.wbem_request`.
+    """
+    ctx = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
+    if x509 is not None and x509.get('cert_file'):
+        ctx.load_cert_chain(x509['cert_file'], x509.get('key_file'))
+    if ca_certs:
+        ctx.verify_mode = ssl.CERT_REQUIRED
+        if os.path.isdir(ca_certs):
+            ctx.load_verify_locations(capath=ca_certs)
+        else:
+            ctx.load_verify_locations(cafile=ca_certs)
+        ctx.check_hostname = True
+    else:
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
+async def _read_body(reader, headers):
+    """
+    Read the body of an HTTP response, using chunked transfer encoding,
+    the Content-Length header field, or the end of the connection.
+    """
+    if headers.get('Transfer-Encoding', '').lower() == 'chunked':
+        chunks = []
+        while True:
+            line = await reader.readline()
+            try:
+                size = int(line.split(b';')[0], 16)
+            except ValueError:
+                raise ConnectionError("HTTP error: Invalid chunk size line: "
+                                      "%r" % line)
+            if size == 0:
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        # Skip the trailer
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+        return b''.join(chunks)
+
+    length = headers.get('Content-Length', None)
+    if length is not None:
+        return await reader.readexactly(int(length))
+    return await reader.read()
+
+
+async def _async_wbem_request(url, data, creds, cimxml_headers, x509,
+                              ca_certs, no_verification, compression,
+                              compression_threshold, transfer_lens):
+    # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+    """
+    Implement :func:`async_wbem_request` without the timeout handling.
+    """
+
+    host, port, use_ssl = parse_url(_ensure_unicode(url))
+
+    data = b'<?xml version="1.0" encoding="utf-8" ?>\n' + _ensure_bytes(data)
+
+    if compression and compression_threshold is not None and \
+            len(data) >= compression_threshold:
+        body_data = gzip_content(data)
+        content_encoding = 'gzip'
+    else:
+        body_data = data
+        content_encoding = None
+    if transfer_lens is not None:
+        transfer_lens[0:2] = [len(body_data), 0]
+
+    if use_ssl:
+        if no_verification:
+            ca_certs = None
+        elif ca_certs is None:
+            ca_certs = get_default_ca_certs()
+        connect = asyncio.open_connection(
+            host, port, ssl=_ssl_context(x509, ca_certs),
+            server_hostname=host)
+    elif url.startswith('http'):
+        connect = asyncio.open_connection(host, port)
+    else:
+        uds_path = url[5:] if url.startswith('file:') else url
+        try:
+            if not S_ISSOCK(os.stat(uds_path).st_mode):
+                raise ConnectionError('File URL is not a socket: %s' % url)
+        except OSError as exc:
+            raise ConnectionError('Error with file URL %s: %s' % (url, exc))
+        host = 'localhost'
+        port = None
+        connect = asyncio.open_unix_connection(uds_path)
+
+    if port is None:
+        host_header = host
+    elif ':' in host:
+        host_header = '[%s]:%s' % (host, port)
+    else:
+        host_header = '%s:%s' % (host, port)
+
+    headers = [
+        ('Host', host_header),
+        ('Content-type', 'application/xml; charset="utf-8"'),
+        ('Content-length', str(len(body_data))),
+        ('Accept-Encoding', ACCEPT_ENCODING if compression else 'identity'),
+        ('Connection', 'close'),
+    ]
+    if content_encoding:
+        headers.append(('Content-Encoding', content_encoding))
+    if creds is not None:
+        auth = '%s:%s' % (creds[0], creds[1])
+        auth64 = _ensure_unicode(base64.b64encode(
+            _ensure_bytes(auth))).replace('\n', '')
+        headers.append(('Authorization', 'Basic %s' % auth64))
+    for n, v in cimxml_headers or []:
+        headers.append((n, quote(_ensure_unicode(v))))
+
+    request_head = 'POST /cimom HTTP/1.1\r\n' + \
+        ''.join(['%s: %s\r\n' % (n, v) for n, v in headers]) + '\r\n'
+
+    writer = None
+    try:
+        reader, writer = await connect
+        writer.write(request_head.encode('latin-1') + body_data)
+        await writer.drain()
+
+        head = await reader.readuntil(b'\r\n\r\n')
+        status_line, _, header_data = head.partition(b'\r\n')
+        try:
+            version, status, reason = \
+                (status_line.decode('latin-1').split(None, 2) + [''])[0:3]
+            status = int(status)
+        except ValueError:
+            raise ConnectionError("The server returned a bad HTTP status "
+                                  "line: %r" % status_line)
+        if not version.startswith('HTTP/'):
+            raise ConnectionError("The server returned a bad HTTP status "
+                                  "line: %r" % status_line)
+        response_headers = httplib.parse_headers(io.BytesIO(header_data))
+
+        svr_resp_time = response_headers.get('WBEMServerResponseTime', None)
+        if svr_resp_time:
+            try:
+                svr_resp_time = float(svr_resp_time) / 1000000
+            except ValueError:
+                pass
+
+        if status != 200:
+            if status == 401:
+                raise AuthError(reason)
+            cimerror_hdr = response_headers.get('CIMError', None)
+            if cimerror_hdr is not None:
+                cimdetails = {}
+                pgdetails_hdr = response_headers.get('PGErrorDetail', None)
+                if pgdetails_hdr is not None:
+                    cimdetails['PGErrorDetail'] = unquote(pgdetails_hdr)
+                raise HTTPError(status, reason, cimerror_hdr, cimdetails)
+            raise HTTPError(status, reason)
+
+        body = await _read_body(reader, response_headers)
+
+    except asyncio.IncompleteReadError as exc:
+        raise ConnectionError("HTTP incomplete read: %s" % exc)
+    except asyncio.LimitOverrunError as exc:
+        raise ConnectionError("HTTP error: %s" % exc)
+    except ssl.CertificateError as exc:
+        raise ConnectionError(
+            "SSL certificate error %s: %s" % (exc.__class__, exc))
+    except ssl.SSLError as exc:
+        raise ConnectionError("SSL error %s: %s" % (exc.__class__, exc))
+    except OSError as exc:
+        raise ConnectionError("Socket error: %s" % exc)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if transfer_lens is not None:
+        transfer_lens[1] = len(body)
+    if compression:
+        decoder = _content_decoder(
+            response_headers.get('Content-Encoding', None))
+        if decoder is not None:
+            body = decoder.decompress(body) + decoder.flush()
+
+    return body, svr_resp_time
+
+
+async def async_wbem_request(url, data, creds, cimxml_headers=None,
+                             x509=None, ca_certs=None, no_verification=False,
+                             timeout=None, compression=False,
+                             compression_threshold=None, transfer_lens=None):
+    # pylint: disable=too-many-arguments
+    """
+    Send an HTTP or HTTPS request to a WBEM server and return the response,
+    using :mod:`py:asyncio` streams.
+
+    A new connection is used for each request, and is closed after the
+    response has been read. Only basic authentication is supported.
+
+    The parameters, return value and exceptions are the same as for
+    :func:`~pywbem.cim_http.wbem_request`, except that the `timeout`
+    applies to the request as a whole.
+    """
+    try:
+        return await asyncio.wait_for(
+            _async_wbem_request(url, data, creds, cimxml_headers, x509,
+                                ca_certs, no_verification, compression,
+                                compression_threshold, transfer_lens),
+            timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutError("The client timed out and closed the socket "
+                           "after %.0fs." % timeout)
+
+
+class _AsyncOperation(object):
+    # pylint: disable=too-few-public-methods
+    """
+    Measurement data of a single operation of an
+    :class:`~pywbem.AsyncWBEMConnection` object.
+
+    Because several operations of a connection can be in flight at the same
+    time, the data is maintained per operation. When the operation ends,
+    the data is added to the statistics of the connection and is made
+    available in the ``last_*`` attributes of the connection.
+    """
+
+    def __init__(self, conn, name):
+        self.conn = conn
+        self.name = name
+        self.request_len = 0
+        self.reply_len = 0
+        self.server_response_time = None
+        self.transfer_lens = [0, 0]
+        self._start_time = None
+
+    def __enter__(self):
+        self._start_time = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # pylint: disable=protected-access
+        duration = time.time() - self._start_time
+        conn = self.conn
+        conn.statistics.get_op_statistic(self.name).record(
+            duration, self.request_len, self.reply_len,
+            self.server_response_time, exc_type is not None,
+            *self.transfer_lens)
+        conn._last_operation_time = duration
+        conn._last_request_len = self.request_len
+        conn._last_reply_len = self.reply_len
+        conn._last_server_response_time = self.server_response_time
+        conn._last_transfer_lens[0:2] = self.transfer_lens
+        return False
+
+
+class _IterQueryInstancesReturn(object):
+    """
+    The return data for :meth:`~pywbem.AsyncWBEMConnection.IterQueryInstances`.
+    """
+
+    def __init__(self, instances, query_result_class=None):
+        self._query_result_class = query_result_class
+        self.instances = instances
+
+    @property
+    def query_result_class(self):
+        """
+        :class:`~pywbem.CIMClass`: The query result class, if requested
+        via the `ReturnQueryResultClass` parameter, or `None`.
+        """
+        return self._query_result_class
+
+    @property
+    def generator(self):
+        """
+        :term:`py:generator` iterating :class:`~pywbem.CIMInstance`:
+        A generator object that iterates the CIM instances representing
+        the query result.
+        """
+        for inst in self.instances:
+            yield inst
+
+
+def _validateAsyncIterParams(MaxObjectCount, OperationTimeout):
+    # pylint: disable=invalid-name
+    """
+    Validate common parameters for an async iter... operation.
+
+    In addition to the validation for the iter... operations of
+    WBEMConnection, an AdaptiveMaxObjectCount object is rejected, because the
+    reply sizes and server response times that it is tuned with are not
+    available per operation when operations are in flight concurrently.
+
+    Raises:
+
+      ValueError: if these parameters are invalid
+    """
+    if isinstance(MaxObjectCount, AdaptiveMaxObjectCount):
+        raise ValueError('AsyncWBEMConnection does not support an '
+                         'AdaptiveMaxObjectCount object for MaxObjectCount')
+    _validateIterCommonParams(MaxObjectCount, OperationTimeout)
+
+
+def _check_fallback_params(operation, FilterQueryLanguage=None,
+                           FilterQuery=None, ContinueOnError=None):
+    # pylint: disable=invalid-name
+    """
+    Reject the parameters of a pull operation that cannot be passed on to
+    the corresponding traditional operation.
+    """
+    if FilterQuery is not None or FilterQueryLanguage is not None:
+        raise ValueError('%s does not support FilterQuery.' % operation)
+    if ContinueOnError is not None:
+        raise ValueError('%s does not support ContinueOnError.' % operation)
+
+
+class AsyncWBEMConnection(WBEMConnection):
+    # pylint: disable=arguments-differ
+    """
+    *New in pywbem 0.13 as experimental.*
+
+    A client's connection to a WBEM server, for performing WBEM operations
+    with :mod:`py:asyncio`.
+
+    This class is a subclass of :class:`~pywbem.WBEMConnection` and supports
+    the same WBEM operation methods, as coroutine functions. Many operations
+    of one connection object can be in flight at the same time, e.g. by means
+    of :func:`py:asyncio.gather`.
+
+    Differences to :class:`~pywbem.WBEMConnection`:
+
+    * A new HTTP connection is used for each operation.
+    * Only basic authentication is supported, i.e. there is no support for
+      the local authentication schemes of OpenPegasus and OpenWBEM.
+    * Operation recorders are not invoked, and streaming of the instances
+      returned by EnumerateInstances is not supported.
+    * The ``Iter...()`` methods do not support an
+      :class:`~pywbem.AdaptiveMaxObjectCount` object for `MaxObjectCount`.
+    * The ``last_*`` attributes reflect the operation that completed last.
+    """
+
+    def __init__(self, url, creds=None, default_namespace=DEFAULT_NAMESPACE,
+                 x509=None, ca_certs=None, no_verification=False, timeout=None,
+                 use_pull_operations=False, stats_enabled=False,
+                 compression=False, compression_threshold=None):
+        """
+        The parameters have the same meaning as for
+        :class:`~pywbem.WBEMConnection`.
+
+        The `timeout` parameter limits the duration of each operation as a
+        whole.
+        """
+        super(AsyncWBEMConnection, self).__init__(
+            url, creds=creds, default_namespace=default_namespace, x509=x509,
+            ca_certs=ca_certs, no_verification=no_verification,
+            timeout=timeout, use_pull_operations=use_pull_operations,
+            stats_enabled=stats_enabled, compression=compression,
+            compression_threshold=compression_threshold)
+
+    async def _arequest(self, op, cimxml_headers, request_data):
+        """
+        Send the request of an operation to the WBEM server, and return the
+        parsed response as a tuple tree.
+        """
+        op.request_len = len(request_data)
+        reply_xml, op.server_response_time = await async_wbem_request(
+            self.url, request_data, self.creds, cimxml_headers,
+            x509=self.x509,
+            ca_certs=self.ca_certs,
+            no_verification=self.no_verification,
+            timeout=self.timeout,
+            compression=self.compression,
+            compression_threshold=self.compression_threshold,
+            transfer_lens=op.transfer_lens)
+        op.reply_len = len(reply_xml)
+
+        # Set the raw response before parsing (which can fail)
+        if self.debug:
+            self._last_raw_reply = reply_xml
+
+        # Parse the XML into CIM objects (may raise ParseError):
+        tup_tree = _parse_reply(reply_xml)
+
+        # Set the pretty response after parsing (it could fail otherwise)
+        if self.debug:
+            self._last_reply = _to_pretty_xml(reply_xml)
+
+        return tup_tree
+
+    async def _aimethodcall(self, op, namespace, response_params_rqd=None,
+                            **params):
+        """
+        Perform the intrinsic CIM-XML operation of `op`.
+        """
+        cimxml_headers, request_data = self._imethodcall_request(
+            op.name, namespace, **params)
+        tup_tree = await self._arequest(op, cimxml_headers, request_data)
+        return self._imethodcall_result(tup_tree, op.name,
+                                        response_params_rqd)
+
+    async def _amethodcall(self, op, methodname, objectname, Params=None,
+                           **params):
+        # pylint: disable=invalid-name
+        """
+        Perform an extrinsic CIM-XML method call.
+        """
+        cimxml_headers, request_data = self._methodcall_request(
+            methodname, objectname, Params, **params)
+        tup_tree = await self._arequest(op, cimxml_headers, request_data)
+        return self._methodcall_result(tup_tree, methodname)
+
+    def _complete_paths(self, paths):
+        """
+        Set the host of the instance paths returned by the traditional
+        operations, if not set. Their namespace has already been set by
+        the operation methods.
+        """
+        host = parse_url(self.url)[0]
+        for path in paths:
+            if path.host is None:
+                path.host = host
+
+    async def _iter_pull(self, use_pull_attr, open_op, pull_op, items_attr,
+                         fallback_op, MaxObjectCount):
+        # pylint: disable=invalid-name,too-many-arguments
+        """
+        Common implementation of the ``Iter...()`` methods: Use the open and
+        pull operations, unless it is known that the WBEM server does not
+        support them, and fall back to the traditional operation otherwise.
+        """
+        pull_result = None
+        try:
+            if getattr(self, use_pull_attr) is None or \
+                    getattr(self, use_pull_attr):
+                try:
+                    pull_result = await open_op()
+
+                    # Open operation succeeded; set has_pull flag
+                    setattr(self, use_pull_attr, True)
+
+                    for obj in getattr(pull_result, items_attr):
+                        yield obj
+
+                    while not pull_result.eos:
+                        pull_result = await pull_op(
+                            pull_result.context, MaxObjectCount=MaxObjectCount)
+                        for obj in getattr(pull_result, items_attr):
+                            yield obj
+                    pull_result = None
+                    return
+
+                except CIMError as ce:
+                    if getattr(self, use_pull_attr) is None and \
+                            ce.status_code == CIM_ERR_NOT_SUPPORTED:
+                        setattr(self, use_pull_attr, False)
+                    else:
+                        raise
+
+            for obj in await fallback_op():
+                yield obj
+
+        # Cleanup if caller closes the iterator before exhausting it
+        finally:
+            if pull_result is not None and not pull_result.eos:
+                await self.CloseEnumeration(pull_result.context)
+
+    #
+    # Operations
+    #
+
+    async def EnumerateInstances(self, ClassName, namespace=None,
+                                 LocalOnly=None, DeepInheritance=None,
+                                 IncludeQualifiers=None,
+                                 IncludeClassOrigin=None, PropertyList=None,
+                                 **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.EnumerateInstances`.
+        """
+        with _AsyncOperation(self, 'EnumerateInstances') as op:
+            if namespace is None and isinstance(ClassName, CIMClassName):
+                namespace = ClassName.namespace
+            namespace = self._iparam_namespace_from_namespace(namespace)
+            classname = self._iparam_classname(ClassName)
+            PropertyList = _iparam_propertylist(PropertyList)
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                ClassName=classname,
+                LocalOnly=LocalOnly,
+                DeepInheritance=DeepInheritance,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList,
+                **extra)
+
+            instances = [] if result is None else result[0][2]
+            for instance in instances:
+                instance.path.namespace = namespace
+            return instances
+
+    async def EnumerateInstanceNames(self, ClassName, namespace=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.EnumerateInstanceNames`.
+        """
+        with _AsyncOperation(self, 'EnumerateInstanceNames') as op:
+            if namespace is None and isinstance(ClassName, CIMClassName):
+                namespace = ClassName.namespace
+            namespace = self._iparam_namespace_from_namespace(namespace)
+            classname = self._iparam_classname(ClassName)
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                ClassName=classname,
+                **extra)
+
+            instancenames = [] if result is None else result[0][2]
+            for instancename in instancenames:
+                instancename.namespace = namespace
+            return instancenames
+
+    async def GetInstance(self, InstanceName, LocalOnly=None,
+                          IncludeQualifiers=None, IncludeClassOrigin=None,
+                          PropertyList=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of :meth:`~pywbem.WBEMConnection.GetInstance`.
+        """
+        with _AsyncOperation(self, 'GetInstance') as op:
+            namespace = self._iparam_namespace_from_objectname(InstanceName)
+            instancename = self._iparam_instancename(InstanceName)
+            PropertyList = _iparam_propertylist(PropertyList)
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                InstanceName=instancename,
+                LocalOnly=LocalOnly,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList,
+                **extra)
+
+            instance = result[0][2][0]
+            instance.path = instancename
+            instance.path.namespace = namespace
+            return instance
+
+    async def ModifyInstance(self, ModifiedInstance, IncludeQualifiers=None,
+                             PropertyList=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of :meth:`~pywbem.WBEMConnection.ModifyInstance`.
+        """
+        with _AsyncOperation(self, 'ModifyInstance') as op:
+            if ModifiedInstance.path is None:
+                raise ValueError(
+                    'ModifiedInstance parameter must have path attribute set')
+            if ModifiedInstance.path.classname is None:
+                raise ValueError(
+                    'ModifiedInstance parameter must have classname set in '
+                    ' path')
+            if ModifiedInstance.classname is None:
+                raise ValueError(
+                    'ModifiedInstance parameter must have classname set in '
+                    'instance')
+
+            namespace = self._iparam_namespace_from_objectname(
+                ModifiedInstance.path)
+            PropertyList = _iparam_propertylist(PropertyList)
+
+            instance = ModifiedInstance.copy()
+            instance.path.namespace = None
+            instance.path.host = None
+
+            await self._aimethodcall(
+                op,
+                namespace,
+                ModifiedInstance=instance,
+                IncludeQualifiers=IncludeQualifiers,
+                PropertyList=PropertyList,
+                **extra)
+
+    async def CreateInstance(self, NewInstance, namespace=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of :meth:`~pywbem.WBEMConnection.CreateInstance`.
+        """
+        with _AsyncOperation(self, 'CreateInstance') as op:
+            if namespace is None and \
+               getattr(NewInstance.path, 'namespace', None) is not None:
+                namespace = NewInstance.path.namespace
+            namespace = self._iparam_namespace_from_namespace(namespace)
+
+            instance = NewInstance.copy()
+            instance.path = None
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                NewInstance=instance,
+                **extra)
+
+            instancename = result[0][2][0]
+            instancename.namespace = namespace
+            return instancename
+
+    async def DeleteInstance(self, InstanceName, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of :meth:`~pywbem.WBEMConnection.DeleteInstance`.
+        """
+        with _AsyncOperation(self, 'DeleteInstance') as op:
+            namespace = self._iparam_namespace_from_objectname(InstanceName)
+            instancename = self._iparam_instancename(InstanceName)
+
+            await self._aimethodcall(
+                op,
+                namespace,
+                InstanceName=instancename,
+                **extra)
+
+    async def Associators(self, ObjectName, AssocClass=None, ResultClass=None,
+                          Role=None, ResultRole=None, IncludeQualifiers=None,
+                          IncludeClassOrigin=None, PropertyList=None,
+                          **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of :meth:`~pywbem.WBEMConnection.Associators`.
+        """
+        with _AsyncOperation(self, 'Associators') as op:
+            namespace = self._iparam_namespace_from_objectname(ObjectName)
+            objectname = self._iparam_objectname(ObjectName)
+            PropertyList = _iparam_propertylist(PropertyList)
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                ObjectName=objectname,
+                AssocClass=self._iparam_classname(AssocClass),
+                ResultClass=self._iparam_classname(ResultClass),
+                Role=Role,
+                ResultRole=ResultRole,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList,
+                **extra)
+
+            objects = [] if result is None else [x[2] for x in result[0][2]]
+            if not isinstance(objectname, CIMInstanceName):
+                for classpath, klass in objects:
+                    klass.path = classpath
+            return objects
+
+    async def AssociatorNames(self, ObjectName, AssocClass=None,
+                              ResultClass=None, Role=None, ResultRole=None,
+                              **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.AssociatorNames`.
+        """
+        with _AsyncOperation(self, 'AssociatorNames') as op:
+            namespace = self._iparam_namespace_from_objectname(ObjectName)
+            objectname = self._iparam_objectname(ObjectName)
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                ObjectName=objectname,
+                AssocClass=self._iparam_classname(AssocClass),
+                ResultClass=self._iparam_classname(ResultClass),
+                Role=Role,
+                ResultRole=ResultRole,
+                **extra)
+
+            return [] if result is None else [x[2] for x in result[0][2]]
+
+    async def References(self, ObjectName, ResultClass=None, Role=None,
+                         IncludeQualifiers=None, IncludeClassOrigin=None,
+                         PropertyList=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of :meth:`~pywbem.WBEMConnection.References`.
+        """
+        with _AsyncOperation(self, 'References') as op:
+            namespace = self._iparam_namespace_from_objectname(ObjectName)
+            objectname = self._iparam_objectname(ObjectName)
+            PropertyList = _iparam_propertylist(PropertyList)
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                ObjectName=objectname,
+                ResultClass=self._iparam_classname(ResultClass),
+                Role=Role,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList,
+                **extra)
+
+            objects = [] if result is None else [x[2] for x in result[0][2]]
+            if not isinstance(objectname, CIMInstanceName):
+                for classpath, klass in objects:
+                    klass.path = classpath
+            return objects
+
+    async def ReferenceNames(self, ObjectName, ResultClass=None, Role=None,
+                             **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of :meth:`~pywbem.WBEMConnection.ReferenceNames`.
+        """
+        with _AsyncOperation(self, 'ReferenceNames') as op:
+            namespace = self._iparam_namespace_from_objectname(ObjectName)
+            objectname = self._iparam_objectname(ObjectName)
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                ObjectName=objectname,
+                ResultClass=self._iparam_classname(ResultClass),
+                Role=Role,
+                **extra)
+
+            return [] if result is None else [x[2] for x in result[0][2]]
+
+    async def InvokeMethod(self, MethodName, ObjectName, Params=None,
+                           **params):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of :meth:`~pywbem.WBEMConnection.InvokeMethod`.
+        """
+        with _AsyncOperation(self, 'InvokeMethod') as op:
+            return await self._amethodcall(op, MethodName, ObjectName, Params,
+                                           **params)
+
+    async def ExecQuery(self, QueryLanguage, Query, namespace=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of :meth:`~pywbem.WBEMConnection.ExecQuery`.
+        """
+        with _AsyncOperation(self, 'ExecQuery') as op:
+            namespace = self._iparam_namespace_from_namespace(namespace)
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                QueryLanguage=QueryLanguage,
+                Query=Query,
+                **extra)
+
+            instances = [] if result is None else \
+                [tt[2] for tt in result[0][2]]
+            for instance in instances:
+                instance.path.namespace = namespace
+            return instances
+
+    def IterEnumerateInstances(self, ClassName, namespace=None,
+                               LocalOnly=None,
+                               DeepInheritance=None, IncludeQualifiers=None,
+                               IncludeClassOrigin=None, PropertyList=None,
+                               FilterQueryLanguage=None, FilterQuery=None,
+                               OperationTimeout=None, ContinueOnError=None,
+                               MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT,
+                               **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.IterEnumerateInstances`.
+
+        Returns an :term:`py:asynchronous generator` iterating
+        :class:`~pywbem.CIMInstance`.
+        """
+        _validateAsyncIterParams(MaxObjectCount, OperationTimeout)
+
+        def open_op():
+            return self.OpenEnumerateInstances(
+                ClassName, namespace=namespace, LocalOnly=LocalOnly,
+                DeepInheritance=DeepInheritance,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList,
+                FilterQueryLanguage=FilterQueryLanguage,
+                FilterQuery=FilterQuery,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=MaxObjectCount, **extra)
+
+        async def fallback_op():
+            _check_fallback_params('EnumerateInstances', FilterQueryLanguage,
+                                   FilterQuery, ContinueOnError)
+            instances = await self.EnumerateInstances(
+                ClassName, namespace=namespace, LocalOnly=LocalOnly,
+                DeepInheritance=DeepInheritance,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList, **extra)
+            self._complete_paths([inst.path for inst in instances])
+            return instances
+
+        return self._iter_pull(
+            '_use_enum_inst_pull_operations', open_op,
+            self.PullInstancesWithPath, 'instances', fallback_op,
+            MaxObjectCount)
+
+    def IterEnumerateInstancePaths(self, ClassName, namespace=None,
+                                   FilterQueryLanguage=None, FilterQuery=None,
+                                   OperationTimeout=None, ContinueOnError=None,
+                                   MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT,
+                                   **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.IterEnumerateInstancePaths`.
+
+        Returns an :term:`py:asynchronous generator` iterating
+        :class:`~pywbem.CIMInstanceName`.
+        """
+        _validateAsyncIterParams(MaxObjectCount, OperationTimeout)
+
+        def open_op():
+            return self.OpenEnumerateInstancePaths(
+                ClassName, namespace=namespace,
+                FilterQueryLanguage=FilterQueryLanguage,
+                FilterQuery=FilterQuery,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=MaxObjectCount, **extra)
+
+        async def fallback_op():
+            _check_fallback_params('EnumerateInstanceNames',
+                                   FilterQueryLanguage, FilterQuery,
+                                   ContinueOnError)
+            paths = await self.EnumerateInstanceNames(
+                ClassName, namespace=namespace, **extra)
+            self._complete_paths(paths)
+            return paths
+
+        return self._iter_pull(
+            '_use_enum_path_pull_operations', open_op,
+            self.PullInstancePaths, 'paths', fallback_op, MaxObjectCount)
+
+    def IterAssociatorInstances(self, InstanceName, AssocClass=None,
+                                ResultClass=None,
+                                Role=None, ResultRole=None,
+                                IncludeQualifiers=None,
+                                IncludeClassOrigin=None, PropertyList=None,
+                                FilterQueryLanguage=None, FilterQuery=None,
+                                OperationTimeout=None, ContinueOnError=None,
+                                MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT,
+                                **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.IterAssociatorInstances`.
+
+        Returns an :term:`py:asynchronous generator` iterating
+        :class:`~pywbem.CIMInstance`.
+        """
+        _validateAsyncIterParams(MaxObjectCount, OperationTimeout)
+
+        def open_op():
+            return self.OpenAssociatorInstances(
+                InstanceName,
+                AssocClass=AssocClass,
+                ResultClass=ResultClass,
+                Role=Role,
+                ResultRole=ResultRole,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList,
+                FilterQueryLanguage=FilterQueryLanguage,
+                FilterQuery=FilterQuery,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=MaxObjectCount, **extra)
+
+        async def fallback_op():
+            _check_fallback_params('Associators', FilterQueryLanguage,
+                                   FilterQuery, ContinueOnError)
+            return await self.Associators(
+                InstanceName,
+                AssocClass=AssocClass,
+                ResultClass=ResultClass,
+                Role=Role,
+                ResultRole=ResultRole,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList, **extra)
+
+        return self._iter_pull(
+            '_use_assoc_inst_pull_operations', open_op,
+            self.PullInstancesWithPath, 'instances', fallback_op,
+            MaxObjectCount)
+
+    def IterAssociatorInstancePaths(self, InstanceName, AssocClass=None,
+                                    ResultClass=None,
+                                    Role=None, ResultRole=None,
+                                    FilterQueryLanguage=None, FilterQuery=None,
+                                    OperationTimeout=None, ContinueOnError=None,
+                                    MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT,
+                                    **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.IterAssociatorInstancePaths`.
+
+        Returns an :term:`py:asynchronous generator` iterating
+        :class:`~pywbem.CIMInstanceName`.
+        """
+        _validateAsyncIterParams(MaxObjectCount, OperationTimeout)
+
+        def open_op():
+            return self.OpenAssociatorInstancePaths(
+                InstanceName,
+                AssocClass=AssocClass,
+                ResultClass=ResultClass,
+                Role=Role,
+                ResultRole=ResultRole,
+                FilterQueryLanguage=FilterQueryLanguage,
+                FilterQuery=FilterQuery,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=MaxObjectCount, **extra)
+
+        async def fallback_op():
+            _check_fallback_params('AssociatorNames', FilterQueryLanguage,
+                                   FilterQuery, ContinueOnError)
+            return await self.AssociatorNames(
+                InstanceName,
+                AssocClass=AssocClass,
+                ResultClass=ResultClass,
+                Role=Role,
+                ResultRole=ResultRole, **extra)
+
+        return self._iter_pull(
+            '_use_assoc_path_pull_operations', open_op,
+            self.PullInstancePaths, 'paths', fallback_op, MaxObjectCount)
+
+    def IterReferenceInstances(self, InstanceName, ResultClass=None,
+                               Role=None, IncludeQualifiers=None,
+                               IncludeClassOrigin=None, PropertyList=None,
+                               FilterQueryLanguage=None, FilterQuery=None,
+                               OperationTimeout=None, ContinueOnError=None,
+                               MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT,
+                               **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.IterReferenceInstances`.
+
+        Returns an :term:`py:asynchronous generator` iterating
+        :class:`~pywbem.CIMInstance`.
+        """
+        _validateAsyncIterParams(MaxObjectCount, OperationTimeout)
+
+        def open_op():
+            return self.OpenReferenceInstances(
+                InstanceName,
+                ResultClass=ResultClass,
+                Role=Role,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList,
+                FilterQueryLanguage=FilterQueryLanguage,
+                FilterQuery=FilterQuery,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=MaxObjectCount, **extra)
+
+        async def fallback_op():
+            _check_fallback_params('References', FilterQueryLanguage,
+                                   FilterQuery, ContinueOnError)
+            return await self.References(
+                InstanceName,
+                ResultClass=ResultClass,
+                Role=Role,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList, **extra)
+
+        return self._iter_pull(
+            '_use_ref_inst_pull_operations', open_op,
+            self.PullInstancesWithPath, 'instances', fallback_op,
+            MaxObjectCount)
+
+    def IterReferenceInstancePaths(self, InstanceName, ResultClass=None,
+                                   Role=None,
+                                   FilterQueryLanguage=None, FilterQuery=None,
+                                   OperationTimeout=None, ContinueOnError=None,
+                                   MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT,
+                                   **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.IterReferenceInstancePaths`.
+
+        Returns an :term:`py:asynchronous generator` iterating
+        :class:`~pywbem.CIMInstanceName`.
+        """
+        _validateAsyncIterParams(MaxObjectCount, OperationTimeout)
+
+        def open_op():
+            return self.OpenReferenceInstancePaths(
+                InstanceName,
+                ResultClass=ResultClass,
+                Role=Role,
+                FilterQueryLanguage=FilterQueryLanguage,
+                FilterQuery=FilterQuery,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=MaxObjectCount, **extra)
+
+        async def fallback_op():
+            _check_fallback_params('ReferenceNames', FilterQueryLanguage,
+                                   FilterQuery, ContinueOnError)
+            return await self.ReferenceNames(
+                InstanceName,
+                ResultClass=ResultClass,
+                Role=Role, **extra)
+
+        return self._iter_pull(
+            '_use_ref_path_pull_operations', open_op,
+            self.PullInstancePaths, 'paths', fallback_op, MaxObjectCount)
+
+    async def IterQueryInstances(self, FilterQueryLanguage, FilterQuery,
+                                 namespace=None, ReturnQueryResultClass=None,
+                                 OperationTimeout=None, ContinueOnError=None,
+                                 MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT,
+                                 **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.IterQueryInstances`.
+
+        Like the synchronous version, the result is returned once all
+        instances have been received.
+        """
+        _validateAsyncIterParams(MaxObjectCount, OperationTimeout)
+
+        pull_result = None
+        try:
+            if self._use_query_pull_operations is None or \
+                    self._use_query_pull_operations:
+                try:
+                    pull_result = await self.OpenQueryInstances(
+                        FilterQueryLanguage,
+                        FilterQuery,
+                        namespace=namespace,
+                        ReturnQueryResultClass=ReturnQueryResultClass,
+                        OperationTimeout=OperationTimeout,
+                        ContinueOnError=ContinueOnError,
+                        MaxObjectCount=MaxObjectCount, **extra)
+
+                    # Open operation succeeded; set has_pull flag
+                    self._use_query_pull_operations = True
+
+                    instances = pull_result.instances
+                    qrc = pull_result.query_result_class if \
+                        ReturnQueryResultClass else None
+                    while not pull_result.eos:
+                        pull_result = await self.PullInstances(
+                            pull_result.context, MaxObjectCount=MaxObjectCount)
+                        instances.extend(pull_result.instances)
+                    pull_result = None
+                    return _IterQueryInstancesReturn(instances,
+                                                     query_result_class=qrc)
+
+                except CIMError as ce:
+                    if self._use_query_pull_operations is None and \
+                       ce.status_code == CIM_ERR_NOT_SUPPORTED:
+                        self._use_query_pull_operations = False
+                    else:
+                        raise
+
+            if ReturnQueryResultClass is not None:
+                raise ValueError('ExecQuery does not support'
+                                 ' ReturnQueryResultClass.')
+            _check_fallback_params('ExecQuery',
+                                   ContinueOnError=ContinueOnError)
+
+            instances = await self.ExecQuery(FilterQueryLanguage, FilterQuery,
+                                             namespace=namespace, **extra)
+            return _IterQueryInstancesReturn(instances)
+
+        finally:
+            if pull_result is not None and not pull_result.eos:
+                await self.CloseEnumeration(pull_result.context)
+
+    async def OpenEnumerateInstances(self, ClassName, namespace=None,
+                                     LocalOnly=None, DeepInheritance=None,
+                                     IncludeQualifiers=None,
+                                     IncludeClassOrigin=None,
+                                     PropertyList=None,
+                                     FilterQueryLanguage=None,
+                                     FilterQuery=None, OperationTimeout=None,
+                                     ContinueOnError=None,
+                                     MaxObjectCount=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.OpenEnumerateInstances`.
+        """
+        if MaxObjectCount is not None and MaxObjectCount < 0:
+            raise ValueError('MaxObjectCount must be >= 0 but is %s' %
+                             MaxObjectCount)
+
+        with _AsyncOperation(self, 'OpenEnumerateInstances') as op:
+            if namespace is None and isinstance(ClassName, CIMClassName):
+                namespace = ClassName.namespace
+            namespace = self._iparam_namespace_from_namespace(namespace)
+            classname = self._iparam_classname(ClassName)
+            PropertyList = _iparam_propertylist(PropertyList)
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                ClassName=classname,
+                LocalOnly=LocalOnly,
+                DeepInheritance=DeepInheritance,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList,
+                FilterQueryLanguage=FilterQueryLanguage,
+                FilterQuery=FilterQuery,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=MaxObjectCount,
+                response_params_rqd=True,
+                **extra)
+
+            return pull_inst_result_tuple(
+                *self._get_rslt_params(result, namespace))
+
+    async def OpenEnumerateInstancePaths(self, ClassName, namespace=None,
+                                         FilterQueryLanguage=None,
+                                         FilterQuery=None,
+                                         OperationTimeout=None,
+                                         ContinueOnError=None,
+                                         MaxObjectCount=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.OpenEnumerateInstancePaths`.
+        """
+        with _AsyncOperation(self, 'OpenEnumerateInstancePaths') as op:
+            if namespace is None and isinstance(ClassName, CIMClassName):
+                namespace = ClassName.namespace
+            namespace = self._iparam_namespace_from_namespace(namespace)
+            classname = self._iparam_classname(ClassName)
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                ClassName=classname,
+                FilterQueryLanguage=FilterQueryLanguage,
+                FilterQuery=FilterQuery,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=MaxObjectCount,
+                response_params_rqd=True,
+                **extra)
+
+            return pull_path_result_tuple(
+                *self._get_rslt_params(result, namespace))
+
+    async def OpenAssociatorInstances(self, InstanceName, AssocClass=None,
+                                      ResultClass=None, Role=None,
+                                      ResultRole=None, IncludeQualifiers=None,
+                                      IncludeClassOrigin=None,
+                                      PropertyList=None,
+                                      FilterQueryLanguage=None,
+                                      FilterQuery=None, OperationTimeout=None,
+                                      ContinueOnError=None,
+                                      MaxObjectCount=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.OpenAssociatorInstances`.
+        """
+        with _AsyncOperation(self, 'OpenAssociatorInstances') as op:
+            namespace = self._iparam_namespace_from_objectname(InstanceName)
+            instancename = self._iparam_instancename(InstanceName)
+            PropertyList = _iparam_propertylist(PropertyList)
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                InstanceName=instancename,
+                AssocClass=self._iparam_classname(AssocClass),
+                ResultClass=self._iparam_classname(ResultClass),
+                Role=Role,
+                ResultRole=ResultRole,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList,
+                FilterQueryLanguage=FilterQueryLanguage,
+                FilterQuery=FilterQuery,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=MaxObjectCount,
+                response_params_rqd=True,
+                **extra)
+
+            return pull_inst_result_tuple(
+                *self._get_rslt_params(result, namespace))
+
+    async def OpenAssociatorInstancePaths(self, InstanceName, AssocClass=None,
+                                          ResultClass=None, Role=None,
+                                          ResultRole=None,
+                                          FilterQueryLanguage=None,
+                                          FilterQuery=None,
+                                          OperationTimeout=None,
+                                          ContinueOnError=None,
+                                          MaxObjectCount=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.OpenAssociatorInstancePaths`.
+        """
+        with _AsyncOperation(self, 'OpenAssociatorInstancePaths') as op:
+            namespace = self._iparam_namespace_from_objectname(InstanceName)
+            instancename = self._iparam_instancename(InstanceName)
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                InstanceName=instancename,
+                AssocClass=self._iparam_classname(AssocClass),
+                ResultClass=self._iparam_classname(ResultClass),
+                Role=Role,
+                ResultRole=ResultRole,
+                FilterQueryLanguage=FilterQueryLanguage,
+                FilterQuery=FilterQuery,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=MaxObjectCount,
+                response_params_rqd=True,
+                **extra)
+
+            return pull_path_result_tuple(
+                *self._get_rslt_params(result, namespace))
+
+    async def OpenReferenceInstances(self, InstanceName, ResultClass=None,
+                                     Role=None, IncludeQualifiers=None,
+                                     IncludeClassOrigin=None,
+                                     PropertyList=None,
+                                     FilterQueryLanguage=None,
+                                     FilterQuery=None, OperationTimeout=None,
+                                     ContinueOnError=None,
+                                     MaxObjectCount=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.OpenReferenceInstances`.
+        """
+        with _AsyncOperation(self, 'OpenReferenceInstances') as op:
+            namespace = self._iparam_namespace_from_objectname(InstanceName)
+            instancename = self._iparam_instancename(InstanceName)
+            PropertyList = _iparam_propertylist(PropertyList)
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                InstanceName=instancename,
+                ResultClass=self._iparam_classname(ResultClass),
+                Role=Role,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList,
+                FilterQueryLanguage=FilterQueryLanguage,
+                FilterQuery=FilterQuery,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=MaxObjectCount,
+                response_params_rqd=True,
+                **extra)
+
+            return pull_inst_result_tuple(
+                *self._get_rslt_params(result, namespace))
+
+    async def OpenReferenceInstancePaths(self, InstanceName, ResultClass=None,
+                                         Role=None, FilterQueryLanguage=None,
+                                         FilterQuery=None,
+                                         OperationTimeout=None,
+                                         ContinueOnError=None,
+                                         MaxObjectCount=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.OpenReferenceInstancePaths`.
+        """
+        with _AsyncOperation(self, 'OpenReferenceInstancePaths') as op:
+            namespace = self._iparam_namespace_from_objectname(InstanceName)
+            instancename = self._iparam_instancename(InstanceName)
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                InstanceName=instancename,
+                ResultClass=self._iparam_classname(ResultClass),
+                Role=Role,
+                FilterQueryLanguage=FilterQueryLanguage,
+                FilterQuery=FilterQuery,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=MaxObjectCount,
+                response_params_rqd=True,
+                **extra)
+
+            return pull_path_result_tuple(
+                *self._get_rslt_params(result, namespace))
+
+    async def OpenQueryInstances(self, FilterQueryLanguage, FilterQuery,
+                                 namespace=None, ReturnQueryResultClass=None,
+                                 OperationTimeout=None, ContinueOnError=None,
+                                 MaxObjectCount=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.OpenQueryInstances`.
+        """
+        if MaxObjectCount is not None and MaxObjectCount < 0:
+            raise ValueError('MaxObjectCount must be >= 0 but is %s' %
+                             MaxObjectCount)
+
+        with _AsyncOperation(self, 'OpenQueryInstances') as op:
+            namespace = self._iparam_namespace_from_namespace(namespace)
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                FilterQuery=FilterQuery,
+                FilterQueryLanguage=FilterQueryLanguage,
+                ReturnQueryResultClass=ReturnQueryResultClass,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=MaxObjectCount,
+                response_params_rqd=True,
+                **extra)
+
+            insts, eos, enum_ctxt = self._get_rslt_params(result, namespace)
+
+            query_result_class = None
+            if ReturnQueryResultClass:
+                for p in result:
+                    if p[0] == 'QueryResultClass' and \
+                            isinstance(p[2], CIMClass):
+                        query_result_class = p[2]
+                        break
+                else:
+                    raise CIMError(CIM_ERR_INVALID_PARAMETER,
+                                   "ReturnQueryResultClass invalid or "
+                                   "missing.")
+
+            return pull_query_result_tuple(insts, eos, enum_ctxt,
+                                           query_result_class)
+
+    async def _apull(self, method_name, result_tuple, context, MaxObjectCount,
+                     **extra):
+        # pylint: disable=invalid-name
+        """
+        Common implementation of the pull operations.
+        """
+        with _AsyncOperation(self, method_name) as op:
+            _validatePullParams(MaxObjectCount, context)
+
+            namespace = context[1]
+
+            result = await self._aimethodcall(
+                op,
+                namespace=namespace,
+                EnumerationContext=context[0],
+                MaxObjectCount=MaxObjectCount,
+                response_params_rqd=True,
+                **extra)
+
+            return result_tuple(*self._get_rslt_params(result, namespace))
+
+    async def PullInstancesWithPath(self, context, MaxObjectCount, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.PullInstancesWithPath`.
+        """
+        return await self._apull('PullInstancesWithPath',
+                                 pull_inst_result_tuple, context,
+                                 MaxObjectCount, **extra)
+
+    async def PullInstancePaths(self, context, MaxObjectCount, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.PullInstancePaths`.
+        """
+        return await self._apull('PullInstancePaths', pull_path_result_tuple,
+                                 context, MaxObjectCount, **extra)
+
+    async def PullInstances(self, context, MaxObjectCount, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of :meth:`~pywbem.WBEMConnection.PullInstances`.
+        """
+        return await self._apull('PullInstances', pull_inst_result_tuple,
+                                 context, MaxObjectCount, **extra)
+
+    async def CloseEnumeration(self, context, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.CloseEnumeration`.
+        """
+        with _AsyncOperation(self, 'CloseEnumeration') as op:
+            if context is None:
+                raise ValueError("Invalid context: None "
+                                 "(Enumeration may be exhausted)")
+
+            await self._aimethodcall(
+                op,
+                namespace=context[1],
+                EnumerationContext=context[0],
+                **extra)
+
+    async def EnumerateClasses(self, namespace=None, ClassName=None,
+                               DeepInheritance=None, LocalOnly=None,
+                               IncludeQualifiers=None, IncludeClassOrigin=None,
+                               **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.EnumerateClasses`.
+        """
+        with _AsyncOperation(self, 'EnumerateClasses') as op:
+            if namespace is None and isinstance(ClassName, CIMClassName):
+                namespace = ClassName.namespace
+            namespace = self._iparam_namespace_from_namespace(namespace)
+            classname = self._iparam_classname(ClassName)
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                ClassName=classname,
+                DeepInheritance=DeepInheritance,
+                LocalOnly=LocalOnly,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                **extra)
+
+            classes = [] if result is None else result[0][2]
+            for klass in classes:
+                klass.path = CIMClassName(
+                    classname=klass.classname, host=self.host,
+                    namespace=namespace)
+            return classes
+
+    async def EnumerateClassNames(self, namespace=None, ClassName=None,
+                                  DeepInheritance=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.EnumerateClassNames`.
+        """
+        with _AsyncOperation(self, 'EnumerateClassNames') as op:
+            if namespace is None and isinstance(ClassName, CIMClassName):
+                namespace = ClassName.namespace
+            namespace = self._iparam_namespace_from_namespace(namespace)
+            classname = self._iparam_classname(ClassName)
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                ClassName=classname,
+                DeepInheritance=DeepInheritance,
+                **extra)
+
+            return [] if result is None else \
+                [x.classname for x in result[0][2]]
+
+    async def GetClass(self, ClassName, namespace=None, LocalOnly=None,
+                       IncludeQualifiers=None, IncludeClassOrigin=None,
+                       PropertyList=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of :meth:`~pywbem.WBEMConnection.GetClass`.
+        """
+        with _AsyncOperation(self, 'GetClass') as op:
+            if namespace is None and isinstance(ClassName, CIMClassName):
+                namespace = ClassName.namespace
+            namespace = self._iparam_namespace_from_namespace(namespace)
+            classname = self._iparam_classname(ClassName)
+            PropertyList = _iparam_propertylist(PropertyList)
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                ClassName=classname,
+                LocalOnly=LocalOnly,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList,
+                **extra)
+
+            klass = result[0][2][0]
+            klass.path = CIMClassName(
+                classname=klass.classname, host=self.host, namespace=namespace)
+            return klass
+
+    async def ModifyClass(self, ModifiedClass, namespace=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of :meth:`~pywbem.WBEMConnection.ModifyClass`.
+        """
+        with _AsyncOperation(self, 'ModifyClass') as op:
+            namespace = self._iparam_namespace_from_namespace(namespace)
+
+            klass = ModifiedClass.copy()
+            klass.path = None
+
+            await self._aimethodcall(
+                op,
+                namespace,
+                ModifiedClass=klass,
+                **extra)
+
+    async def CreateClass(self, NewClass, namespace=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of :meth:`~pywbem.WBEMConnection.CreateClass`.
+        """
+        with _AsyncOperation(self, 'CreateClass') as op:
+            namespace = self._iparam_namespace_from_namespace(namespace)
+
+            klass = NewClass.copy()
+            klass.path = None
+
+            await self._aimethodcall(
+                op,
+                namespace,
+                NewClass=klass,
+                **extra)
+
+    async def DeleteClass(self, ClassName, namespace=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of :meth:`~pywbem.WBEMConnection.DeleteClass`.
+        """
+        with _AsyncOperation(self, 'DeleteClass') as op:
+            if namespace is None and isinstance(ClassName, CIMClassName):
+                namespace = ClassName.namespace
+            namespace = self._iparam_namespace_from_namespace(namespace)
+            classname = self._iparam_classname(ClassName)
+
+            await self._aimethodcall(
+                op,
+                namespace,
+                ClassName=classname,
+                **extra)
+
+    async def EnumerateQualifiers(self, namespace=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.EnumerateQualifiers`.
+        """
+        with _AsyncOperation(self, 'EnumerateQualifiers') as op:
+            namespace = self._iparam_namespace_from_namespace(namespace)
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                **extra)
+
+            return [] if result is None else result[0][2]
+
+    async def GetQualifier(self, QualifierName, namespace=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of :meth:`~pywbem.WBEMConnection.GetQualifier`.
+        """
+        with _AsyncOperation(self, 'GetQualifier') as op:
+            namespace = self._iparam_namespace_from_namespace(namespace)
+
+            result = await self._aimethodcall(
+                op,
+                namespace,
+                QualifierName=QualifierName,
+                **extra)
+
+            return result[0][2][0]
+
+    async def SetQualifier(self, QualifierDeclaration, namespace=None,
+                           **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of :meth:`~pywbem.WBEMConnection.SetQualifier`.
+        """
+        with _AsyncOperation(self, 'SetQualifier') as op:
+            namespace = self._iparam_namespace_from_namespace(namespace)
+
+            await self._aimethodcall(
+                op,
+                namespace,
+                QualifierDeclaration=QualifierDeclaration,
+                **extra)
+
+    async def DeleteQualifier(self, QualifierName, namespace=None, **extra):
+        # pylint: disable=invalid-name
+        """
+        Asynchronous version of
+        :meth:`~pywbem.WBEMConnection.DeleteQualifier`.
+        """
+        with _AsyncOperation(self, 'DeleteQualifier') as op:
+            namespace = self._iparam_namespace_from_namespace(namespace)
+
+            await self._aimethodcall(
+                op,
+                namespace,
+                QualifierName=QualifierName,
+                **extra)
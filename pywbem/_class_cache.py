@@ -0,0 +1,351 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+*New in pywbem 0.13 as experimental.*
+
+A :class:`~pywbem.WBEMConnection` object can cache the CIM classes it has
+retrieved from the WBEM server in a :class:`~pywbem.ClassCache` object, so
+that repeated :meth:`~pywbem.WBEMConnection.GetClass` and
+:meth:`~pywbem.WBEMConnection.EnumerateClasses` operations for the same
+classes (e.g. by :meth:`~pywbem.ValueMapping.for_property`) do not cause a
+round trip to the WBEM server. The class cache is enabled via the
+``class_cache_size`` init parameter of :class:`~pywbem.WBEMConnection`.
+
+Example::
+
+    conn = pywbem.WBEMConnection('https://myserver', ('user', 'password'),
+                                 class_cache_size=500, class_cache_ttl=600,
+                                 stats_enabled=True)
+
+    for i in range(10):
+        cls = conn.GetClass('CIM_ComputerSystem', LocalOnly=False)
+
+    print(conn.statistics.class_cache_hits)  # 9
+
+CIM-XML does not provide a means for revalidating a cached class with the
+WBEM server (such as an HTTP ETag), so the cached classes expire after a
+time-to-live instead. Classes that are created, modified or deleted through
+the same connection are removed from the cache right away; changes made by
+other clients become visible when the cached classes expire.
+"""
+
+from __future__ import absolute_import
+
+import copy
+import time
+import threading
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ordereddict import OrderedDict
+
+__all__ = ['ClassCache']
+
+
+def _lower(name):
+    """Return the lower-cased name, or `None`."""
+    return name.lower() if name is not None else None
+
+
+class ClassCache(object):
+    """
+    *New in pywbem 0.13 as experimental.*
+
+    A cache for the CIM classes retrieved by a
+    :class:`~pywbem.WBEMConnection` object, with least-recently-used (LRU)
+    eviction and an optional time-to-live (TTL) of its entries.
+
+    Classes are cached together with the operation parameters that determine
+    their content (`LocalOnly`, `IncludeQualifiers`, `IncludeClassOrigin` and
+    `PropertyList`), so that a class is only returned from the cache for the
+    same parameter values it was retrieved with. Class and namespace names
+    are matched case-insensitively.
+
+    The cache stores and returns deep copies of the classes, so the returned
+    classes may be modified by the caller.
+
+    The methods of this class are thread-safe.
+    """
+
+    def __init__(self, maxsize, ttl=None, statistics=None):
+        """
+        Parameters:
+
+          maxsize (:term:`integer`):
+            Maximum number of entries in the cache. When an entry is added to
+            a full cache, the least recently used entry is removed. Each
+            cached class and each cached enumeration of classes is one entry.
+            Must be a positive integer.
+
+          ttl (:term:`number`):
+            Time-to-live of the cache entries in seconds. An entry that is
+            older is not returned from the cache anymore.
+
+            `None` means that the entries do not expire.
+
+          statistics (:class:`~pywbem.Statistics`):
+            Statistics container that is updated with the hit and miss
+            counters of this cache, or `None` for no statistics.
+        """
+        if maxsize is None or maxsize <= 0:
+            raise ValueError("Class cache size must be a positive integer, "
+                             "but is: %r" % maxsize)
+        if ttl is not None and ttl <= 0:
+            raise ValueError("Class cache TTL must be a positive number or "
+                             "None, but is: %r" % ttl)
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._statistics = statistics
+        # Cache key to tuple(expiry time or None, value), least recently used
+        # first. The value is a CIMClass object for a class entry, or a list
+        # of class names for an enumeration entry.
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return "%s(maxsize=%r, ttl=%r, size=%r)" % \
+            (self.__class__.__name__, self._maxsize, self._ttl,
+             len(self._entries))
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def maxsize(self):
+        """
+        :term:`integer`: Maximum number of entries in the cache.
+        """
+        return self._maxsize
+
+    @property
+    def ttl(self):
+        """
+        :term:`number`: Time-to-live of the cache entries in seconds, or
+        `None` if the entries do not expire.
+        """
+        return self._ttl
+
+    @staticmethod
+    def _class_key(namespace, classname, local_only, include_qualifiers,
+                   include_class_origin, property_list):
+        """Return the cache key for a class."""
+        if property_list is not None:
+            property_list = tuple(sorted(p.lower() for p in property_list))
+        return (_lower(namespace), 'class', classname.lower(), local_only,
+                include_qualifiers, include_class_origin, property_list)
+
+    @staticmethod
+    def _enum_key(namespace, classname, deep_inheritance, local_only,
+                  include_qualifiers, include_class_origin):
+        """Return the cache key for an enumeration of classes."""
+        return (_lower(namespace), 'enum', _lower(classname),
+                deep_inheritance, local_only, include_qualifiers,
+                include_class_origin)
+
+    def _lookup(self, key):
+        """
+        Return the value of an unexpired entry and mark it as recently used,
+        or return `None`. Must be called with the lock held.
+        """
+        try:
+            expiry, value = self._entries[key]
+        except KeyError:
+            return None
+        if expiry is not None and time.time() >= expiry:
+            del self._entries[key]
+            return None
+        # Move the entry to the most recently used end
+        del self._entries[key]
+        self._entries[key] = (expiry, value)
+        return value
+
+    def _store(self, key, value):
+        """
+        Add or replace an entry, evicting the least recently used entries
+        as needed. Must be called with the lock held.
+        """
+        expiry = time.time() + self._ttl if self._ttl is not None else None
+        self._entries.pop(key, None)
+        self._entries[key] = (expiry, value)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def _count(self, hit):
+        """Update the hit and miss counters in the statistics container."""
+        if self._statistics is not None:
+            self._statistics.count_class_cache(hit)
+
+    def get_class(self, namespace, classname, local_only=None,
+                  include_qualifiers=None, include_class_origin=None,
+                  property_list=None):
+        """
+        Return a cached class that was retrieved with the same operation
+        parameters, or `None` if there is none.
+
+        Parameters:
+
+          namespace (:term:`string`): Name of the CIM namespace.
+
+          classname (:term:`string`): Name of the class.
+
+          local_only (:class:`py:bool`): `LocalOnly` operation parameter.
+
+          include_qualifiers (:class:`py:bool`): `IncludeQualifiers`
+            operation parameter.
+
+          include_class_origin (:class:`py:bool`): `IncludeClassOrigin`
+            operation parameter.
+
+          property_list (:term:`py:iterable` of :term:`string`):
+            `PropertyList` operation parameter.
+
+        Returns:
+
+          :class:`~pywbem.CIMClass`: A copy of the cached class, or `None`.
+        """
+        key = self._class_key(namespace, classname, local_only,
+                              include_qualifiers, include_class_origin,
+                              property_list)
+        with self._lock:
+            klass = self._lookup(key)
+        self._count(klass is not None)
+        return copy.deepcopy(klass) if klass is not None else None
+
+    def put_class(self, klass, namespace, local_only=None,
+                  include_qualifiers=None, include_class_origin=None,
+                  property_list=None):
+        """
+        Add a class that was retrieved with the specified operation
+        parameters to the cache.
+
+        The parameters are the same as for
+        :meth:`~pywbem.ClassCache.get_class`, except for `klass`
+        (:class:`~pywbem.CIMClass`), the class to be added. A copy of it is
+        stored.
+        """
+        key = self._class_key(namespace, klass.classname, local_only,
+                              include_qualifiers, include_class_origin,
+                              property_list)
+        klass = copy.deepcopy(klass)
+        with self._lock:
+            self._store(key, klass)
+
+    def get_classes(self, namespace, classname, deep_inheritance=None,
+                    local_only=None, include_qualifiers=None,
+                    include_class_origin=None):
+        """
+        Return the cached result of a class enumeration with the same
+        operation parameters, or `None` if there is none or if one of the
+        enumerated classes is no longer in the cache.
+
+        Parameters:
+
+          namespace (:term:`string`): Name of the CIM namespace.
+
+          classname (:term:`string`): Name of the class whose subclasses were
+            enumerated, or `None` for the top-level classes.
+
+          deep_inheritance (:class:`py:bool`): `DeepInheritance` operation
+            parameter.
+
+          local_only (:class:`py:bool`): `LocalOnly` operation parameter.
+
+          include_qualifiers (:class:`py:bool`): `IncludeQualifiers`
+            operation parameter.
+
+          include_class_origin (:class:`py:bool`): `IncludeClassOrigin`
+            operation parameter.
+
+        Returns:
+
+          list of :class:`~pywbem.CIMClass`: Copies of the cached classes,
+          or `None`.
+        """
+        key = self._enum_key(namespace, classname, deep_inheritance,
+                             local_only, include_qualifiers,
+                             include_class_origin)
+        classes = None
+        with self._lock:
+            classnames = self._lookup(key)
+            if classnames is not None:
+                classes = []
+                for cln in classnames:
+                    klass = self._lookup(self._class_key(
+                        namespace, cln, local_only, include_qualifiers,
+                        include_class_origin, None))
+                    if klass is None:
+                        classes = None
+                        break
+                    classes.append(klass)
+        self._count(classes is not None)
+        if classes is None:
+            return None
+        return copy.deepcopy(classes)
+
+    def put_classes(self, classes, namespace, classname,
+                    deep_inheritance=None, local_only=None,
+                    include_qualifiers=None, include_class_origin=None):
+        """
+        Add the result of a class enumeration with the specified operation
+        parameters to the cache.
+
+        Each enumerated class is also added as a class entry, so that it is
+        returned by :meth:`~pywbem.ClassCache.get_class` for the same
+        parameters (and no property list).
+
+        The parameters are the same as for
+        :meth:`~pywbem.ClassCache.get_classes`, except for `classes`
+        (list of :class:`~pywbem.CIMClass`), the enumerated classes. Copies
+        of them are stored.
+        """
+        key = self._enum_key(namespace, classname, deep_inheritance,
+                             local_only, include_qualifiers,
+                             include_class_origin)
+        copies = copy.deepcopy(classes)
+        with self._lock:
+            for klass in copies:
+                self._store(self._class_key(
+                    namespace, klass.classname, local_only,
+                    include_qualifiers, include_class_origin, None), klass)
+            self._store(key, [klass.classname for klass in copies])
+
+    def invalidate(self, namespace=None):
+        """
+        Remove the cached classes and class enumerations of a CIM namespace,
+        or of all namespaces.
+
+        Because a class modification also affects its subclasses and the
+        class enumerations, all entries of the namespace are removed.
+
+        Parameters:
+
+          namespace (:term:`string`): Name of the CIM namespace, or `None`
+            for all namespaces.
+        """
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                return
+            ns = namespace.lower()
+            for key in [k for k in self._entries if k[0] == ns]:
+                del self._entries[key]
+
+    def clear(self):
+        """
+        Remove all entries from the cache.
+        """
+        self.invalidate()
@@ -0,0 +1,654 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+One-pass parser for CIM-XML that creates the CIM objects directly from the
+events of the expat XML parser, without creating a tupletree first.
+
+The result of :func:`parse_cimxml` is the same as the result of
+``parse_cim(xml_to_tupletree_sax(xml_string, meaning))``, i.e. it is
+constrained to the shape of the CIM-XML tree in the same way as described in
+the :mod:`pywbem.tupleparse` module.
+
+This parser is used instead of the tupletree based parser if the
+:data:`~pywbem.config.DIRECT_CIMXML_PARSER` config variable is set. Its
+validation of the CIM-XML elements is slightly less strict than the validation
+in :mod:`pywbem.tupleparse`; for example, unknown attributes are ignored.
+"""
+
+# Implementation:
+#
+# The parser maintains a stack of frames, one for each XML element that has
+# been started but not yet ended. A frame is a list:
+#
+#   frame[0]: element name
+#   frame[1]: dict of attributes
+#   frame[2]: list of (name, value) tuples for the completed child elements,
+#             where value is the digested form of the child element
+#   frame[3]: list of text pieces in the element
+#
+# When an element ends, the function for the element name in the _END
+# dispatch table creates the digested form of the element from its frame
+# (i.e. a CIM object, a Python value, or a tuple for the elements that
+# tupleparse returns as tuples), and adds it to the child list of the frame of
+# the parent element.
+#
+# Elements that are not in the _END dispatch table (e.g. METHOD or
+# QUALIFIER.DECLARATION, which are rare in responses) are collected as a
+# tupletree and are digested using tupleparse.parse_any() when they end, so
+# that all CIM-XML elements are supported.
+
+# This module is meant to be safe for 'import *'.
+
+from __future__ import absolute_import
+
+import sys
+from xml.parsers import expat
+import six
+
+from .cim_obj import CIMInstance, CIMInstanceName, CIMClass, CIMClassName, \
+    CIMProperty, CIMQualifier
+from .tupleparse import parse_any, parse_embeddedObject, \
+    unpack_single_value, unpack_boolean
+from .tupletree import check_invalid_utf8_sequences, check_invalid_xml_chars
+from .exceptions import ParseError
+
+__all__ = []
+
+
+def _kid_values(frame, allowed):
+    """
+    Return the values of the child elements of an element, checking that
+    their names are in `allowed`.
+    """
+    result = []
+    for kid_name, kid_value in frame[2]:
+        if kid_name not in allowed:
+            raise ParseError("Element %r has invalid child element %r "
+                             "(allowed are child elements %r)" %
+                             (frame[0], kid_name, allowed))
+        result.append(kid_value)
+    return result
+
+
+def _one_kid(frame, allowed):
+    """
+    Return the value of the only child element of an element, checking that
+    its name is in `allowed`.
+    """
+    kids = frame[2]
+    if len(kids) != 1:
+        if not kids:
+            raise ParseError("Element %r misses required child element %r" %
+                             (frame[0], allowed))
+        raise ParseError("Element %r has too many child elements %r "
+                         "(allowed is one child element %r)" %
+                         (frame[0], [k[0] for k in kids], allowed))
+    kid_name, kid_value = kids[0]
+    if kid_name not in allowed:
+        raise ParseError("Element %s has invalid child element %r "
+                         "(allowed is one child element %r)" %
+                         (frame[0], kid_name, allowed))
+    return kid_value
+
+
+def _optional_kid(frame, allowed):
+    """
+    Return the value of the optional child element of an element, or `None`.
+    """
+    if not frame[2]:
+        return None
+    return _one_kid(frame, allowed)
+
+
+def _two_kids(frame, expected):
+    """
+    Return the (name, value) tuples of the two child elements of an element.
+    """
+    kids = frame[2]
+    if len(kids) != 2:
+        raise ParseError("Element %r has invalid number of child elements %r "
+                         "(expecting two child elements %s)" %
+                         (frame[0], [k[0] for k in kids], expected))
+    return kids
+
+
+def _attr(frame, attr_name):
+    """Return the value of a required attribute of an element."""
+    try:
+        return frame[1][attr_name]
+    except KeyError:
+        raise ParseError("Element %r misses required attribute %r "
+                         "(only has attributes %r)" %
+                         (frame[0], attr_name, list(frame[1].keys())))
+
+
+def _pcdata(frame):
+    """Return the text content of an element that has no child elements."""
+    if frame[2]:
+        raise ParseError("Element %r has unexpected child elements: %r"
+                         "(allowed is only text content)" %
+                         (frame[0], [k[0] for k in frame[2]]))
+    return u''.join(frame[3])
+
+
+def _embedded_object(attrl):
+    """Return the value of the EmbeddedObject attribute, or `None`."""
+    try:
+        return attrl['EmbeddedObject']
+    except KeyError:
+        return attrl.get('EMBEDDEDOBJECT', None)
+
+
+def _unpack_value(frame):
+    """
+    Return the value of the VALUE or VALUE.ARRAY child element of an element,
+    converted to the CIM type specified in its TYPE attribute.
+    """
+    cimtype = _attr(frame, 'TYPE')
+    raw_val = None
+    found = False
+    for kid_name, kid_value in frame[2]:
+        if kid_name == 'VALUE' or kid_name == 'VALUE.ARRAY':
+            if found:
+                raise ParseError("Element %r has too many child elements "
+                                 "(allowed is one of 'VALUE' or "
+                                 "'VALUE.ARRAY')" % frame[0])
+            raw_val = kid_value
+            found = True
+    if raw_val is None:
+        return None
+    if isinstance(raw_val, list):
+        return [unpack_single_value(data, cimtype) for data in raw_val]
+    return unpack_single_value(raw_val, cimtype)
+
+
+def _matching(frame, matched):
+    """Return the values of the child elements with a name in `matched`."""
+    return [value for kid_name, value in frame[2] if kid_name in matched]
+
+
+#
+# Functions creating the digested form of an element from its frame.
+#
+
+def _end_value(frame):
+    return _pcdata(frame)
+
+
+def _end_value_null(frame):  # pylint: disable=unused-argument
+    return None
+
+
+def _end_value_array(frame):
+    return _kid_values(frame, ('VALUE', 'VALUE.NULL'))
+
+
+def _end_value_reference(frame):
+    return _one_kid(frame, ('CLASSPATH', 'LOCALCLASSPATH', 'CLASSNAME',
+                            'INSTANCEPATH', 'LOCALINSTANCEPATH',
+                            'INSTANCENAME'))
+
+
+def _end_value_refarray(frame):
+    return _kid_values(frame, ('VALUE.REFERENCE', 'VALUE.NULL'))
+
+
+def _end_namespace(frame):
+    return _attr(frame, 'NAME')
+
+
+def _end_localnamespacepath(frame):
+    ns_list = _kid_values(frame, ('NAMESPACE',))
+    if not ns_list:
+        raise ParseError("Element %r misses child elements "
+                         "(expecting one or more child elements 'NAMESPACE')" %
+                         frame[0])
+    return u'/'.join(ns_list)
+
+
+def _end_host(frame):
+    return _pcdata(frame)
+
+
+def _end_namespacepath(frame):
+    kids = _two_kids(frame, "(HOST, LOCALNAMESPACEPATH)")
+    return kids[0][1], kids[1][1]
+
+
+def _end_classname(frame):
+    return CIMClassName(_attr(frame, 'NAME'))
+
+
+def _end_classpath(frame):
+    kids = _two_kids(frame, "(NAMESPACEPATH, CLASSNAME)")
+    class_path = kids[1][1]
+    class_path.host, class_path.namespace = kids[0][1]
+    return class_path
+
+
+def _end_localclasspath(frame):
+    kids = _two_kids(frame, "(LOCALNAMESPACEPATH, CLASSNAME)")
+    class_path = kids[1][1]
+    class_path.namespace = kids[0][1]
+    return class_path
+
+
+def _end_instancepath(frame):
+    kids = _two_kids(frame, "(NAMESPACEPATH, INSTANCENAME)")
+    inst_path = kids[1][1]
+    inst_path.host, inst_path.namespace = kids[0][1]
+    return inst_path
+
+
+def _end_localinstancepath(frame):
+    kids = _two_kids(frame, "(LOCALNAMESPACEPATH, INSTANCENAME)")
+    inst_path = kids[1][1]
+    inst_path.namespace = kids[0][1]
+    return inst_path
+
+
+def _end_instancename(frame):
+    classname = _attr(frame, 'CLASSNAME')
+    kids = frame[2]
+    if not kids:
+        return CIMInstanceName(classname, {})
+    k0_name = kids[0][0]
+    if k0_name == 'KEYVALUE' or k0_name == 'VALUE.REFERENCE':
+        if len(kids) != 1:
+            raise ParseError("Element %r has more than one child element %r "
+                             "(expecting child elements "
+                             "(KEYBINDING* | KEYVALUE? | VALUE.REFERENCE?))" %
+                             (frame[0], k0_name))
+        return CIMInstanceName(classname, {None: kids[0][1]})
+    if k0_name == 'KEYBINDING':
+        kbs = {}
+        for kb_name, kb_value in _kid_values(frame, ('KEYBINDING',)):
+            kbs[kb_name] = kb_value
+        return CIMInstanceName(classname, kbs)
+    raise ParseError("Element %r has invalid child elements %r "
+                     "(expecting child elements "
+                     "(KEYBINDING* | KEYVALUE? | VALUE.REFERENCE?))" %
+                     (frame[0], [k[0] for k in kids]))
+
+
+def _end_keybinding(frame):
+    # Returned as a tuple (name, value), which is used only by INSTANCENAME.
+    return (_attr(frame, 'NAME'),
+            _one_kid(frame, ('KEYVALUE', 'VALUE.REFERENCE')))
+
+
+def _end_keyvalue(frame):
+    data = _pcdata(frame)
+    attrl = frame[1]
+    cimtype = attrl.get('TYPE', None)
+    if cimtype is None:
+        valuetype = attrl.get('VALUETYPE', 'string')
+        if valuetype == 'string' or valuetype == 'boolean':
+            cimtype = valuetype
+        elif valuetype != 'numeric':
+            raise ParseError("Element %r has invalid 'VALUETYPE' attribute "
+                             "value %r" % (frame[0], valuetype))
+    return unpack_single_value(data, cimtype)
+
+
+def _end_qualifier(frame):
+    attrl = frame[1]
+    value = _unpack_value(frame)
+    return CIMQualifier(
+        _attr(frame, 'NAME'), value, attrl['TYPE'],
+        propagated=unpack_boolean(attrl.get('PROPAGATED', 'false')),
+        overridable=unpack_boolean(attrl.get('OVERRIDABLE', 'true')),
+        tosubclass=unpack_boolean(attrl.get('TOSUBCLASS', 'true')),
+        toinstance=unpack_boolean(attrl.get('TOINSTANCE', 'false')),
+        translatable=unpack_boolean(attrl.get('TRANSLATABLE', 'false')))
+
+
+def _end_property(frame):
+    attrl = frame[1]
+    pname = _attr(frame, 'NAME')
+    try:
+        val = _unpack_value(frame)
+    except ValueError as exc:
+        raise ParseError("Cannot parse content of 'VALUE' child element of "
+                         "'PROPERTY' element with name %r: %s" %
+                         (pname, exc))
+    embedded_object = _embedded_object(attrl)
+    if embedded_object is not None:
+        val = parse_embeddedObject(val)
+    return CIMProperty(
+        pname, val, attrl['TYPE'],
+        class_origin=attrl.get('CLASSORIGIN', None),
+        propagated=unpack_boolean(attrl.get('PROPAGATED', 'false')),
+        qualifiers=_matching(frame, ('QUALIFIER',)),
+        embedded_object=embedded_object)
+
+
+def _end_property_array(frame):
+    attrl = frame[1]
+    pname = _attr(frame, 'NAME')
+    values = _unpack_value(frame)
+    array_size = attrl.get('ARRAYSIZE', None)
+    if array_size is not None:
+        array_size = int(array_size)
+    embedded_object = _embedded_object(attrl)
+    if embedded_object is not None:
+        values = parse_embeddedObject(values)
+    return CIMProperty(
+        pname, values, attrl['TYPE'],
+        class_origin=attrl.get('CLASSORIGIN', None),
+        propagated=unpack_boolean(attrl.get('PROPAGATED', 'false')),
+        qualifiers=_matching(frame, ('QUALIFIER',)),
+        is_array=True,
+        array_size=array_size,
+        embedded_object=embedded_object)
+
+
+def _end_property_reference(frame):
+    attrl = frame[1]
+    pname = _attr(frame, 'NAME')
+    value = _matching(frame, ('VALUE.REFERENCE',))
+    if not value:
+        value = None
+    elif len(value) == 1:
+        value = value[0]
+    else:
+        raise ParseError("Element %r has more than one child element "
+                         "'VALUE.REFERENCE' (allowed are zero or one)" %
+                         frame[0])
+    return CIMProperty(
+        pname, value, type='reference',
+        qualifiers=_matching(frame, ('QUALIFIER',)),
+        reference_class=attrl.get('REFERENCECLASS', None),
+        class_origin=attrl.get('CLASSORIGIN', None),
+        propagated=unpack_boolean(attrl.get('PROPAGATED', 'false')))
+
+
+_PROPERTY_ELEMENTS = ('PROPERTY', 'PROPERTY.ARRAY', 'PROPERTY.REFERENCE')
+
+
+def _end_instance(frame):
+    classname = _attr(frame, 'CLASSNAME')
+    qualifiers = []
+    props = []
+    for kid_name, kid_value in frame[2]:
+        if kid_name in _PROPERTY_ELEMENTS:
+            props.append(kid_value)
+        elif kid_name == 'QUALIFIER':
+            qualifiers.append(kid_value)
+        else:
+            raise ParseError("Element %r has invalid child element %r "
+                             "(allowed are child elements %r)" %
+                             (frame[0], kid_name,
+                              ('QUALIFIER',) + _PROPERTY_ELEMENTS))
+    return CIMInstance(classname, properties=props, qualifiers=qualifiers)
+
+
+def _end_class(frame):
+    classname = _attr(frame, 'NAME')
+    _kid_values(frame, ('QUALIFIER', 'METHOD') + _PROPERTY_ELEMENTS)
+    return CIMClass(classname,
+                    superclass=frame[1].get('SUPERCLASS', None),
+                    properties=_matching(frame, _PROPERTY_ELEMENTS),
+                    qualifiers=_matching(frame, ('QUALIFIER',)),
+                    methods=_matching(frame, ('METHOD',)))
+
+
+def _end_value_namedinstance(frame):
+    kids = _two_kids(frame, "(INSTANCENAME, INSTANCE)")
+    instance = kids[1][1]
+    instance.path = kids[0][1]
+    return instance
+
+
+def _end_value_instancewithpath(frame):
+    kids = _two_kids(frame, "(INSTANCEPATH, INSTANCE)")
+    instance = kids[1][1]
+    instance.path = kids[0][1]
+    return instance
+
+
+def _end_value_objectwithpath(frame):
+    kids = _two_kids(frame,
+                     "((CLASSPATH, CLASS) | (INSTANCEPATH, INSTANCE))")
+    if kids[0][0] == 'CLASSPATH':
+        # See tupleparse.parse_value_objectwithpath() for why this is a tuple
+        obj = (kids[0][1], kids[1][1])
+    else:
+        obj = kids[1][1]
+        obj.path = kids[0][1]
+    return frame[0], frame[1], obj
+
+
+def _end_value_object(frame):
+    return frame[0], frame[1], _one_kid(frame, ('CLASS', 'INSTANCE'))
+
+
+def _end_ireturnvalue(frame):
+    kids = frame[2]
+    if kids:
+        first = kids[0][0]
+        for kid_name, _ in kids:
+            if kid_name != first:
+                raise ParseError("Element %r has invalid child element %r "
+                                 "(sequence must have like elements %r)" %
+                                 (frame[0], kid_name, first))
+    return frame[0], frame[1], [kid[1] for kid in kids]
+
+
+def _end_returnvalue(frame):
+    child = _optional_kid(frame, ('VALUE', 'VALUE.REFERENCE'))
+    if _embedded_object(frame[1]) is not None:
+        child = parse_embeddedObject(child)
+    return frame[0], frame[1], child
+
+
+def _end_paramvalue(frame):
+    attrl = frame[1]
+    child = _optional_kid(frame, ('VALUE', 'VALUE.REFERENCE', 'VALUE.ARRAY',
+                                  'VALUE.REFARRAY', 'CLASSNAME',
+                                  'INSTANCENAME', 'CLASS', 'INSTANCE',
+                                  'VALUE.NAMEDINSTANCE'))
+    paramtype = attrl.get('PARAMTYPE', None)
+    if paramtype is None:
+        paramtype = attrl.get('TYPE', None)
+    if _embedded_object(attrl) is not None:
+        child = parse_embeddedObject(child)
+    return _attr(frame, 'NAME'), paramtype, child
+
+
+def _end_error(frame):
+    _attr(frame, 'CODE')
+    return frame[0], frame[1], None
+
+
+def _end_imethodresponse(frame):
+    _attr(frame, 'NAME')
+    return frame[0], frame[1], _kid_values(frame, ('ERROR', 'IRETURNVALUE',
+                                                   'PARAMVALUE'))
+
+
+def _end_methodresponse(frame):
+    _attr(frame, 'NAME')
+    return frame[0], frame[1], _kid_values(frame, ('ERROR', 'RETURNVALUE',
+                                                   'PARAMVALUE'))
+
+
+def _end_simplersp(frame):
+    return frame[0], frame[1], _one_kid(frame, ('METHODRESPONSE',
+                                                'IMETHODRESPONSE'))
+
+
+def _end_message(frame):
+    _attr(frame, 'ID')
+    _attr(frame, 'PROTOCOLVERSION')
+    return frame[0], frame[1], _one_kid(
+        frame, ('SIMPLEREQ', 'MULTIREQ', 'SIMPLERSP', 'MULTIRSP',
+                'SIMPLEEXPREQ', 'MULTIEXPREQ', 'SIMPLEEXPRSP', 'MULTIEXPRSP'))
+
+
+def _end_cim(frame):
+    cimversion = _attr(frame, 'CIMVERSION')
+    _attr(frame, 'DTDVERSION')
+    if not cimversion.startswith('2.'):
+        raise ParseError("CIMVERSION is %s, expected 2.x.y" % cimversion)
+    return frame[0], frame[1], _one_kid(frame, ('MESSAGE', 'DECLARATION'))
+
+
+# Dispatch table for the elements that are digested directly, with the
+# function creating the digested form of the element, and a flag indicating
+# whether the element may have non-blank text content.
+_END = {
+    'CIM': (_end_cim, False),
+    'MESSAGE': (_end_message, False),
+    'SIMPLERSP': (_end_simplersp, False),
+    'IMETHODRESPONSE': (_end_imethodresponse, False),
+    'METHODRESPONSE': (_end_methodresponse, False),
+    'ERROR': (_end_error, False),
+    'IRETURNVALUE': (_end_ireturnvalue, False),
+    'RETURNVALUE': (_end_returnvalue, False),
+    'PARAMVALUE': (_end_paramvalue, False),
+    'VALUE': (_end_value, True),
+    'VALUE.NULL': (_end_value_null, False),
+    'VALUE.ARRAY': (_end_value_array, False),
+    'VALUE.REFERENCE': (_end_value_reference, False),
+    'VALUE.REFARRAY': (_end_value_refarray, False),
+    'VALUE.OBJECT': (_end_value_object, False),
+    'VALUE.NAMEDINSTANCE': (_end_value_namedinstance, False),
+    'VALUE.INSTANCEWITHPATH': (_end_value_instancewithpath, False),
+    'VALUE.OBJECTWITHPATH': (_end_value_objectwithpath, False),
+    'NAMESPACE': (_end_namespace, False),
+    'LOCALNAMESPACEPATH': (_end_localnamespacepath, False),
+    'HOST': (_end_host, True),
+    'NAMESPACEPATH': (_end_namespacepath, False),
+    'CLASSNAME': (_end_classname, False),
+    'CLASSPATH': (_end_classpath, False),
+    'LOCALCLASSPATH': (_end_localclasspath, False),
+    'INSTANCENAME': (_end_instancename, False),
+    'INSTANCEPATH': (_end_instancepath, False),
+    'LOCALINSTANCEPATH': (_end_localinstancepath, False),
+    'KEYBINDING': (_end_keybinding, False),
+    'KEYVALUE': (_end_keyvalue, True),
+    'QUALIFIER': (_end_qualifier, False),
+    'PROPERTY': (_end_property, False),
+    'PROPERTY.ARRAY': (_end_property_array, False),
+    'PROPERTY.REFERENCE': (_end_property_reference, False),
+    'INSTANCE': (_end_instance, False),
+    'CLASS': (_end_class, False),
+}
+
+
+class _CIMXMLHandler(object):
+    # pylint: disable=too-few-public-methods
+    """
+    Expat event handlers that digest the CIM-XML elements while they are
+    being parsed.
+    """
+
+    def __init__(self):
+        self.stack = []
+        # Root element of a subtree that is collected as a tupletree, or None
+        self.raw_root = None
+        self.root = None
+
+    def start_element(self, name, attrl):
+        """Handle the start of an element."""
+        if self.raw_root is None and name in _END:
+            self.stack.append([name, attrl, [], []])
+            return
+        element = (name, attrl, [], None)
+        if self.raw_root is None:
+            self.raw_root = element
+        else:
+            self.stack[-1][2].append(element)
+        self.stack.append(element)
+
+    def end_element(self, name):
+        """Handle the end of an element."""
+        frame = self.stack.pop()
+        if self.raw_root is not None:
+            if frame is not self.raw_root:
+                return
+            self.raw_root = None
+            value = parse_any(frame)
+        else:
+            func, allow_pcdata = _END[name]
+            if not allow_pcdata and frame[3]:
+                text = u''.join(frame[3])
+                if text.lstrip(' \t\n') != '':
+                    raise ParseError("Element %r has unexpected non-blank "
+                                     "text content %r" % (name, text))
+            value = func(frame)
+        if self.stack:
+            self.stack[-1][2].append((name, value))
+        else:
+            self.root = value
+
+    def characters(self, content):
+        """Handle character data in an element."""
+        if self.raw_root is not None:
+            self.stack[-1][2].append(content)
+        else:
+            self.stack[-1][3].append(content)
+
+
+def parse_cimxml(xml_string, meaning):
+    """
+    Parse a CIM-XML document and return its digested form.
+
+    Parameters:
+
+      xml_string (:term:`string`): A unicode string or UTF-8 encoded byte
+        string containing the CIM-XML document to be parsed.
+
+      meaning (:term:`string`):
+        Short text with meaning of the XML string, for messages in exceptions.
+
+    Returns:
+
+      The same result as ``parse_cim(xml_to_tupletree_sax(xml_string,
+      meaning))``.
+
+    Raises:
+
+      pywbem.ParseError: Error detected by the expat parser, by the
+        UTF-8/XML checkers, or in the CIM-XML elements.
+    """
+
+    handler = _CIMXMLHandler()
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    parser.StartElementHandler = handler.start_element
+    parser.EndElementHandler = handler.end_element
+    parser.CharacterDataHandler = handler.characters
+
+    if isinstance(xml_string, six.text_type):
+        xml_string = xml_string.encode("utf-8")
+
+    try:
+        parser.Parse(xml_string, True)
+    except expat.ExpatError as exc:
+
+        # See xml_to_tupletree_sax() for the improvement of the exception
+        # info.
+        org_tb = sys.exc_info()[2]
+        unicode_string = check_invalid_utf8_sequences(xml_string, meaning)
+        check_invalid_xml_chars(unicode_string, meaning)
+        pe = ParseError("ExpatError raised when parsing %s: %s" %
+                        (meaning, exc))
+        six.reraise(type(pe), pe, org_tb)  # ignore this call in traceback!
+
+    return handler.root
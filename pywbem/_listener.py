@@ -144,6 +144,7 @@ from .cim_constants import CIM_ERR_NOT_SUPPORTED, CIM_ERR_INVALID_PARAMETER, \
     _statuscode2name
 from .tupleparse import parse_cim
 from .tupletree import xml_to_tupletree_sax
+from .cim_http import decode_content
 from .exceptions import ParseError, VersionError
 
 # CIM-XML protocol related versions implemented by the WBEM listener.
@@ -336,10 +337,12 @@ class ListenerRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
 
         # Content-Encoding header check described in DSP0200
         content_encoding = self.headers.get('Content-Encoding', 'identity')
-        if content_encoding.lower() != 'identity':
+        if content_encoding.strip().lower() not in ('identity', 'gzip',
+                                                    'x-gzip', 'deflate'):
             self.send_http_error(406, 'header-mismatch',
                                  'Invalid Content-Encoding header value: '
-                                 '%s (listener supports only identity)' %
+                                 '%s (listener supports only identity, gzip '
+                                 'and deflate)' %
                                  content_encoding)
             return
 
@@ -356,6 +359,7 @@ class ListenerRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
         body = self.rfile.read(content_len)
 
         try:
+            body = decode_content(body, content_encoding)
             msgid, methodname, params = self.parse_export_request(body)
         except ParseError as exc:
             self.send_http_error(400, "request-not-well-formed", str(exc))
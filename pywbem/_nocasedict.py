@@ -57,6 +57,23 @@ from .config import DEBUG_WARNING_ORIGIN
 
 __all__ = []
 
+# Dictionary type that preserves the insertion order of its items. The
+# built-in dict does that from Python 3.7 on, and needs less memory and is
+# faster than OrderedDict.
+if sys.version_info[0:2] >= (3, 7):
+    _OrderedDictType = dict  # pylint: disable=invalid-name
+else:
+    _OrderedDictType = OrderedDict  # pylint: disable=invalid-name
+
+# Cache of lower-cased string keys, by original key. Keys are typically names
+# of CIM elements, so the same keys are looked up very often. A key found in
+# this cache is known to be a string, so the type check can be skipped.
+_LOWER_KEYS = {}
+
+# Maximum number of keys in _LOWER_KEYS. Once reached, additional keys are
+# lower-cased without being cached.
+_LOWER_KEYS_MAX = 10000
+
 
 class NocaseDict(object):
     # pylint: disable=too-many-lines
@@ -86,6 +103,12 @@ class NocaseDict(object):
       * Determining length: `len(d)`
     """
 
+    # The internal dictionaries are keyed by the lower-cased keys, and have
+    # the same order of items. _data has the values, and _keys has the
+    # original keys. Using __slots__ and no tuple per item reduces the memory
+    # used by the many NocaseDict objects in CIM objects.
+    __slots__ = ('_data', '_keys', 'allow_unnamed_keys')
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the new dictionary from input arguments.
@@ -136,9 +159,10 @@ class NocaseDict(object):
         to the new dictionary.
         """
 
-        # The internal dictionary, with lower case keys. An item in this dict
-        # is the tuple (original key, value).
-        self._data = OrderedDict()
+        # The internal dictionaries, with lower case keys. An item in _data
+        # has the value, and an item in _keys has the original key.
+        self._data = _OrderedDictType()
+        self._keys = _OrderedDictType()
 
         # Flag indicating whether unnamed keys (a key of `None`) is allowed.
         # Can be set to allow unnamed keys.
@@ -156,11 +180,16 @@ class NocaseDict(object):
                     # This is used for dictionaries:
                     iterator = arg
                 for item in iterator:
-                    try:
-                        key = item.name
-                        value = item
-                    except AttributeError:
+                    # pylint: disable=unidiomatic-typecheck
+                    if type(item) is tuple:
+                        # Fast path for the most common case
                         key, value = item
+                    else:
+                        try:
+                            key = item.name
+                            value = item
+                        except AttributeError:
+                            key, value = item
                     self[key] = value
             elif isinstance(arg, (OrderedDict, NocaseDict)):
                 # Initialize from OrderedDict/NocaseDict object
@@ -194,6 +223,19 @@ class NocaseDict(object):
                           stacklevel=_stacklevel_above_module(__name__))
         self.update(kwargs)
 
+    def __getstate__(self):
+        """
+        Return the state of the object for pickling. This is needed because
+        the class uses __slots__.
+        """
+        return (self._data, self._keys, self.allow_unnamed_keys)
+
+    def __setstate__(self, state):
+        """
+        Set the state of the object when unpickling.
+        """
+        self._data, self._keys, self.allow_unnamed_keys = state
+
     # Basic accessor and settor methods
 
     def _real_key(self, key):
@@ -201,8 +243,15 @@ class NocaseDict(object):
         Return the normalized key to be used for the internal dictionary,
         from the input key.
         """
+        try:
+            return _LOWER_KEYS[key]
+        except (KeyError, TypeError):
+            pass
         if isinstance(key, six.string_types):
-            return key.lower()
+            lower_key = key.lower()
+            if len(_LOWER_KEYS) < _LOWER_KEYS_MAX:
+                _LOWER_KEYS[key] = lower_key
+            return lower_key
         elif self.allow_unnamed_keys and key is None:
             return None
         else:
@@ -220,7 +269,7 @@ class NocaseDict(object):
         """
         k = self._real_key(key)
         try:
-            return self._data[k][1]
+            return self._data[k]
         except KeyError:
             raise KeyError('Key %r not found' % key)
 
@@ -235,7 +284,8 @@ class NocaseDict(object):
         Raises `TypeError` if the specified key does not have string type.
         """
         k = self._real_key(key)
-        self._data[k] = (key, value)
+        self._data[k] = value
+        self._keys[k] = key
 
     def __delitem__(self, key):
         """
@@ -251,6 +301,7 @@ class NocaseDict(object):
             del self._data[k]
         except KeyError:
             raise KeyError('Key %r not found' % key)
+        del self._keys[k]
 
     def __len__(self):
         """
@@ -276,10 +327,7 @@ class NocaseDict(object):
 
         The key is looked up case-insensitively.
         """
-        try:
-            return self[key]
-        except KeyError:
-            return default
+        return self._data.get(self._real_key(key), default)
 
     def setdefault(self, key, default):
         """
@@ -320,16 +368,16 @@ class NocaseDict(object):
         Return an iterator through the dictionary keys in their original
         case, preserving the original order of items.
         """
-        for item in six.iteritems(self._data):
-            yield item[1][0]
+        for key in six.itervalues(self._keys):
+            yield key
 
     def itervalues(self):
         """
         Return an iterator through the dictionary values, preserving the
         original order of items.
         """
-        for item in six.iteritems(self._data):
-            yield item[1][1]
+        for value in six.itervalues(self._data):
+            yield value
 
     def iteritems(self):
         """
@@ -337,8 +385,9 @@ class NocaseDict(object):
         tuple of its original key and its value, preserving the original order
         of items.
         """
-        for item in six.iteritems(self._data):
-            yield item[1]
+        keys = self._keys
+        for k, value in six.iteritems(self._data):
+            yield keys[k], value
 
     def __iter__(self):
         """
@@ -405,6 +454,7 @@ class NocaseDict(object):
         Remove all items from the dictionary.
         """
         self._data.clear()
+        self._keys.clear()
 
     def copy(self):
         """
@@ -420,7 +470,9 @@ class NocaseDict(object):
         completely deep copies of objects of this class.
         """
         result = NocaseDict()
-        result._data = self._data.copy()  # pylint: disable=protected-access
+        # pylint: disable=protected-access
+        result._data = self._data.copy()
+        result._keys = self._keys.copy()
         return result
 
     def __eq__(self, other):
@@ -462,11 +514,20 @@ class NocaseDict(object):
 
     def __lt__(self, other):
         self.__ordering_deprecated()
-        # Delegate to the underlying standard dictionary. This will result in
-        # a case sensitive comparison, but that will be better than the faulty
+        # Delegate to standard dictionaries. This will result in a case
+        # sensitive comparison, but that will be better than the faulty
         # algorithm that was used before. It will raise TypeError "unorderable
         # types" in Python 3.
-        return self._data < other._data  # pylint: disable=protected-access
+        # pylint: disable=protected-access
+        return self._cmp_dict() < other._cmp_dict()
+
+    def _cmp_dict(self):
+        """
+        Return a standard dictionary with the lower-cased keys and tuples of
+        original key and value, for the ordering comparisons.
+        """
+        return dict([(k, (self._keys[k], v))
+                     for k, v in six.iteritems(self._data)])
 
     def __gt__(self, other):
         """
@@ -506,5 +567,5 @@ class NocaseDict(object):
         hashable objects which compare equal must have the same hash value.
         This method ensures that that condition is satisfied.
         """
-        fs = frozenset([(k, self._data[k][1]) for k in self._data])
+        fs = frozenset(six.iteritems(self._data))
         return hash(fs)
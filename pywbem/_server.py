@@ -94,7 +94,12 @@ Example output:
       DMTF Indications Profile 1.1.0
 """
 
+import copy
 import re
+import threading
+import time
+
+from six.moves import queue
 
 from .cim_constants import CIM_ERR_INVALID_NAMESPACE, CIM_ERR_INVALID_CLASS, \
     CIM_ERR_METHOD_NOT_FOUND, CIM_ERR_METHOD_NOT_AVAILABLE, \
@@ -104,6 +109,7 @@ from ._nocasedict import NocaseDict
 from .cim_obj import CIMInstanceName
 from .cim_operations import WBEMConnection
 from ._valuemapping import ValueMapping
+from ._statistics import Statistics
 
 __all__ = ['WBEMServer']
 
@@ -143,23 +149,67 @@ class WBEMServer(object):
         '__Namespace',
     ]
 
-    def __init__(self, conn):
+    # Process-wide cache of the information discovered about WBEM servers,
+    # for WBEMServer objects with a discovery_cache_ttl.
+    # Key: tuple(lower-cased URL, user name or None); value: tuple(expiry time,
+    # dict(attr: value)).
+    _discovery_cache = {}
+    _discovery_cache_lock = threading.Lock()
+
+    # Attributes of WBEMServer objects that are kept in the discovery cache
+    _DISCOVERY_ATTRS = ('_interop_ns', '_namespaces', '_namespace_classname',
+                        '_brand', '_version', '_profiles')
+
+    def __init__(self, conn, discovery_workers=None,
+                 discovery_cache_ttl=None):
         """
         Parameters:
 
           conn (:class:`~pywbem.WBEMConnection`):
             Connection to the WBEM server.
+
+          discovery_workers (:term:`integer`):
+            *New in pywbem 0.13 as experimental.*
+
+            Maximum number of operations that :meth:`discover` performs
+            concurrently, each on its own copy of the connection.
+
+            `None` or 1 means that the operations are performed one after
+            another on the connection.
+
+          discovery_cache_ttl (:term:`number`):
+            *New in pywbem 0.13 as experimental.*
+
+            Time to live in seconds of the information about the WBEM server
+            (Interop namespace, namespaces, brand, version and profiles) in a
+            process-wide cache that is shared by the
+            :class:`~pywbem.WBEMServer` objects for the same URL and user
+            name. The information that has been determined by one of these
+            objects is not determined again by the others, until it expires.
+            See :meth:`~pywbem.WBEMServer.clear_discovery_cache`.
+
+            `None` means that the cache is not used.
         """
         if not isinstance(conn, WBEMConnection):
             raise TypeError("conn argument of WBEMServer must be a "
                             "WBEMConnection object")
+        if discovery_workers is not None and discovery_workers < 1:
+            raise ValueError("discovery_workers must be at least 1, but is "
+                             "%s" % discovery_workers)
+        if discovery_cache_ttl is not None and discovery_cache_ttl <= 0:
+            raise ValueError("discovery_cache_ttl must be a positive number "
+                             "or None, but is: %r" % discovery_cache_ttl)
         self._conn = conn
+        self._discovery_workers = discovery_workers
+        self._discovery_cache_ttl = discovery_cache_ttl
         self._interop_ns = None
         self._namespaces = None
         self._namespace_classname = None
         self._brand = None
         self._version = None
         self._profiles = None
+        if discovery_cache_ttl is not None:
+            self._load_discovery_cache()
 
     def __repr__(self):
         """
@@ -187,6 +237,23 @@ class WBEMServer(object):
         """
         return self._conn
 
+    @property
+    def discovery_workers(self):
+        """
+        :term:`integer`: Maximum number of operations that :meth:`discover`
+        performs concurrently, or `None`.
+        """
+        return self._discovery_workers
+
+    @property
+    def discovery_cache_ttl(self):
+        """
+        :term:`number`: Time to live in seconds of the information about the
+        WBEM server in the process-wide discovery cache, or `None` if the
+        cache is not used.
+        """
+        return self._discovery_cache_ttl
+
     @property
     def interop_ns(self):
         """
@@ -298,6 +365,213 @@ class WBEMServer(object):
             self._determine_profiles()
         return self._profiles
 
+    @classmethod
+    def clear_discovery_cache(cls):
+        """
+        *New in pywbem 0.13 as experimental.*
+
+        Remove the information about all WBEM servers from the process-wide
+        discovery cache that is used by :class:`~pywbem.WBEMServer` objects
+        with a `discovery_cache_ttl`.
+
+        This does not change the information already known by existing
+        :class:`~pywbem.WBEMServer` objects.
+        """
+        with cls._discovery_cache_lock:
+            cls._discovery_cache.clear()
+
+    def discover(self):
+        """
+        *New in pywbem 0.13 as experimental.*
+
+        Determine the Interop namespace, the namespaces, the brand and
+        version, and the advertised management profiles of the WBEM server,
+        as far as they are not yet known.
+
+        Normally, this information is determined when it is first accessed
+        through the corresponding properties. Calling this method determines
+        all of it upfront, in as few round trips as possible:
+
+        If the `discovery_workers` init parameter is greater than 1, the
+        candidate Interop namespaces defined in :attr:`INTEROP_NAMESPACES`
+        are probed concurrently, and then the namespaces, the brand and
+        version, and the profiles are retrieved concurrently. Each of these
+        operations is performed on its own shallow copy of the connection,
+        that shares the persistent HTTP connections and the class cache of
+        the connection. The statistics of these operations are added to the
+        statistics of the connection. If operation recorders have been added
+        to the connection, the operations are performed one after another
+        on the connection, so that they are all recorded.
+
+        Raises:
+
+            Exceptions raised by :class:`~pywbem.WBEMConnection`.
+            CIMError: CIM_ERR_NOT_FOUND, Interop namespace could not be
+              determined.
+            CIMError: CIM_ERR_NOT_FOUND, Namespace class could not be
+              determined.
+            CIMError: CIM_ERR_NOT_FOUND, Unexpected number of
+              `CIM_ObjectManager` instances.
+        """
+        if not self._concurrent_discovery():
+            for name in ('interop_ns', 'namespaces', 'brand', 'profiles'):
+                getattr(self, name)
+            return
+
+        if self._interop_ns is None:
+            candidates = list(self.INTEROP_NAMESPACES)
+            results = self._run_concurrently(
+                [lambda conn, ns=ns: self._probe_interop_ns(conn, ns)
+                 for ns in candidates])
+            # Use the first candidate in the list that exists, as in the
+            # sequential case.
+            for ns_result, exc in results:
+                if exc is not None:
+                    raise exc
+                if ns_result is not None:
+                    self._interop_ns = ns_result
+                    self._store_discovery_cache()
+                    break
+            else:
+                raise CIMError(CIM_ERR_NOT_FOUND,
+                               "Interop namespace could not be determined "
+                               "(tried %s)" % candidates)
+
+        funcs = []
+        if self._namespaces is None:
+            funcs.append(self._determine_namespaces)
+        if self._brand is None:
+            funcs.append(self._determine_brand)
+        if self._profiles is None:
+            funcs.append(self._determine_profiles)
+        for _, exc in self._run_concurrently(funcs):
+            if exc is not None:
+                raise exc
+
+    def _concurrent_discovery(self):
+        """
+        Return a boolean indicating whether :meth:`discover` performs its
+        operations concurrently.
+        """
+        return self._discovery_workers is not None and \
+            self._discovery_workers > 1 and \
+            not self._conn.operation_recorders
+
+    def _worker_conn(self):
+        """
+        Return a connection for performing operations concurrently with
+        other operations: A shallow copy of the connection of this object
+        that has its own state for the current operation and its own
+        statistics.
+        """
+        conn = copy.copy(self._conn)
+        # pylint: disable=protected-access
+        conn._operation_recorders = []
+        conn._last_transfer_lens = [0, 0]
+        conn._statistics = Statistics(self._conn.statistics.enabled)
+        return conn
+
+    def _run_concurrently(self, funcs, max_workers=None):
+        """
+        Call the specified functions concurrently, using at most
+        `max_workers` threads (default: `discovery_workers`), each with its
+        own connection that is passed to the functions as their only
+        argument.
+
+        Returns:
+
+          list of tuple(result, exception): The result of each function, or
+          the exception it raised, in the order of the functions.
+        """
+        results = [(None, None)] * len(funcs)
+        tasks = queue.Queue()
+        for i in range(len(funcs)):
+            tasks.put(i)
+        if max_workers is None:
+            max_workers = self._discovery_workers
+        num_workers = min(len(funcs), max_workers)
+        conns = [self._worker_conn() for _ in range(num_workers)]
+
+        def worker(conn):
+            """Call functions until there are no more tasks."""
+            while True:
+                try:
+                    i = tasks.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    results[i] = (funcs[i](conn), None)
+                except Exception as exc:  # pylint: disable=broad-except
+                    results[i] = (None, exc)
+
+        threads = [threading.Thread(target=worker, args=(conn,))
+                   for conn in conns]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for conn in conns:
+            self._conn.statistics.merge(conn.statistics)
+        return results
+
+    def _load_discovery_cache(self):
+        """
+        Set the information about the WBEM server from the discovery cache,
+        if it has an entry for the URL of the WBEM server that has not
+        expired.
+        """
+        key = self._discovery_cache_key()
+        with self._discovery_cache_lock:
+            try:
+                expiry, attrs = self._discovery_cache[key]
+            except KeyError:
+                return
+            if expiry <= time.time():
+                del self._discovery_cache[key]
+                return
+            for name, value in attrs.items():
+                if isinstance(value, list):
+                    value = list(value)
+                setattr(self, name, value)
+
+    def _store_discovery_cache(self):
+        """
+        Add the information about the WBEM server that is known by this
+        object to the discovery cache, if the cache is used.
+
+        A new cache entry expires after `discovery_cache_ttl` seconds, and
+        information that is added to an existing entry expires with it.
+        Information that is already in the entry is not replaced.
+        """
+        if self._discovery_cache_ttl is None:
+            return
+        key = self._discovery_cache_key()
+        now = time.time()
+        with self._discovery_cache_lock:
+            entry = self._discovery_cache.get(key)
+            if entry is None or entry[0] <= now:
+                entry = (now + self._discovery_cache_ttl, {})
+                self._discovery_cache[key] = entry
+            attrs = entry[1]
+            for name in self._DISCOVERY_ATTRS:
+                value = getattr(self, name)
+                if value is None or name in attrs:
+                    continue
+                if isinstance(value, list):
+                    value = list(value)
+                attrs[name] = value
+
+    def _discovery_cache_key(self):
+        """
+        Return the key of the entry for this WBEM server in the discovery
+        cache. It includes the user name, because the information about the
+        WBEM server can depend on the authorization of the user.
+        """
+        creds = self._conn.creds
+        user = creds[0] if creds else None
+        return (self.url.lower(), user)
+
     def get_selected_profiles(self, registered_org=None, registered_name=None,
                               registered_version=None):
         """
@@ -444,10 +718,127 @@ class WBEMServer(object):
         if not isinstance(profile_path, CIMInstanceName):
             raise TypeError("profile_path must be a CIMInstanceName, but is "
                             "a %s" % type(profile_path))
+        return self._get_central_instances(self._conn, profile_path,
+                                           central_class, scoping_class,
+                                           scoping_path)
+
+    def get_central_instances_bulk(self, profiles, max_workers=None,
+                                   max_object_count=1000):
+        # pylint: disable=line-too-long
+        """
+        *New in pywbem 0.13 as experimental.*
+
+        Return the instance paths of the central instances of multiple
+        management profiles.
+
+        This method determines the central instances of each profile in the
+        same way as :meth:`~pywbem.WBEMServer.get_central_instances`, but is
+        faster for many profiles or many scoping instances:
+
+        * The association traversals are performed with
+          :meth:`~pywbem.WBEMConnection.IterAssociatorInstancePaths`, using
+          `max_object_count`. That uses the pull operations if they are
+          enabled on the connection (see its `use_pull_operations` init
+          parameter).
+
+        * The results of the association traversals, and the central
+          instances determined for the profiles (including referencing
+          profiles at upper levels of the scoping class methodology), are
+          kept for the duration of the call. Profiles that share the same
+          referencing profile or scoping instances therefore cause the
+          corresponding operations only once.
+
+        * If `max_workers` is greater than 1, the profiles are processed
+          concurrently, and so are the traversals from the scoping instances
+          down to the central instances of each profile. Each thread uses
+          its own shallow copy of the connection, as described for
+          :meth:`~pywbem.WBEMServer.discover`. If operation recorders have
+          been added to the connection, the operations are performed one
+          after another on the connection.
+
+        Parameters:
+
+          profiles (:term:`py:iterable`):
+            The management profiles. Each item is either the instance path of
+            the `CIM_RegisteredProfile` instance (a
+            :class:`~pywbem.CIMInstanceName`), or a tuple of
+            (`profile_path`, `central_class`, `scoping_class`,
+            `scoping_path`) with the meaning of the parameters of
+            :meth:`~pywbem.WBEMServer.get_central_instances`.
+
+          max_workers (:term:`integer`):
+            Maximum number of threads that process the profiles concurrently,
+            and maximum number of threads that perform the traversals down to
+            the central instances for each profile.
+            `None` or 1 means that all operations are performed one after
+            another on the connection.
+
+          max_object_count (:term:`integer`):
+            Maximum number of instance paths returned by each open or pull
+            operation of the association traversals.
+
+        Returns:
+
+          :class:`py:list` of :class:`py:list` of :class:`~pywbem.CIMInstanceName`:
+          The instance paths of the central instances of each management
+          profile, in the order of the profiles.
+
+        Raises:
+
+            Exceptions raised by :class:`~pywbem.WBEMConnection`.
+            ValueError: Various errors in scoping path traversal.
+            TypeError: A profile path must be a
+              :class:`~pywbem.CIMInstanceName`.
+
+            If the central instances of more than one profile cannot be
+            determined, the exception for the first of these profiles is
+            raised.
+        """  # noqa: E501
+        # pylint: enable=line-too-long
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1, but is %s" %
+                             max_workers)
+        profile_args = []
+        for profile in profiles:
+            if not isinstance(profile, tuple):
+                profile = (profile, None, None, None)
+            if not isinstance(profile[0], CIMInstanceName):
+                raise TypeError("profile_path must be a CIMInstanceName, but "
+                                "is a %s" % type(profile[0]))
+            profile_args.append(profile)
+
+        resolver = _CentralInstancesResolver(self, max_workers,
+                                             max_object_count)
+        results = resolver.run(
+            [lambda conn, args=args: resolver.central_instances(conn, *args)
+             for args in profile_args])
+        for _, exc in results:
+            if exc is not None:
+                raise exc
+        return [list(ci_paths) for ci_paths, _ in results]
+
+    def _get_central_instances(self, conn, profile_path, central_class,
+                               scoping_class, scoping_path, resolver=None):
+        """
+        Return the instance paths of the central instances of a management
+        profile, using the specified connection.
+
+        If a :class:`_CentralInstancesResolver` object is specified, it is
+        used for the association traversals and for determining the central
+        instances at the upper levels of the scoping class methodology.
+
+        For details, see :meth:`get_central_instances`.
+        """
+        if resolver is None:
+            associator_names = conn.AssociatorNames
+        else:
+            def associator_names(**kwargs):
+                """Memoized association traversal."""
+                return resolver.associator_names(conn, **kwargs)
 
         # Try GetCentralInstances() method:
         try:
-            (ret_val, out_params) = self._conn.InvokeMethod(
+            (ret_val, out_params) = conn.InvokeMethod(
                 MethodName="GetCentralInstances",
                 ObjectName=profile_path)
         except CIMError as exc:
@@ -467,7 +858,7 @@ class WBEMServer(object):
             return out_params['CentralInstances']
 
         # Try central methodology
-        ci_paths = self._conn.AssociatorNames(
+        ci_paths = associator_names(
             ObjectName=profile_path,
             AssocClass="CIM_ElementConformsToProfile",
             ResultRole="ManagedElement")
@@ -484,7 +875,7 @@ class WBEMServer(object):
                              "class methodology were not specified")
 
         # Go up one level on the profile side
-        referencing_profile_paths = self._conn.AssociatorNames(
+        referencing_profile_paths = associator_names(
             ObjectName=profile_path,
             AssocClass="CIM_ReferencedProfile",
             ResultRole="Dependent")
@@ -502,21 +893,31 @@ class WBEMServer(object):
         else:
             upper_central_class = None
             upper_scoping_path = None
-        scoping_inst_paths = self.get_central_instances(
-            referencing_profile_paths[0],
-            upper_central_class, scoping_class, upper_scoping_path)
+        if resolver is None:
+            scoping_inst_paths = self._get_central_instances(
+                conn, referencing_profile_paths[0],
+                upper_central_class, scoping_class, upper_scoping_path)
+        else:
+            scoping_inst_paths = resolver.central_instances(
+                conn, referencing_profile_paths[0],
+                upper_central_class, scoping_class, upper_scoping_path)
         if not scoping_inst_paths:
             raise ValueError("No scoping instances found")
 
         # Go down one level on the resource side (using the last
         # entry in the scoping path as the association to traverse)
-        total_ci_paths = []
         assoc_class = scoping_path[-1]
-        for ip in scoping_inst_paths:
-            ci_paths = self._conn.AssociatorNames(
-                ObjectName=ip,
-                AssocClass=assoc_class,
+        if resolver is None:
+            ci_paths_list = (associator_names(ObjectName=ip,
+                                              AssocClass=assoc_class,
+                                              ResultClass=central_class)
+                             for ip in scoping_inst_paths)
+        else:
+            ci_paths_list = resolver.associator_names_many(
+                scoping_inst_paths, AssocClass=assoc_class,
                 ResultClass=central_class)
+        total_ci_paths = []
+        for ci_paths in ci_paths_list:
             if not ci_paths:
                 # At least one central instance for each scoping instance
                 raise ValueError("No central instances found traversing down "
@@ -544,33 +945,10 @@ class WBEMServer(object):
             CIMError: CIM_ERR_NOT_FOUND, Interop namespace could not be
               determined.
         """
-        test_classname = 'CIM_Namespace'
         interop_ns = None
         for ns in self.INTEROP_NAMESPACES:
-            try:
-                inst_paths = self._conn.EnumerateInstanceNames(test_classname,
-                                                               namespace=ns)
-            except CIMError as exc:
-                if exc.status_code == CIM_ERR_INVALID_NAMESPACE:
-                    # Current namespace does not exist.
-                    continue
-                elif exc.status_code in (CIM_ERR_INVALID_CLASS,
-                                         CIM_ERR_NOT_FOUND):
-                    # Class is not implemented, but current namespace exists.
-                    interop_ns = ns
-                    break
-                else:
-                    # Some other error happened.
-                    raise
-            else:
-                # Namespace class is implemented in the current namespace.
-                # Use the returned namespace name, if possible.
-                ns_names = [p.keybindings['name'] for p in inst_paths]
-                ns_dict = NocaseDict(list(zip(ns_names, ns_names)))
-                try:
-                    interop_ns = ns_dict[ns]
-                except KeyError:
-                    interop_ns = ns
+            interop_ns = self._probe_interop_ns(self._conn, ns)
+            if interop_ns is not None:
                 break
         if interop_ns is None:
             # Exhausted the possible namespaces
@@ -578,6 +956,46 @@ class WBEMServer(object):
                            "Interop namespace could not be determined "
                            "(tried %s)" % self.INTEROP_NAMESPACES)
         self._interop_ns = interop_ns
+        self._store_discovery_cache()
+
+    @staticmethod
+    def _probe_interop_ns(conn, ns):
+        """
+        Probe whether a namespace exists in the WBEM server, for determining
+        the Interop namespace.
+
+        Returns:
+
+          :term:`string`: The name of the namespace as returned by the WBEM
+          server if possible, or otherwise as specified, or `None` if the
+          namespace does not exist.
+
+        Raises:
+
+            Exceptions raised by :class:`~pywbem.WBEMConnection`.
+        """
+        test_classname = 'CIM_Namespace'
+        try:
+            inst_paths = conn.EnumerateInstanceNames(test_classname,
+                                                     namespace=ns)
+        except CIMError as exc:
+            if exc.status_code == CIM_ERR_INVALID_NAMESPACE:
+                # Current namespace does not exist.
+                return None
+            elif exc.status_code in (CIM_ERR_INVALID_CLASS,
+                                     CIM_ERR_NOT_FOUND):
+                # Class is not implemented, but current namespace exists.
+                return ns
+            # Some other error happened.
+            raise
+        # Namespace class is implemented in the current namespace.
+        # Use the returned namespace name, if possible.
+        ns_names = [p.keybindings['name'] for p in inst_paths]
+        ns_dict = NocaseDict(list(zip(ns_names, ns_names)))
+        try:
+            return ns_dict[ns]
+        except KeyError:
+            return ns
 
     def _validate_interop_ns(self, interop_ns):
         """
@@ -611,8 +1029,9 @@ class WBEMServer(object):
             else:
                 raise
         self._interop_ns = interop_ns
+        self._store_discovery_cache()
 
-    def _determine_namespaces(self):
+    def _determine_namespaces(self, conn=None):
         """
         Determine the names of all namespaces of the WBEM server, by
         communicating with it and enumerating the instances of a number of
@@ -626,6 +1045,12 @@ class WBEMServer(object):
         namespaces, and returns.
         Otherwise, it raises an exception.
 
+        Parameters:
+
+          conn (:class:`~pywbem.WBEMConnection`):
+            Connection to be used, or `None` for the connection of this
+            object.
+
         Raises:
 
             Exceptions raised by :class:`~pywbem.WBEMConnection`.
@@ -634,11 +1059,12 @@ class WBEMServer(object):
             CIMError: CIM_ERR_NOT_FOUND, Namespace class could not be
               determined.
         """
+        conn = conn or self._conn
         ns_insts = None
         ns_classname = None
         for classname in self.NAMESPACE_CLASSNAMES:
             try:
-                ns_insts = self._conn.EnumerateInstances(
+                ns_insts = conn.EnumerateInstances(
                     classname, namespace=self.interop_ns)
             except CIMError as exc:
                 if exc.status_code in (CIM_ERR_INVALID_CLASS,
@@ -659,8 +1085,9 @@ class WBEMServer(object):
                            "(tried %s)" % self.NAMESPACE_CLASSNAMES)
         self._namespace_classname = ns_classname
         self._namespaces = [inst['Name'] for inst in ns_insts]
+        self._store_discovery_cache()
 
-    def _determine_brand(self):
+    def _determine_brand(self, conn=None):
         """
         Determine the brand of the WBEM server (e.g. OpenPegasus, SFCB, ...)
         and its version, by communicating with it and retrieving the
@@ -670,6 +1097,12 @@ class WBEMServer(object):
         properties of this object and returns.
         Otherwise, it raises an exception.
 
+        Parameters:
+
+          conn (:class:`~pywbem.WBEMConnection`):
+            Connection to be used, or `None` for the connection of this
+            object.
+
         Raises:
 
             Exceptions raised by :class:`~pywbem.WBEMConnection`.
@@ -678,7 +1111,8 @@ class WBEMServer(object):
             CIMError: CIM_ERR_NOT_FOUND, Unexpected number of
               `CIM_ObjectManager` instances.
         """
-        cimom_insts = self._conn.EnumerateInstances(
+        conn = conn or self._conn
+        cimom_insts = conn.EnumerateInstances(
             "CIM_ObjectManager", namespace=self.interop_ns)
         if len(cimom_insts) != 1:
             raise CIMError(CIM_ERR_NOT_FOUND,
@@ -708,8 +1142,9 @@ class WBEMServer(object):
             version = None
         self._brand = brand
         self._version = version
+        self._store_discovery_cache()
 
-    def _determine_profiles(self):
+    def _determine_profiles(self, conn=None):
         """
         Determine the WBEM management profiles advertised by the WBEM server,
         by communicating with it and enumerating the instances of
@@ -721,12 +1156,148 @@ class WBEMServer(object):
         objects), and returns.
         Otherwise, it raises an exception.
 
+        Parameters:
+
+          conn (:class:`~pywbem.WBEMConnection`):
+            Connection to be used, or `None` for the connection of this
+            object.
+
         Raises:
 
             Exceptions raised by :class:`~pywbem.WBEMConnection`.
             CIMError: CIM_ERR_NOT_FOUND, Interop namespace could not be
               determined.
         """
-        mp_insts = self._conn.EnumerateInstances("CIM_RegisteredProfile",
-                                                 namespace=self.interop_ns)
+        conn = conn or self._conn
+        mp_insts = conn.EnumerateInstances("CIM_RegisteredProfile",
+                                           namespace=self.interop_ns)
         self._profiles = mp_insts
+        self._store_discovery_cache()
+
+
+class _CentralInstancesResolver(object):
+    """
+    Determines the central instances of management profiles for
+    :meth:`WBEMServer.get_central_instances_bulk`, memoizing the results of
+    the association traversals and the central instances of each profile.
+
+    The memoized results are shared by the threads of the resolver; a result
+    that is being determined by one thread is waited for by the others.
+    """
+
+    def __init__(self, server, max_workers, max_object_count):
+        self._server = server
+        self._max_workers = max_workers
+        self._max_object_count = max_object_count
+        self._lock = threading.Lock()
+        # Memoized results. Key: tuple; value: list(event, result, exc)
+        self._memo = {}
+
+    def run(self, funcs):
+        """
+        Call the specified functions with a connection as their only
+        argument, concurrently if the resolver has more than one worker.
+
+        Returns:
+
+          list of tuple(result, exception): The result of each function, or
+          the exception it raised, in the order of the functions.
+        """
+        server = self._server
+        # pylint: disable=protected-access
+        if self._max_workers is None or self._max_workers <= 1 or \
+                len(funcs) <= 1 or server.conn.operation_recorders:
+            results = []
+            for func in funcs:
+                try:
+                    results.append((func(server.conn), None))
+                except Exception as exc:  # pylint: disable=broad-except
+                    results.append((None, exc))
+            return results
+        return server._run_concurrently(funcs, self._max_workers)
+
+    @staticmethod
+    def _path_key(path):
+        """
+        Return the instance path for use in a memo key, without host,
+        because the paths returned by the WBEM server may have a host while
+        the paths specified by the user may not.
+        """
+        if path.host is None:
+            return path
+        path = path.copy()
+        path.host = None
+        return path
+
+    def _memoized(self, key, func):
+        """
+        Return the memoized result for the key, calling the function to
+        determine it if needed. An exception raised by the function is
+        memoized and raised as well.
+        """
+        with self._lock:
+            entry = self._memo.get(key)
+            owner = entry is None
+            if owner:
+                entry = [threading.Event(), None, None]
+                self._memo[key] = entry
+        if owner:
+            try:
+                entry[1] = func()
+            except Exception as exc:  # pylint: disable=broad-except
+                entry[2] = exc
+            entry[0].set()
+        else:
+            entry[0].wait()
+        if entry[2] is not None:
+            raise entry[2]
+        return entry[1]
+
+    def associator_names(self, conn, ObjectName, AssocClass, ResultClass=None,
+                         ResultRole=None):
+        # pylint: disable=invalid-name
+        """
+        Return the memoized instance paths of the instances associated with
+        an instance.
+        """
+        key = ('assoc', self._path_key(ObjectName), AssocClass.lower(),
+               ResultClass.lower() if ResultClass else None,
+               ResultRole.lower() if ResultRole else None)
+        return self._memoized(key, lambda: list(
+            conn.IterAssociatorInstancePaths(
+                ObjectName, AssocClass=AssocClass, ResultClass=ResultClass,
+                ResultRole=ResultRole,
+                MaxObjectCount=self._max_object_count)))
+
+    def associator_names_many(self, object_names, AssocClass,
+                              ResultClass=None):
+        # pylint: disable=invalid-name
+        """
+        Return the memoized instance paths of the instances associated with
+        each of the instances, in the order of the instances.
+        """
+        results = self.run(
+            [lambda conn, ip=ip: self.associator_names(
+                conn, ObjectName=ip, AssocClass=AssocClass,
+                ResultClass=ResultClass)
+             for ip in object_names])
+        for _, exc in results:
+            if exc is not None:
+                raise exc
+        return [paths for paths, _ in results]
+
+    def central_instances(self, conn, profile_path, central_class,
+                          scoping_class, scoping_path):
+        """
+        Return the memoized instance paths of the central instances of a
+        management profile.
+        """
+        key = ('central', self._path_key(profile_path),
+               central_class.lower() if central_class else None,
+               scoping_class.lower() if scoping_class else None,
+               tuple(c.lower() for c in scoping_path)
+               if scoping_path is not None else None)
+        # pylint: disable=protected-access
+        return self._memoized(key, lambda: self._server._get_central_instances(
+            conn, profile_path, central_class, scoping_class, scoping_path,
+            resolver=self))
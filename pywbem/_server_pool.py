@@ -0,0 +1,325 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+*New in pywbem 0.13 as experimental.*
+
+The :class:`~pywbem.WBEMServerPool` class performs the same WBEM operation
+on a group of WBEM servers concurrently, using a pool of threads. The results
+are returned per WBEM server, in the order in which the operations complete.
+
+Example::
+
+    pool = pywbem.WBEMServerPool(
+        ['https://server1', 'https://server2', 'https://server3'],
+        creds=('user', 'password'), max_workers=2, timeout=30,
+        stats_enabled=True)
+
+    for conn, result, exc in pool.map('EnumerateInstances',
+                                      'CIM_ComputerSystem'):
+        if exc:
+            print('%s: failed: %s' % (conn.url, exc))
+        else:
+            print('%s: %s instances' % (conn.url, len(result)))
+
+    print(pool.statistics.formatted())
+"""
+
+from __future__ import absolute_import
+
+import threading
+import time
+import types
+from collections import namedtuple
+
+import six
+from six.moves import queue
+
+from .cim_operations import WBEMConnection
+from .exceptions import TimeoutError
+from ._statistics import Statistics
+
+__all__ = ['WBEMServerPool']
+
+# Result of an operation on one WBEM server of a WBEMServerPool
+# pylint: disable=invalid-name
+pool_result_tuple = namedtuple("pool_result_tuple",
+                               ["conn", "result", "exception"])
+
+
+class WBEMServerPool(object):
+    """
+    *New in pywbem 0.13 as experimental.*
+
+    A group of connections to WBEM servers, for performing the same WBEM
+    operation on all of them concurrently.
+
+    The operations are performed by a pool of threads. Each connection is
+    used by at most one thread at a time, so the connections do not need
+    to be thread-safe beyond that: If the operation on a connection timed out
+    and is still running, :meth:`map` does not perform another operation on
+    that connection until it has completed.
+    """
+
+    def __init__(self, connections, creds=None, max_workers=None,
+                 timeout=None, **kwargs):
+        """
+        Parameters:
+
+          connections (:term:`py:iterable`):
+            The WBEM servers of the pool. Each item is either a
+            :class:`~pywbem.WBEMConnection` object, or a URL string for which
+            a :class:`~pywbem.WBEMConnection` object is created.
+
+          creds:
+            Credentials for the connections that are created from URL
+            strings. For details, see the `creds` parameter of
+            :class:`~pywbem.WBEMConnection`.
+
+          max_workers (:term:`integer`):
+            Maximum number of operations that are performed concurrently.
+            `None` means one per WBEM server.
+
+          timeout (:term:`number`):
+            Timeout in seconds for the operation on each WBEM server,
+            measured from the start of the operation on that server. If the
+            operation does not complete in time, a
+            :exc:`~pywbem.TimeoutError` is returned for that server. Its
+            thread can only end when the operation returns, so it still
+            counts against `max_workers` until then. The timeout is also
+            used as the socket timeout of connections that are created from
+            URL strings.
+
+            `None` means that the operations are not timed out by the pool.
+
+          kwargs:
+            Additional init parameters for the connections that are created
+            from URL strings (e.g. `default_namespace`, `stats_enabled`).
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError('max_workers must be at least 1, but is %s' %
+                             max_workers)
+        self._max_workers = max_workers
+        self._timeout = timeout
+        self._connections = []
+        for conn in connections:
+            if isinstance(conn, six.string_types):
+                conn = WBEMConnection(conn, creds, timeout=timeout, **kwargs)
+            elif not isinstance(conn, WBEMConnection):
+                raise TypeError('Expecting a WBEMConnection object or URL '
+                                'string, got: %s' % type(conn))
+            self._connections.append(conn)
+        # Indexes of the connections on which an operation is running or
+        # about to be started, protected by _lock.
+        self._busy = set()
+        self._lock = threading.Lock()
+
+    @property
+    def connections(self):
+        """
+        :class:`py:list` of :class:`~pywbem.WBEMConnection`: The connections
+        to the WBEM servers of the pool.
+        """
+        return list(self._connections)
+
+    @property
+    def max_workers(self):
+        """
+        :term:`integer`: Maximum number of operations that are performed
+        concurrently, or `None` for one per WBEM server.
+        """
+        return self._max_workers
+
+    @property
+    def timeout(self):
+        """
+        :term:`number`: Timeout in seconds for the operation on each WBEM
+        server, or `None`.
+        """
+        return self._timeout
+
+    @property
+    def statistics(self):
+        """
+        :class:`~pywbem.Statistics`: The statistics of all connections of
+        the pool, aggregated into a new statistics container.
+
+        Only operations performed on connections with enabled statistics
+        are included (see the `stats_enabled` parameter of
+        :class:`~pywbem.WBEMConnection`).
+        """
+        stats = Statistics(enable=True)
+        for conn in self._connections:
+            stats.merge(conn.statistics)
+        return stats
+
+    def __repr__(self):
+        """
+        Return a representation of the :class:`~pywbem.WBEMServerPool`
+        object with all attributes, that is suitable for debugging.
+        """
+        return "%s(connections=%r, max_workers=%r, timeout=%r)" % \
+            (self.__class__.__name__, [c.url for c in self._connections],
+             self._max_workers, self._timeout)
+
+    def close(self):
+        """
+        Close the connections of the pool (see
+        :meth:`~pywbem.WBEMConnection.close`).
+        """
+        for conn in self._connections:
+            conn.close()
+
+    def map(self, method_name, *args, **kwargs):
+        """
+        Perform a WBEM operation on all WBEM servers of the pool
+        concurrently, and return the results in the order in which the
+        operations complete.
+
+        Operations that return a generator (e.g. the ``Iter...()`` methods)
+        are iterated completely by the thread performing the operation, and
+        their result is returned as a list.
+
+        The operations are started when the iteration of the returned
+        generator starts. Closing the generator before it is exhausted
+        prevents operations from being started that are not yet running.
+
+        If an earlier operation on a connection timed out and is still
+        running, the operation is not performed on that connection, and a
+        :exc:`~pywbem.TimeoutError` is returned for it right away.
+
+        Parameters:
+
+          method_name (:term:`string`):
+            Name of the operation method of :class:`~pywbem.WBEMConnection`
+            (e.g. ``'EnumerateInstances'``).
+
+          args:
+            Positional arguments for the operation method.
+
+          kwargs:
+            Keyword arguments for the operation method.
+
+        Returns:
+
+          :term:`py:generator` iterating ``pool_result_tuple``:
+          A generator that yields a named tuple for each WBEM server, with
+          these items:
+
+          * **conn** (:class:`~pywbem.WBEMConnection`): The connection to
+            the WBEM server.
+          * **result**: The result of the operation, or `None` if it failed.
+          * **exception** (:exc:`py:Exception`): The exception raised by the
+            operation, or `None` if it succeeded.
+
+        Raises:
+
+          AttributeError: `method_name` is not a method of
+            :class:`~pywbem.WBEMConnection`.
+        """
+        if not callable(getattr(WBEMConnection, method_name, None)):
+            raise AttributeError('WBEMConnection has no operation method %r' %
+                                 method_name)
+        return self._map(method_name, args, kwargs)
+
+    def _map(self, method_name, args, kwargs):
+        """
+        Implement the generator returned by :meth:`map`.
+        """
+        conns = self._connections
+        tasks = queue.Queue()
+        results = queue.Queue()
+        stop = threading.Event()
+        start_times = {}
+
+        with self._lock:
+            busy = self._busy.copy()
+            for i in range(len(conns)):
+                if i not in busy:
+                    self._busy.add(i)
+                    tasks.put(i)
+
+        def worker():
+            """Perform operations until there are no more tasks."""
+            while not stop.is_set():
+                try:
+                    i = tasks.get_nowait()
+                except queue.Empty:
+                    return
+                start_times[i] = time.time()
+                try:
+                    result = getattr(conns[i], method_name)(*args, **kwargs)
+                    if isinstance(result, types.GeneratorType):
+                        result = list(result)
+                    results.put((i, result, None))
+                except Exception as exc:  # pylint: disable=broad-except
+                    results.put((i, None, exc))
+                finally:
+                    with self._lock:
+                        self._busy.discard(i)
+
+        num_workers = len(conns) - len(busy)
+        if self._max_workers is not None:
+            num_workers = min(num_workers, self._max_workers)
+        for _ in range(num_workers):
+            thread = threading.Thread(target=worker)
+            thread.daemon = True
+            thread.start()
+
+        pending = set(range(len(conns))) - busy
+        try:
+            for i in sorted(busy):
+                yield pool_result_tuple(
+                    conns[i], None,
+                    TimeoutError("The operation on %s was not started because "
+                                 "an earlier operation on it that timed out "
+                                 "has not completed yet." % conns[i].url))
+            while pending:
+                wait = None
+                if self._timeout is not None:
+                    now = time.time()
+                    deadlines = dict([(i, start_times[i] + self._timeout)
+                                      for i in pending if i in start_times])
+                    for i, deadline in deadlines.items():
+                        if deadline <= now:
+                            pending.discard(i)
+                            yield pool_result_tuple(
+                                conns[i], None,
+                                TimeoutError("The operation on %s did not "
+                                             "complete within %ss." %
+                                             (conns[i].url, self._timeout)))
+                    if not pending:
+                        break
+                    deadlines = [d for d in deadlines.values() if d > now]
+                    wait = min(deadlines) - now if deadlines else \
+                        self._timeout
+                try:
+                    i, result, exc = results.get(timeout=wait)
+                except queue.Empty:
+                    continue
+                if i in pending:
+                    pending.discard(i)
+                    yield pool_result_tuple(conns[i], result, exc)
+        finally:
+            stop.set()
+            # Release the connections whose operation was not started
+            while True:
+                try:
+                    i = tasks.get_nowait()
+                except queue.Empty:
+                    break
+                with self._lock:
+                    self._busy.discard(i)
@@ -79,6 +79,15 @@ each kind of operation in a connection.
 Finally, the statistics support maintains the total count of operations and the
 count of operations that failed, for each kind of operation.
 
+If the connection uses a pool of persistent HTTP connections (see the
+``conn_pool_size`` init parameter of :class:`~pywbem.WBEMConnection`), the
+statistics support also maintains the number of newly established HTTP
+connections, the number of operations that reused a pooled HTTP connection,
+and the current number of idle connections in the pool (see
+:attr:`~pywbem.Statistics.conn_created_count`,
+:attr:`~pywbem.Statistics.conn_reused_count` and
+:attr:`~pywbem.Statistics.conn_pool_size`).
+
 All data in the statistics applies to WBEM operations performed during periods
 of time where the statistics are enabled on a connection. Operations performed
 during periods of time where the statistics are disabled on a connection, are
@@ -193,6 +202,14 @@ class OperationStatistic(object):
         self._reply_len_min = float('inf')
         self._reply_len_max = float(0)
 
+        self._request_wire_len_sum = float(0)
+        self._reply_wire_len_sum = float(0)
+
+        self._max_object_count_count = 0
+        self._max_object_count_sum = float(0)
+        self._max_object_count_min = float('inf')
+        self._max_object_count_max = float(0)
+
     @property
     def stat_start_time(self):
         """
@@ -353,6 +370,74 @@ class OperationStatistic(object):
         """
         return self._reply_len_max
 
+    @property
+    def avg_request_wire_len(self):
+        """
+        :class:`py:float`: The average size of the HTTP body in the CIM-XML
+        requests of the measured operations as transferred on the network,
+        in Bytes.
+
+        This size is smaller than :attr:`avg_request_len` if requests are
+        compressed (see the ``compression`` parameter of
+        :class:`~pywbem.WBEMConnection`).
+        """
+        try:
+            return self._request_wire_len_sum / self._count
+        except ZeroDivisionError:
+            return 0.0
+
+    @property
+    def avg_reply_wire_len(self):
+        """
+        :class:`py:float`: The average size of the HTTP body in the CIM-XML
+        responses of the measured operations as transferred on the network,
+        in Bytes.
+
+        This size is smaller than :attr:`avg_reply_len` if responses are
+        compressed (see the ``compression`` parameter of
+        :class:`~pywbem.WBEMConnection`).
+        """
+        try:
+            return self._reply_wire_len_sum / self._count
+        except ZeroDivisionError:
+            return 0.0
+
+    @property
+    def avg_max_object_count(self):
+        """
+        *New in pywbem 0.13.*
+
+        :class:`py:float`: The average `MaxObjectCount` of the measured open
+        and pull operations, or 0 if no `MaxObjectCount` was recorded.
+
+        This shows the batch sizes chosen for the operations, e.g. by
+        :class:`~pywbem.AdaptiveMaxObjectCount`.
+        """
+        try:
+            return self._max_object_count_sum / self._max_object_count_count
+        except ZeroDivisionError:
+            return 0.0
+
+    @property
+    def min_max_object_count(self):
+        """
+        *New in pywbem 0.13.*
+
+        :class:`py:float`: The minimum `MaxObjectCount` of the measured open
+        and pull operations.
+        """
+        return self._max_object_count_min
+
+    @property
+    def max_max_object_count(self):
+        """
+        *New in pywbem 0.13.*
+
+        :class:`py:float`: The maximum `MaxObjectCount` of the measured open
+        and pull operations.
+        """
+        return self._max_object_count_max
+
     def reset(self):
         """
         Reset the statistics data for this object.
@@ -377,6 +462,14 @@ class OperationStatistic(object):
         self._reply_len_min = float('inf')
         self._reply_len_max = float(0)
 
+        self._request_wire_len_sum = float(0)
+        self._reply_wire_len_sum = float(0)
+
+        self._max_object_count_count = 0
+        self._max_object_count_sum = float(0)
+        self._max_object_count_min = float('inf')
+        self._max_object_count_max = float(0)
+
     def start_timer(self):
         """
         This is a low-level method that is called by pywbem at the begin of an
@@ -393,7 +486,8 @@ class OperationStatistic(object):
                 self._stat_start_time = self._start_time
 
     def stop_timer(self, request_len, reply_len, server_time=None,
-                   exception=False):
+                   exception=False, request_wire_len=None,
+                   reply_wire_len=None):
         """
         This is a low-level method is called by pywbem at the end of an
         operation. It completes the measurement for that operation by capturing
@@ -418,6 +512,16 @@ class OperationStatistic(object):
             server received the request to when it started sending the
             response. If `None`, there is no time from the server.
 
+          request_wire_len (:term:`integer`)
+            Size of the HTTP body of the CIM-XML request message as
+            transferred on the network (i.e. after compression, if any),
+            in Bytes. `None` means it is the same as `request_len`.
+
+          reply_wire_len (:term:`integer`)
+            Size of the HTTP body of the CIM-XML response message as
+            transferred on the network (i.e. before decompression, if any),
+            in Bytes. `None` means it is the same as `reply_len`.
+
         Returns:
 
           float: The elapsed time for the operation that just ended, or
@@ -430,41 +534,153 @@ class OperationStatistic(object):
                                    ' start_timer()')
             dt = time.time() - self._start_time
             self._start_time = None
-            self._count += 1
-            self._time_sum += dt
-            self._request_len_sum += request_len
-            self._reply_len_sum += reply_len
-
-            if exception:
-                self._exception_count += 1
-
-            if dt > self._time_max:
-                self._time_max = dt
-            if dt < self._time_min:
-                self._time_min = dt
-
-            if server_time:
-                self._server_time_stored = True
-                self._server_time_sum += server_time
-                if dt > self._server_time_max:
-                    self._server_time_max = server_time
-                if dt < self._server_time_min:
-                    self._server_time_min = server_time
-
-            if request_len > self._request_len_max:
-                self._request_len_max = request_len
-            if request_len < self._request_len_min:
-                self._request_len_min = request_len
-
-            if reply_len > self._reply_len_max:
-                self._reply_len_max = reply_len
-            if reply_len < self._reply_len_min:
-                self._reply_len_min = reply_len
-
+            self.record(dt, request_len, reply_len, server_time, exception,
+                        request_wire_len, reply_wire_len)
             return dt
         else:
             return None
 
+    def record(self, duration, request_len, reply_len, server_time=None,
+               exception=False, request_wire_len=None, reply_wire_len=None):
+        # pylint: disable=too-many-arguments
+        """
+        *New in pywbem 0.13.*
+
+        This is a low-level method that is called by pywbem at the end of an
+        operation whose elapsed time has been measured by the caller. It
+        updates the statistics data, if statistics is enabled for the
+        connection.
+
+        In contrast to :meth:`~pywbem.OperationStatistic.start_timer` and
+        :meth:`~pywbem.OperationStatistic.stop_timer`, this method supports
+        multiple operations with the same name that execute concurrently
+        (e.g. in :class:`~pywbem.AsyncWBEMConnection`).
+
+        Parameters:
+
+          duration (:class:`py:float`)
+            Elapsed time for the operation, in seconds.
+
+          For the other parameters, see
+          :meth:`~pywbem.OperationStatistic.stop_timer`.
+        """
+        if not self.container.enabled:
+            return
+        dt = duration
+        if not self._stat_start_time:
+            self._stat_start_time = time.time() - dt
+        self._count += 1
+        self._time_sum += dt
+        self._request_len_sum += request_len
+        self._reply_len_sum += reply_len
+        self._request_wire_len_sum += request_len \
+            if request_wire_len is None else request_wire_len
+        self._reply_wire_len_sum += reply_len \
+            if reply_wire_len is None else reply_wire_len
+
+        if exception:
+            self._exception_count += 1
+
+        if dt > self._time_max:
+            self._time_max = dt
+        if dt < self._time_min:
+            self._time_min = dt
+
+        if server_time:
+            self._server_time_stored = True
+            self._server_time_sum += server_time
+            if dt > self._server_time_max:
+                self._server_time_max = server_time
+            if dt < self._server_time_min:
+                self._server_time_min = server_time
+
+        if request_len > self._request_len_max:
+            self._request_len_max = request_len
+        if request_len < self._request_len_min:
+            self._request_len_min = request_len
+
+        if reply_len > self._reply_len_max:
+            self._reply_len_max = reply_len
+        if reply_len < self._reply_len_min:
+            self._reply_len_min = reply_len
+
+    def record_max_object_count(self, max_object_count):
+        """
+        *New in pywbem 0.13.*
+
+        This is a low-level method that is called by pywbem for open and pull
+        operations, to record the `MaxObjectCount` that was requested. It
+        updates the statistics data, if statistics is enabled for the
+        connection.
+
+        Parameters:
+
+          max_object_count (:term:`integer`)
+            The `MaxObjectCount` of the operation.
+        """
+        if not self.container.enabled or max_object_count is None:
+            return
+        self._max_object_count_count += 1
+        self._max_object_count_sum += max_object_count
+        if max_object_count > self._max_object_count_max:
+            self._max_object_count_max = max_object_count
+        if max_object_count < self._max_object_count_min:
+            self._max_object_count_min = max_object_count
+
+    def merge(self, other):
+        """
+        *New in pywbem 0.13.*
+
+        Add the statistics data of another operation statistic object to
+        the statistics data of this object, e.g. to aggregate the
+        statistics of an operation across several connections.
+
+        Parameters:
+
+          other (:class:`~pywbem.OperationStatistic`):
+            The operation statistic object whose data is added. It is not
+            changed.
+        """
+        # pylint: disable=protected-access
+        if other._stat_start_time and (
+                not self._stat_start_time or
+                other._stat_start_time < self._stat_start_time):
+            self._stat_start_time = other._stat_start_time
+        self._count += other._count
+        self._exception_count += other._exception_count
+
+        self._time_sum += other._time_sum
+        self._time_min = min(self._time_min, other._time_min)
+        self._time_max = max(self._time_max, other._time_max)
+
+        self._server_time_sum += other._server_time_sum
+        self._server_time_min = min(self._server_time_min,
+                                    other._server_time_min)
+        self._server_time_max = max(self._server_time_max,
+                                    other._server_time_max)
+        self._server_time_stored = self._server_time_stored or \
+            other._server_time_stored
+
+        self._request_len_sum += other._request_len_sum
+        self._request_len_min = min(self._request_len_min,
+                                    other._request_len_min)
+        self._request_len_max = max(self._request_len_max,
+                                    other._request_len_max)
+
+        self._reply_len_sum += other._reply_len_sum
+        self._reply_len_min = min(self._reply_len_min, other._reply_len_min)
+        self._reply_len_max = max(self._reply_len_max, other._reply_len_max)
+
+        self._request_wire_len_sum += other._request_wire_len_sum
+        self._reply_wire_len_sum += other._reply_wire_len_sum
+
+        self._max_object_count_count += other._max_object_count_count
+        self._max_object_count_sum += other._max_object_count_sum
+        self._max_object_count_min = min(self._max_object_count_min,
+                                         other._max_object_count_min)
+        self._max_object_count_max = max(self._max_object_count_max,
+                                         other._max_object_count_max)
+
     def __repr__(self):
         """
         Return a human readable string with the statistics values, for debug
@@ -485,7 +701,12 @@ class OperationStatistic(object):
                'max_request_len={s.max_request_len!r}, ' \
                'avg_reply_len={s.avg_reply_len!r}, ' \
                'min_reply_len={s.min_reply_len!r}, ' \
-               'max_reply_len={s.max_reply_len!r})'. \
+               'max_reply_len={s.max_reply_len!r}, ' \
+               'avg_request_wire_len={s.avg_request_wire_len!r}, ' \
+               'avg_reply_wire_len={s.avg_reply_wire_len!r}, ' \
+               'avg_max_object_count={s.avg_max_object_count!r}, ' \
+               'min_max_object_count={s.min_max_object_count!r}, ' \
+               'max_max_object_count={s.max_max_object_count!r})'. \
                format(s=self)
 
     formatted_header_w_svr = \
@@ -572,6 +793,11 @@ class Statistics(object):
         self._enabled = bool(enable)
         self._op_stats = {}
         self._disabled_stats = OperationStatistic(self, "disabled")
+        self._conn_created_count = 0
+        self._conn_reused_count = 0
+        self._conn_pool_size = 0
+        self._class_cache_hits = 0
+        self._class_cache_misses = 0
 
     @property
     def enabled(self):
@@ -592,6 +818,111 @@ class Statistics(object):
         """
         self._enabled = False
 
+    @property
+    def conn_created_count(self):
+        """
+        :term:`integer`: The number of HTTP connections that were newly
+        established for operations on a connection that uses a pool of
+        persistent HTTP connections (see the ``conn_pool_size`` init
+        parameter of :class:`~pywbem.WBEMConnection`).
+        """
+        return self._conn_created_count
+
+    @property
+    def conn_reused_count(self):
+        """
+        :term:`integer`: The number of operations that reused an idle
+        persistent HTTP connection from the connection pool, instead of
+        establishing a new HTTP connection.
+        """
+        return self._conn_reused_count
+
+    @property
+    def conn_pool_size(self):
+        """
+        :term:`integer`: The number of idle persistent HTTP connections that
+        were in the connection pool at the time of the last change of the
+        pool.
+        """
+        return self._conn_pool_size
+
+    def count_connection(self, reused, reconnected=False):
+        """
+        This is a low-level method that is called by pywbem when an HTTP
+        connection is checked out of a connection pool. It updates the
+        connection counters, if statistics is enabled.
+
+        Parameters:
+
+          reused (:class:`py:bool`):
+            Boolean indicating whether an idle connection was reused (`True`)
+            or a new connection was established (`False`).
+
+          reconnected (:class:`py:bool`):
+            Boolean indicating that an idle connection that was counted as
+            reused turned out to be stale and has been replaced by a new
+            connection. In this case, the count is moved from the reused
+            to the created connections, and `reused` is ignored.
+        """
+        if self.enabled:
+            if reconnected:
+                self._conn_reused_count -= 1
+                self._conn_created_count += 1
+            elif reused:
+                self._conn_reused_count += 1
+            else:
+                self._conn_created_count += 1
+
+    def set_conn_pool_size(self, size):
+        """
+        This is a low-level method that is called by pywbem when the number
+        of idle connections in a connection pool has changed.
+
+        Parameters:
+
+          size (:term:`integer`):
+            Number of idle connections in the connection pool.
+        """
+        if self.enabled:
+            self._conn_pool_size = size
+
+    @property
+    def class_cache_hits(self):
+        """
+        :term:`integer`: The number of class retrievals that were satisfied
+        from the class cache of the connection (see the ``class_cache_size``
+        init parameter of :class:`~pywbem.WBEMConnection`), without an
+        operation to the WBEM server.
+        """
+        return self._class_cache_hits
+
+    @property
+    def class_cache_misses(self):
+        """
+        :term:`integer`: The number of class retrievals that were not found
+        in the class cache of the connection and caused an operation to the
+        WBEM server.
+        """
+        return self._class_cache_misses
+
+    def count_class_cache(self, hit):
+        """
+        This is a low-level method that is called by pywbem when the class
+        cache of a connection is looked up. It updates the class cache
+        counters, if statistics is enabled.
+
+        Parameters:
+
+          hit (:class:`py:bool`):
+            Boolean indicating whether the lookup found the class (`True`) or
+            not (`False`).
+        """
+        if self.enabled:
+            if hit:
+                self._class_cache_hits += 1
+            else:
+                self._class_cache_misses += 1
+
     def start_timer(self, name):
         """
         This method is called by pywbem to start the timer for a particular
@@ -657,6 +988,31 @@ class Statistics(object):
         """
         return copy.deepcopy(self._op_stats).items()
 
+    def merge(self, other):
+        """
+        *New in pywbem 0.13.*
+
+        Add the statistics data of another statistics container to this
+        container, e.g. to aggregate the statistics of several connections.
+
+        The data is added regardless of whether this container is enabled.
+
+        Parameters:
+
+          other (:class:`~pywbem.Statistics`):
+            The statistics container whose data is added. It is not changed.
+        """
+        # pylint: disable=protected-access
+        for name, op_stat in other._op_stats.items():
+            if name not in self._op_stats:
+                self._op_stats[name] = OperationStatistic(self, name)
+            self._op_stats[name].merge(op_stat)
+        self._conn_created_count += other._conn_created_count
+        self._conn_reused_count += other._conn_reused_count
+        self._conn_pool_size += other._conn_pool_size
+        self._class_cache_hits += other._class_cache_hits
+        self._class_cache_misses += other._class_cache_misses
+
     def __repr__(self):
         """
         Return a human readable display of the contents, for debug purposes.
@@ -710,6 +1066,25 @@ class Statistics(object):
 
             for name, stats in snapshot:  # pylint: disable=unused-variable
                 ret += stats.formatted(include_svr)
+
+            for name, stats in snapshot:
+                # pylint: disable=protected-access
+                if stats._max_object_count_count:
+                    ret += 'MaxObjectCount: avg {0:.0f}, min {1:.0f}, ' \
+                           'max {2:.0f} {3}\n'. \
+                           format(stats.avg_max_object_count,
+                                  stats.min_max_object_count,
+                                  stats.max_max_object_count, name)
+
+            if self._conn_created_count or self._conn_reused_count:
+                ret += 'Connections: created {0}, reused {1}, ' \
+                       'pooled {2}\n'.format(self._conn_created_count,
+                                             self._conn_reused_count,
+                                             self._conn_pool_size)
+
+            if self._class_cache_hits or self._class_cache_misses:
+                ret += 'Class cache: hits {0}, misses {1}\n'.format(
+                    self._class_cache_hits, self._class_cache_misses)
         else:
             ret += "Disabled"
         return ret.strip()
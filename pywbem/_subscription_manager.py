@@ -159,6 +159,24 @@ SYSTEM_CREATION_CLASSNAME = 'CIM_ComputerSystem'
 
 DEFAULT_QUERY_LANGUAGE = 'WQL'
 
+# Maximum number of concurrent GetInstance operations for retrieving the owned
+# instances in add_server()
+_MAX_RECOVERY_WORKERS = 8
+
+
+def _path_without_host(path):
+    """
+    Return the instance path without host, for comparing the instance paths
+    returned by the WBEM server with the reference keybindings of
+    subscription paths, which may differ in whether they have a host.
+    """
+    if path.host is None:
+        return path
+    path = path.copy()
+    path.host = None
+    return path
+
+
 __all__ = ['WBEMSubscriptionManager']
 
 
@@ -296,6 +314,12 @@ class WBEMSubscriptionManager(object):
         references a filter or a destination that is owned by this subscription
         manager, it is considered owned by this subscription manager as well.
 
+        Since only the instance paths are needed for that, the paths of the
+        three kinds of instances are enumerated concurrently. Then the full
+        instances are retrieved only for the owned instances, concurrently as
+        well. If operation recorders have been added to the connection, the
+        operations are performed one after another on the connection.
+
         Parameters:
 
           server (:class:`~pywbem.WBEMServer`):
@@ -333,40 +357,113 @@ class WBEMSubscriptionManager(object):
         this_host = getfqdn()
 
         dest_name_pattern = re.compile(
-            r'^pywbemdestination:owned:%s:%s:[^:]*$' %
-            (this_host, self._subscription_manager_id))
-        dest_insts = server.conn.EnumerateInstances(
-            DESTINATION_CLASSNAME, namespace=server.interop_ns)
-        for inst in dest_insts:
-            if re.match(dest_name_pattern, inst.path.keybindings['Name']) \
-                    and inst.path.keybindings['SystemName'] == this_host:
-                self._owned_destinations[server_id].append(inst)
-
+            r'^pywbemdestination:owned:%s:[^:]*$' %
+            re.escape(self._subscription_manager_id))
         filter_name_pattern = re.compile(
-            r'^pywbemfilter:owned:%s:%s:[^:]*:[^:]*$' %
-            (this_host, self._subscription_manager_id))
-        filter_insts = server.conn.EnumerateInstances(
-            FILTER_CLASSNAME, namespace=server.interop_ns)
-        for inst in filter_insts:
-            if re.match(filter_name_pattern, inst.path.keybindings['Name']) \
-                    and inst.path.keybindings['SystemName'] == this_host:
-                self._owned_filters[server_id].append(inst)
-
-        sub_insts = server.conn.EnumerateInstances(
-            SUBSCRIPTION_CLASSNAME, namespace=server.interop_ns)
-        owned_filter_paths = [inst.path for inst in
-                              self._owned_filters[server_id]]
-        owned_destination_paths = [inst.path for inst in
-                                   self._owned_destinations[server_id]]
-        for inst in sub_insts:
-            if inst.path.keybindings['Filter'] in \
-                    owned_filter_paths \
-                    or inst.path.keybindings['Handler'] in \
-                    owned_destination_paths:
-                self._owned_subscriptions[server_id].append(inst)
+            r'^pywbemfilter:owned:%s:[^:]*:[^:]*$' %
+            re.escape(self._subscription_manager_id))
+
+        # Enumerate only the instance paths, because the keys contain all
+        # information needed to determine ownership. The full instances are
+        # retrieved only for the owned instances.
+        dest_paths, filter_paths, sub_paths = self._enumerate_paths(
+            server, [DESTINATION_CLASSNAME, FILTER_CLASSNAME,
+                     SUBSCRIPTION_CLASSNAME])
+
+        owned_dest_paths = [
+            path for path in dest_paths
+            if dest_name_pattern.match(path.keybindings['Name']) and
+            path.keybindings['SystemName'] == this_host]
+        owned_filter_paths = [
+            path for path in filter_paths
+            if filter_name_pattern.match(path.keybindings['Name']) and
+            path.keybindings['SystemName'] == this_host]
+        owned_dest_set = set(_path_without_host(p) for p in owned_dest_paths)
+        owned_filter_set = set(_path_without_host(p)
+                               for p in owned_filter_paths)
+        owned_sub_paths = [
+            path for path in sub_paths
+            if _path_without_host(path.keybindings['Filter']) in
+            owned_filter_set or
+            _path_without_host(path.keybindings['Handler']) in owned_dest_set]
+
+        # Retrieve the full owned instances in one batch
+        owned_paths = owned_dest_paths + owned_filter_paths + owned_sub_paths
+        insts = self._run_operations(
+            server,
+            [lambda conn, path=path: conn.GetInstance(path)
+             for path in owned_paths],
+            _MAX_RECOVERY_WORKERS)
+        num_dests = len(owned_dest_paths)
+        num_filters = len(owned_filter_paths)
+        self._owned_destinations[server_id].extend(insts[:num_dests])
+        self._owned_filters[server_id].extend(
+            insts[num_dests:num_dests + num_filters])
+        self._owned_subscriptions[server_id].extend(
+            insts[num_dests + num_filters:])
 
         return server_id
 
+    @staticmethod
+    def _run_operations(server, funcs, max_workers):
+        """
+        Call the specified functions with a connection to a WBEM server as
+        their only argument, concurrently using at most `max_workers`
+        threads unless operation recorders have been added to the connection.
+
+        Returns:
+
+          :class:`py:list`: The results of the functions, in the order of the
+          functions.
+
+        Raises:
+
+            Exceptions raised by the functions.
+        """
+        if not funcs:
+            return []
+        if server.conn.operation_recorders or max_workers == 1 or \
+                len(funcs) == 1:
+            return [func(server.conn) for func in funcs]
+        # pylint: disable=protected-access
+        results = server._run_concurrently(
+            funcs, max_workers=min(len(funcs), max_workers))
+        for _, exc in results:
+            if exc is not None:
+                raise exc
+        return [result for result, _ in results]
+
+    @staticmethod
+    def _enumerate_paths(server, classnames):
+        """
+        Enumerate the instance paths of the specified classes in the Interop
+        namespace of a WBEM server, concurrently unless operation recorders
+        have been added to the connection.
+
+        Parameters:
+
+          server (:class:`~pywbem.WBEMServer`):
+            The WBEM server.
+
+          classnames (:class:`py:list` of :term:`string`):
+            The class names.
+
+        Returns:
+
+          :class:`py:list` of :class:`py:list` of
+          :class:`~pywbem.CIMInstanceName`: The instance paths for each class,
+          in the order of the classes.
+
+        Raises:
+
+            Exceptions raised by :class:`~pywbem.WBEMConnection`.
+        """
+        interop_ns = server.interop_ns
+        funcs = [lambda conn, cln=cln: list(conn.IterEnumerateInstancePaths(
+            cln, namespace=interop_ns)) for cln in classnames]
+        return WBEMSubscriptionManager._run_operations(
+            server, funcs, len(funcs))
+
     def remove_server(self, server_id):
         """
         Remove a registered WBEM server from the subscription manager. This
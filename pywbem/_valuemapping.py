@@ -25,6 +25,9 @@ This class supports value ranges (e.g. ``"4..6"``) and the unclaimed marker
 """
 
 import re
+import copy
+import threading
+from bisect import bisect_right
 import six
 try:
     from collections import OrderedDict
@@ -176,6 +179,16 @@ class ValueMapping(object):
             'unclaimed': None
     """
 
+    # Process-wide cache of ValueMapping objects created by the factory methods
+    # with use_cache=True, least recently used first. Key: tuple(url,
+    # namespace, kind, names...), lower-cased; value: ValueMapping object
+    # without connection. Protected by _cache_lock.
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    # Maximum number of value mappings in the cache
+    _cache_maxsize = 1000
+
     def __init__(self):
 
         self._conn = None
@@ -190,13 +203,17 @@ class ValueMapping(object):
         # Attributes for converting binary values to Values strings:
         self._b2v_single_dict = {}  # for single values; bin: values
         self._b2v_range_tuple_list = []  # for value ranges; tuple(lo,hi,values)
+        # Low values of the ranges in _b2v_range_tuple_list for bisecting, if
+        # the ranges are sorted and do not overlap; else None.
+        self._b2v_range_lo_list = []
         self._b2v_unclaimed = None  # value of the unclaimed indicator '..'
 
         # Attributes for converting Values strings to binary values:
         self._v2b_dict = {}  # values: bin (int or tuple)
 
     @classmethod
-    def for_property(cls, server, namespace, classname, propname):
+    def for_property(cls, server, namespace, classname, propname,
+                     use_cache=False):
         # pylint: disable=line-too-long
         """
         Factory method that returns a new :class:`~pywbem.ValueMapping`
@@ -224,9 +241,25 @@ class ValueMapping(object):
             Name of the CIM property that defines the `Values` / `ValueMap`
             qualifiers.
 
+          use_cache (:class:`py:bool`):
+            *New in pywbem 0.13 as experimental.*
+
+            If `True`, the value mapping is looked up in a process-wide cache
+            of value mappings, by the URL of the connection, the namespace, the
+            class name and the property name. Only if it is not found there, it
+            is created (retrieving the class from the WBEM server) and added to
+            the cache. See :meth:`~pywbem.ValueMapping.clear_cache`.
+
+            The cache holds up to 1000 value mappings, removing the least
+            recently used ones. A value mapping returned from the cache is a
+            copy that uses the specified connection.
+
+            `False` (default) means that a new value mapping is created,
+            without using the cache.
+
         Returns:
 
-            The new :class:`~pywbem.ValueMapping` instance.
+            The new (or cached) :class:`~pywbem.ValueMapping` instance.
 
         Raises:
 
@@ -243,6 +276,13 @@ class ValueMapping(object):
             conn = server.conn
             get_class = conn.GetClass
 
+        if use_cache:
+            key = cls._cache_key(conn, namespace, 'property', classname,
+                                 propname)
+            cached_vm = cls._cache_get(key, conn)
+            if cached_vm is not None:
+                return cached_vm
+
         class_obj = get_class(ClassName=classname,
                               namespace=namespace,
                               LocalOnly=False,
@@ -252,10 +292,13 @@ class ValueMapping(object):
         new_vm = cls._create_for_element(property_obj, conn, namespace,
                                          classname, propname=propname)
 
+        if use_cache:
+            cls._cache_put(key, new_vm)
         return new_vm
 
     @classmethod
-    def for_method(cls, server, namespace, classname, methodname):
+    def for_method(cls, server, namespace, classname, methodname,
+                   use_cache=False):
         # pylint: disable=line-too-long
         """
         Factory method that returns a new :class:`~pywbem.ValueMapping`
@@ -282,9 +325,25 @@ class ValueMapping(object):
             Name of the CIM method that defines the `Values` / `ValueMap`
             qualifiers.
 
+          use_cache (:class:`py:bool`):
+            *New in pywbem 0.13 as experimental.*
+
+            If `True`, the value mapping is looked up in a process-wide cache
+            of value mappings, by the URL of the connection, the namespace, the
+            class name and the method name. Only if it is not found there, it
+            is created (retrieving the class from the WBEM server) and added to
+            the cache. See :meth:`~pywbem.ValueMapping.clear_cache`.
+
+            The cache holds up to 1000 value mappings, removing the least
+            recently used ones. A value mapping returned from the cache is a
+            copy that uses the specified connection.
+
+            `False` (default) means that a new value mapping is created,
+            without using the cache.
+
         Returns:
 
-            The new :class:`~pywbem.ValueMapping` instance.
+            The new (or cached) :class:`~pywbem.ValueMapping` instance.
 
         Raises:
 
@@ -301,6 +360,13 @@ class ValueMapping(object):
             conn = server.conn
             get_class = conn.GetClass
 
+        if use_cache:
+            key = cls._cache_key(conn, namespace, 'method', classname,
+                                 methodname)
+            cached_vm = cls._cache_get(key, conn)
+            if cached_vm is not None:
+                return cached_vm
+
         class_obj = get_class(ClassName=classname,
                               namespace=namespace,
                               LocalOnly=False,
@@ -310,11 +376,13 @@ class ValueMapping(object):
         new_vm = cls._create_for_element(method_obj, conn, namespace,
                                          classname, methodname=methodname)
 
+        if use_cache:
+            cls._cache_put(key, new_vm)
         return new_vm
 
     @classmethod
     def for_parameter(cls, server, namespace, classname, methodname,
-                      parametername):
+                      parametername, use_cache=False):
         # pylint: disable=line-too-long
         """
         Factory method that returns a new :class:`~pywbem.ValueMapping`
@@ -344,9 +412,26 @@ class ValueMapping(object):
             Name of the CIM parameter that defines the `Values` / `ValueMap`
             qualifiers.
 
+          use_cache (:class:`py:bool`):
+            *New in pywbem 0.13 as experimental.*
+
+            If `True`, the value mapping is looked up in a process-wide cache
+            of value mappings, by the URL of the connection, the namespace, the
+            class name and the method and parameter names. Only if it is not
+            found there, it is created (retrieving the class from the WBEM
+            server) and added to the cache. See
+            :meth:`~pywbem.ValueMapping.clear_cache`.
+
+            The cache holds up to 1000 value mappings, removing the least
+            recently used ones. A value mapping returned from the cache is a
+            copy that uses the specified connection.
+
+            `False` (default) means that a new value mapping is created,
+            without using the cache.
+
         Returns:
 
-            The new :class:`~pywbem.ValueMapping` instance.
+            The new (or cached) :class:`~pywbem.ValueMapping` instance.
 
         Raises:
 
@@ -364,6 +449,13 @@ class ValueMapping(object):
             conn = server.conn
             get_class = conn.GetClass
 
+        if use_cache:
+            key = cls._cache_key(conn, namespace, 'parameter', classname,
+                                 methodname, parametername)
+            cached_vm = cls._cache_get(key, conn)
+            if cached_vm is not None:
+                return cached_vm
+
         class_obj = get_class(ClassName=classname,
                               namespace=namespace,
                               LocalOnly=False,
@@ -375,8 +467,82 @@ class ValueMapping(object):
                                          classname, methodname=methodname,
                                          parametername=parametername)
 
+        if use_cache:
+            cls._cache_put(key, new_vm)
         return new_vm
 
+    @staticmethod
+    def _cache_key(conn, namespace, kind, *names):
+        """
+        Return the key in the process-wide cache for the value mapping of a
+        CIM element.
+        """
+        if namespace is None:
+            namespace = conn.default_namespace
+        return (conn.url.lower(), namespace.strip('/').lower(), kind) + \
+            tuple(name.lower() for name in names)
+
+    @classmethod
+    def _cache_get(cls, key, conn):
+        """
+        Return a copy of the cached value mapping for the key that uses the
+        specified connection, and mark it as recently used, or return `None`.
+        """
+        with cls._cache_lock:
+            try:
+                cached_vm = cls._cache.pop(key)
+            except KeyError:
+                return None
+            cls._cache[key] = cached_vm
+        vm = copy.copy(cached_vm)
+        vm._conn = conn  # pylint: disable=protected-access
+        return vm
+
+    @classmethod
+    def _cache_put(cls, key, vm):
+        """
+        Add a copy of the value mapping without its connection to the cache,
+        removing the least recently used value mappings as needed.
+        """
+        cached_vm = copy.copy(vm)
+        cached_vm._conn = None  # pylint: disable=protected-access
+        with cls._cache_lock:
+            cls._cache.pop(key, None)
+            cls._cache[key] = cached_vm
+            while len(cls._cache) > cls._cache_maxsize:
+                cls._cache.popitem(last=False)
+
+    @classmethod
+    def _invalidate_cache(cls, url, namespace):
+        """
+        Remove the cached value mappings for a namespace of a WBEM server.
+        Called by :class:`~pywbem.WBEMConnection` when classes have been
+        created, modified or deleted in that namespace.
+        """
+        prefix = (url.lower(), namespace.strip('/').lower())
+        with cls._cache_lock:
+            for key in [k for k in cls._cache if k[0:2] == prefix]:
+                del cls._cache[key]
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        *New in pywbem 0.13 as experimental.*
+
+        Remove all value mappings from the process-wide cache of value
+        mappings that is used by the factory methods if their `use_cache`
+        parameter is `True`.
+
+        The cached value mappings reflect the class definitions at the time
+        they were created. Value mappings for a namespace are removed from
+        the cache automatically when classes are created, modified or deleted
+        in that namespace through a :class:`~pywbem.WBEMConnection`, so this
+        method should be called when classes have been changed in the WBEM
+        servers by other means.
+        """
+        with cls._cache_lock:
+            cls._cache.clear()
+
     @classmethod
     def _values_tuple(cls, i, valuemap_list, values_list, cimtype):
         """
@@ -542,6 +708,16 @@ class ValueMapping(object):
                         vm._b2v_range_tuple_list.append((lo, hi, values_str))
                         vm._v2b_dict[values_str] = (lo, hi)
 
+        # Prepare the value ranges for bisecting, if they do not overlap.
+        # Overlapping ranges are searched in their order of definition.
+        ranges = sorted(vm._b2v_range_tuple_list)
+        if all(ranges[i][1] < ranges[i + 1][0]
+               for i in range(len(ranges) - 1)):
+            vm._b2v_range_tuple_list = ranges
+            vm._b2v_range_lo_list = [r[0] for r in ranges]
+        else:
+            vm._b2v_range_lo_list = None
+
         # pylint: enable=protected-access
         return vm
 
@@ -650,11 +826,27 @@ class ValueMapping(object):
         except KeyError:
             pass
 
+        return self._tovalues_range(element_value)
+
+    def _tovalues_range(self, element_value):
+        """
+        Return the `Values` string for an integer element value that is not
+        a single value, from the value ranges or the unclaimed indicator.
+        """
+
         # try value ranges
-        for range_tuple in self._b2v_range_tuple_list:
-            lo, hi, values_str = range_tuple
-            if lo <= element_value <= hi:
-                return values_str
+        lo_list = self._b2v_range_lo_list
+        if lo_list is not None:
+            i = bisect_right(lo_list, element_value) - 1
+            if i >= 0:
+                _, hi, values_str = self._b2v_range_tuple_list[i]
+                if element_value <= hi:
+                    return values_str
+        else:
+            for range_tuple in self._b2v_range_tuple_list:
+                lo, hi, values_str = range_tuple
+                if lo <= element_value <= hi:
+                    return values_str
 
         # try catch-all '..'
         if self._b2v_unclaimed is not None:
@@ -663,6 +855,55 @@ class ValueMapping(object):
         raise ValueError("Element value outside of the set defined by "
                          "ValueMap: %r" % element_value)
 
+    def tovalues_many(self, element_values):
+        # pylint: disable=line-too-long
+        """
+        *New in pywbem 0.13 as experimental.*
+
+        Return the `Values` strings for multiple element values, based upon
+        this value mapping.
+
+        This is equivalent to calling :meth:`~pywbem.ValueMapping.tovalues`
+        for each element value, but is faster for large numbers of values,
+        e.g. when translating the values of a property for many instances.
+
+        Parameters:
+
+          element_values (:term:`py:iterable` of :term:`integer` or :class:`~pywbem.CIMInt`):
+            The values of the CIM element (property, method, parameter).
+
+        Returns:
+
+          list of :term:`string`:
+            The `Values` strings for the element values, in the same order.
+
+        Raises:
+
+          ValueError: Element value outside of the set defined by `ValueMap`.
+          TypeError: Element value is not an integer type.
+        """  # noqa: E501
+
+        int_types = (six.integer_types, CIMInt)
+        single_dict = self._b2v_single_dict
+        # Values strings found in the ranges, for values that repeat
+        range_dict = {}
+        result = []
+        append = result.append
+        for element_value in element_values:
+            if not isinstance(element_value, int_types):
+                raise TypeError("Element value is not an integer type: %s" %
+                                type(element_value))
+            try:
+                append(single_dict[element_value])
+            except KeyError:
+                try:
+                    append(range_dict[element_value])
+                except KeyError:
+                    values_str = self._tovalues_range(element_value)
+                    range_dict[element_value] = values_str
+                    append(values_str)
+        return result
+
     def tobinary(self, values_str):
         """
         Return the integer value or values for a `Values` string, based upon
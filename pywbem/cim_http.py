@@ -38,11 +38,13 @@ import os
 import sys
 import errno
 import socket
+import select
 import getpass
 from stat import S_ISSOCK
 import platform
 import base64
 import threading
+import zlib
 from datetime import datetime
 import warnings
 
@@ -51,7 +53,8 @@ from six.moves import http_client as httplib
 from six.moves import urllib
 
 from .cim_obj import CIMClassName, CIMInstanceName
-from .exceptions import ConnectionError, AuthError, TimeoutError, HTTPError
+from .exceptions import ConnectionError, AuthError, TimeoutError, \
+    HTTPError, ParseError
 from ._utils import _ensure_unicode, _ensure_bytes
 
 _ON_RTD = os.environ.get('READTHEDOCS', None) == 'True'
@@ -161,7 +164,7 @@ class HTTPTimeout(object):  # pylint: disable=too-few-public-methods
     exception in the thread that executed the ``with`` statement.
     """
 
-    def __init__(self, timeout, http_conn):
+    def __init__(self, timeout, http_conn, close_on_error=False):
         """Initialize the HTTPTimeout object.
 
         :Parameters:
@@ -171,10 +174,17 @@ class HTTPTimeout(object):  # pylint: disable=too-few-public-methods
 
           http_conn (`httplib.HTTPBaseConnection` or subclass):
             The connection that is to be stopped when the timeout expires.
+
+          close_on_error (:class:`py:bool`):
+            Close the connection when an exception is raised in the
+            ``with`` statement (including the timeout). This is used for
+            persistent connections, whose state is unknown after an error
+            and which therefore must not be reused.
         """
 
         self._timeout = timeout
         self._http_conn = http_conn
+        self._close_on_error = close_on_error
         # time in seconds after which a retry of socket shutdown is scheduled
         # if the socket is not yet connected when timeout expires
         self._retrytime = 5
@@ -196,6 +206,9 @@ class HTTPTimeout(object):  # pylint: disable=too-few-public-methods
     def __exit__(self, exc_type, exc_value, traceback):
         if self._timeout is not None:
             self._timer.cancel()
+        if self._close_on_error and (exc_type is not None or self._shutdown):
+            self._http_conn.close()
+        if self._timeout is not None:
             if self._shutdown:
                 # If the timer handler has shut down the socket, we
                 # want to make that known, and override any other
@@ -230,6 +243,357 @@ class HTTPTimeout(object):  # pylint: disable=too-few-public-methods
             self._timer.start()
 
 
+class HTTPConnectionPool(object):
+    """
+    A pool of idle persistent (keep-alive) HTTP connections, for use by a
+    single :class:`~pywbem.WBEMConnection` object.
+
+    Connections are checked out of the pool by :func:`wbem_request` at the
+    begin of an operation and are returned to the pool after the complete
+    HTTP response has been read, unless the WBEM server indicated that it
+    will close the connection (e.g. via a ``Connection: close`` header).
+    Connections that fail during an operation are never returned to the pool.
+
+    Each pooled connection is stored together with a key that represents the
+    connection parameters it was created with (URL, certificates, timeout),
+    so that a change of these parameters on the
+    :class:`~pywbem.WBEMConnection` object does not cause connections with
+    outdated parameters to be reused.
+
+    Idle connections whose socket has been closed by the WBEM server in the
+    mean time are detected and discarded when checking out a connection.
+    """
+
+    def __init__(self, maxsize, statistics=None):
+        """
+        Parameters:
+
+          maxsize (:term:`integer`):
+            Maximum number of idle connections kept in the pool. When a
+            connection is returned to a full pool, the oldest idle connection
+            is closed. Must be a positive integer.
+
+          statistics (:class:`~pywbem.Statistics`):
+            Statistics container that is updated with the connection
+            counters of this pool, or `None` for no statistics.
+        """
+        if maxsize is None or maxsize <= 0:
+            raise ValueError("Connection pool size must be a positive "
+                             "integer, but is: %r" % maxsize)
+        self._maxsize = maxsize
+        self._statistics = statistics
+        self._idle = []  # list of tuple(key, client), oldest first
+        self._lock = threading.Lock()
+
+    @property
+    def maxsize(self):
+        """
+        :term:`integer`: Maximum number of idle connections kept in the pool.
+        """
+        return self._maxsize
+
+    @property
+    def size(self):
+        """
+        :term:`integer`: Number of idle connections currently in the pool.
+        """
+        return len(self._idle)
+
+    def get(self, key):
+        """
+        Check out an idle connection with the specified key from the pool.
+
+        Idle connections that have been dropped by the WBEM server are closed
+        and discarded.
+
+        Returns:
+
+          The connection object (a subclass of `httplib.HTTPConnection`), or
+          `None` if the pool has no usable connection for that key.
+        """
+        with self._lock:
+            for i in range(len(self._idle) - 1, -1, -1):
+                idle_key, client = self._idle[i]
+                if idle_key != key:
+                    continue
+                del self._idle[i]
+                if _is_connection_dropped(client):
+                    client.close()
+                    continue
+                self._update_statistics(reused=True)
+                return client
+            self._update_statistics(reused=False)
+            return None
+
+    def put(self, key, client):
+        """
+        Return a connection that is ready for the next request to the pool.
+
+        If the pool is full, the oldest idle connection is closed.
+        """
+        with self._lock:
+            self._idle.append((key, client))
+            while len(self._idle) > self._maxsize:
+                _, old_client = self._idle.pop(0)
+                old_client.close()
+            self._update_statistics()
+
+    def reconnected(self):
+        """
+        Record that a connection checked out of the pool turned out to be
+        stale while sending the request, and has been reconnected.
+
+        The connection is then counted as created instead of as reused.
+        """
+        if self._statistics is not None:
+            self._statistics.count_connection(reused=False, reconnected=True)
+
+    def close(self):
+        """
+        Close all idle connections in the pool.
+        """
+        with self._lock:
+            for _, client in self._idle:
+                client.close()
+            self._idle = []
+            self._update_statistics()
+
+    def _update_statistics(self, reused=None):
+        """
+        Update the connection counters in the statistics container.
+        """
+        if self._statistics is not None:
+            if reused is not None:
+                self._statistics.count_connection(reused)
+            self._statistics.set_conn_pool_size(len(self._idle))
+
+
+def _is_connection_dropped(client):
+    """
+    Return a boolean indicating whether the socket of an idle HTTP connection
+    has been closed by the peer.
+
+    An idle keep-alive socket must not be readable; if it is, the server has
+    either closed it (EOF) or sent unexpected data, and in both cases it
+    cannot be used for the next request.
+    """
+    sock = client.sock
+    if sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (ValueError, TypeError, select.error, socket.error):
+        # The socket does not support select (e.g. some SSL socket
+        # implementations). We assume it is alive; wbem_request() handles
+        # a stale connection when sending the request.
+        return False
+    return bool(readable)
+
+
+# Value for the Accept-Encoding header that is sent when HTTP compression is
+# enabled.
+ACCEPT_ENCODING = 'gzip, deflate'
+
+
+class _ContentDecoder(object):
+    # pylint: disable=too-few-public-methods
+    """
+    Incremental decoder for an HTTP body with a Content-Encoding of gzip or
+    deflate.
+
+    For the deflate encoding, RFC 7230 requires the zlib format, but some HTTP
+    servers send raw deflate data. Both are accepted: if the data does not
+    start with a zlib header, it is decoded as raw deflate data.
+    """
+
+    def __init__(self, content_encoding):
+        self._encoding = content_encoding
+        if content_encoding == 'deflate':
+            self._decompobj = zlib.decompressobj()
+            self._first = True
+        else:
+            self._decompobj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            self._first = False
+
+    def decompress(self, data):
+        """
+        Decode the next piece of the body and return the decoded data
+        that is available so far, as a :term:`byte string`.
+
+        Raises:
+
+          :exc:`~pywbem.ParseError`
+        """
+        try:
+            if self._first:
+                self._first = False
+                try:
+                    return self._decompobj.decompress(data)
+                except zlib.error:
+                    self._decompobj = zlib.decompressobj(-zlib.MAX_WBITS)
+            return self._decompobj.decompress(data)
+        except zlib.error as exc:
+            raise ParseError("Cannot decode HTTP body with Content-Encoding "
+                             "%r: %s" % (self._encoding, exc))
+
+    def flush(self):
+        """
+        Return the remaining decoded data, as a :term:`byte string`.
+        """
+        return self._decompobj.flush()
+
+
+def _content_decoder(content_encoding):
+    """
+    Return a :class:`_ContentDecoder` object for the value of an HTTP
+    Content-Encoding header, or `None` if the body is not encoded.
+
+    Raises:
+
+      :exc:`~pywbem.ParseError`: Unsupported content encoding.
+    """
+    if content_encoding is None:
+        return None
+    encoding = content_encoding.strip().lower()
+    if encoding in ('', 'identity'):
+        return None
+    if encoding in ('gzip', 'x-gzip'):
+        return _ContentDecoder('gzip')
+    if encoding == 'deflate':
+        return _ContentDecoder('deflate')
+    raise ParseError("Unsupported Content-Encoding in HTTP body: %r" %
+                     content_encoding)
+
+
+def decode_content(data, content_encoding):
+    """
+    Return the decoded HTTP body for the value of an HTTP Content-Encoding
+    header. The supported encodings are identity, gzip (including x-gzip)
+    and deflate.
+
+    Parameters:
+
+      data (:term:`byte string`): The HTTP body.
+
+      content_encoding (:term:`string`): The value of the Content-Encoding
+        header, or `None` if the header was not present.
+
+    Returns:
+
+      :term:`byte string`: The decoded HTTP body.
+
+    Raises:
+
+      :exc:`~pywbem.ParseError`: Unsupported encoding or invalid encoded data.
+    """
+    decoder = _content_decoder(content_encoding)
+    if decoder is None:
+        return data
+    return decoder.decompress(data) + decoder.flush()
+
+
+def gzip_content(data):
+    """
+    Return the HTTP body compressed with the gzip Content-Encoding.
+
+    Parameters:
+
+      data (:term:`byte string`): The HTTP body.
+
+    Returns:
+
+      :term:`byte string`: The compressed HTTP body.
+    """
+    compobj = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compobj.compress(data) + compobj.flush()
+
+
+class HTTPResponseStream(object):
+    """
+    The body of a successful HTTP response that is read incrementally,
+    as returned by :func:`wbem_request` when invoked with `stream=True`.
+
+    The body is read in pieces using :meth:`iter_chunks`, so that it can be
+    processed while it is still arriving from the WBEM server. The stream
+    must be closed using :meth:`close` when done with it. If the body has
+    been read completely, closing the stream returns the connection to the
+    connection pool (if any); otherwise the connection is closed because it
+    cannot be used for subsequent requests.
+
+    The timeout of the connection applies to each individual read from the
+    socket, and not to the reading of the complete body.
+
+    If the body has a Content-Encoding of gzip or deflate, it is decoded
+    while it is being read.
+    """
+
+    def __init__(self, response, client, conn_pool=None, pool_key=None,
+                 decoder=None):
+        self._response = response
+        self._client = client
+        self._conn_pool = conn_pool
+        self._pool_key = pool_key
+        self._decoder = decoder
+        self._complete = False
+        self._closed = False
+        #: :term:`integer`: Number of bytes of the (decoded) body read so far.
+        self.bytes_read = 0
+        #: :term:`integer`: Number of bytes of the body read so far, as
+        #: transferred on the network (i.e. before decoding).
+        self.wire_bytes_read = 0
+
+    def iter_chunks(self, chunk_size=65536):
+        """
+        Generator that reads the body of the HTTP response and yields it in
+        pieces of at most `chunk_size` bytes, as :term:`byte string`.
+
+        Raises:
+
+          :exc:`~pywbem.ConnectionError`
+          :exc:`~pywbem.TimeoutError`
+        """
+        while True:
+            try:
+                chunk = self._response.read(chunk_size)
+            except socket.timeout as exc:
+                raise TimeoutError("The client timed out waiting for the "
+                                   "rest of the response: %s" % exc)
+            except httplib.IncompleteRead as exc:
+                raise ConnectionError("HTTP incomplete read: %s" % exc)
+            except httplib.HTTPException as exc:
+                raise ConnectionError("HTTP error: %s" % exc)
+            except SocketErrors as exc:
+                raise ConnectionError("Socket error: %s" % exc)
+            if not chunk:
+                break
+            self.wire_bytes_read += len(chunk)
+            if self._decoder is not None:
+                chunk = self._decoder.decompress(chunk)
+                if not chunk:
+                    continue
+            self.bytes_read += len(chunk)
+            yield chunk
+        if self._decoder is not None:
+            chunk = self._decoder.flush()
+            if chunk:
+                self.bytes_read += len(chunk)
+                yield chunk
+        self._complete = True
+
+    def close(self):
+        """
+        Close the stream and release its connection.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._complete and self._conn_pool is not None and \
+                not self._response.will_close:
+            self._conn_pool.put(self._pool_key, self._client)
+        else:
+            self._client.close()
+
+
 def parse_url(url, allow_defaults=True):
     """Return a tuple (`host`, `port`, `ssl`) from the URL specified in the
     `url` parameter.
@@ -347,7 +711,9 @@ def get_default_ca_certs():
 def wbem_request(url, data, creds, cimxml_headers=None, debug=False, x509=None,
                  verify_callback=None, ca_certs=None,
                  no_verification=False, timeout=None, recorders=None,
-                 conn_id=None):
+                 conn_id=None, conn_pool=None, stream=False,
+                 compression=False, compression_threshold=None,
+                 transfer_lens=None, idempotent=False):
     # pylint: disable=too-many-arguments,unused-argument
     # pylint: disable=too-many-locals
     """
@@ -424,12 +790,59 @@ def wbem_request(url, data, creds, cimxml_headers=None, debug=False, x509=None,
         string that uniquely defines a connection.  Used as part of any
         logs created.
 
+      conn_pool (:class:`HTTPConnectionPool`):
+        Pool of persistent HTTP connections to be used for the request.
+        An idle connection from the pool is reused if one is available for
+        the same connection parameters, and the connection is returned to
+        the pool after the response has been read, unless the WBEM server
+        indicated that it closes the connection.
+        If a reused connection turns out to have been closed by the WBEM
+        server, the request is transparently retried on a new connection,
+        if the request had not been sent completely or if `idempotent` is
+        `True`. Otherwise, :exc:`~pywbem.ConnectionError` is raised, because
+        the WBEM server may have performed the operation.
+        `None` means that a new connection is created for the request and
+        is not reused afterwards.
+
+      stream (:class:`py:bool`):
+        Boolean indicating that the body of a successful response is not read
+        by this function, but is returned as a :class:`HTTPResponseStream`
+        object for reading it incrementally. The response body is then not
+        staged in the operation recorders.
+
+      compression (:class:`py:bool`):
+        Boolean indicating that HTTP compression is used: The gzip and
+        deflate content encodings are advertised for the response, and
+        a response body with one of these content encodings is decoded
+        (incrementally, if `stream` is `True`). In addition, the request body
+        is compressed with the gzip content encoding if its size reaches
+        `compression_threshold`.
+
+      compression_threshold (:term:`integer`):
+        Minimum size in Bytes of the request body for compressing it, if
+        `compression` is `True`. `None` means that the request body is not
+        compressed.
+
+      transfer_lens (:class:`py:list`):
+        If not `None`, a list whose first two items are set to the sizes in
+        Bytes of the request body and of the response body as transferred on
+        the network (i.e. after compression, if any). If `stream` is `True`,
+        the size of the response body is not set; it is available from the
+        returned :class:`HTTPResponseStream` object.
+
+      idempotent (:class:`py:bool`):
+        Boolean indicating that the request may be sent again to the WBEM
+        server after it has been sent completely, i.e. that the operation
+        does not modify anything on the WBEM server. See `conn_pool`.
+
     Returns:
 
         Tuple containing:
 
             The CIM-XML formatted response data from the WBEM server, as a
-            :term:`byte string` object.
+            :term:`byte string` object, or as a :class:`HTTPResponseStream`
+            object if `stream` is `True`. The response data is decoded if it
+            was compressed.
 
             The server response time in seconds as floating point number if
             this data was received from the server. If no data returned
@@ -677,6 +1090,17 @@ def wbem_request(url, data, creds, cimxml_headers=None, debug=False, x509=None,
 
     data = b'<?xml version="1.0" encoding="utf-8" ?>\n' + data
 
+    # The request body as transferred on the network
+    if compression and compression_threshold is not None and \
+            len(data) >= compression_threshold:
+        body_data = gzip_content(data)
+        content_encoding = 'gzip'
+    else:
+        body_data = data
+        content_encoding = None
+    if transfer_lens is not None:
+        transfer_lens[0:2] = [len(body_data), 0]
+
     # Note that certs get passed even if ca_certs is None and
     # no_verification=False
     if not no_verification and ca_certs is None:
@@ -686,17 +1110,27 @@ def wbem_request(url, data, creds, cimxml_headers=None, debug=False, x509=None,
 
     local = False
     svr_resp_time = None
+    client = None
+    reused_conn = False
+    pool_key = None
+    if conn_pool is not None:
+        pool_key = (url, key_file, cert_file, ca_certs, verify_callback,
+                    timeout)
+        client = conn_pool.get(pool_key)
+        reused_conn = client is not None
     if use_ssl:
-        client = HTTPSConnection(host=host,
-                                 port=port,
-                                 key_file=key_file,
-                                 cert_file=cert_file,
-                                 ca_certs=ca_certs,
-                                 verify_callback=verify_callback,
-                                 timeout=timeout)
+        if client is None:
+            client = HTTPSConnection(host=host,
+                                     port=port,
+                                     key_file=key_file,
+                                     cert_file=cert_file,
+                                     ca_certs=ca_certs,
+                                     verify_callback=verify_callback,
+                                     timeout=timeout)
     else:
         if url.startswith('http'):
-            client = HTTPConnection(host=host, port=port, timeout=timeout)
+            if client is None:
+                client = HTTPConnection(host=host, port=port, timeout=timeout)
         else:
             if url.startswith('file:'):
                 url_ = url[5:]
@@ -705,7 +1139,8 @@ def wbem_request(url, data, creds, cimxml_headers=None, debug=False, x509=None,
             try:
                 status = os.stat(url_)
                 if S_ISSOCK(status.st_mode):
-                    client = FileHTTPConnection(url_)
+                    if client is None:
+                        client = FileHTTPConnection(url_)
                     local = True
                 else:
                     raise ConnectionError('File URL is not a socket: %s' % url)
@@ -734,18 +1169,24 @@ def wbem_request(url, data, creds, cimxml_headers=None, debug=False, x509=None,
             recorder.stage_http_response1(conn_id, None, None, None, None)
             recorder.stage_http_response2(None)
 
-    with HTTPTimeout(timeout, client):
+    with HTTPTimeout(timeout, client,
+                     close_on_error=conn_pool is not None):
 
         try_limit = 5  # Number of tries with authentication challenges.
 
         for num_tries in range(0, try_limit):  # pylint: disable=unused-variable
 
-            client.putrequest(method, target)
+            # httplib sends "Accept-Encoding: identity" unless skipped
+            client.putrequest(method, target, skip_accept_encoding=compression)
 
             standard_headers = [
                 ('Content-type', 'application/xml; charset="utf-8"'),
-                ('Content-length', str(len(data))),
+                ('Content-length', str(len(body_data))),
             ]
+            if compression:
+                standard_headers.append(('Accept-Encoding', ACCEPT_ENCODING))
+            if content_encoding:
+                standard_headers.append(('Content-Encoding', content_encoding))
             if local_auth_header:
                 standard_headers.append(local_auth_header)
             elif creds is not None:
@@ -770,6 +1211,9 @@ def wbem_request(url, data, creds, cimxml_headers=None, debug=False, x509=None,
                 v = urllib.parse.quote(v)
                 client.putheader(n, v)
 
+            # Indicates that the complete request has been sent
+            request_sent = False
+
             try:
 
                 # See RFC 2616 section 8.2.2
@@ -788,8 +1232,14 @@ def wbem_request(url, data, creds, cimxml_headers=None, debug=False, x509=None,
                     # endheaders() is the first method in this sequence that
                     # actually sends something to the server (using send()).
                     client.endheaders()
-                    client.send(data)
+                    client.send(body_data)
+                    request_sent = True
                 except SocketErrors as exc:
+                    if reused_conn:
+                        # A reused persistent connection may have been
+                        # closed by the server while it was idle. This is
+                        # handled by reconnecting, below.
+                        raise
                     if exc.args[0] == errno.ECONNRESET:
                         warnings.warn("Ignoring socket error ECONNRESET "
                                       "(connection reset), continuing with "
@@ -910,8 +1360,24 @@ def wbem_request(url, data, creds, cimxml_headers=None, debug=False, x509=None,
 
                     raise HTTPError(response.status, response.reason)
 
+                if compression:
+                    decoder = _content_decoder(
+                        response.getheader('Content-Encoding', None))
+                else:
+                    decoder = None
+
+                if stream:
+                    body = HTTPResponseStream(response, client,
+                                              conn_pool, pool_key, decoder)
+                    break
+
                 body = response.read()
 
+                if transfer_lens is not None:
+                    transfer_lens[1] = len(body)
+                if decoder is not None:
+                    body = decoder.decompress(body) + decoder.flush()
+
                 if recorders:
                     for recorder in recorders:
                         recorder.stage_http_response2(body)
@@ -928,6 +1394,14 @@ def wbem_request(url, data, creds, cimxml_headers=None, debug=False, x509=None,
                 # a BadStatusLine exception with an empty line.
                 if exc.line is None or exc.line.strip().strip("'") in \
                         ('', 'None'):
+                    if reused_conn and idempotent:
+                        # The server closed the idle persistent connection,
+                        # presumably before our request arrived. Retry on a
+                        # new one, since the request can be sent again.
+                        client.close()
+                        reused_conn = False
+                        conn_pool.reconnected()
+                        continue  # with next retry
                     # TODO 4/2018 AM Enable retry logic. For unknown reasons,
                     #   retrying causes testclient test case SocketError104 to
                     #   fail. Also, retrying needs to be tested with a real
@@ -956,11 +1430,30 @@ def wbem_request(url, data, creds, cimxml_headers=None, debug=False, x509=None,
                 # Base class for all httplib exceptions
                 raise ConnectionError("HTTP error: %s" % exc)
             except SocketErrors as exc:
+                if reused_conn and (idempotent or not request_sent) and \
+                        exc.args and \
+                        exc.args[0] in (errno.ECONNRESET, errno.EPIPE):
+                    # The server closed the idle persistent connection
+                    # before our request arrived (or the request can be sent
+                    # again). Retry on a new one.
+                    client.close()
+                    reused_conn = False
+                    conn_pool.reconnected()
+                    continue  # with next retry
                 raise ConnectionError("Socket error: %s" % exc)
 
             # Operation was successful
             break
 
+    if conn_pool is not None and not stream:
+        if response.will_close:
+            # The server indicated that it closes the connection (e.g. via
+            # the 'Connection: close' header); httplib has already
+            # detached the socket from the connection.
+            client.close()
+        else:
+            conn_pool.put(pool_key, client)
+
     return body, svr_resp_time
 
 
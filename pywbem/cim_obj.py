@@ -252,6 +252,7 @@ from xml.dom.minidom import Element
 import six
 
 from . import cim_xml
+from . import config
 from .config import DEBUG_WARNING_ORIGIN, SEND_VALUE_NULL
 from .cim_types import _CIMComparisonMixin, type_from_name, cimtype, \
     atomic_to_cim_xml, CIMType, CIMDateTime, Uint8, Sint8, Uint16, Sint16, \
@@ -438,6 +439,37 @@ def cmpdict(dict1, dict2):
     return 1
 
 
+# Empty NocaseDict that is used for read-only access in place of qualifier
+# dictionaries that have not been allocated. It must never be modified.
+_EMPTY_NOCASEDICT = NocaseDict()
+
+# Types of CIM values whose objects cannot be modified, and therefore do not
+# need to be copied in deep copies.
+_IMMUTABLE_VALUE_TYPES = six.string_types + number_types + (CIMDateTime,)
+
+
+def _slots_getstate(obj):
+    """
+    Return the state of an object of a class with __slots__ for pickling, as
+    a dictionary of the attribute values.
+    """
+    state = dict(getattr(obj, '__dict__', {}))
+    for cls in type(obj).__mro__:
+        for name in cls.__dict__.get('__slots__', ()):
+            if hasattr(obj, name):
+                state[name] = getattr(obj, name)
+    return state
+
+
+def _slots_setstate(obj, state):
+    """
+    Set the state of an object of a class with __slots__ when unpickling,
+    from a state returned by :func:`_slots_getstate`.
+    """
+    for name, value in six.iteritems(state):
+        setattr(obj, name, value)
+
+
 def _qualifiers_tomof(qualifiers, indent, maxline=MAX_MOF_LINE):
     """
     Return a MOF fragment with the qualifier values, including the surrounding
@@ -1091,6 +1123,47 @@ def _cim_qualifier(key, value):
     return qual
 
 
+class _KeybindingsDict(NocaseDict):
+    """
+    The NocaseDict used for the keybindings of CIMInstanceName objects.
+
+    It counts its modifications, so that CIMInstanceName objects can detect
+    whether their cached comparison key and hash value are still valid,
+    without a reference from the dictionary back to the instance path.
+    """
+
+    __slots__ = ('_version',)
+
+    def __init__(self, *args, **kwargs):
+        self._version = 0
+        super(_KeybindingsDict, self).__init__(*args, **kwargs)
+
+    def __getstate__(self):
+        """
+        Return the state of the object for pickling.
+        """
+        return super(_KeybindingsDict, self).__getstate__() + (self._version,)
+
+    def __setstate__(self, state):
+        """
+        Set the state of the object when unpickling.
+        """
+        super(_KeybindingsDict, self).__setstate__(state[:-1])
+        self._version = state[-1]
+
+    def __setitem__(self, key, value):
+        super(_KeybindingsDict, self).__setitem__(key, value)
+        self._version += 1
+
+    def __delitem__(self, key):
+        super(_KeybindingsDict, self).__delitem__(key)
+        self._version += 1
+
+    def clear(self):
+        super(_KeybindingsDict, self).clear()
+        self._version += 1
+
+
 class CIMInstanceName(_CIMComparisonMixin):
     """
     A CIM instance path (aka *CIM instance name*).
@@ -1105,6 +1178,12 @@ class CIMInstanceName(_CIMComparisonMixin):
     periods in which their public attributes remain unchanged.
     """
 
+    # _cmp_key and _hash are the cached comparison key and hash value, and
+    # _cmp_key_version is the modification count of the keybindings they
+    # were determined from. The setter methods invalidate them.
+    __slots__ = ('_classname', '_keybindings', '_host', '_namespace',
+                 '_cmp_key', '_cmp_key_version', '_hash')
+
     def __init__(self, classname, keybindings=None, host=None, namespace=None):
         # pylint: disable=line-too-long
         """
@@ -1163,12 +1242,66 @@ class CIMInstanceName(_CIMComparisonMixin):
           TypeError: An error in the provided argument types.
         """  # noqa: E501
 
+        self._cmp_key = None
+        self._cmp_key_version = None
+        self._hash = None
+
         # We use the respective setter methods:
         self.classname = classname
         self.keybindings = keybindings
         self.namespace = namespace
         self.host = host
 
+    def __getstate__(self):
+        """
+        Return the state of the object for pickling. This is needed because
+        the class uses __slots__.
+
+        The cached comparison key and hash value are not included, because
+        the hash values of strings differ between Python processes.
+        """
+        state = _slots_getstate(self)
+        state['_cmp_key'] = None
+        state['_hash'] = None
+        return state
+
+    def __setstate__(self, state):
+        """
+        Set the state of the object when unpickling.
+        """
+        _slots_setstate(self, state)
+
+    def __deepcopy__(self, memo):
+        """
+        Return a deep copy of the object, for :func:`py:copy.deepcopy`.
+
+        This is equivalent to the default deep copy, but faster: Keybinding
+        values of immutable types (e.g. strings and numbers) are shared with
+        the original object, and only the other keybinding values (e.g.
+        :class:`~pywbem.CIMInstanceName` objects of reference keybindings)
+        are deep copied.
+        """
+        # pylint: disable=protected-access
+        result = self.__class__.__new__(self.__class__)
+        memo[id(self)] = result
+        result._classname = self._classname
+        result._host = self._host
+        result._namespace = self._namespace
+        result._cmp_key = None
+        result._cmp_key_version = None
+        result._hash = None
+        keybindings = _KeybindingsDict()
+        data = keybindings._data
+        for key, value in six.iteritems(self._keybindings._data):
+            if value is not None and \
+                    not isinstance(value, _IMMUTABLE_VALUE_TYPES):
+                value = copy_.deepcopy(value, memo)
+            data[key] = value
+        keybindings._keys.update(self._keybindings._keys)
+        keybindings.allow_unnamed_keys = self._keybindings.allow_unnamed_keys
+        result._keybindings = keybindings
+        return result
+
     @property
     def classname(self):
         """
@@ -1188,6 +1321,7 @@ class CIMInstanceName(_CIMComparisonMixin):
 
         # pylint: disable=attribute-defined-outside-init
         self._classname = _ensure_unicode(classname)
+        self._cmp_key = None
 
         # We perform this check after the initialization to avoid errors
         # in test tools that show the object with repr().
@@ -1253,8 +1387,9 @@ class CIMInstanceName(_CIMComparisonMixin):
     def keybindings(self, keybindings):
         """Setter method; for a description see the getter method."""
         # pylint: disable=attribute-defined-outside-init
-        self._keybindings = NocaseDict()
+        self._keybindings = _KeybindingsDict()
         self._keybindings.allow_unnamed_keys = True
+        self._cmp_key = None
         if keybindings:
             try:
                 # This is used for iterables:
@@ -1291,6 +1426,7 @@ class CIMInstanceName(_CIMComparisonMixin):
         """Setter method; for a description see the getter method."""
         # pylint: disable=attribute-defined-outside-init
         self._namespace = _ensure_unicode(namespace)
+        self._cmp_key = None
         if self._namespace is not None:
             # In Python 3, a byte string cannot be stripped by a unicode char
             # Therefore, the stripping needs to be done after the unicode
@@ -1318,6 +1454,7 @@ class CIMInstanceName(_CIMComparisonMixin):
         """Setter method; for a description see the getter method."""
         # pylint: disable=attribute-defined-outside-init
         self._host = _ensure_unicode(host)
+        self._cmp_key = None
 
     def _cmp(self, other):
         """
@@ -1342,24 +1479,73 @@ class CIMInstanceName(_CIMComparisonMixin):
         if not isinstance(other, CIMInstanceName):
             raise TypeError("other must be CIMInstanceName, but is: %s" %
                             type(other))
+        # pylint: disable=protected-access
+        self_key = self._get_cmp_key()
+        if self_key is not None and self_key == other._get_cmp_key():
+            return 0
         return (cmpname(self.host, other.host) or
                 cmpname(self.namespace, other.namespace) or
                 cmpname(self.classname, other.classname) or
                 cmpdict(self.keybindings, other.keybindings))
 
+    def _get_cmp_key(self):
+        """
+        Return the comparison key of this instance path, or `None` if a
+        keybinding value is not hashable or is a
+        :class:`~pywbem.CIMInstanceName` object.
+
+        The comparison key is a tuple of the lower-cased host, namespace and
+        class name, and a frozenset of the keybinding items with lower-cased
+        names. Two instance paths compare equal if their comparison keys
+        are equal.
+
+        The comparison key is cached until an attribute is set or the
+        keybindings are modified. Since modifications of a
+        :class:`~pywbem.CIMInstanceName` object used as the value of a
+        reference keybinding cannot be detected, there is no comparison key
+        for instance paths with such keybindings.
+        """
+        # pylint: disable=protected-access
+        version = self._keybindings._version
+        if self._cmp_key is None or self._cmp_key_version != version:
+            self._cmp_key = None
+            self._hash = None
+            for value in six.itervalues(self._keybindings._data):
+                if isinstance(value, CIMInstanceName):
+                    return None
+            try:
+                keybindings = frozenset(six.iteritems(self._keybindings._data))
+            except TypeError:
+                return None
+            self._cmp_key = (
+                None if self._host is None else self._host.lower(),
+                None if self._namespace is None else self._namespace.lower(),
+                self._classname.lower(),
+                keybindings)
+            self._cmp_key_version = version
+            self._hash = None
+        return self._cmp_key
+
     def __hash__(self):
         """
         Return a hash value based on the public attributes of this class, taking
         into account any case insensitivities described for these attributes.
         This approach causes this class to be :term:`unchanged-hashable`.
-        """
-        hashes = (
-            _hash_name(self.host),
-            _hash_name(self.namespace),
-            _hash_name(self.classname),
-            _hash_dict(self.keybindings),
-        )
-        return hash(hashes)
+
+        The hash value is cached together with the comparison key.
+        """
+        cmp_key = self._get_cmp_key()
+        if cmp_key is None:
+            hashes = (
+                _hash_name(self.host),
+                _hash_name(self.namespace),
+                _hash_name(self.classname),
+                _hash_dict(self.keybindings),
+            )
+            return hash(hashes)
+        if self._hash is None:
+            self._hash = hash(cmp_key)
+        return self._hash
 
     def __str__(self):
         """
@@ -1605,6 +1791,71 @@ class CIMInstanceName(_CIMComparisonMixin):
             cim_xml.NAMESPACEPATH(cim_xml.HOST(self.host), localnsp_xml),
             instancename_xml)
 
+    def _write_cimxml(self, buf, ignore_host=False, ignore_namespace=False):
+        """
+        Fast CIM-XML writer: Write the CIM-XML representation returned by
+        :meth:`tocimxml` to the buffer (a list of unicode strings).
+        """
+
+        if self.namespace is None or ignore_namespace:
+            self._write_instancename(buf)
+            return
+
+        if self.host is None or ignore_host:
+            pos = cim_xml._xml_start(buf, u'LOCALINSTANCEPATH')
+            cim_xml._xml_localnamespacepath(buf, self.namespace)
+            self._write_instancename(buf)
+            cim_xml._xml_end(buf, u'LOCALINSTANCEPATH', pos)
+            return
+
+        pos = cim_xml._xml_start(buf, u'INSTANCEPATH')
+        cim_xml._xml_namespacepath(buf, self.host, self.namespace)
+        self._write_instancename(buf)
+        cim_xml._xml_end(buf, u'INSTANCEPATH', pos)
+
+    def _write_instancename(self, buf):
+        """
+        Fast CIM-XML writer: Write the INSTANCENAME element to the buffer.
+        """
+
+        pos = cim_xml._xml_start(buf, u'INSTANCENAME',
+                                 [(u'CLASSNAME', self.classname)])
+
+        for key, value in self.keybindings.items():
+
+            pos_kb = cim_xml._xml_start(buf, u'KEYBINDING', [(u'NAME', key)])
+
+            if isinstance(value, CIMInstanceName):
+                pos_ref = cim_xml._xml_start(buf, u'VALUE.REFERENCE')
+                value._write_cimxml(buf)  # pylint: disable=protected-access
+                cim_xml._xml_end(buf, u'VALUE.REFERENCE', pos_ref)
+                cim_xml._xml_end(buf, u'KEYBINDING', pos_kb)
+                continue
+
+            # See tocimxml() for the type checks
+            if isinstance(value, bool):
+                type_ = 'boolean'
+                if value:
+                    value = 'TRUE'
+                else:
+                    value = 'FALSE'
+            elif isinstance(value, number_types):
+                type_ = 'numeric'
+                value = str(value)
+            elif isinstance(value, six.string_types):
+                type_ = 'string'
+            else:
+                raise TypeError('Keybinding %s has invalid type: %s' %
+                                (key, builtin_type(value)))
+
+            pos_kv = cim_xml._xml_start(buf, u'KEYVALUE',
+                                        [(u'VALUETYPE', type_)])
+            cim_xml._xml_text(buf, value)
+            cim_xml._xml_end(buf, u'KEYVALUE', pos_kv)
+            cim_xml._xml_end(buf, u'KEYBINDING', pos_kb)
+
+        cim_xml._xml_end(buf, u'INSTANCENAME', pos)
+
     def tocimxmlstr(self, indent=None, ignore_host=False,
                     ignore_namespace=False):
         """
@@ -1638,6 +1889,10 @@ class CIMInstanceName(_CIMComparisonMixin):
             The CIM-XML representation of the value, as a
             :term:`unicode string`.
         """
+        if indent is None and config.FAST_CIMXML_WRITER:
+            buf = []
+            self._write_cimxml(buf, ignore_host, ignore_namespace)
+            return u''.join(buf)
         xml_elem = self.tocimxml(ignore_host, ignore_namespace)
         return tocimxmlstr(xml_elem, indent)
 
@@ -2153,6 +2408,9 @@ class CIMInstance(_CIMComparisonMixin):
     periods in which their public attributes remain unchanged.
     """
 
+    __slots__ = ('_classname', '_path', '_property_list', '_properties',
+                 '_qualifiers')
+
     # pylint: disable=too-many-arguments
     def __init__(self, classname, properties=None, qualifiers=None,
                  path=None, property_list=None):
@@ -2226,6 +2484,19 @@ class CIMInstance(_CIMComparisonMixin):
         self.properties = properties  # Depends on path & property_list set
         self.qualifiers = qualifiers
 
+    def __getstate__(self):
+        """
+        Return the state of the object for pickling. This is needed because
+        the class uses __slots__.
+        """
+        return _slots_getstate(self)
+
+    def __setstate__(self, state):
+        """
+        Set the state of the object when unpickling.
+        """
+        _slots_setstate(self, state)
+
     @property
     def classname(self):
         """
@@ -2353,32 +2624,37 @@ class CIMInstance(_CIMComparisonMixin):
         Note that :term:`DSP0200` has deprecated the presence of qualifier
         values on CIM instances.
         """
+        if self._qualifiers is None:
+            self._qualifiers = NocaseDict()
         return self._qualifiers
 
     @qualifiers.setter
     def qualifiers(self, qualifiers):
         """Setter method; for a description see the getter method."""
         # We make sure that the dictionary is a NocaseDict object, and that the
-        # property values are CIMQualifier objects:
+        # property values are CIMQualifier objects. The dictionary is
+        # allocated only when there are qualifiers, or by the getter method:
         # pylint: disable=attribute-defined-outside-init
+        if not qualifiers:
+            self._qualifiers = None
+            return
         self._qualifiers = NocaseDict()
-        if qualifiers:
-            try:
-                # This is used for iterables:
-                iterator = qualifiers.items()
-            except AttributeError:
-                # This is used for dictionaries:
-                iterator = qualifiers
-            for item in iterator:
-                if isinstance(item, CIMQualifier):
-                    key = item.name
-                    value = item
-                elif isinstance(item, tuple):
-                    key, value = item
-                else:
-                    raise TypeError("Input object for qualifiers has "
-                                    "invalid item in iterable: %r" % item)
-                self.qualifiers[key] = _cim_qualifier(key, value)
+        try:
+            # This is used for iterables:
+            iterator = qualifiers.items()
+        except AttributeError:
+            # This is used for dictionaries:
+            iterator = qualifiers
+        for item in iterator:
+            if isinstance(item, CIMQualifier):
+                key = item.name
+                value = item
+            elif isinstance(item, tuple):
+                key, value = item
+            else:
+                raise TypeError("Input object for qualifiers has "
+                                "invalid item in iterable: %r" % item)
+            self._qualifiers[key] = _cim_qualifier(key, value)
 
     @property
     def path(self):
@@ -2468,7 +2744,8 @@ class CIMInstance(_CIMComparisonMixin):
         return (cmpname(self.classname, other.classname) or
                 cmpitem(self.path, other.path) or
                 cmpdict(self.properties, other.properties) or
-                cmpdict(self.qualifiers, other.qualifiers))
+                cmpdict(self._qualifiers or _EMPTY_NOCASEDICT,
+                        other._qualifiers or _EMPTY_NOCASEDICT))
 
     def __hash__(self):
         """
@@ -2481,7 +2758,7 @@ class CIMInstance(_CIMComparisonMixin):
             _hash_name(self.classname),
             _hash_item(self.path),
             _hash_dict(self.properties),
-            _hash_dict(self.qualifiers),
+            _hash_dict(self._qualifiers or _EMPTY_NOCASEDICT),
         )
         return hash(hashes)
 
@@ -2570,7 +2847,7 @@ class CIMInstance(_CIMComparisonMixin):
         result = CIMInstance(
             self.classname,
             properties=self.properties,  # setter copies
-            qualifiers=self.qualifiers)  # setter copies
+            qualifiers=self._qualifiers)  # setter copies
 
         # The path is set after the init method, because the init method
         # would overwrite the values of keybindings that have corresponding
@@ -2749,7 +3026,8 @@ class CIMInstance(_CIMComparisonMixin):
         instance_xml = cim_xml.INSTANCE(
             self.classname,
             properties=[p.tocimxml() for p in self.properties.values()],
-            qualifiers=[q.tocimxml() for q in self.qualifiers.values()])
+            qualifiers=[q.tocimxml() for q in
+                        (self._qualifiers or _EMPTY_NOCASEDICT).values()])
 
         if self.path is None or ignore_path:
             return instance_xml
@@ -2768,6 +3046,45 @@ class CIMInstance(_CIMComparisonMixin):
             self.path.tocimxml(),
             instance_xml)
 
+    def _write_cimxml(self, buf, ignore_path=False):
+        """
+        Fast CIM-XML writer: Write the CIM-XML representation returned by
+        :meth:`tocimxml` to the buffer (a list of unicode strings).
+        """
+
+        # pylint: disable=protected-access
+
+        for key, value in self.properties.items():
+            if not isinstance(value, CIMProperty):
+                raise TypeError("Property %s has invalid type: %s "
+                                "(must be CIMProperty)" %
+                                (key, builtin_type(value)))
+
+        if self.path is None or ignore_path:
+            outer_tag = None
+        elif self.path.namespace is None:
+            outer_tag = u'VALUE.NAMEDINSTANCE'
+        elif self.path.host is None:
+            outer_tag = u'VALUE.OBJECTWITHLOCALPATH'
+        else:
+            outer_tag = u'VALUE.INSTANCEWITHPATH'
+
+        if outer_tag:
+            pos_outer = cim_xml._xml_start(buf, outer_tag)
+            self.path._write_cimxml(buf)
+
+        pos = cim_xml._xml_start(buf, u'INSTANCE',
+                                 [(u'CLASSNAME', self.classname)])
+        if self._qualifiers:
+            for q in self._qualifiers.values():
+                q._write_cimxml(buf)
+        for p in self.properties.values():
+            p._write_cimxml(buf)
+        cim_xml._xml_end(buf, u'INSTANCE', pos)
+
+        if outer_tag:
+            cim_xml._xml_end(buf, outer_tag, pos_outer)
+
     def tocimxmlstr(self, indent=None, ignore_path=False):
         """
         *New in pywbem 0.9.*
@@ -2797,6 +3114,10 @@ class CIMInstance(_CIMComparisonMixin):
             The CIM-XML representation of the object, as a
             :term:`unicode string`.
         """
+        if indent is None and config.FAST_CIMXML_WRITER:
+            buf = []
+            self._write_cimxml(buf, ignore_path)
+            return u''.join(buf)
         xml_elem = self.tocimxml(ignore_path)
         return tocimxmlstr(xml_elem, indent)
 
@@ -3138,6 +3459,33 @@ class CIMClassName(_CIMComparisonMixin):
             cim_xml.NAMESPACEPATH(cim_xml.HOST(self.host), localnsp_xml),
             classname_xml)
 
+    def _write_cimxml(self, buf, ignore_host=False, ignore_namespace=False):
+        """
+        Fast CIM-XML writer: Write the CIM-XML representation returned by
+        :meth:`tocimxml` to the buffer (a list of unicode strings).
+        """
+
+        if self.namespace is None or ignore_namespace:
+            outer_tag = None
+        elif self.host is None or ignore_host:
+            outer_tag = u'LOCALCLASSPATH'
+        else:
+            outer_tag = u'CLASSPATH'
+
+        if outer_tag:
+            pos = cim_xml._xml_start(buf, outer_tag)
+            if outer_tag == u'CLASSPATH':
+                cim_xml._xml_namespacepath(buf, self.host, self.namespace)
+            else:
+                cim_xml._xml_localnamespacepath(buf, self.namespace)
+
+        cim_xml._xml_end(buf, u'CLASSNAME',
+                         cim_xml._xml_start(buf, u'CLASSNAME',
+                                            [(u'NAME', self.classname)]))
+
+        if outer_tag:
+            cim_xml._xml_end(buf, outer_tag, pos)
+
     def tocimxmlstr(self, indent=None, ignore_host=False,
                     ignore_namespace=False):
         """
@@ -3171,6 +3519,10 @@ class CIMClassName(_CIMComparisonMixin):
             The CIM-XML representation of the object, as a
             :term:`unicode string`.
         """
+        if indent is None and config.FAST_CIMXML_WRITER:
+            buf = []
+            self._write_cimxml(buf, ignore_host, ignore_namespace)
+            return u''.join(buf)
         xml_elem = self.tocimxml(ignore_host, ignore_namespace)
         return tocimxmlstr(xml_elem, indent)
 
@@ -3912,6 +4264,10 @@ class CIMProperty(_CIMComparisonMixin):
     periods in which their public attributes remain unchanged.
     """
 
+    __slots__ = ('_name', '_value', '_type', '_reference_class',
+                 '_embedded_object', '_is_array', '_array_size',
+                 '_class_origin', '_propagated', '_qualifiers')
+
     # pylint: disable=too-many-statements
     def __init__(self, name, value, type=None,
                  class_origin=None, array_size=None, propagated=None,
@@ -4114,6 +4470,19 @@ class CIMProperty(_CIMComparisonMixin):
         self.qualifiers = qualifiers
         self.embedded_object = embedded_object
 
+    def __getstate__(self):
+        """
+        Return the state of the object for pickling. This is needed because
+        the class uses __slots__.
+        """
+        return _slots_getstate(self)
+
+    def __setstate__(self, state):
+        """
+        Set the state of the object when unpickling.
+        """
+        _slots_setstate(self, state)
+
     @property
     def name(self):
         """
@@ -4359,32 +4728,37 @@ class CIMProperty(_CIMComparisonMixin):
             q1 = prop.qualifiers['q1']  # Access "q1"
             del prop.qualifiers['q1']  # Delete "q1" from the class
         """
+        if self._qualifiers is None:
+            self._qualifiers = NocaseDict()
         return self._qualifiers
 
     @qualifiers.setter
     def qualifiers(self, qualifiers):
         """Setter method; for a description see the getter method."""
         # We make sure that the dictionary is a NocaseDict object, and that the
-        # property values are CIMQualifier objects:
+        # property values are CIMQualifier objects. The dictionary is
+        # allocated only when there are qualifiers, or by the getter method:
         # pylint: disable=attribute-defined-outside-init
+        if not qualifiers:
+            self._qualifiers = None
+            return
         self._qualifiers = NocaseDict()
-        if qualifiers:
-            try:
-                # This is used for iterables:
-                iterator = qualifiers.items()
-            except AttributeError:
-                # This is used for dictionaries:
-                iterator = qualifiers
-            for item in iterator:
-                if isinstance(item, CIMQualifier):
-                    key = item.name
-                    value = item
-                elif isinstance(item, tuple):
-                    key, value = item
-                else:
-                    raise TypeError("Input object for qualifiers has "
-                                    "invalid item in iterable: %r" % item)
-                self.qualifiers[key] = _cim_qualifier(key, value)
+        try:
+            # This is used for iterables:
+            iterator = qualifiers.items()
+        except AttributeError:
+            # This is used for dictionaries:
+            iterator = qualifiers
+        for item in iterator:
+            if isinstance(item, CIMQualifier):
+                key = item.name
+                value = item
+            elif isinstance(item, tuple):
+                key, value = item
+            else:
+                raise TypeError("Input object for qualifiers has "
+                                "invalid item in iterable: %r" % item)
+            self._qualifiers[key] = _cim_qualifier(key, value)
 
     def copy(self):
         """
@@ -4413,7 +4787,7 @@ class CIMProperty(_CIMComparisonMixin):
             propagated=self.propagated,
             is_array=self.is_array,
             reference_class=self.reference_class,
-            qualifiers=self.qualifiers)  # setter copies
+            qualifiers=self._qualifiers)  # setter copies
 
     def __str__(self):
         """
@@ -4460,7 +4834,8 @@ class CIMProperty(_CIMComparisonMixin):
         preserved from the :class:`~pywbem.CIMProperty` object.
         """
 
-        qualifiers = [q.tocimxml() for q in self.qualifiers.values()]
+        qualifiers = [q.tocimxml() for q in
+                      (self._qualifiers or _EMPTY_NOCASEDICT).values()]
 
         if self.is_array:
             assert self.type != 'reference'
@@ -4527,6 +4902,76 @@ class CIMProperty(_CIMComparisonMixin):
                 embedded_object=self.embedded_object,
                 qualifiers=qualifiers)
 
+    def _write_cimxml(self, buf):
+        """
+        Fast CIM-XML writer: Write the CIM-XML representation returned by
+        :meth:`tocimxml` to the buffer (a list of unicode strings).
+        """
+
+        # pylint: disable=protected-access
+
+        propagated = None if self.propagated is None else \
+            str(self.propagated).lower()
+
+        if self.is_array:
+            assert self.type != 'reference'
+            tag = u'PROPERTY.ARRAY'
+            array_size = None if self.array_size is None else \
+                str(self.array_size)
+            pos = cim_xml._xml_start(
+                buf, tag,
+                [(u'NAME', self.name),
+                 (u'TYPE', self.type),
+                 (u'ARRAYSIZE', array_size),
+                 (u'CLASSORIGIN', self.class_origin),
+                 (u'EmbeddedObject', self.embedded_object),
+                 (u'PROPAGATED', propagated)])
+        elif self.type == 'reference':
+            tag = u'PROPERTY.REFERENCE'
+            pos = cim_xml._xml_start(
+                buf, tag,
+                [(u'NAME', self.name),
+                 (u'REFERENCECLASS', self.reference_class),
+                 (u'CLASSORIGIN', self.class_origin),
+                 (u'PROPAGATED', propagated)])
+        else:
+            tag = u'PROPERTY'
+            pos = cim_xml._xml_start(
+                buf, tag,
+                [(u'NAME', self.name),
+                 (u'TYPE', self.type),
+                 (u'CLASSORIGIN', self.class_origin),
+                 (u'PROPAGATED', propagated),
+                 (u'EmbeddedObject', self.embedded_object)])
+
+        if self._qualifiers:
+            for q in self._qualifiers.values():
+                q._write_cimxml(buf)
+
+        if self.value is not None:
+            if self.is_array:
+                pos_arr = cim_xml._xml_start(buf, u'VALUE.ARRAY')
+                for v in self.value:
+                    if v is None:
+                        _write_cimxml_null(buf)
+                    elif self.embedded_object is not None:
+                        assert isinstance(v, (CIMInstance, CIMClass))
+                        _write_cimxml_value(buf, _embedded_cimxml(v))
+                    else:
+                        _write_cimxml_value(buf, atomic_to_cim_xml(v))
+                cim_xml._xml_end(buf, u'VALUE.ARRAY', pos_arr)
+            elif self.type == 'reference':
+                pos_ref = cim_xml._xml_start(buf, u'VALUE.REFERENCE')
+                self.value._write_cimxml(buf)
+                cim_xml._xml_end(buf, u'VALUE.REFERENCE', pos_ref)
+            elif self.embedded_object is not None:
+                assert isinstance(self.value, (CIMInstance, CIMClass))
+                _write_cimxml_value(buf, _embedded_cimxml(self.value))
+            else:
+                _write_cimxml_value(buf, atomic_to_cim_xml(self.value))
+
+        cim_xml._xml_end(buf, tag, pos)
+
     def tocimxmlstr(self, indent=None):
         """
         *New in pywbem 0.9.*
@@ -4553,6 +4998,10 @@ class CIMProperty(_CIMComparisonMixin):
             The CIM-XML representation of the object, as a
             :term:`unicode string`.
         """
+        if indent is None and config.FAST_CIMXML_WRITER:
+            buf = []
+            self._write_cimxml(buf)
+            return u''.join(buf)
         xml_elem = self.tocimxml()
         return tocimxmlstr(xml_elem, indent)
 
@@ -4692,7 +5141,8 @@ class CIMProperty(_CIMComparisonMixin):
                 cmpitem(self.array_size, other.array_size) or
                 cmpitem(self.propagated, other.propagated) or
                 cmpname(self.class_origin, other.class_origin) or
-                cmpdict(self.qualifiers, other.qualifiers))
+                cmpdict(self._qualifiers or _EMPTY_NOCASEDICT,
+                        other._qualifiers or _EMPTY_NOCASEDICT))
 
     def __hash__(self):
         """
@@ -4710,7 +5160,7 @@ class CIMProperty(_CIMComparisonMixin):
             _hash_item(self.array_size),
             _hash_item(self.propagated),
             _hash_name(self.class_origin),
-            _hash_dict(self.qualifiers),
+            _hash_dict(self._qualifiers or _EMPTY_NOCASEDICT),
         )
         return hash(hashes)
 
@@ -5933,6 +6383,9 @@ class CIMQualifier(_CIMComparisonMixin):
     periods in which their public attributes remain unchanged.
     """
 
+    __slots__ = ('_name', '_value', '_type', '_propagated', '_tosubclass',
+                 '_toinstance', '_overridable', '_translatable')
+
     # pylint: disable=too-many-arguments
     def __init__(self, name, value, type=None, propagated=None,
                  overridable=None, tosubclass=None, toinstance=None,
@@ -6058,6 +6511,19 @@ class CIMQualifier(_CIMComparisonMixin):
         self.toinstance = toinstance
         self.translatable = translatable
 
+    def __getstate__(self):
+        """
+        Return the state of the object for pickling. This is needed because
+        the class uses __slots__.
+        """
+        return _slots_getstate(self)
+
+    def __setstate__(self, state):
+        """
+        Set the state of the object when unpickling.
+        """
+        _slots_setstate(self, state)
+
     @property
     def name(self):
         """
@@ -6378,6 +6844,29 @@ class CIMQualifier(_CIMComparisonMixin):
                                  toinstance=self.toinstance,
                                  translatable=self.translatable)
 
+    def _write_cimxml(self, buf):
+        """
+        Fast CIM-XML writer: Write the CIM-XML representation returned by
+        :meth:`tocimxml` to the buffer (a list of unicode strings).
+        """
+
+        def flavor(value):
+            """Return the attribute value for a boolean flavor."""
+            return None if value is None else str(value).lower()
+
+        pos = cim_xml._xml_start(
+            buf, u'QUALIFIER',
+            [(u'NAME', self.name),
+             (u'TYPE', self.type),
+             (u'PROPAGATED', flavor(self.propagated)),
+             (u'OVERRIDABLE', flavor(self.overridable)),
+             (u'TOSUBCLASS', flavor(self.tosubclass)),
+             (u'TOINSTANCE', flavor(self.toinstance)),
+             (u'TRANSLATABLE', flavor(self.translatable))])
+        if self.value is not None:
+            _write_cimxml_atomic(buf, self.value)
+        cim_xml._xml_end(buf, u'QUALIFIER', pos)
+
     def tocimxmlstr(self, indent=None):
         """
         *New in pywbem 0.9.*
@@ -6404,6 +6893,10 @@ class CIMQualifier(_CIMComparisonMixin):
             The CIM-XML representation of the object, as a
             :term:`unicode string`.
         """
+        if indent is None and config.FAST_CIMXML_WRITER:
+            buf = []
+            self._write_cimxml(buf)
+            return u''.join(buf)
         xml_elem = self.tocimxml()
         return tocimxmlstr(xml_elem, indent)
 
@@ -7193,6 +7686,79 @@ def tocimxml(value):
     return cim_xml.VALUE(atomic_to_cim_xml(value))
 
 
+def _write_cimxml_null(buf):
+    """
+    Fast CIM-XML writer: Write the representation of a NULL array item to the
+    buffer.
+    """
+    if SEND_VALUE_NULL:
+        cim_xml._xml_end(buf, u'VALUE.NULL',
+                         cim_xml._xml_start(buf, u'VALUE.NULL'))
+    else:
+        cim_xml._xml_end(buf, u'VALUE', cim_xml._xml_start(buf, u'VALUE'))
+
+
+def _write_cimxml_value(buf, pcdata):
+    """
+    Fast CIM-XML writer: Write a VALUE element with the CIM-XML string value
+    (or `None`) to the buffer.
+    """
+    pos = cim_xml._xml_start(buf, u'VALUE')
+    if pcdata is not None:
+        cim_xml._xml_pcdata(buf, pcdata)
+    cim_xml._xml_end(buf, u'VALUE', pos)
+
+
+def _write_cimxml_atomic(buf, value):
+    """
+    Fast CIM-XML writer: Write a VALUE or VALUE.ARRAY element for the atomic
+    value or tuple/list of atomic values to the buffer.
+    """
+    if isinstance(value, (tuple, list)):
+        pos = cim_xml._xml_start(buf, u'VALUE.ARRAY')
+        for v in value:
+            if v is None:
+                _write_cimxml_null(buf)
+            else:
+                _write_cimxml_value(buf, atomic_to_cim_xml(v))
+        cim_xml._xml_end(buf, u'VALUE.ARRAY', pos)
+    else:
+        _write_cimxml_value(buf, atomic_to_cim_xml(value))
+
+
+def _embedded_cimxml(obj):
+    """
+    Return the CIM-XML string of an embedded instance or class, as a
+    :term:`unicode string`, using the fast CIM-XML writer where possible.
+    """
+    buf = []
+    _write_cimxml(buf, obj)
+    return u''.join(buf)
+
+
+def _write_cimxml(buf, value):
+    """
+    Fast CIM-XML writer: Write the CIM-XML representation returned by
+    :func:`tocimxml` to the buffer (a list of unicode strings).
+
+    CIM objects for which the fast CIM-XML writer is not implemented (e.g.
+    CIMClass) are converted to XML using their :meth:`tocimxml` method.
+    """
+    # pylint: disable=protected-access
+    if isinstance(value, (tuple, list)):
+        _write_cimxml_atomic(buf, value)
+    elif hasattr(value, '_write_cimxml'):
+        value._write_cimxml(buf)
+    elif hasattr(value, 'tocimxml'):
+        buf.append(cim_xml._to_unicode(value.tocimxml().toxml()))
+    else:
+        if value is None:
+            warnings.warn("A value of None for pywbem.tocimxml() has been "
+                          "deprecated.",
+                          DeprecationWarning, stacklevel=3)
+        _write_cimxml_value(buf, atomic_to_cim_xml(value))
+
+
 def tocimxmlstr(value, indent=None):
     """
     *New in pywbem 0.9.*
@@ -7224,6 +7790,10 @@ def tocimxmlstr(value, indent=None):
 
     if isinstance(value, Element):
         xml_elem = value
+    elif indent is None and config.FAST_CIMXML_WRITER:
+        buf = []
+        _write_cimxml(buf, value)
+        return u''.join(buf)
     else:
         xml_elem = tocimxml(value)
 
@@ -134,6 +134,9 @@ from __future__ import absolute_import
 
 import os
 import re
+import copy
+import time
+import threading
 from datetime import datetime, timedelta
 from xml.dom import minidom
 import warnings
@@ -141,20 +144,27 @@ from collections import namedtuple
 import logging
 
 import six
+from six.moves import queue
 from . import cim_xml
+from . import config
 from .config import DEFAULT_ITER_MAXOBJECTCOUNT
 from .cim_constants import DEFAULT_NAMESPACE, CIM_ERR_INVALID_PARAMETER, \
     CIM_ERR_NOT_SUPPORTED
 from .cim_types import CIMType, CIMDateTime, atomic_to_cim_xml
 from ._nocasedict import NocaseDict
 from .cim_obj import CIMInstance, CIMInstanceName, CIMClass, CIMClassName, \
-    CIMParameter, tocimxml, cimvalue
-from .cim_http import get_cimobject_header, wbem_request
-from .tupleparse import parse_cim
-from .tupletree import xml_to_tupletree_sax
+    CIMParameter, tocimxml, cimvalue, _write_cimxml
+from .cim_http import get_cimobject_header, wbem_request, \
+    HTTPConnectionPool
+from .tupleparse import parse_cim, parse_value_namedinstance
+from .tupletree import xml_to_tupletree_sax, CIMStreamParser
+from ._expatparse import parse_cimxml
 from .cim_http import parse_url
 from .exceptions import ParseError, CIMError
 from ._statistics import Statistics
+from ._adaptive_pull import AdaptiveMaxObjectCount
+from ._class_cache import ClassCache
+from ._valuemapping import ValueMapping
 from ._recorder import LogOperationRecorder
 from ._logging import DEFAULT_LOG_DETAIL_LEVEL, LOG_DESTINATIONS, \
     LOGGER_API_CALLS_NAME, LOGGER_HTTP_NAME, LOG_DETAIL_LEVELS, \
@@ -183,6 +193,18 @@ pull_query_result_tuple = namedtuple("pull_query_result_tuple",
                                      ["instances", "eos", "context",
                                       "query_result_class"])
 
+# Intrinsic operations that do not modify anything on the WBEM server, and
+# that can therefore be sent again when the persistent HTTP connection of a
+# connection pool turns out to have been closed by the WBEM server. The open
+# and pull operations are not included because they create or advance
+# enumeration contexts.
+_IDEMPOTENT_OPERATIONS = frozenset([
+    'GetClass', 'EnumerateClasses', 'EnumerateClassNames',
+    'GetInstance', 'EnumerateInstances', 'EnumerateInstanceNames',
+    'Associators', 'AssociatorNames', 'References', 'ReferenceNames',
+    'ExecQuery', 'GetQualifier', 'EnumerateQualifiers',
+])
+
 
 def _to_pretty_xml(xml_string):
     """
@@ -200,6 +222,38 @@ def _to_pretty_xml(xml_string):
     return re.sub(r'>( *[\r\n]+)+( *)<', r'>\n\2<', pretty_result)
 
 
+def _parse_reply(reply_xml):
+    """
+    Parse a CIM-XML response into its digested form, using the parser
+    selected by the :data:`~pywbem.config.DIRECT_CIMXML_PARSER` config
+    variable.
+
+    Raises:
+
+      pywbem.ParseError
+    """
+    if config.DIRECT_CIMXML_PARSER:
+        return parse_cimxml(reply_xml, "CIM-XML response")
+    tt_ = xml_to_tupletree_sax(reply_xml, "CIM-XML response")
+    return parse_cim(tt_)
+
+
+def _cimxml_node(value, fast):
+    """
+    Return a cim_xml node for the CIM object or CIM data type value.
+
+    If `fast` is True, the CIM-XML is created using the fast CIM-XML writer
+    (see :data:`~pywbem.config.FAST_CIMXML_WRITER`) and is returned as a
+    node that contains the CIM-XML string unchanged.
+    """
+    if fast:
+        buf = []
+        _write_cimxml(buf, value)
+        # pylint: disable=protected-access
+        return cim_xml._RawXML(u''.join(buf))
+    return tocimxml(value)
+
+
 def _check_classname(val):
     """
     Validate a classname.
@@ -221,19 +275,25 @@ def _iparam_propertylist(property_list):
         else property_list
 
 
-def _validateIterCommonParams(MaxObjectCount, OperationTimeout):
+def _validateIterCommonParams(MaxObjectCount, OperationTimeout,
+                              prefetch=None):
     """
     Validate common parameters for an iter... operation.
 
-    MaxObjectCount must be a positive non-zero integer or None.
+    MaxObjectCount must be a positive non-zero integer or an
+    AdaptiveMaxObjectCount object.
 
     OperationTimeout must be positive integer or zero
 
+    prefetch must be positive integer or zero or None
+
     Raises:
 
       ValueError: if these parameters are invalid
     """
-    if MaxObjectCount is None or MaxObjectCount <= 0:
+    if isinstance(MaxObjectCount, AdaptiveMaxObjectCount):
+        pass
+    elif MaxObjectCount is None or MaxObjectCount <= 0:
         raise ValueError('MaxObjectCount must be > 0 but is %s' %
                          MaxObjectCount)
 
@@ -241,6 +301,21 @@ def _validateIterCommonParams(MaxObjectCount, OperationTimeout):
         raise ValueError('OperationTimeout must be >= 0 but is %s' %
                          OperationTimeout)
 
+    if prefetch is not None and prefetch < 0:
+        raise ValueError('prefetch must be >= 0 but is %s' % prefetch)
+
+
+def _adaptive_tuner(MaxObjectCount):
+    """
+    Return the AdaptiveMaxObjectCount object specified for the MaxObjectCount
+    parameter of an iter... operation, after resetting it for a new
+    enumeration, or None if MaxObjectCount is a number.
+    """
+    if isinstance(MaxObjectCount, AdaptiveMaxObjectCount):
+        MaxObjectCount.reset()
+        return MaxObjectCount
+    return None
+
 
 def _validatePullParams(MaxObjectCount, context):
     """
@@ -273,11 +348,15 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
     default namespace (this allows omitting the namespace on subsequent
     operations).
 
-    As usual in HTTP, there is no persistent TCP connection; the connectedness
+    By default, there is no persistent TCP connection; the connectedness
     provided by this class is only conceptual. That is, the creation of the
     connection object does not cause any interaction with the WBEM server, and
     each subsequent WBEM operation performs an independent, state-less
-    HTTP/HTTPS request.
+    HTTP/HTTPS request. Optionally, a pool of persistent (keep-alive) HTTP
+    connections can be enabled via the ``conn_pool_size`` init parameter, in
+    which case subsequent WBEM operations reuse the TCP connections (and
+    TLS sessions) to the WBEM server. The operations remain state-less at the
+    level of the CIM-XML protocol.
 
     After creating a :class:`~pywbem.WBEMConnection` object, various methods
     may be called on the object, which cause WBEM operations to be issued to
@@ -372,7 +451,10 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
     def __init__(self, url, creds=None, default_namespace=DEFAULT_NAMESPACE,
                  x509=None, verify_callback=None, ca_certs=None,
                  no_verification=False, timeout=None, use_pull_operations=False,
-                 stats_enabled=False):
+                 stats_enabled=False, conn_pool_size=None,
+                 stream_instances=False, compression=False,
+                 compression_threshold=None, class_cache_size=None,
+                 class_cache_ttl=None):
         # pylint: disable=line-too-long
         """
         Parameters:
@@ -607,6 +689,121 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
             WBEM operations executed via this connection. See the
 
             :ref:`WBEM operation statistics` section for details.
+
+          conn_pool_size (:term:`integer`):
+            *New in pywbem 0.13.*
+
+            Maximum number of idle persistent (keep-alive) HTTP connections to
+            the WBEM server that are kept open by this connection object for
+            reuse by subsequent operations.
+
+            When reusing a connection, the TCP connection setup and TLS
+            handshake with the WBEM server are avoided. A connection is not
+            reused if the WBEM server indicated that it closes the connection
+            (e.g. via a ``Connection: close`` header). Idle connections that
+            have been closed by the WBEM server are detected and replaced by
+            new connections transparently. If the WBEM server closes a reused
+            connection after the request has been sent, the request is sent
+            again on a new connection only for operations that do not modify
+            anything on the WBEM server (e.g. ``GetInstance``); for other
+            operations, :exc:`~pywbem.ConnectionError` is raised.
+
+            The number of newly established and reused connections is
+            available in the :attr:`~pywbem.WBEMConnection.statistics` of
+            this connection.
+
+            The idle connections can be closed using
+            :meth:`~pywbem.WBEMConnection.close`.
+
+            `None` or ``0`` (default) means that no persistent connections are
+            used, i.e. each operation uses a new HTTP connection.
+
+          stream_instances (:class:`py:bool`):
+            *New in pywbem 0.13.*
+
+            Enables streaming of the instances returned by
+            :meth:`~pywbem.WBEMConnection.EnumerateInstances` (and by
+            :meth:`~pywbem.WBEMConnection.IterEnumerateInstances` when it uses
+            the traditional operation).
+
+            If `True`, :meth:`~pywbem.WBEMConnection.EnumerateInstances`
+            returns a :term:`py:generator` instead of a list. The HTTP
+            response body is parsed incrementally while it is being received
+            from the WBEM server, and each instance is yielded as soon as it
+            has been received completely. Thus, the memory used by the
+            operation is bounded by the size of the largest instance, and not
+            by the size of the entire response. The request is sent to the
+            WBEM server when the iteration starts, and any errors (including
+            :exc:`~pywbem.CIMError` returned by the server) are raised
+            during the iteration.
+
+            Streaming is not used while debug mode is enabled or operation
+            recorders are active, because they need the complete response.
+
+            `False` (default) means that instances are not streamed.
+
+          compression (:class:`py:bool`):
+            *New in pywbem 0.13.*
+
+            Enables HTTP compression for the CIM-XML messages exchanged with
+            the WBEM server.
+
+            If `True`, the gzip and deflate content encodings are advertised
+            to the WBEM server in the ``Accept-Encoding`` header of the
+            requests, and responses that are compressed with one of these
+            content encodings are decompressed (incrementally, when instances
+            are streamed). In addition, request bodies whose size reaches the
+            ``compression_threshold`` are compressed with the gzip content
+            encoding.
+
+            The sizes of the compressed and uncompressed HTTP bodies are
+            available in the :attr:`~pywbem.WBEMConnection.statistics` of
+            this connection.
+
+            `False` (default) means that HTTP compression is not used.
+
+          compression_threshold (:term:`integer`):
+            *New in pywbem 0.13.*
+
+            Minimum size in Bytes of the CIM-XML request body for compressing
+            it with the gzip content encoding, if ``compression`` is `True`.
+            Note that the WBEM server must support compressed requests.
+
+            `None` (default) means that requests are not compressed.
+
+          class_cache_size (:term:`integer`):
+            *New in pywbem 0.13 as experimental.*
+
+            Maximum number of entries in a cache for the classes returned by
+            :meth:`~pywbem.WBEMConnection.GetClass` and
+            :meth:`~pywbem.WBEMConnection.EnumerateClasses`. See
+            :class:`~pywbem.ClassCache` for details.
+
+            When a class is requested again with the same operation
+            parameters, it is returned from the cache without an operation
+            to the WBEM server. Such operations are therefore not recorded by
+            the operation recorders and the operation statistics; the number
+            of cache hits and misses is available in the
+            :attr:`~pywbem.WBEMConnection.statistics` of this connection.
+            Operations with additional keyword arguments (`extra`) bypass the
+            cache.
+
+            The cache is invalidated for a namespace when
+            :meth:`~pywbem.WBEMConnection.CreateClass`,
+            :meth:`~pywbem.WBEMConnection.ModifyClass` or
+            :meth:`~pywbem.WBEMConnection.DeleteClass` are performed on that
+            namespace through this connection. Changes of the classes by
+            other clients are not detected before the cached classes expire
+            (see ``class_cache_ttl``).
+
+            `None` or ``0`` (default) means that classes are not cached.
+
+          class_cache_ttl (:term:`number`):
+            *New in pywbem 0.13 as experimental.*
+
+            Time-to-live in seconds of the entries of the class cache.
+
+            `None` (default) means that the cached classes do not expire.
         """  # noqa: E501
         # pylint: enable=line-too-long
 
@@ -657,6 +854,26 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         self._last_operation_time = None
         self._last_server_response_time = None
 
+        self._stream_instances = stream_instances
+
+        self._compression = compression
+        self._compression_threshold = compression_threshold
+        # Sizes of the last request and reply as transferred on the network
+        self._last_transfer_lens = [0, 0]
+
+        self._conn_pool_size = conn_pool_size
+        if conn_pool_size:
+            self._conn_pool = HTTPConnectionPool(conn_pool_size,
+                                                 self._statistics)
+        else:
+            self._conn_pool = None
+
+        if class_cache_size:
+            self._class_cache = ClassCache(class_cache_size, class_cache_ttl,
+                                           self._statistics)
+        else:
+            self._class_cache = None
+
         if self._activate_logging:
             recorder = LogOperationRecorder(
                 conn_id=self.conn_id,
@@ -1047,6 +1264,74 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         """
         return self._use_pull_operations
 
+    @property
+    def conn_pool_size(self):
+        """
+        *New in pywbem 0.13.*
+
+        :term:`integer`: Maximum number of idle persistent HTTP connections
+        kept open by this connection object, or `None` if persistent
+        connections are not used.
+
+        For details, see the description of the same-named constructor
+        parameter of :class:`~pywbem.WBEMConnection`.
+        """
+        return self._conn_pool_size
+
+    @property
+    def stream_instances(self):
+        """
+        *New in pywbem 0.13.*
+
+        :class:`py:bool`: Boolean indicating that the instances returned by
+        :meth:`~pywbem.WBEMConnection.EnumerateInstances` are streamed.
+
+        For details, see the description of the same-named constructor
+        parameter of :class:`~pywbem.WBEMConnection`.
+        """
+        return self._stream_instances
+
+    @property
+    def compression(self):
+        """
+        *New in pywbem 0.13.*
+
+        :class:`py:bool`: Boolean indicating that HTTP compression is used.
+
+        For details, see the description of the same-named constructor
+        parameter of :class:`~pywbem.WBEMConnection`.
+        """
+        return self._compression
+
+    @property
+    def compression_threshold(self):
+        """
+        *New in pywbem 0.13.*
+
+        :term:`integer`: Minimum size in Bytes of a request body for
+        compressing it, or `None` if requests are not compressed.
+
+        For details, see the description of the same-named constructor
+        parameter of :class:`~pywbem.WBEMConnection`.
+        """
+        return self._compression_threshold
+
+    @property
+    def class_cache(self):
+        """
+        *New in pywbem 0.13 as experimental.*
+
+        :class:`~pywbem.ClassCache`: The class cache of this connection, or
+        `None` if classes are not cached.
+
+        The cache can be cleared using its :meth:`~pywbem.ClassCache.clear`
+        method.
+
+        For details, see the description of the ``class_cache_size``
+        constructor parameter of :class:`~pywbem.WBEMConnection`.
+        """
+        return self._class_cache
+
     @property
     def debug(self):
         """
@@ -1221,6 +1506,23 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                 self.timeout, self.use_pull_operations, self.stats_enabled,
                 recorder_list)
 
+    def close(self):
+        """
+        *New in pywbem 0.13.*
+
+        Close the idle persistent HTTP connections of this connection object.
+
+        This method can be called when the connection object is no longer
+        needed, in order to release the network resources held by its
+        persistent HTTP connections. The connection object remains usable;
+        subsequent operations establish new HTTP connections as needed.
+
+        If persistent connections are not used (see the ``conn_pool_size``
+        init parameter), this method does nothing.
+        """
+        if self._conn_pool is not None:
+            self._conn_pool.close()
+
     @classmethod
     def _configure_logger(cls, simple_name, log_dest, detail_level,
                           log_filename, connection, propagate):
@@ -1562,6 +1864,94 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         Perform an intrinsic CIM-XML operation.
         """
 
+        cimxml_headers, request_data = self._imethodcall_request(
+            methodname, namespace, **params)
+
+        reply_xml, self._last_server_response_time = wbem_request(
+            self.url, request_data, self.creds, cimxml_headers,
+            x509=self.x509,
+            verify_callback=self.verify_callback,
+            ca_certs=self.ca_certs,
+            no_verification=self.no_verification,
+            timeout=self.timeout,
+            debug=self.debug,
+            recorders=self._operation_recorders,
+            conn_id=self.conn_id,
+            conn_pool=self._conn_pool,
+            compression=self._compression,
+            compression_threshold=self._compression_threshold,
+            transfer_lens=self._last_transfer_lens,
+            idempotent=methodname in _IDEMPOTENT_OPERATIONS)
+
+        self._last_reply_len = len(reply_xml)
+
+        # Set the raw response before parsing (which can fail)
+        if self.debug:
+            self._last_raw_reply = reply_xml
+
+        # Parse the XML into CIM objects (may raise ParseError):
+        tup_tree = _parse_reply(reply_xml)
+
+        # Set the pretty response after parsing (it could fail otherwise)
+        if self.debug:
+            self._last_reply = _to_pretty_xml(reply_xml)
+
+        return self._imethodcall_result(tup_tree, methodname,
+                                        response_params_rqd)
+
+    def _imethodcall_stream(self, methodname, namespace, **params):
+        """
+        Perform an intrinsic CIM-XML operation whose return value consists of
+        VALUE.NAMEDINSTANCE elements, and return a generator that yields the
+        returned instances as :class:`~pywbem.CIMInstance` objects while the
+        response is being received.
+
+        The request is sent when the iteration starts. Errors in the response
+        (including ERROR elements) are raised during the iteration.
+        """
+
+        cimxml_headers, request_data = self._imethodcall_request(
+            methodname, namespace, **params)
+
+        reply_stream, self._last_server_response_time = wbem_request(
+            self.url, request_data, self.creds, cimxml_headers,
+            x509=self.x509,
+            verify_callback=self.verify_callback,
+            ca_certs=self.ca_certs,
+            no_verification=self.no_verification,
+            timeout=self.timeout,
+            debug=self.debug,
+            recorders=self._operation_recorders,
+            conn_id=self.conn_id,
+            conn_pool=self._conn_pool,
+            stream=True,
+            compression=self._compression,
+            compression_threshold=self._compression_threshold,
+            transfer_lens=self._last_transfer_lens,
+            idempotent=methodname in _IDEMPOTENT_OPERATIONS)
+
+        try:
+            parser = CIMStreamParser(['VALUE.NAMEDINSTANCE'], ['IRETURNVALUE'],
+                                     "CIM-XML response")
+            for chunk in reply_stream.iter_chunks():
+                self._last_reply_len = reply_stream.bytes_read
+                self._last_transfer_lens[1] = reply_stream.wire_bytes_read
+                # Parse the completed instances (may raise ParseError)
+                for tt_ in parser.feed(chunk):
+                    yield parse_value_namedinstance(tt_)
+
+            # Check the remainder of the response, without the instances
+            tup_tree = parse_cim(parser.close())
+            self._imethodcall_result(tup_tree, methodname)
+        finally:
+            reply_stream.close()
+
+    def _imethodcall_request(self, methodname, namespace, **params):
+        """
+        Build the request for an intrinsic CIM-XML operation, and return
+        a tuple of the CIM-XML extension headers and the request data.
+        """
+
         # Create HTTP extension headers for CIM-XML.
         # Note: The two-step encoding required by DSP0200 will be performed in
         # wbem_request().
@@ -1574,7 +1964,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
 
         # Create parameter list
 
-        plist = [cim_xml.IPARAMVALUE(x[0], tocimxml(x[1]))
+        fast = config.FAST_CIMXML_WRITER and not self.debug
+        plist = [cim_xml.IPARAMVALUE(x[0], _cimxml_node(x[1], fast))
                  for x in params.items() if x[1] is not None]
 
         # Build XML request
@@ -1598,40 +1989,23 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
             self._last_raw_reply = None
             self._last_reply = None
 
-        # Send request and receive response
+        # Reset the statistics data of the previous request
         self._last_request_len = 0
         self._last_reply_len = 0
+        self._last_transfer_lens[0:2] = [0, 0]
         self._last_server_response_time = None
 
         request_data = req_xml.toxml()
         self._last_request_len = len(request_data)
 
-        reply_xml, self._last_server_response_time = wbem_request(
-            self.url, request_data, self.creds, cimxml_headers,
-            x509=self.x509,
-            verify_callback=self.verify_callback,
-            ca_certs=self.ca_certs,
-            no_verification=self.no_verification,
-            timeout=self.timeout,
-            debug=self.debug,
-            recorders=self._operation_recorders,
-            conn_id=self.conn_id)
-
-        self._last_reply_len = len(reply_xml)
-
-        # Set the raw response before parsing (which can fail)
-        if self.debug:
-            self._last_raw_reply = reply_xml
-
-        # Parse the XML into a tuple tree (may raise ParseError):
-        tt_ = xml_to_tupletree_sax(reply_xml, "CIM-XML response")
-        tup_tree = parse_cim(tt_)
-
-        # Set the pretty response after parsing (it could fail otherwise)
-        if self.debug:
-            self._last_reply = _to_pretty_xml(reply_xml)
+        return cimxml_headers, request_data
 
-        # Check the tuple tree
+    @staticmethod
+    def _imethodcall_result(tup_tree, methodname, response_params_rqd=None):
+        """
+        Check the parsed response of an intrinsic CIM-XML operation and
+        return its result.
+        """
 
         if tup_tree[0] != 'CIM':
             raise ParseError('Expecting CIM element, got %s' % tup_tree[0])
@@ -1717,6 +2091,57 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
           **params: CIM method input parameters, for details see InvokeMethod().
         """
 
+        cimxml_headers, request_data = self._methodcall_request(
+            methodname, objectname, Params, **params)
+
+        reply_xml, self._last_server_response_time = wbem_request(
+            self.url, request_data, self.creds, cimxml_headers,
+            x509=self.x509,
+            verify_callback=self.verify_callback,
+            ca_certs=self.ca_certs,
+            no_verification=self.no_verification,
+            timeout=self.timeout,
+            debug=self.debug,
+            recorders=self._operation_recorders,
+            conn_id=self.conn_id,
+            conn_pool=self._conn_pool,
+            compression=self._compression,
+            compression_threshold=self._compression_threshold,
+            transfer_lens=self._last_transfer_lens)
+
+        self._last_reply_len = len(reply_xml)
+
+        # Set the raw response before parsing (which can fail)
+        if self.debug:
+            self._last_raw_reply = reply_xml
+
+        # Parse the XML into CIM objects (may raise ParseError):
+        tup_tree = _parse_reply(reply_xml)
+
+        # Set the pretty response after parsing (it could fail otherwise)
+        if self.debug:
+            self._last_reply = _to_pretty_xml(reply_xml)
+
+        return self._methodcall_result(tup_tree, methodname)
+
+    def _methodcall_request(self, methodname, objectname, Params=None,
+                            **params):
+        """
+        Build the request for an extrinsic CIM-XML method call, and return
+        a tuple of the CIM-XML extension headers and the request data.
+
+        Parameters:
+
+          methodname (string): CIM method name.
+
+          objectname (string or CIMInstanceName or CIMClassName):
+            Target object. Strings are interpreted as class names.
+
+          Params: CIM method input parameters, for details see InvokeMethod().
+
+          **params: CIM method input parameters, for details see InvokeMethod().
+        """
+
         if isinstance(objectname, (CIMInstanceName, CIMClassName)):
             localobject = objectname.copy()
             if localobject.namespace is None:
@@ -1740,6 +2165,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
             ('CIMObject', get_cimobject_header(localobject)),
         ]
 
+        fast = config.FAST_CIMXML_WRITER and not self.debug
+
         # Create parameter list
 
         def infer_type(obj):
@@ -1774,8 +2201,13 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                 # This includes CIMDateTime (subclass of CIMType)
                 return cim_xml.VALUE(atomic_to_cim_xml(obj))
             if isinstance(obj, (CIMClassName, CIMInstanceName)):
-                return cim_xml.VALUE_REFERENCE(obj.tocimxml())
+                return cim_xml.VALUE_REFERENCE(_cimxml_node(obj, fast))
             if isinstance(obj, CIMInstance):
+                if fast:
+                    buf = []
+                    # pylint: disable=protected-access
+                    obj._write_cimxml(buf, ignore_path=True)
+                    return cim_xml.VALUE(u''.join(buf))
                 return cim_xml.VALUE(obj.tocimxml(ignore_path=True).toxml())
             if isinstance(obj, CIMClass):
                 # CIMClass.tocimxml() always ignores path
@@ -1835,39 +2267,29 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
             self._last_raw_reply = None
             self._last_reply = None
 
-        # Send request and receive response
+        # Reset the statistics data of the previous request
 
         self._last_request_len = 0
         self._last_reply_len = 0
+        self._last_transfer_lens[0:2] = [0, 0]
         self._last_server_response_time = None
 
         request_data = req_xml.toxml()
         self._last_request_len = len(request_data)
 
-        reply_xml, self._last_server_response_time = wbem_request(
-            self.url, request_data, self.creds, cimxml_headers,
-            x509=self.x509,
-            verify_callback=self.verify_callback,
-            ca_certs=self.ca_certs,
-            no_verification=self.no_verification,
-            timeout=self.timeout,
-            debug=self.debug,
-            recorders=self._operation_recorders,
-            conn_id=self.conn_id)
-
-        self._last_reply_len = len(reply_xml)
+        return cimxml_headers, request_data
 
-        # Set the raw response before parsing (which can fail)
-        if self.debug:
-            self._last_raw_reply = reply_xml
+    @staticmethod
+    def _methodcall_result(tup_tree, methodname):
+        """
+        Check the parsed response of an extrinsic CIM-XML method call, and
+        return a tuple of its return value and output parameters.
 
-        # Parse the XML into a tuple tree (may raise ParseError):
-        tt_ = xml_to_tupletree_sax(reply_xml, "CIM-XML response")
-        tup_tree = parse_cim(tt_)
+        Raises:
 
-        # Set the pretty response after parsing (it could fail otherwise)
-        if self.debug:
-            self._last_reply = _to_pretty_xml(reply_xml)
+          pywbem.ParseError
+          pywbem.CIMError
+        """
 
         # Check the tuple tree
 
@@ -2180,6 +2602,12 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
             A list of :class:`~pywbem.CIMInstance` objects that are
             representations of the enumerated instances.
 
+            If streaming of instances is enabled for the connection (see the
+            `stream_instances` parameter of
+            :class:`~pywbem.WBEMConnection`), a :term:`py:generator` object
+            that iterates these :class:`~pywbem.CIMInstance` objects is
+            returned instead of the list.
+
             The `path` attribute of each :class:`~pywbem.CIMInstance`
             object is a :class:`~pywbem.CIMInstanceName` object with its
             attributes set as follows:
@@ -2194,6 +2622,17 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
             Exceptions described in :class:`~pywbem.WBEMConnection`.
         """  # noqa: E501
 
+        if self._stream_instances and not self.debug and \
+                not self._operation_recorders:
+            return self._enumerate_instances_stream(
+                ClassName, namespace,
+                LocalOnly=LocalOnly,
+                DeepInheritance=DeepInheritance,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList,
+                **extra)
+
         exc = None
         instances = None
         method_name = 'EnumerateInstances'
@@ -2250,10 +2689,52 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(instances, exc)
 
+    def _enumerate_instances_stream(self, ClassName, namespace,
+                                    PropertyList=None, **params):
+        # pylint: disable=invalid-name
+        """
+        Generator performing the EnumerateInstances operation with streaming
+        of the returned instances.
+
+        The operation statistics cover the time until the generator is
+        exhausted or closed.
+        """
+
+        exc = None
+        method_name = 'EnumerateInstances'
+
+        stats = self.statistics.start_timer(method_name)
+        try:
+            if namespace is None and isinstance(ClassName, CIMClassName):
+                namespace = ClassName.namespace
+            namespace = self._iparam_namespace_from_namespace(namespace)
+            classname = self._iparam_classname(ClassName)
+            PropertyList = _iparam_propertylist(PropertyList)
+
+            for instance in self._imethodcall_stream(
+                    method_name,
+                    namespace,
+                    ClassName=classname,
+                    PropertyList=PropertyList,
+                    **params):
+                # See EnumerateInstances() for why the namespace is set.
+                instance.path.namespace = namespace
+                yield instance
+
+        except Exception as exce:
+            exc = exce
+            raise
+        finally:
+            self._last_operation_time = stats.stop_timer(
+                self.last_request_len, self.last_reply_len,
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
+
     def EnumerateInstanceNames(self, ClassName, namespace=None, **extra):
         # pylint: disable=invalid-name,line-too-long
         """
@@ -2347,7 +2828,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(instancenames, exc)
 
@@ -2492,7 +2974,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(instance, exc)
 
@@ -2681,7 +3164,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(None, exc)
 
@@ -2803,7 +3287,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(instancename, exc)
 
@@ -2869,7 +3354,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(None, exc)
 
@@ -3083,7 +3569,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(objects, exc)
 
@@ -3237,7 +3724,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(objects, exc)
 
@@ -3434,7 +3922,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(objects, exc)
 
@@ -3570,7 +4059,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(objects, exc)
 
@@ -3692,7 +4182,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(result_tuple, exc)
 
@@ -3790,10 +4281,99 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(instances, exc)
 
+    def _tuned_pull_op(self, tuner, method, *args, **kwargs):
+        """
+        Perform an open or pull operation for an iter... operation.
+
+        If an AdaptiveMaxObjectCount object is specified as `tuner`, its
+        current MaxObjectCount is used for the operation, and it is updated
+        from the measured round-trip time, reply size and server response
+        time of the operation.
+        """
+        if tuner is None:
+            return method(*args, **kwargs)
+        kwargs['MaxObjectCount'] = tuner.max_object_count
+        start_time = time.time()
+        result = method(*args, **kwargs)
+        objects = result.paths if isinstance(result, pull_path_result_tuple) \
+            else result.instances
+        tuner.update(len(objects), time.time() - start_time,
+                     self.last_reply_len, self.last_server_response_time)
+        return result
+
+    def _iter_prefetched_pulls(self, pull_method, context, MaxObjectCount,
+                               prefetch, tuner=None):
+        """
+        Generator that performs the pull operations of an open enumeration
+        session in a background thread, and yields their pull result tuples.
+
+        At most `prefetch` pull results are held ahead of the consumer. The
+        enumeration session is closed when the generator is closed before
+        the end of the sequence has been pulled, or when a pull operation
+        failed.
+
+        The pull operations are performed on a shallow copy of this
+        connection that has its own state for the current operation and its
+        own statistics, so that they do not interfere with operations the
+        consumer performs on this connection meanwhile. The statistics of the
+        pull operations are added to the statistics of this connection when
+        the generator is done.
+        """
+        # pylint: disable=protected-access
+        pull_conn = copy.copy(self)
+        pull_conn._operation_recorders = []
+        pull_conn._last_transfer_lens = [0, 0]
+        pull_conn._statistics = Statistics(self._statistics.enabled)
+        pull_method = getattr(pull_conn, pull_method.__name__)
+
+        batches = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+        # Context of the enumeration session that is still open, or None
+        state = {'context': context}
+
+        def puller():
+            """Pull until eos, an error, or until stopped by the consumer."""
+            while not stop.is_set():
+                try:
+                    result = pull_conn._tuned_pull_op(
+                        tuner, pull_method, state['context'],
+                        MaxObjectCount=MaxObjectCount)
+                    state['context'] = None if result.eos else result.context
+                    item = (result, None)
+                except Exception as exc:  # pylint: disable=broad-except
+                    item = (None, exc)
+                while not stop.is_set():
+                    try:
+                        batches.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        pass
+                if item[1] is not None or item[0].eos:
+                    return
+
+        thread = threading.Thread(target=puller)
+        thread.daemon = True
+        thread.start()
+        try:
+            while True:
+                result, exc = batches.get()
+                if exc is not None:
+                    raise exc
+                yield result
+                if result.eos:
+                    return
+        finally:
+            stop.set()
+            thread.join()
+            self._statistics.merge(pull_conn._statistics)
+            if state['context'] is not None:
+                self.CloseEnumeration(state['context'])
+
     def IterEnumerateInstances(self, ClassName, namespace=None,
                                LocalOnly=None,
                                DeepInheritance=None, IncludeQualifiers=None,
@@ -3801,7 +4381,7 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                                FilterQueryLanguage=None, FilterQuery=None,
                                OperationTimeout=None, ContinueOnError=None,
                                MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT,
-                               **extra):
+                               prefetch=None, **extra):
         # pylint: disable=invalid-name,line-too-long
         """
         *New in pywbem 0.10 as experimental and finalized in 0.12.*
@@ -4022,6 +4602,30 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
             between 100 and 1000 typically do not have a significant impact on
             either memory or overall efficiency.
 
+            *New in pywbem 0.13:* An :class:`~pywbem.AdaptiveMaxObjectCount`
+            object may be specified instead of a number. The MaxObjectCount
+            of each open and pull request is then adjusted based on the
+            measured times and reply sizes of the previous requests.
+
+          prefetch (:term:`integer`):
+            *New in pywbem 0.13.*
+
+            If a positive number, the pull operations are performed by a
+            background thread while the instances returned so far are being
+            consumed, with at most this number of pull results being held
+            ahead of the consumer. The enumeration session is closed when the
+            returned generator is closed before it is exhausted.
+
+            `None` or 0 (default) means that the next pull operation is
+            performed only when the previous pull result has been consumed.
+
+            Prefetching is not performed if operation recorders are enabled
+            on the connection. The prefetched pull operations are performed
+            on a separate copy of the connection, so they are not reflected
+            in the `last_*` attributes of the connection; their statistics
+            are added to the statistics of the connection when the returned
+            generator is exhausted or closed.
+
         Keyword Arguments:
 
           extra :
@@ -4054,7 +4658,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                 else:
                     print('instance %s' % inst.tomof())
         """  # noqa: E501
-        _validateIterCommonParams(MaxObjectCount, OperationTimeout)
+        _validateIterCommonParams(MaxObjectCount, OperationTimeout, prefetch)
+        tuner = _adaptive_tuner(MaxObjectCount)
 
         # Common variable for pull result tuple used by pulls and finally:
         pull_result = None
@@ -4064,7 +4669,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                     self._use_enum_inst_pull_operations):
 
                 try:        # operation try block
-                    pull_result = self.OpenEnumerateInstances(
+                    pull_result = self._tuned_pull_op(
+                        tuner, self.OpenEnumerateInstances,
                         ClassName, namespace=namespace, LocalOnly=LocalOnly,
                         DeepInheritance=DeepInheritance,
                         IncludeQualifiers=IncludeQualifiers,
@@ -4082,9 +4688,27 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                     for inst in pull_result.instances:
                         yield inst
 
+                    if prefetch and not pull_result.eos and \
+                            not self._operation_recorders:
+                        # The enumeration session is closed by the prefetching
+                        # generator, if needed.
+                        context = pull_result.context
+                        pull_result = None
+                        prefetcher = self._iter_prefetched_pulls(
+                            self.PullInstancesWithPath, context,
+                            MaxObjectCount, prefetch, tuner)
+                        try:
+                            for rslt in prefetcher:
+                                for inst in rslt.instances:
+                                    yield inst
+                        finally:
+                            prefetcher.close()
+                        return
+
                     # loop to pull while more while eos not returned.
                     while not pull_result.eos:
-                        pull_result = self.PullInstancesWithPath(
+                        pull_result = self._tuned_pull_op(
+                            tuner, self.PullInstancesWithPath,
                             pull_result.context, MaxObjectCount=MaxObjectCount)
 
                         for inst in pull_result.instances:
@@ -4131,13 +4755,13 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                 namespace = ClassName.namespace
             namespace = self._iparam_namespace_from_namespace(namespace)
 
+            # The result may be a generator if streaming is enabled, so it is
+            # iterated only once.
             for inst in enum_rslt:
                 if inst.path.namespace is None:
                     inst.path.namespace = namespace
                 if inst.path.host is None:
                     inst.path.host = host
-
-            for inst in enum_rslt:
                 yield inst
 
         # Cleanup if caller closes the iterator before exhausting it
@@ -4151,7 +4775,7 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                                    FilterQueryLanguage=None, FilterQuery=None,
                                    OperationTimeout=None, ContinueOnError=None,
                                    MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT,
-                                   **extra):
+                                   prefetch=None, **extra):
         """
         *New in pywbem 0.10 as experimental and finalized in 0.12.*
 
@@ -4309,6 +4933,30 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
             between 100 and 1000 typically do not have a significant impact on
             either memory or overall efficiency.
 
+            *New in pywbem 0.13:* An :class:`~pywbem.AdaptiveMaxObjectCount`
+            object may be specified instead of a number. The MaxObjectCount
+            of each open and pull request is then adjusted based on the
+            measured times and reply sizes of the previous requests.
+
+          prefetch (:term:`integer`):
+            *New in pywbem 0.13.*
+
+            If a positive number, the pull operations are performed by a
+            background thread while the instances returned so far are being
+            consumed, with at most this number of pull results being held
+            ahead of the consumer. The enumeration session is closed when the
+            returned generator is closed before it is exhausted.
+
+            `None` or 0 (default) means that the next pull operation is
+            performed only when the previous pull result has been consumed.
+
+            Prefetching is not performed if operation recorders are enabled
+            on the connection. The prefetched pull operations are performed
+            on a separate copy of the connection, so they are not reflected
+            in the `last_*` attributes of the connection; their statistics
+            are added to the statistics of the connection when the returned
+            generator is exhausted or closed.
+
         Keyword Arguments:
 
           extra :
@@ -4334,7 +4982,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                 print('path %s' % path)
         """
 
-        _validateIterCommonParams(MaxObjectCount, OperationTimeout)
+        _validateIterCommonParams(MaxObjectCount, OperationTimeout, prefetch)
+        tuner = _adaptive_tuner(MaxObjectCount)
 
         # Common variable for pull result tuple used by pulls and finally:
 
@@ -4345,7 +4994,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                     self._use_enum_path_pull_operations):
 
                 try:        # operation try block
-                    pull_result = self.OpenEnumerateInstancePaths(
+                    pull_result = self._tuned_pull_op(
+                        tuner, self.OpenEnumerateInstancePaths,
                         ClassName, namespace=namespace,
                         FilterQueryLanguage=FilterQueryLanguage,
                         FilterQuery=FilterQuery,
@@ -4359,9 +5009,27 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                     for inst in pull_result.paths:
                         yield inst
 
+                    if prefetch and not pull_result.eos and \
+                            not self._operation_recorders:
+                        # The enumeration session is closed by the prefetching
+                        # generator, if needed.
+                        context = pull_result.context
+                        pull_result = None
+                        prefetcher = self._iter_prefetched_pulls(
+                            self.PullInstancePaths, context, MaxObjectCount,
+                            prefetch, tuner)
+                        try:
+                            for rslt in prefetcher:
+                                for inst in rslt.paths:
+                                    yield inst
+                        finally:
+                            prefetcher.close()
+                        return
+
                     # Loop to pull while more while eos not returned.
                     while not pull_result.eos:
-                        pull_result = self.PullInstancePaths(
+                        pull_result = self._tuned_pull_op(
+                            tuner, self.PullInstancePaths,
                             pull_result.context, MaxObjectCount=MaxObjectCount)
 
                         for inst in pull_result.paths:
@@ -4426,7 +5094,7 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                                 FilterQueryLanguage=None, FilterQuery=None,
                                 OperationTimeout=None, ContinueOnError=None,
                                 MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT,
-                                **extra):
+                                prefetch=None, **extra):
         # pylint: disable=invalid-name,line-too-long
         """
         *New in pywbem 0.10 as experimental and finalized in 0.12.*
@@ -4637,6 +5305,30 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
             * The default is defined as a system config variable.
             * `None` is not allowed.
 
+            *New in pywbem 0.13:* An :class:`~pywbem.AdaptiveMaxObjectCount`
+            object may be specified instead of a number. The MaxObjectCount
+            of each open and pull request is then adjusted based on the
+            measured times and reply sizes of the previous requests.
+
+          prefetch (:term:`integer`):
+            *New in pywbem 0.13.*
+
+            If a positive number, the pull operations are performed by a
+            background thread while the instances returned so far are being
+            consumed, with at most this number of pull results being held
+            ahead of the consumer. The enumeration session is closed when the
+            returned generator is closed before it is exhausted.
+
+            `None` or 0 (default) means that the next pull operation is
+            performed only when the previous pull result has been consumed.
+
+            Prefetching is not performed if operation recorders are enabled
+            on the connection. The prefetched pull operations are performed
+            on a separate copy of the connection, so they are not reflected
+            in the `last_*` attributes of the connection; their statistics
+            are added to the statistics of the connection when the returned
+            generator is exhausted or closed.
+
         Keyword Arguments:
 
           extra :
@@ -4670,7 +5362,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
 
         # Must be positive integer gt zero
 
-        _validateIterCommonParams(MaxObjectCount, OperationTimeout)
+        _validateIterCommonParams(MaxObjectCount, OperationTimeout, prefetch)
+        tuner = _adaptive_tuner(MaxObjectCount)
 
         # Common variable for pull result tuple used by pulls and finally:
 
@@ -4680,7 +5373,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                     self._use_assoc_inst_pull_operations):
 
                 try:        # operation try block
-                    pull_result = self.OpenAssociatorInstances(
+                    pull_result = self._tuned_pull_op(
+                        tuner, self.OpenAssociatorInstances,
                         InstanceName,
                         AssocClass=AssocClass,
                         ResultClass=ResultClass,
@@ -4701,9 +5395,27 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                     for inst in pull_result.instances:
                         yield inst
 
+                    if prefetch and not pull_result.eos and \
+                            not self._operation_recorders:
+                        # The enumeration session is closed by the prefetching
+                        # generator, if needed.
+                        context = pull_result.context
+                        pull_result = None
+                        prefetcher = self._iter_prefetched_pulls(
+                            self.PullInstancesWithPath, context,
+                            MaxObjectCount, prefetch, tuner)
+                        try:
+                            for rslt in prefetcher:
+                                for inst in rslt.instances:
+                                    yield inst
+                        finally:
+                            prefetcher.close()
+                        return
+
                     # Loop to pull while more while eos not returned.
                     while not pull_result.eos:
-                        pull_result = self.PullInstancesWithPath(
+                        pull_result = self._tuned_pull_op(
+                            tuner, self.PullInstancesWithPath,
                             pull_result.context, MaxObjectCount=MaxObjectCount)
 
                         for inst in pull_result.instances:
@@ -4760,7 +5472,7 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                                     FilterQueryLanguage=None, FilterQuery=None,
                                     OperationTimeout=None, ContinueOnError=None,
                                     MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT,
-                                    **extra):
+                                    prefetch=None, **extra):
         # pylint: disable=invalid-name
         """
         *New in pywbem 0.10 as experimental and finalized in 0.12.*
@@ -4933,6 +5645,30 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
             * The default is defined as a system config variable.
             * `None` is not allowed.
 
+            *New in pywbem 0.13:* An :class:`~pywbem.AdaptiveMaxObjectCount`
+            object may be specified instead of a number. The MaxObjectCount
+            of each open and pull request is then adjusted based on the
+            measured times and reply sizes of the previous requests.
+
+          prefetch (:term:`integer`):
+            *New in pywbem 0.13.*
+
+            If a positive number, the pull operations are performed by a
+            background thread while the instances returned so far are being
+            consumed, with at most this number of pull results being held
+            ahead of the consumer. The enumeration session is closed when the
+            returned generator is closed before it is exhausted.
+
+            `None` or 0 (default) means that the next pull operation is
+            performed only when the previous pull result has been consumed.
+
+            Prefetching is not performed if operation recorders are enabled
+            on the connection. The prefetched pull operations are performed
+            on a separate copy of the connection, so they are not reflected
+            in the `last_*` attributes of the connection; their statistics
+            are added to the statistics of the connection when the returned
+            generator is exhausted or closed.
+
         Keyword Arguments:
 
           extra :
@@ -4958,7 +5694,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                 print('path %s' % path)
         """
 
-        _validateIterCommonParams(MaxObjectCount, OperationTimeout)
+        _validateIterCommonParams(MaxObjectCount, OperationTimeout, prefetch)
+        tuner = _adaptive_tuner(MaxObjectCount)
 
         # Common variable for pull result tuple used by pulls and finally:
         pull_result = None
@@ -4967,7 +5704,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                     self._use_assoc_path_pull_operations):
 
                 try:        # Open operation try block
-                    pull_result = self.OpenAssociatorInstancePaths(
+                    pull_result = self._tuned_pull_op(
+                        tuner, self.OpenAssociatorInstancePaths,
                         InstanceName,
                         AssocClass=AssocClass,
                         ResultClass=ResultClass,
@@ -4985,9 +5723,27 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                     for inst in pull_result.paths:
                         yield inst
 
+                    if prefetch and not pull_result.eos and \
+                            not self._operation_recorders:
+                        # The enumeration session is closed by the prefetching
+                        # generator, if needed.
+                        context = pull_result.context
+                        pull_result = None
+                        prefetcher = self._iter_prefetched_pulls(
+                            self.PullInstancePaths, context, MaxObjectCount,
+                            prefetch, tuner)
+                        try:
+                            for rslt in prefetcher:
+                                for inst in rslt.paths:
+                                    yield inst
+                        finally:
+                            prefetcher.close()
+                        return
+
                     # Loop to pull while more while eos not returned.
                     while not pull_result.eos:
-                        pull_result = self.PullInstancePaths(
+                        pull_result = self._tuned_pull_op(
+                            tuner, self.PullInstancePaths,
                             pull_result.context, MaxObjectCount=MaxObjectCount)
 
                         for inst in pull_result.paths:
@@ -5040,7 +5796,7 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                                FilterQueryLanguage=None, FilterQuery=None,
                                OperationTimeout=None, ContinueOnError=None,
                                MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT,
-                               **extra):
+                               prefetch=None, **extra):
         # pylint: disable=invalid-name,line-too-long
         """
         *New in pywbem 0.10 as experimental and finalized in 0.12.*
@@ -5231,6 +5987,30 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
             * The default is defined as a system config variable.
             * `None` is not allowed.
 
+            *New in pywbem 0.13:* An :class:`~pywbem.AdaptiveMaxObjectCount`
+            object may be specified instead of a number. The MaxObjectCount
+            of each open and pull request is then adjusted based on the
+            measured times and reply sizes of the previous requests.
+
+          prefetch (:term:`integer`):
+            *New in pywbem 0.13.*
+
+            If a positive number, the pull operations are performed by a
+            background thread while the instances returned so far are being
+            consumed, with at most this number of pull results being held
+            ahead of the consumer. The enumeration session is closed when the
+            returned generator is closed before it is exhausted.
+
+            `None` or 0 (default) means that the next pull operation is
+            performed only when the previous pull result has been consumed.
+
+            Prefetching is not performed if operation recorders are enabled
+            on the connection. The prefetched pull operations are performed
+            on a separate copy of the connection, so they are not reflected
+            in the `last_*` attributes of the connection; their statistics
+            are added to the statistics of the connection when the returned
+            generator is exhausted or closed.
+
         Keyword Arguments:
 
           extra :
@@ -5264,7 +6044,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
 
         # Must be positive integer gt zero
 
-        _validateIterCommonParams(MaxObjectCount, OperationTimeout)
+        _validateIterCommonParams(MaxObjectCount, OperationTimeout, prefetch)
+        tuner = _adaptive_tuner(MaxObjectCount)
 
         # Common variable for pull result tuple used by pulls and finally:
         pull_result = None
@@ -5273,7 +6054,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                     self._use_ref_inst_pull_operations):
 
                 try:        # operation try block
-                    pull_result = self.OpenReferenceInstances(
+                    pull_result = self._tuned_pull_op(
+                        tuner, self.OpenReferenceInstances,
                         InstanceName,
                         ResultClass=ResultClass,
                         Role=Role,
@@ -5291,9 +6073,27 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                     for inst in pull_result.instances:
                         yield inst
 
+                    if prefetch and not pull_result.eos and \
+                            not self._operation_recorders:
+                        # The enumeration session is closed by the prefetching
+                        # generator, if needed.
+                        context = pull_result.context
+                        pull_result = None
+                        prefetcher = self._iter_prefetched_pulls(
+                            self.PullInstancesWithPath, context,
+                            MaxObjectCount, prefetch, tuner)
+                        try:
+                            for rslt in prefetcher:
+                                for inst in rslt.instances:
+                                    yield inst
+                        finally:
+                            prefetcher.close()
+                        return
+
                     # Loop to pull while more while eos not returned.
                     while not pull_result.eos:
-                        pull_result = self.PullInstancesWithPath(
+                        pull_result = self._tuned_pull_op(
+                            tuner, self.PullInstancesWithPath,
                             pull_result.context, MaxObjectCount=MaxObjectCount)
                         for inst in pull_result.instances:
                             yield inst
@@ -5346,7 +6146,7 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                                    FilterQueryLanguage=None, FilterQuery=None,
                                    OperationTimeout=None, ContinueOnError=None,
                                    MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT,
-                                   **extra):
+                                   prefetch=None, **extra):
         # pylint: disable=invalid-name
         """
         *New in pywbem 0.10 as experimental and finalized in 0.12.*
@@ -5505,6 +6305,30 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
             * The default is defined as a system config variable.
             * `None` is not allowed.
 
+            *New in pywbem 0.13:* An :class:`~pywbem.AdaptiveMaxObjectCount`
+            object may be specified instead of a number. The MaxObjectCount
+            of each open and pull request is then adjusted based on the
+            measured times and reply sizes of the previous requests.
+
+          prefetch (:term:`integer`):
+            *New in pywbem 0.13.*
+
+            If a positive number, the pull operations are performed by a
+            background thread while the instances returned so far are being
+            consumed, with at most this number of pull results being held
+            ahead of the consumer. The enumeration session is closed when the
+            returned generator is closed before it is exhausted.
+
+            `None` or 0 (default) means that the next pull operation is
+            performed only when the previous pull result has been consumed.
+
+            Prefetching is not performed if operation recorders are enabled
+            on the connection. The prefetched pull operations are performed
+            on a separate copy of the connection, so they are not reflected
+            in the `last_*` attributes of the connection; their statistics
+            are added to the statistics of the connection when the returned
+            generator is exhausted or closed.
+
         Keyword Arguments:
 
           extra :
@@ -5530,7 +6354,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                 print('path %s' % path)
         """
 
-        _validateIterCommonParams(MaxObjectCount, OperationTimeout)
+        _validateIterCommonParams(MaxObjectCount, OperationTimeout, prefetch)
+        tuner = _adaptive_tuner(MaxObjectCount)
 
         # Common variable for pull result tuple used by pulls and finally:
         pull_result = None
@@ -5539,7 +6364,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                     self._use_ref_path_pull_operations):
 
                 try:        # Open operation try block
-                    pull_result = self.OpenReferenceInstancePaths(
+                    pull_result = self._tuned_pull_op(
+                        tuner, self.OpenReferenceInstancePaths,
                         InstanceName,
                         ResultClass=ResultClass,
                         Role=Role,
@@ -5555,9 +6381,27 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                     for inst in pull_result.paths:
                         yield inst
 
+                    if prefetch and not pull_result.eos and \
+                            not self._operation_recorders:
+                        # The enumeration session is closed by the prefetching
+                        # generator, if needed.
+                        context = pull_result.context
+                        pull_result = None
+                        prefetcher = self._iter_prefetched_pulls(
+                            self.PullInstancePaths, context, MaxObjectCount,
+                            prefetch, tuner)
+                        try:
+                            for rslt in prefetcher:
+                                for inst in rslt.paths:
+                                    yield inst
+                        finally:
+                            prefetcher.close()
+                        return
+
                     # Loop to pull while more while eos not returned.
                     while not pull_result.eos:
-                        pull_result = self.PullInstancePaths(
+                        pull_result = self._tuned_pull_op(
+                            tuner, self.PullInstancePaths,
                             pull_result.context, MaxObjectCount=MaxObjectCount)
 
                         for inst in pull_result.paths:
@@ -5740,6 +6584,11 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
             * The default is defined as a system config variable.
             * `None` is not allowed.
 
+            *New in pywbem 0.13:* An :class:`~pywbem.AdaptiveMaxObjectCount`
+            object may be specified instead of a number. The MaxObjectCount
+            of each open and pull request is then adjusted based on the
+            measured times and reply sizes of the previous requests.
+
         Keyword Arguments:
 
           extra :
@@ -5813,6 +6662,7 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                     yield inst
 
         _validateIterCommonParams(MaxObjectCount, OperationTimeout)
+        tuner = _adaptive_tuner(MaxObjectCount)
 
         # Common variable for pull result tuple used by pulls and finally:
         pull_result = None
@@ -5822,7 +6672,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                     self._use_query_pull_operations):
 
                 try:        # operation try block
-                    pull_result = self.OpenQueryInstances(
+                    pull_result = self._tuned_pull_op(
+                        tuner, self.OpenQueryInstances,
                         FilterQueryLanguage,
                         FilterQuery,
                         namespace=namespace,
@@ -5843,7 +6694,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
 
                     if not pull_result.eos:
                         while not pull_result.eos:
-                            pull_result = self.PullInstances(
+                            pull_result = self._tuned_pull_op(
+                                tuner, self.PullInstances,
                                 pull_result.context,
                                 MaxObjectCount=MaxObjectCount)
                             _instances.extend(pull_result.instances)
@@ -6160,6 +7012,7 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         try:
 
             stats = self.statistics.start_timer(method_name)
+            stats.record_max_object_count(MaxObjectCount)
             if namespace is None and isinstance(ClassName, CIMClassName):
                 namespace = ClassName.namespace
             namespace = self._iparam_namespace_from_namespace(namespace)
@@ -6193,7 +7046,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(result_tuple, exc)
 
@@ -6393,6 +7247,7 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
 
         try:
             stats = self.statistics.start_timer(method_name)
+            stats.record_max_object_count(MaxObjectCount)
             if namespace is None and isinstance(ClassName, CIMClassName):
                 namespace = ClassName.namespace
             namespace = self._iparam_namespace_from_namespace(namespace)
@@ -6420,7 +7275,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(result_tuple, exc)
 
@@ -6670,6 +7526,7 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         try:
 
             stats = self.statistics.start_timer(method_name)
+            stats.record_max_object_count(MaxObjectCount)
             namespace = self._iparam_namespace_from_objectname(InstanceName)
             instancename = self._iparam_instancename(InstanceName)
             PropertyList = _iparam_propertylist(PropertyList)
@@ -6703,7 +7560,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(result_tuple, exc)
 
@@ -6913,6 +7771,7 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         try:
 
             stats = self.statistics.start_timer(method_name)
+            stats.record_max_object_count(MaxObjectCount)
             namespace = self._iparam_namespace_from_objectname(InstanceName)
             instancename = self._iparam_instancename(InstanceName)
 
@@ -6942,7 +7801,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(result_tuple, exc)
 
@@ -7176,6 +8036,7 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         try:
 
             stats = self.statistics.start_timer(method_name)
+            stats.record_max_object_count(MaxObjectCount)
             namespace = self._iparam_namespace_from_objectname(InstanceName)
             instancename = self._iparam_instancename(InstanceName)
             PropertyList = _iparam_propertylist(PropertyList)
@@ -7207,7 +8068,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(result_tuple, exc)
 
@@ -7402,6 +8264,7 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         try:
 
             stats = self.statistics.start_timer(method_name)
+            stats.record_max_object_count(MaxObjectCount)
             namespace = self._iparam_namespace_from_objectname(InstanceName)
             instancename = self._iparam_instancename(InstanceName)
 
@@ -7429,7 +8292,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(result_tuple, exc)
 
@@ -7623,6 +8487,7 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         try:
 
             stats = self.statistics.start_timer(method_name)
+            stats.record_max_object_count(MaxObjectCount)
             namespace = self._iparam_namespace_from_namespace(namespace)
 
             result = self._imethodcall(
@@ -7652,7 +8517,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(result_tuple, exc)
 
@@ -7784,6 +8650,7 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         try:
 
             stats = self.statistics.start_timer(method_name)
+            stats.record_max_object_count(MaxObjectCount)
             _validatePullParams(MaxObjectCount, context)
 
             namespace = context[1]
@@ -7806,7 +8673,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(result_tuple, exc)
 
@@ -7935,6 +8803,7 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         try:
 
             stats = self.statistics.start_timer(method_name)
+            stats.record_max_object_count(MaxObjectCount)
             _validatePullParams(MaxObjectCount, context)
 
             namespace = context[1]
@@ -7957,7 +8826,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(result_tuple, exc)
 
@@ -8079,6 +8949,7 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         try:
 
             stats = self.statistics.start_timer(method_name)
+            stats.record_max_object_count(MaxObjectCount)
             _validatePullParams(MaxObjectCount, context)
 
             namespace = context[1]
@@ -8101,7 +8972,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(result, exc)
 
@@ -8185,7 +9057,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(None, exc)
 
@@ -8297,6 +9170,23 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         classes = None
         method_name = 'EnumerateClasses'
 
+        if self._class_cache is not None and not extra:
+            cache_ns = namespace
+            if cache_ns is None and isinstance(ClassName, CIMClassName):
+                cache_ns = ClassName.namespace
+            cache_ns = self._iparam_namespace_from_namespace(cache_ns)
+            cache_cln = self._iparam_classname(ClassName)
+            classes = self._class_cache.get_classes(
+                cache_ns, cache_cln.classname if cache_cln else None,
+                DeepInheritance, LocalOnly, IncludeQualifiers,
+                IncludeClassOrigin)
+            if classes is not None:
+                for klass in classes:
+                    klass.path = CIMClassName(
+                        classname=klass.classname, host=self.host,
+                        namespace=cache_ns)
+                return classes
+
         if self._operation_recorders:
             self.operation_recorder_reset()
             self.operation_recorder_stage_pywbem_args(
@@ -8335,6 +9225,12 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                 klass.path = CIMClassName(
                     classname=klass.classname, host=self.host,
                     namespace=namespace)
+            if self._class_cache is not None and not extra:
+                self._class_cache.put_classes(
+                    classes, namespace,
+                    classname.classname if classname else None,
+                    DeepInheritance, LocalOnly, IncludeQualifiers,
+                    IncludeClassOrigin)
             return classes
 
         except Exception as exce:
@@ -8343,7 +9239,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(classes, exc)
 
@@ -8458,7 +9355,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(classnames, exc)
 
@@ -8555,6 +9453,21 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         exc = None
         method_name = 'GetClass'
 
+        if self._class_cache is not None and not extra:
+            cache_ns = namespace
+            if cache_ns is None and isinstance(ClassName, CIMClassName):
+                cache_ns = ClassName.namespace
+            cache_ns = self._iparam_namespace_from_namespace(cache_ns)
+            klass = self._class_cache.get_class(
+                cache_ns, self._iparam_classname(ClassName).classname,
+                LocalOnly, IncludeQualifiers, IncludeClassOrigin,
+                _iparam_propertylist(PropertyList))
+            if klass is not None:
+                klass.path = CIMClassName(
+                    classname=klass.classname, host=self.host,
+                    namespace=cache_ns)
+                return klass
+
         if self._operation_recorders:
             self.operation_recorder_reset()
             self.operation_recorder_stage_pywbem_args(
@@ -8589,6 +9502,10 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
             klass = result[0][2][0]
             klass.path = CIMClassName(
                 classname=klass.classname, host=self.host, namespace=namespace)
+            if self._class_cache is not None and not extra:
+                self._class_cache.put_class(
+                    klass, namespace, LocalOnly, IncludeQualifiers,
+                    IncludeClassOrigin, PropertyList)
             return klass
         except Exception as exce:
             exc = exce
@@ -8596,7 +9513,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(klass, exc)
 
@@ -8670,6 +9588,10 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                 namespace,
                 ModifiedClass=klass,
                 **extra)
+            if self._class_cache is not None:
+                self._class_cache.invalidate(namespace)
+            # pylint: disable=protected-access
+            ValueMapping._invalidate_cache(self.url, namespace)
 
         except Exception as exce:
             exc = exce
@@ -8677,7 +9599,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(None, exc)
 
@@ -8749,6 +9672,10 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                 namespace,
                 NewClass=klass,
                 **extra)
+            if self._class_cache is not None:
+                self._class_cache.invalidate(namespace)
+            # pylint: disable=protected-access
+            ValueMapping._invalidate_cache(self.url, namespace)
             return
 
         except Exception as exce:
@@ -8757,7 +9684,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(None, exc)
 
@@ -8828,6 +9756,10 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
                 namespace,
                 ClassName=classname,
                 **extra)
+            if self._class_cache is not None:
+                self._class_cache.invalidate(namespace)
+            # pylint: disable=protected-access
+            ValueMapping._invalidate_cache(self.url, namespace)
             return
 
         except Exception as exce:
@@ -8836,7 +9768,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(None, exc)
 
@@ -8915,7 +9848,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(qualifiers, exc)
 
@@ -8998,7 +9932,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(qualifiername, exc)
 
@@ -9072,7 +10007,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(None, exc)
 
@@ -9145,7 +10081,8 @@ class WBEMConnection(object):  # pylint: disable=too-many-instance-attributes
         finally:
             self._last_operation_time = stats.stop_timer(
                 self.last_request_len, self.last_reply_len,
-                self.last_server_response_time, exc)
+                self.last_server_response_time, exc,
+                *self._last_transfer_lens)
             if self._operation_recorders:
                 self.operation_recorder_stage_result(None, exc)
 
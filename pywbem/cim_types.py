@@ -78,8 +78,14 @@ import re
 import warnings
 import copy
 import traceback
+import threading
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ordereddict import OrderedDict
 import six
 
+from . import config
 from .config import DEBUG_WARNING_ORIGIN, ENFORCE_INTEGER_RANGE
 from ._utils import _ensure_unicode, _hash_item
 
@@ -110,6 +116,8 @@ class _CIMComparisonMixin(object):  # pylint: disable=too-few-public-methods
     used).
     """
 
+    __slots__ = ()
+
     def __eq__(self, other):
         """
         Invoked when two CIM objects are compared with the `==` operator.
@@ -278,6 +286,143 @@ class MinutesFromUTC(tzinfo):
         return timedelta(0)
 
 
+# Shared MinutesFromUTC objects, by offset in minutes. The CIM datetime
+# format limits the offsets to +/-999 minutes, so the number of entries
+# created by parsing is bounded.
+_MINUTES_FROM_UTC = {}
+
+
+def _minutes_from_utc(offset):
+    """
+    Return a MinutesFromUTC object for the offset in minutes, that is shared
+    with other users of the same offset. This is possible because
+    MinutesFromUTC objects are not modifiable.
+    """
+    try:
+        return _MINUTES_FROM_UTC[offset]
+    except KeyError:
+        tzi = MinutesFromUTC(offset)
+        _MINUTES_FROM_UTC[offset] = tzi
+        return tzi
+
+
+_DATETIME_PATTERN = re.compile(
+    r'^(\d{4})(\d{2})(\d{2})(\d{2})(\d{2})(\d{2})\.'
+    r'(\d{6})([+|-])(\d{3})')
+
+_INTERVAL_PATTERN = re.compile(
+    r'^(\d{8})(\d{2})(\d{2})(\d{2})\.(\d{6})(:)(000)')
+
+# Cache of parsed CIM datetime strings, see config.CIMDATETIME_CACHE_SIZE
+_DATETIME_CACHE = OrderedDict()
+_DATETIME_CACHE_LOCK = threading.Lock()
+
+
+def _parse_datetime_fast(dtarg):
+    """
+    Parse a unicode string in the fixed 25-character CIM datetime format
+    using string slices, and return a tuple (datetime, timedelta) of which
+    one item is `None`.
+
+    Return `None` if the string is not in the strict format or has invalid
+    field values; it then needs to be parsed by _parse_datetime().
+    """
+    if len(dtarg) != 25 or dtarg[14] != u'.' or \
+            not dtarg[0:14].isdigit() or not dtarg[15:21].isdigit() or \
+            not dtarg[22:25].isdigit():
+        return None
+    sign = dtarg[21]
+    # Converting the digits before the dot with a single int() and splitting
+    # the number is faster than converting each field separately.
+    value, second = divmod(int(dtarg[0:14]), 100)
+    value, minute = divmod(value, 100)
+    value, hour = divmod(value, 100)
+    try:
+        if sign == u'+' or sign == u'-':
+            offset = int(dtarg[22:25])
+            if sign == u'-':
+                offset = -offset
+            value, day = divmod(value, 100)
+            year, month = divmod(value, 100)
+            return (datetime(year, month, day, hour, minute, second,
+                             int(dtarg[15:21]), _minutes_from_utc(offset)),
+                    None)
+        if sign == u':' and dtarg[22:25] == u'000':
+            return (None,
+                    timedelta(value, hour * 3600 + minute * 60 + second,
+                              int(dtarg[15:21])))
+    except ValueError:
+        pass
+    return None
+
+
+def _parse_datetime(dtarg):
+    """
+    Parse a unicode string in CIM datetime format and return a tuple
+    (datetime, timedelta) of which one item is `None`.
+
+    Raises:
+      ValueError: Invalid CIM datetime format or field values.
+    """
+    result = _parse_datetime_fast(dtarg)
+    if result is not None:
+        return result
+
+    srch_result = _DATETIME_PATTERN.search(dtarg)
+    if srch_result is not None:
+        parts = srch_result.groups()
+        offset = int(parts[8])
+        if parts[7] == '-':
+            offset = -offset
+        try:
+            return (datetime(int(parts[0]), int(parts[1]), int(parts[2]),
+                             int(parts[3]), int(parts[4]), int(parts[5]),
+                             int(parts[6]), _minutes_from_utc(offset)),
+                    None)
+        except ValueError as exc:
+            raise ValueError('dtarg argument "%s" has invalid field '
+                             'values for CIM datetime timestamp '
+                             'format: %s' % (dtarg, exc))
+
+    srch_result = _INTERVAL_PATTERN.search(dtarg)
+    if srch_result is not None:
+        parts = srch_result.groups()
+        # Because the input values are limited by the matched
+        # pattern, timedelta() never throws any exception.
+        return (None,
+                timedelta(days=int(parts[0]), hours=int(parts[1]),
+                          minutes=int(parts[2]), seconds=int(parts[3]),
+                          microseconds=int(parts[4])))
+
+    raise ValueError('dtarg argument "%s" has an invalid CIM '
+                     'datetime format' % dtarg)
+
+
+def _parse_datetime_cached(dtarg):
+    """
+    Parse a unicode string in CIM datetime format like _parse_datetime(),
+    using the least recently used cache of parsed strings, if enabled.
+    """
+    cache_size = config.CIMDATETIME_CACHE_SIZE
+    if not cache_size:
+        return _parse_datetime(dtarg)
+    with _DATETIME_CACHE_LOCK:
+        try:
+            result = _DATETIME_CACHE.pop(dtarg)
+        except KeyError:
+            result = None
+        else:
+            _DATETIME_CACHE[dtarg] = result
+    if result is not None:
+        return result
+    result = _parse_datetime(dtarg)
+    with _DATETIME_CACHE_LOCK:
+        _DATETIME_CACHE[dtarg] = result
+        while len(_DATETIME_CACHE) > cache_size:
+            _DATETIME_CACHE.popitem(last=False)
+    return result
+
+
 class CIMType(object):  # pylint: disable=too-few-public-methods
     """Base type for all CIM data types defined in this package."""
 
@@ -333,44 +478,10 @@ class CIMDateTime(CIMType, _CIMComparisonMixin):
         self.__datetime = None
         dtarg = _ensure_unicode(dtarg)
         if isinstance(dtarg, six.text_type):
-            date_pattern = re.compile(
-                r'^(\d{4})(\d{2})(\d{2})(\d{2})(\d{2})(\d{2})\.'
-                r'(\d{6})([+|-])(\d{3})')
-            srch_result = date_pattern.search(dtarg)
-            if srch_result is not None:
-                parts = srch_result.groups()
-                offset = int(parts[8])
-                if parts[7] == '-':
-                    offset = -offset
-                try:
-                    self.__datetime = datetime(int(parts[0]), int(parts[1]),
-                                               int(parts[2]), int(parts[3]),
-                                               int(parts[4]), int(parts[5]),
-                                               int(parts[6]),
-                                               MinutesFromUTC(offset))
-                except ValueError as exc:
-                    raise ValueError('dtarg argument "%s" has invalid field '
-                                     'values for CIM datetime timestamp '
-                                     'format: %s' % (dtarg, exc))
-            else:
-                tv_pattern = re.compile(
-                    r'^(\d{8})(\d{2})(\d{2})(\d{2})\.(\d{6})(:)(000)')
-                srch_result = tv_pattern.search(dtarg)
-                if srch_result is not None:
-                    parts = srch_result.groups()
-                    # Because the input values are limited by the matched
-                    # pattern, timedelta() never throws any exception.
-                    self.__timedelta = timedelta(days=int(parts[0]),
-                                                 hours=int(parts[1]),
-                                                 minutes=int(parts[2]),
-                                                 seconds=int(parts[3]),
-                                                 microseconds=int(parts[4]))
-                else:
-                    raise ValueError('dtarg argument "%s" has an invalid CIM '
-                                     'datetime format' % dtarg)
+            self.__datetime, self.__timedelta = _parse_datetime_cached(dtarg)
         elif isinstance(dtarg, datetime):
             if dtarg.tzinfo is None:
-                self.__datetime = dtarg.replace(tzinfo=MinutesFromUTC(0))
+                self.__datetime = dtarg.replace(tzinfo=_minutes_from_utc(0))
             else:
                 self.__datetime = copy.copy(dtarg)
         elif isinstance(dtarg, timedelta):
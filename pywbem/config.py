@@ -39,7 +39,8 @@ they should be used from the ``pywbem`` namespace.
 # This module is meant to be safe for 'import *'.
 
 __all__ = ['ENFORCE_INTEGER_RANGE', 'DEFAULT_ITER_MAXOBJECTCOUNT',
-           'SEND_VALUE_NULL']
+           'SEND_VALUE_NULL', 'DIRECT_CIMXML_PARSER', 'FAST_CIMXML_WRITER',
+           'CIMDATETIME_CACHE_SIZE']
 
 #: Enforce the allowable value range for CIM integer types (e.g.
 #: :class:`~pywbem.Uint8`). For details, see the :class:`~pywbem.CIMInt` base
@@ -93,3 +94,63 @@ DEBUG_WARNING_ORIGIN = False
 #:
 #: *New in pywbem 0.12.*
 SEND_VALUE_NULL = True
+
+#: Selects the parser for the CIM-XML responses received by
+#: :class:`~pywbem.WBEMConnection`.
+#:
+#: * False (default): The CIM-XML response is first parsed into a tupletree,
+#:   which is then converted into the CIM objects.
+#: * True: The CIM objects are created directly from the events of the expat
+#:   XML parser in a single pass, without creating a tupletree. This is faster
+#:   and uses less memory for large responses. The resulting objects are the
+#:   same, but the validation of the CIM-XML elements is slightly less strict.
+#:
+#: Unlike the other configuration variables, this variable is read by pywbem
+#: for every operation, so it must be modified in the ``pywbem.config``
+#: namespace. For example:
+#:
+#: ::
+#:
+#:     import pywbem
+#:     pywbem.config.DIRECT_CIMXML_PARSER = True
+#:
+#: *New in pywbem 0.13 as experimental.*
+DIRECT_CIMXML_PARSER = False
+
+#: Selects how CIM-XML is created for the CIM-XML requests sent by
+#: :class:`~pywbem.WBEMConnection`, and for the `tocimxmlstr()` functions and
+#: methods when invoked without indentation.
+#:
+#: * False (default): The CIM-XML is created by building a tree of
+#:   :term:`Element` objects and converting it to a string.
+#: * True: The CIM-XML for instances, instance paths, class paths, properties,
+#:   qualifiers and CIM data type values is written directly into a string
+#:   buffer, without creating :term:`Element` objects. This is faster and uses
+#:   less memory for large objects. The resulting CIM-XML string is the same.
+#:   This is not used for requests while debug mode is enabled.
+#:
+#: Like :data:`DIRECT_CIMXML_PARSER`, this variable is read by pywbem when
+#: needed, so it must be modified in the ``pywbem.config`` namespace.
+#:
+#: *New in pywbem 0.13 as experimental.*
+FAST_CIMXML_WRITER = False
+
+#: Maximum number of CIM datetime strings whose parsed values are kept in a
+#: least recently used cache, when :class:`~pywbem.CIMDateTime` objects are
+#: created from strings (e.g. when parsing CIM-XML responses).
+#:
+#: The cache avoids parsing the same string again, which is useful when many
+#: objects have the same datetime values (e.g. timestamps of log records or
+#: indications). The parsed :class:`py:datetime.datetime` and
+#: :class:`py:datetime.timedelta` objects are immutable, so they are shared
+#: between the :class:`~pywbem.CIMDateTime` objects created from the same
+#: string.
+#:
+#: * 0 (default): No cache is used.
+#: * A positive number: The maximum number of strings in the cache.
+#:
+#: Like :data:`DIRECT_CIMXML_PARSER`, this variable is read by pywbem when
+#: needed, so it must be modified in the ``pywbem.config`` namespace.
+#:
+#: *New in pywbem 0.13 as experimental.*
+CIMDATETIME_CACHE_SIZE = 0
@@ -0,0 +1,233 @@
+
+# mofparsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "ANY AS ASSOCIATION CLASS DISABLEOVERRIDE DT_BOOL DT_CHAR16 DT_DATETIME DT_REAL32 DT_REAL64 DT_SINT16 DT_SINT32 DT_SINT64 DT_SINT8 DT_STR DT_UINT16 DT_UINT32 DT_UINT64 DT_UINT8 ENABLEOVERRIDE FALSE FLAVOR IDENTIFIER INDICATION INSTANCE METHOD NULL OF PARAMETER PRAGMA PROPERTY QUALIFIER REF REFERENCE RESTRICTED SCHEMA SCOPE TOINSTANCE TOSUBCLASS TRANSLATABLE TRUE binaryValue charValue decimalValue floatValue hexValue octalValue stringValuemofSpecification : mofProductionListmofProductionList : empty\n                         | mofProductionList mofProduction\n                         mofProduction : compilerDirective\n                     | mp_createClass\n                     | mp_setQualifier\n                     | mp_createInstance\n                     mp_createClass : classDeclaration\n                      | assocDeclaration\n                      | indicDeclaration\n                      mp_createInstance : instanceDeclarationmp_setQualifier : qualifierDeclarationcompilerDirective : '#' PRAGMA pragmaName '(' pragmaParameter ')'pragmaName : identifierpragmaParameter : stringValueclassDeclaration : CLASS className '{' classFeatureList '}' ';'\n                        | CLASS className superClass '{' classFeatureList '}' ';'\n                        | CLASS className alias '{' classFeatureList '}' ';'\n                        | CLASS className alias superClass '{' classFeatureList '}' ';'\n                        | qualifierList CLASS className '{' classFeatureList '}' ';'\n                        | qualifierList CLASS className superClass '{' classFeatureList '}' ';'\n                        | qualifierList CLASS className alias '{' classFeatureList '}' ';'\n                        | qualifierList CLASS className alias superClass '{' classFeatureList '}' ';'\n                        classFeatureList : empty\n                        | classFeatureList classFeature\n                        assocDeclaration : '[' ASSOCIATION qualifierListEmpty ']' CLASS className '{' associationFeatureList '}' ';'\n                        | '[' ASSOCIATION qualifierListEmpty ']' CLASS className superClass '{' associationFeatureList '}' ';'\n                        | '[' ASSOCIATION qualifierListEmpty ']' CLASS className alias '{' associationFeatureList '}' ';'\n                        | '[' ASSOCIATION qualifierListEmpty ']' CLASS className alias superClass '{' associationFeatureList '}' ';'\n                        indicDeclaration : '[' INDICATION qualifierListEmpty ']' CLASS className '{' classFeatureList '}' ';'\n                        | '[' INDICATION qualifierListEmpty ']' CLASS className superClass '{' classFeatureList '}' ';'\n                        | '[' INDICATION qualifierListEmpty ']' CLASS className alias '{' classFeatureList '}' ';'\n                        | '[' INDICATION qualifierListEmpty ']' CLASS className alias superClass '{' classFeatureList '}' ';'\n                        qualifierListEmpty : empty\n                          | qualifierListEmpty ',' qualifier\n                          associationFeatureList : empty\n                              | associationFeatureList associationFeature\n                              className : identifieralias : AS aliasIdentifieraliasIdentifier : '$' identifiersuperClass : ':' classNameclassFeature : propertyDeclaration\n                    | methodDeclaration\n                    | referenceDeclaration\n                    associationFeature : classFeaturequalifierList : '[' qualifier qualifierListEmpty ']'qualifier : qualifierName\n                 | qualifierName ':' flavorList\n                 | qualifierName qualifierParameter\n                 | qualifierName qualifierParameter ':' flavorList\n                 flavorList : flavor\n                  | flavorList flavor\n                  qualifierParameter : '(' constantValue ')'\n                          | arrayInitializer\n                          flavor : ENABLEOVERRIDE\n              | DISABLEOVERRIDE\n              | RESTRICTED\n              | TOSUBCLASS\n              | TOINSTANCE\n              | TRANSLATABLE\n              propertyDeclaration : propertyDeclaration_1\n                           | propertyDeclaration_2\n                           | propertyDeclaration_3\n                           | propertyDeclaration_4\n                           | propertyDeclaration_5\n                           | propertyDeclaration_6\n                           | propertyDeclaration_7\n                           | propertyDeclaration_8\n                           propertyDeclaration_1 : dataType propertyName ';'propertyDeclaration_2 : dataType propertyName defaultValue ';'propertyDeclaration_3 : dataType propertyName array ';'propertyDeclaration_4 : dataType propertyName array defaultValue ';'propertyDeclaration_5 : qualifierList dataType propertyName ';'propertyDeclaration_6 : qualifierList dataType propertyName defaultValue ';'propertyDeclaration_7 : qualifierList dataType propertyName array ';'propertyDeclaration_8 : qualifierList dataType propertyName array defaultValue ';'referenceDeclaration : objectRef referenceName ';'\n                            | objectRef referenceName defaultValue ';'\n                            | qualifierList objectRef referenceName ';'\n                            | qualifierList objectRef referenceName defaultValue ';'\n                            methodDeclaration : dataType methodName '(' ')' ';'\n                         | dataType methodName '(' parameterList ')' ';'\n                         | qualifierList dataType methodName '(' ')' ';'\n                         | qualifierList dataType methodName '(' parameterList ')' ';'\n                         propertyName : identifierreferenceName : identifiermethodName : identifierdataType : DT_UINT8\n                | DT_SINT8\n                | DT_UINT16\n                | DT_SINT16\n                | DT_UINT32\n                | DT_SINT32\n                | DT_UINT64\n                | DT_SINT64\n                | DT_REAL32\n                | DT_REAL64\n                | DT_CHAR16\n                | DT_STR\n                | DT_BOOL\n                | DT_DATETIME\n                objectRef : className REFparameterList : parameter\n                     | parameterList ',' parameter\n                     parameter : parameter_1\n                 | parameter_2\n                 | parameter_3\n                 | parameter_4\n                 parameter_1 : dataType parameterName\n                   | dataType parameterName array\n                   parameter_2 : qualifierList dataType parameterName\n                   | qualifierList dataType parameterName array\n                   parameter_3 : objectRef parameterName\n                   | objectRef parameterName array\n                   parameter_4 : qualifierList objectRef parameterName\n                   | qualifierList objectRef parameterName array\n                   parameterName : identifierarray : '[' ']'\n             | '[' integerValue ']'\n             defaultValue : '=' initializerinitializer : constantValue\n                   | arrayInitializer\n                   | referenceInitializer\n                   arrayInitializer : '{' constantValueList '}'\n                        | '{' '}'\n                        constantValueList : constantValue\n                         | constantValueList ',' constantValue\n                         stringValueList : stringValue\n                       | stringValueList stringValue\n                       constantValue : integerValue\n                     | floatValue\n                     | charValue\n                     | stringValueList\n                     | booleanValue\n                     | nullValue\n                     integerValue : binaryValue\n                    | octalValue\n                    | decimalValue\n                    | hexValue\n                    referenceInitializer : objectHandle\n                            | aliasIdentifier\n                            objectHandle : identifierqualifierDeclaration : QUALIFIER qualifierName qualifierType scope ';'\n                            | QUALIFIER qualifierName qualifierType scope defaultFlavor ';'\n                            qualifierName : identifier\n                     | ASSOCIATION\n                     | INDICATION\n                     qualifierType : qualifierType_1\n                     | qualifierType_2\n                     qualifierType_1 : ':' dataType array\n                       | ':' dataType array defaultValue\n                       qualifierType_2 : ':' dataType\n                       | ':' dataType defaultValue\n                       scope : ',' SCOPE '(' metaElementList ')'metaElementList : metaElement\n                       | metaElementList ',' metaElement\n                       metaElement : SCHEMA\n                   | CLASS\n                   | ASSOCIATION\n                   | INDICATION\n                   | QUALIFIER\n                   | PROPERTY\n                   | REFERENCE\n                   | METHOD\n                   | PARAMETER\n                   | ANY\n                   defaultFlavor : ',' FLAVOR '(' flavorListWithComma ')'flavorListWithComma : flavor\n                           | flavorListWithComma ',' flavor\n                           instanceDeclaration : INSTANCE OF className '{' valueInitializerList '}' ';'\n                           | INSTANCE OF className alias '{' valueInitializerList '}' ';'\n                           | qualifierList INSTANCE OF className '{' valueInitializerList '}' ';'\n                           | qualifierList INSTANCE OF className alias '{' valueInitializerList '}' ';'\n                           valueInitializerList : valueInitializer\n                            | valueInitializerList valueInitializer\n                            valueInitializer : identifier defaultValue ';'\n                        | qualifierList identifier defaultValue ';'\n                        booleanValue : FALSE\n                    | TRUE\n                    nullValue : NULLidentifier : IDENTIFIER\n                  | ANY\n                  | AS\n                  | CLASS\n                  | DISABLEOVERRIDE\n                  | dataType\n                  | ENABLEOVERRIDE\n                  | FLAVOR\n                  | INSTANCE\n                  | METHOD\n                  | OF\n                  | PARAMETER\n                  | PRAGMA\n                  | PROPERTY\n                  | QUALIFIER\n                  | REFERENCE\n                  | RESTRICTED\n                  | SCHEMA\n                  | SCOPE\n                  | TOSUBCLASS\n                  | TOINSTANCE\n                  | TRANSLATABLE\n    empty :"
+    
+_lr_action_items = {'#':([0,2,3,4,5,6,7,8,10,11,12,13,14,181,194,196,216,243,244,246,272,296,297,298,300,316,332,333,356,360,368,369,371,372,374,375,],[-203,9,-2,-3,-4,-5,-6,-7,-8,-9,-10,-12,-11,-143,-13,-16,-144,-17,-18,-20,-170,-19,-21,-22,-172,-171,-23,-173,-26,-30,-27,-28,-31,-32,-29,-33,]),'CLASS':([0,2,3,4,5,6,7,8,10,11,12,13,14,15,16,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,94,95,96,97,101,102,106,107,108,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,181,188,189,190,192,193,194,195,196,200,201,206,208,209,210,211,212,216,218,230,233,234,235,241,243,244,246,249,251,252,255,272,273,276,284,285,286,287,289,290,293,295,296,297,298,300,302,303,304,305,307,308,309,313,315,316,319,321,322,323,325,328,329,331,332,333,335,336,337,338,339,341,342,343,348,353,355,356,359,360,363,367,368,369,371,372,374,375,],[-203,15,-2,-3,-4,-5,-6,-7,-8,-9,-10,-12,-11,21,59,21,21,21,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,21,21,-203,21,21,21,-24,-203,-203,21,-203,172,21,174,-46,21,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,21,21,21,21,21,21,-203,21,-203,-203,21,21,21,-143,21,21,-174,21,21,-13,-102,-16,21,21,21,21,21,-203,21,21,-144,262,-175,21,21,-69,-77,-17,-18,-20,21,21,-203,-203,-170,-176,21,21,21,-70,-71,21,-73,-79,-78,-19,-21,-22,-172,21,-36,-203,-203,21,-203,-203,262,-177,-171,-81,21,21,21,-72,-74,-75,-80,-23,-173,-37,-45,21,21,-203,21,21,-203,-82,-83,-76,-26,21,-30,21,-84,-27,-28,-31,-32,-29,-33,]),'[':([0,2,3,4,5,6,7,8,10,11,12,13,14,21,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,72,94,95,96,97,102,139,140,146,147,148,149,150,151,152,153,154,155,156,157,162,163,164,166,167,168,170,181,189,190,193,194,196,198,199,206,208,209,210,211,212,216,230,233,234,235,239,241,243,244,246,249,251,252,255,272,273,286,287,289,290,293,295,296,297,298,300,302,303,304,305,307,308,309,315,316,317,318,319,321,324,325,328,329,331,332,333,335,336,337,338,339,341,342,343,348,350,351,353,355,356,359,360,363,367,368,369,371,372,374,375,],[-203,17,-2,-3,-4,-5,-6,-7,-8,-9,-10,-12,-11,-184,-181,-182,-183,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-203,161,-24,-203,-203,-203,187,161,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,161,161,-203,161,-203,-203,161,-143,161,-174,161,-13,-16,187,-85,161,161,161,-203,161,161,-144,-175,161,161,-69,187,-77,-17,-18,-20,161,161,-203,-203,-170,-176,-70,-71,161,-73,-79,-78,-19,-21,-22,-172,161,-36,-203,-203,161,-203,-203,-177,-171,187,-117,-81,161,187,-72,-74,-75,-80,-23,-173,-37,-45,161,161,-203,161,161,-203,-82,187,187,-83,-76,-26,161,-30,161,-84,-27,-28,-31,-32,-29,-33,]),'QUALIFIER':([0,2,3,4,5,6,7,8,10,11,12,13,14,15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,181,188,189,190,192,193,194,195,196,200,201,206,208,209,210,211,212,216,218,230,233,234,235,241,243,244,246,249,251,252,255,272,273,276,284,285,286,287,289,290,293,295,296,297,298,300,302,303,304,305,307,308,309,313,315,316,319,321,322,323,325,328,329,331,332,333,335,336,337,338,339,341,342,343,348,353,355,356,359,360,363,367,368,369,371,372,374,375,],[-203,18,-2,-3,-4,-5,-6,-7,-8,-9,-10,-12,-11,37,37,37,37,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,37,37,-203,37,37,37,-24,-203,-203,37,-203,37,-46,37,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,37,37,37,37,37,37,-203,37,-203,-203,37,37,37,-143,37,37,-174,37,37,-13,-102,-16,37,37,37,37,37,-203,37,37,-144,265,-175,37,37,-69,-77,-17,-18,-20,37,37,-203,-203,-170,-176,37,37,37,-70,-71,37,-73,-79,-78,-19,-21,-22,-172,37,-36,-203,-203,37,-203,-203,265,-177,-171,-81,37,37,37,-72,-74,-75,-80,-23,-173,-37,-45,37,37,-203,37,37,-203,-82,-83,-76,-26,37,-30,37,-84,-27,-28,-31,-32,-29,-33,]),'INSTANCE':([0,2,3,4,5,6,7,8,10,11,12,13,14,15,16,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,181,188,189,190,192,193,194,195,196,200,201,206,208,209,210,211,212,216,230,233,234,235,241,243,244,246,249,251,252,255,272,273,276,284,285,286,287,289,290,293,295,296,297,298,300,302,303,304,305,307,308,309,315,316,319,321,322,323,325,328,329,331,332,333,335,336,337,338,339,341,342,343,348,353,355,356,359,360,363,367,368,369,371,372,374,375,],[-203,19,-2,-3,-4,-5,-6,-7,-8,-9,-10,-12,-11,31,60,31,31,31,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,31,31,-203,31,31,31,-24,-203,-203,31,-203,31,-46,31,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,31,31,31,31,31,31,-203,31,-203,-203,31,31,31,-143,31,31,-174,31,31,-13,-102,-16,31,31,31,31,31,-203,31,31,-144,-175,31,31,-69,-77,-17,-18,-20,31,31,-203,-203,-170,-176,31,31,31,-70,-71,31,-73,-79,-78,-19,-21,-22,-172,31,-36,-203,-203,31,-203,-203,-177,-171,-81,31,31,31,-72,-74,-75,-80,-23,-173,-37,-45,31,31,-203,31,31,-203,-82,-83,-76,-26,31,-30,31,-84,-27,-28,-31,-32,-29,-33,]),'$end':([0,1,2,3,4,5,6,7,8,10,11,12,13,14,181,194,196,216,243,244,246,272,296,297,298,300,316,332,333,356,360,368,369,371,372,374,375,],[-203,0,-1,-2,-3,-4,-5,-6,-7,-8,-9,-10,-12,-11,-143,-13,-16,-144,-17,-18,-20,-170,-19,-21,-22,-172,-171,-23,-173,-26,-30,-27,-28,-31,-32,-29,-33,]),'PRAGMA':([9,15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[20,35,35,35,35,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,35,35,-203,35,35,35,-24,-203,-203,35,-203,35,-46,35,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,35,35,35,35,35,35,-203,35,-203,-203,35,35,35,35,35,-174,35,35,-102,35,35,35,35,35,-203,35,35,-175,35,35,-69,-77,35,35,-203,-203,-176,35,35,35,-70,-71,35,-73,-79,-78,35,-36,-203,-203,35,-203,-203,-177,-81,35,35,35,-72,-74,-75,-80,-37,-45,35,35,-203,35,35,-203,-82,-83,-76,35,35,-84,]),'IDENTIFIER':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[24,24,24,24,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,24,24,-203,24,24,24,-24,-203,-203,24,-203,24,-46,24,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,24,24,24,24,24,24,-203,24,-203,-203,24,24,24,24,24,-174,24,24,-102,24,24,24,24,24,-203,24,24,-175,24,24,-69,-77,24,24,-203,-203,-176,24,24,24,-70,-71,24,-73,-79,-78,24,-36,-203,-203,24,-203,-203,-177,-81,24,24,24,-72,-74,-75,-80,-37,-45,24,24,-203,24,24,-203,-82,-83,-76,24,24,-84,]),'ANY':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,218,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,313,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[25,25,25,25,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,25,25,-203,25,25,25,-24,-203,-203,25,-203,25,-46,25,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,25,25,25,25,25,25,-203,25,-203,-203,25,25,25,25,25,-174,25,25,-102,25,25,25,25,25,-203,25,25,270,-175,25,25,-69,-77,25,25,-203,-203,-176,25,25,25,-70,-71,25,-73,-79,-78,25,-36,-203,-203,25,-203,-203,270,-177,-81,25,25,25,-72,-74,-75,-80,-37,-45,25,25,-203,25,25,-203,-82,-83,-76,25,25,-84,]),'AS':([15,17,18,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,77,78,92,94,95,96,97,101,102,105,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,213,214,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[26,26,26,26,-184,76,-38,-181,-182,-183,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,26,26,-203,26,76,26,76,26,-24,-203,-203,26,-203,76,26,-46,26,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,26,26,26,26,26,26,-203,26,-203,-203,26,26,26,26,26,-174,26,26,-102,26,26,26,26,26,-203,26,26,76,76,-175,26,26,-69,-77,26,26,-203,-203,-176,26,26,26,-70,-71,26,-73,-79,-78,26,-36,-203,-203,26,-203,-203,-177,-81,26,26,26,-72,-74,-75,-80,-37,-45,26,26,-203,26,26,-203,-82,-83,-76,26,26,-84,]),'DISABLEOVERRIDE':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,83,94,95,96,97,101,102,107,109,110,111,112,113,114,115,116,117,118,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,175,176,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,258,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,344,348,353,355,359,363,367,],[27,27,27,27,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,27,27,-203,27,27,113,27,-24,-203,-203,27,-203,27,-46,113,-51,-55,-56,-57,-58,-59,-60,113,27,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,27,27,27,27,27,27,-203,27,-203,-203,27,27,27,-52,113,27,27,-174,27,27,-102,27,27,27,27,27,-203,27,27,-175,27,27,-69,-77,27,27,-203,-203,113,-176,27,27,27,-70,-71,27,-73,-79,-78,27,-36,-203,-203,27,-203,-203,-177,-81,27,27,27,-72,-74,-75,-80,-37,-45,27,27,-203,27,27,-203,113,-82,-83,-76,27,27,-84,]),'ENABLEOVERRIDE':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,83,94,95,96,97,101,102,107,109,110,111,112,113,114,115,116,117,118,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,175,176,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,258,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,344,348,353,355,359,363,367,],[29,29,29,29,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,29,29,-203,29,29,112,29,-24,-203,-203,29,-203,29,-46,112,-51,-55,-56,-57,-58,-59,-60,112,29,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,29,29,29,29,29,29,-203,29,-203,-203,29,29,29,-52,112,29,29,-174,29,29,-102,29,29,29,29,29,-203,29,29,-175,29,29,-69,-77,29,29,-203,-203,112,-176,29,29,29,-70,-71,29,-73,-79,-78,29,-36,-203,-203,29,-203,-203,-177,-81,29,29,29,-72,-74,-75,-80,-37,-45,29,29,-203,29,29,-203,112,-82,-83,-76,29,29,-84,]),'FLAVOR':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,183,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[30,30,30,30,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,30,30,-203,30,30,30,-24,-203,-203,30,-203,30,-46,30,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,30,30,30,30,30,30,-203,30,-203,-203,30,30,30,217,30,30,-174,30,30,-102,30,30,30,30,30,-203,30,30,-175,30,30,-69,-77,30,30,-203,-203,-176,30,30,30,-70,-71,30,-73,-79,-78,30,-36,-203,-203,30,-203,-203,-177,-81,30,30,30,-72,-74,-75,-80,-37,-45,30,30,-203,30,30,-203,-82,-83,-76,30,30,-84,]),'METHOD':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,218,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,313,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[32,32,32,32,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,32,32,-203,32,32,32,-24,-203,-203,32,-203,32,-46,32,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,32,32,32,32,32,32,-203,32,-203,-203,32,32,32,32,32,-174,32,32,-102,32,32,32,32,32,-203,32,32,268,-175,32,32,-69,-77,32,32,-203,-203,-176,32,32,32,-70,-71,32,-73,-79,-78,32,-36,-203,-203,32,-203,-203,268,-177,-81,32,32,32,-72,-74,-75,-80,-37,-45,32,32,-203,32,32,-203,-82,-83,-76,32,32,-84,]),'OF':([15,17,18,19,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,69,72,75,78,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[33,33,33,69,33,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,33,78,33,-203,33,33,33,-24,-203,-203,33,-203,33,-46,33,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,33,33,33,33,33,33,-203,33,-203,-203,33,33,33,33,33,-174,33,33,-102,33,33,33,33,33,-203,33,33,-175,33,33,-69,-77,33,33,-203,-203,-176,33,33,33,-70,-71,33,-73,-79,-78,33,-36,-203,-203,33,-203,-203,-177,-81,33,33,33,-72,-74,-75,-80,-37,-45,33,33,-203,33,33,-203,-82,-83,-76,33,33,-84,]),'PARAMETER':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,218,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,313,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[34,34,34,34,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,34,34,-203,34,34,34,-24,-203,-203,34,-203,34,-46,34,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,34,34,34,34,34,34,-203,34,-203,-203,34,34,34,34,34,-174,34,34,-102,34,34,34,34,34,-203,34,34,269,-175,34,34,-69,-77,34,34,-203,-203,-176,34,34,34,-70,-71,34,-73,-79,-78,34,-36,-203,-203,34,-203,-203,269,-177,-81,34,34,34,-72,-74,-75,-80,-37,-45,34,34,-203,34,34,-203,-82,-83,-76,34,34,-84,]),'PROPERTY':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,218,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,313,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[36,36,36,36,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,36,36,-203,36,36,36,-24,-203,-203,36,-203,36,-46,36,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,36,36,36,36,36,36,-203,36,-203,-203,36,36,36,36,36,-174,36,36,-102,36,36,36,36,36,-203,36,36,266,-175,36,36,-69,-77,36,36,-203,-203,-176,36,36,36,-70,-71,36,-73,-79,-78,36,-36,-203,-203,36,-203,-203,266,-177,-81,36,36,36,-72,-74,-75,-80,-37,-45,36,36,-203,36,36,-203,-82,-83,-76,36,36,-84,]),'REFERENCE':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,218,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,313,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[38,38,38,38,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,38,38,-203,38,38,38,-24,-203,-203,38,-203,38,-46,38,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,38,38,38,38,38,38,-203,38,-203,-203,38,38,38,38,38,-174,38,38,-102,38,38,38,38,38,-203,38,38,267,-175,38,38,-69,-77,38,38,-203,-203,-176,38,38,38,-70,-71,38,-73,-79,-78,38,-36,-203,-203,38,-203,-203,267,-177,-81,38,38,38,-72,-74,-75,-80,-37,-45,38,38,-203,38,38,-203,-82,-83,-76,38,38,-84,]),'RESTRICTED':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,83,94,95,96,97,101,102,107,109,110,111,112,113,114,115,116,117,118,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,175,176,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,258,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,344,348,353,355,359,363,367,],[39,39,39,39,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,39,39,-203,39,39,114,39,-24,-203,-203,39,-203,39,-46,114,-51,-55,-56,-57,-58,-59,-60,114,39,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,39,39,39,39,39,39,-203,39,-203,-203,39,39,39,-52,114,39,39,-174,39,39,-102,39,39,39,39,39,-203,39,39,-175,39,39,-69,-77,39,39,-203,-203,114,-176,39,39,39,-70,-71,39,-73,-79,-78,39,-36,-203,-203,39,-203,-203,-177,-81,39,39,39,-72,-74,-75,-80,-37,-45,39,39,-203,39,39,-203,114,-82,-83,-76,39,39,-84,]),'SCHEMA':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,218,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,313,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[40,40,40,40,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,40,40,-203,40,40,40,-24,-203,-203,40,-203,40,-46,40,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,40,40,40,40,40,40,-203,40,-203,-203,40,40,40,40,40,-174,40,40,-102,40,40,40,40,40,-203,40,40,261,-175,40,40,-69,-77,40,40,-203,-203,-176,40,40,40,-70,-71,40,-73,-79,-78,40,-36,-203,-203,40,-203,-203,261,-177,-81,40,40,40,-72,-74,-75,-80,-37,-45,40,40,-203,40,40,-203,-82,-83,-76,40,40,-84,]),'SCOPE':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,94,95,96,97,101,102,107,109,138,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[41,41,41,41,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,41,41,-203,41,41,41,-24,-203,-203,41,-203,41,-46,184,41,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,41,41,41,41,41,41,-203,41,-203,-203,41,41,41,41,41,-174,41,41,-102,41,41,41,41,41,-203,41,41,-175,41,41,-69,-77,41,41,-203,-203,-176,41,41,41,-70,-71,41,-73,-79,-78,41,-36,-203,-203,41,-203,-203,-177,-81,41,41,41,-72,-74,-75,-80,-37,-45,41,41,-203,41,41,-203,-82,-83,-76,41,41,-84,]),'TOSUBCLASS':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,83,94,95,96,97,101,102,107,109,110,111,112,113,114,115,116,117,118,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,175,176,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,258,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,344,348,353,355,359,363,367,],[42,42,42,42,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,42,42,-203,42,42,115,42,-24,-203,-203,42,-203,42,-46,115,-51,-55,-56,-57,-58,-59,-60,115,42,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,42,42,42,42,42,42,-203,42,-203,-203,42,42,42,-52,115,42,42,-174,42,42,-102,42,42,42,42,42,-203,42,42,-175,42,42,-69,-77,42,42,-203,-203,115,-176,42,42,42,-70,-71,42,-73,-79,-78,42,-36,-203,-203,42,-203,-203,-177,-81,42,42,42,-72,-74,-75,-80,-37,-45,42,42,-203,42,42,-203,115,-82,-83,-76,42,42,-84,]),'TOINSTANCE':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,83,94,95,96,97,101,102,107,109,110,111,112,113,114,115,116,117,118,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,175,176,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,258,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,344,348,353,355,359,363,367,],[43,43,43,43,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,43,43,-203,43,43,116,43,-24,-203,-203,43,-203,43,-46,116,-51,-55,-56,-57,-58,-59,-60,116,43,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,43,43,43,43,43,43,-203,43,-203,-203,43,43,43,-52,116,43,43,-174,43,43,-102,43,43,43,43,43,-203,43,43,-175,43,43,-69,-77,43,43,-203,-203,116,-176,43,43,43,-70,-71,43,-73,-79,-78,43,-36,-203,-203,43,-203,-203,-177,-81,43,43,43,-72,-74,-75,-80,-37,-45,43,43,-203,43,43,-203,116,-82,-83,-76,43,43,-84,]),'TRANSLATABLE':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,83,94,95,96,97,101,102,107,109,110,111,112,113,114,115,116,117,118,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,175,176,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,258,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,344,348,353,355,359,363,367,],[44,44,44,44,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,44,44,-203,44,44,117,44,-24,-203,-203,44,-203,44,-46,117,-51,-55,-56,-57,-58,-59,-60,117,44,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,44,44,44,44,44,44,-203,44,-203,-203,44,44,44,-52,117,44,44,-174,44,44,-102,44,44,44,44,44,-203,44,44,-175,44,44,-69,-77,44,44,-203,-203,117,-176,44,44,44,-70,-71,44,-73,-79,-78,44,-36,-203,-203,44,-203,-203,-177,-81,44,44,44,-72,-74,-75,-80,-37,-45,44,44,-203,44,44,-203,117,-82,-83,-76,44,44,-84,]),'DT_UINT8':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,91,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[45,45,45,45,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,45,45,-203,45,45,45,45,-24,-203,-203,45,-203,45,-46,45,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,45,45,45,45,45,45,-203,45,-203,-203,45,45,45,45,45,-174,45,45,-102,45,45,45,45,45,-203,45,45,-175,45,45,-69,-77,45,45,-203,-203,-176,45,45,45,-70,-71,45,-73,-79,-78,45,-36,-203,-203,45,-203,-203,-177,-81,45,45,45,-72,-74,-75,-80,-37,-45,45,45,-203,45,45,-203,-82,-83,-76,45,45,-84,]),'DT_SINT8':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,91,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[46,46,46,46,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,46,46,-203,46,46,46,46,-24,-203,-203,46,-203,46,-46,46,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,46,46,46,46,46,46,-203,46,-203,-203,46,46,46,46,46,-174,46,46,-102,46,46,46,46,46,-203,46,46,-175,46,46,-69,-77,46,46,-203,-203,-176,46,46,46,-70,-71,46,-73,-79,-78,46,-36,-203,-203,46,-203,-203,-177,-81,46,46,46,-72,-74,-75,-80,-37,-45,46,46,-203,46,46,-203,-82,-83,-76,46,46,-84,]),'DT_UINT16':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,91,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[47,47,47,47,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,47,47,-203,47,47,47,47,-24,-203,-203,47,-203,47,-46,47,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,47,47,47,47,47,47,-203,47,-203,-203,47,47,47,47,47,-174,47,47,-102,47,47,47,47,47,-203,47,47,-175,47,47,-69,-77,47,47,-203,-203,-176,47,47,47,-70,-71,47,-73,-79,-78,47,-36,-203,-203,47,-203,-203,-177,-81,47,47,47,-72,-74,-75,-80,-37,-45,47,47,-203,47,47,-203,-82,-83,-76,47,47,-84,]),'DT_SINT16':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,91,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[48,48,48,48,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,48,48,-203,48,48,48,48,-24,-203,-203,48,-203,48,-46,48,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,48,48,48,48,48,48,-203,48,-203,-203,48,48,48,48,48,-174,48,48,-102,48,48,48,48,48,-203,48,48,-175,48,48,-69,-77,48,48,-203,-203,-176,48,48,48,-70,-71,48,-73,-79,-78,48,-36,-203,-203,48,-203,-203,-177,-81,48,48,48,-72,-74,-75,-80,-37,-45,48,48,-203,48,48,-203,-82,-83,-76,48,48,-84,]),'DT_UINT32':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,91,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[49,49,49,49,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,49,49,-203,49,49,49,49,-24,-203,-203,49,-203,49,-46,49,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,49,49,49,49,49,49,-203,49,-203,-203,49,49,49,49,49,-174,49,49,-102,49,49,49,49,49,-203,49,49,-175,49,49,-69,-77,49,49,-203,-203,-176,49,49,49,-70,-71,49,-73,-79,-78,49,-36,-203,-203,49,-203,-203,-177,-81,49,49,49,-72,-74,-75,-80,-37,-45,49,49,-203,49,49,-203,-82,-83,-76,49,49,-84,]),'DT_SINT32':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,91,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[50,50,50,50,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,50,50,-203,50,50,50,50,-24,-203,-203,50,-203,50,-46,50,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,50,50,50,50,50,50,-203,50,-203,-203,50,50,50,50,50,-174,50,50,-102,50,50,50,50,50,-203,50,50,-175,50,50,-69,-77,50,50,-203,-203,-176,50,50,50,-70,-71,50,-73,-79,-78,50,-36,-203,-203,50,-203,-203,-177,-81,50,50,50,-72,-74,-75,-80,-37,-45,50,50,-203,50,50,-203,-82,-83,-76,50,50,-84,]),'DT_UINT64':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,91,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[51,51,51,51,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,51,51,-203,51,51,51,51,-24,-203,-203,51,-203,51,-46,51,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,51,51,51,51,51,51,-203,51,-203,-203,51,51,51,51,51,-174,51,51,-102,51,51,51,51,51,-203,51,51,-175,51,51,-69,-77,51,51,-203,-203,-176,51,51,51,-70,-71,51,-73,-79,-78,51,-36,-203,-203,51,-203,-203,-177,-81,51,51,51,-72,-74,-75,-80,-37,-45,51,51,-203,51,51,-203,-82,-83,-76,51,51,-84,]),'DT_SINT64':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,91,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[52,52,52,52,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,52,52,-203,52,52,52,52,-24,-203,-203,52,-203,52,-46,52,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,52,52,52,52,52,52,-203,52,-203,-203,52,52,52,52,52,-174,52,52,-102,52,52,52,52,52,-203,52,52,-175,52,52,-69,-77,52,52,-203,-203,-176,52,52,52,-70,-71,52,-73,-79,-78,52,-36,-203,-203,52,-203,-203,-177,-81,52,52,52,-72,-74,-75,-80,-37,-45,52,52,-203,52,52,-203,-82,-83,-76,52,52,-84,]),'DT_REAL32':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,91,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[53,53,53,53,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,53,53,-203,53,53,53,53,-24,-203,-203,53,-203,53,-46,53,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,53,53,53,53,53,53,-203,53,-203,-203,53,53,53,53,53,-174,53,53,-102,53,53,53,53,53,-203,53,53,-175,53,53,-69,-77,53,53,-203,-203,-176,53,53,53,-70,-71,53,-73,-79,-78,53,-36,-203,-203,53,-203,-203,-177,-81,53,53,53,-72,-74,-75,-80,-37,-45,53,53,-203,53,53,-203,-82,-83,-76,53,53,-84,]),'DT_REAL64':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,91,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[54,54,54,54,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,54,54,-203,54,54,54,54,-24,-203,-203,54,-203,54,-46,54,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,54,54,54,54,54,54,-203,54,-203,-203,54,54,54,54,54,-174,54,54,-102,54,54,54,54,54,-203,54,54,-175,54,54,-69,-77,54,54,-203,-203,-176,54,54,54,-70,-71,54,-73,-79,-78,54,-36,-203,-203,54,-203,-203,-177,-81,54,54,54,-72,-74,-75,-80,-37,-45,54,54,-203,54,54,-203,-82,-83,-76,54,54,-84,]),'DT_CHAR16':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,91,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[55,55,55,55,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,55,55,-203,55,55,55,55,-24,-203,-203,55,-203,55,-46,55,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,55,55,55,55,55,55,-203,55,-203,-203,55,55,55,55,55,-174,55,55,-102,55,55,55,55,55,-203,55,55,-175,55,55,-69,-77,55,55,-203,-203,-176,55,55,55,-70,-71,55,-73,-79,-78,55,-36,-203,-203,55,-203,-203,-177,-81,55,55,55,-72,-74,-75,-80,-37,-45,55,55,-203,55,55,-203,-82,-83,-76,55,55,-84,]),'DT_STR':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,91,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[56,56,56,56,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,56,56,-203,56,56,56,56,-24,-203,-203,56,-203,56,-46,56,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,56,56,56,56,56,56,-203,56,-203,-203,56,56,56,56,56,-174,56,56,-102,56,56,56,56,56,-203,56,56,-175,56,56,-69,-77,56,56,-203,-203,-176,56,56,56,-70,-71,56,-73,-79,-78,56,-36,-203,-203,56,-203,-203,-177,-81,56,56,56,-72,-74,-75,-80,-37,-45,56,56,-203,56,56,-203,-82,-83,-76,56,56,-84,]),'DT_BOOL':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,91,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[57,57,57,57,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,57,57,-203,57,57,57,57,-24,-203,-203,57,-203,57,-46,57,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,57,57,57,57,57,57,-203,57,-203,-203,57,57,57,57,57,-174,57,57,-102,57,57,57,57,57,-203,57,57,-175,57,57,-69,-77,57,57,-203,-203,-176,57,57,57,-70,-71,57,-73,-79,-78,57,-36,-203,-203,57,-203,-203,-177,-81,57,57,57,-72,-74,-75,-80,-37,-45,57,57,-203,57,57,-203,-82,-83,-76,57,57,-84,]),'DT_DATETIME':([15,17,18,20,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,69,72,75,78,91,94,95,96,97,101,102,107,109,140,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,170,172,174,188,189,190,192,193,195,200,201,206,208,209,210,211,212,230,233,234,235,241,249,251,252,255,273,276,284,285,286,287,289,290,293,295,302,303,304,305,307,308,309,315,319,321,322,323,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[58,58,58,58,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,58,58,-203,58,58,58,58,-24,-203,-203,58,-203,58,-46,58,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,58,58,58,58,58,58,-203,58,-203,-203,58,58,58,58,58,-174,58,58,-102,58,58,58,58,58,-203,58,58,-175,58,58,-69,-77,58,58,-203,-203,-176,58,58,58,-70,-71,58,-73,-79,-78,58,-36,-203,-203,58,-203,-203,-177,-81,58,58,58,-72,-74,-75,-80,-37,-45,58,58,-203,58,58,-203,-82,-83,-76,58,58,-84,]),'ASSOCIATION':([17,18,107,161,218,313,],[61,67,67,67,263,263,]),'INDICATION':([17,18,107,161,218,313,],[62,68,68,68,264,264,]),'{':([21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,61,62,64,65,67,68,73,74,77,92,98,99,100,103,104,105,141,165,169,171,188,213,214,253,254,256,257,306,310,],[-184,72,-38,-181,-182,-183,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-146,-147,87,-145,-146,-147,96,97,102,140,164,-41,-39,167,168,170,193,-40,210,212,87,252,255,304,305,308,309,339,343,]),':':([21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,61,62,64,65,66,67,68,74,77,84,86,100,104,135,165,177,179,213,214,254,257,],[-184,75,-38,-181,-182,-183,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-146,-147,83,-145,91,-146,-147,75,75,118,-54,-39,75,-125,-40,-53,-124,75,75,75,75,]),'(':([21,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,61,62,64,65,67,68,70,71,184,197,199,217,238,],[-184,-181,-182,-183,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-146,-147,85,-145,-146,-147,93,-14,218,234,-87,258,289,]),']':([21,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,61,62,63,64,65,67,68,79,80,81,82,84,86,110,111,112,113,114,115,116,117,126,127,128,129,135,173,175,176,177,179,187,221,],[-184,-181,-182,-183,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-146,-147,-203,-47,-145,-146,-147,106,-34,108,109,-49,-54,-48,-51,-55,-56,-57,-58,-59,-60,-136,-137,-138,-139,-125,-35,-52,-50,-53,-124,220,271,]),',':([21,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,61,62,63,64,65,67,68,79,80,81,82,84,86,88,89,90,110,111,112,113,114,115,116,117,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,139,165,173,175,176,177,178,179,185,186,215,219,220,222,223,224,225,226,227,228,259,260,261,262,263,264,265,266,267,268,269,270,271,278,279,280,281,282,283,311,312,314,317,318,324,327,346,347,349,350,351,352,364,365,366,],[-184,-181,-182,-183,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-146,-147,-203,-47,-145,-146,-147,107,-34,107,107,-49,-54,138,-148,-149,-48,-51,-55,-56,-57,-58,-59,-60,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-128,-178,-179,-180,180,-125,-126,183,-152,-40,-35,-52,-50,-53,-129,-124,-150,-153,-127,-151,-118,-120,-121,-122,-123,-140,-141,-142,313,-155,-157,-158,-159,-160,-161,-162,-163,-164,-165,-166,-119,321,-103,-105,-106,-107,-108,344,-168,-154,-109,-117,-113,321,-156,-110,-104,-111,-115,-114,-169,-112,-116,]),'REF':([21,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,144,158,200,276,322,],[-184,-38,-181,-182,-183,-185,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,195,-186,-186,-186,-186,]),';':([21,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,120,121,122,123,124,125,126,127,128,129,130,131,132,133,135,137,145,165,178,179,182,198,199,202,203,204,205,207,220,222,223,224,225,226,227,228,229,231,236,237,239,240,242,245,247,248,250,271,274,275,277,288,291,292,294,299,301,314,320,326,330,334,340,345,354,357,358,361,362,370,373,],[-184,-181,-182,-183,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-128,-178,-179,-180,-125,181,196,-40,-129,-124,216,235,-85,241,-86,243,244,246,-118,-120,-121,-122,-123,-140,-141,-142,272,273,286,287,290,293,295,296,297,298,300,-119,315,316,319,325,328,329,331,332,333,-154,348,353,355,356,360,-167,367,368,369,371,372,374,375,]),'=':([21,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,139,185,191,198,199,202,203,220,232,237,239,240,271,292,],[-184,-181,-182,-183,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,188,188,188,188,-85,188,-86,-118,188,188,188,188,-119,188,]),')':([21,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,112,113,114,115,116,117,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,142,143,178,220,234,259,260,261,262,263,264,265,266,267,268,269,270,271,278,279,280,281,282,283,289,311,312,317,318,324,327,346,347,349,350,351,352,364,365,366,],[-184,-181,-182,-183,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-55,-56,-57,-58,-59,-60,177,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-128,-178,-179,-180,194,-15,-129,-118,277,314,-155,-157,-158,-159,-160,-161,-162,-163,-164,-165,-166,-119,320,-103,-105,-106,-107,-108,326,345,-168,-109,-117,-113,354,-156,-110,-104,-111,-115,-114,-169,-112,-116,]),'}':([72,87,94,95,96,97,102,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,136,146,147,148,149,150,151,152,153,154,155,156,157,162,163,164,166,167,168,178,189,190,206,208,209,210,211,215,230,233,235,241,249,251,252,255,273,286,287,290,293,295,302,303,304,305,307,308,309,315,319,325,328,329,331,335,336,337,338,339,341,342,343,348,353,355,359,363,367,],[-203,135,145,-24,-203,-203,-203,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-128,-178,-179,-180,179,-126,-25,-42,-43,-44,-61,-62,-63,-64,-65,-66,-67,-68,204,205,-203,207,-203,-203,-129,229,-174,245,247,248,-203,250,-127,-175,275,-69,-77,299,301,-203,-203,-176,-70,-71,-73,-79,-78,334,-36,-203,-203,340,-203,-203,-177,-81,-72,-74,-75,-80,-37,-45,357,358,-203,361,362,-203,-82,-83,-76,370,373,-84,]),'$':([76,188,],[101,101,]),'floatValue':([85,87,180,188,],[121,121,121,121,]),'charValue':([85,87,180,188,],[122,122,122,122,]),'binaryValue':([85,87,180,187,188,],[126,126,126,126,126,]),'octalValue':([85,87,180,187,188,],[127,127,127,127,127,]),'decimalValue':([85,87,180,187,188,],[128,128,128,128,128,]),'hexValue':([85,87,180,187,188,],[129,129,129,129,129,]),'stringValue':([85,87,93,123,130,178,180,188,],[130,130,143,178,-128,-129,130,130,]),'FALSE':([85,87,180,188,],[131,131,131,131,]),'TRUE':([85,87,180,188,],[132,132,132,132,]),'NULL':([85,87,180,188,],[133,133,133,133,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'mofSpecification':([0,],[1,]),'mofProductionList':([0,],[2,]),'empty':([0,61,62,63,72,96,97,102,164,167,168,210,252,255,304,305,308,309,339,343,],[3,80,80,80,95,95,95,95,95,95,95,95,303,95,303,303,95,95,303,95,]),'mofProduction':([2,],[4,]),'compilerDirective':([2,],[5,]),'mp_createClass':([2,],[6,]),'mp_setQualifier':([2,],[7,]),'mp_createInstance':([2,],[8,]),'classDeclaration':([2,],[10,]),'assocDeclaration':([2,],[11,]),'indicDeclaration':([2,],[12,]),'qualifierDeclaration':([2,],[13,]),'instanceDeclaration':([2,],[14,]),'qualifierList':([2,94,140,162,163,166,170,189,193,206,208,209,211,212,233,234,249,251,289,302,307,321,337,338,341,342,359,363,],[16,159,192,159,159,159,192,192,192,159,159,159,192,192,192,284,159,192,284,159,159,284,159,159,159,159,159,159,]),'className':([15,59,69,75,78,94,159,162,163,166,172,174,206,208,209,234,249,284,289,302,307,321,337,338,341,342,359,363,],[22,77,92,99,105,144,144,144,144,144,213,214,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,]),'identifier':([15,17,18,20,59,69,75,78,94,101,107,140,158,159,160,161,162,163,166,170,172,174,188,189,192,193,200,201,206,208,209,211,212,233,234,249,251,276,284,285,289,302,307,321,322,323,337,338,341,342,359,363,],[23,65,65,71,23,23,23,23,23,165,65,191,199,23,203,65,23,23,23,191,23,23,228,191,232,191,199,203,23,23,23,191,191,191,23,23,191,318,23,318,23,23,23,23,318,318,23,23,23,23,23,23,]),'dataType':([15,17,18,20,59,69,75,78,91,94,101,107,140,158,159,160,161,162,163,166,170,172,174,188,189,192,193,200,201,206,208,209,211,212,233,234,249,251,276,284,285,289,302,307,321,322,323,337,338,341,342,359,363,],[28,28,28,28,28,28,28,28,139,158,28,28,28,28,200,28,28,158,158,158,28,28,28,28,28,28,28,28,28,158,158,158,28,28,28,276,158,28,28,322,28,276,158,158,276,28,28,158,158,158,158,158,158,]),'qualifier':([17,107,161,],[63,173,63,]),'qualifierName':([17,18,107,161,],[64,66,64,64,]),'pragmaName':([20,],[70,]),'superClass':([22,74,77,104,213,214,254,257,],[73,98,103,169,253,256,306,310,]),'alias':([22,77,92,105,213,214,],[74,104,141,171,254,257,]),'qualifierListEmpty':([61,62,63,],[79,81,82,]),'qualifierParameter':([64,],[84,]),'arrayInitializer':([64,188,],[86,224,]),'qualifierType':([66,],[88,]),'qualifierType_1':([66,],[89,]),'qualifierType_2':([66,],[90,]),'classFeatureList':([72,96,97,102,164,167,168,210,255,308,309,343,],[94,162,163,166,206,208,209,249,307,341,342,363,]),'aliasIdentifier':([76,188,],[100,227,]),'flavorList':([83,118,],[110,176,]),'flavor':([83,110,118,176,258,344,],[111,175,111,175,312,364,]),'constantValue':([85,87,180,188,],[119,136,215,223,]),'integerValue':([85,87,180,187,188,],[120,120,120,221,120,]),'stringValueList':([85,87,180,188,],[123,123,123,123,]),'booleanValue':([85,87,180,188,],[124,124,124,124,]),'nullValue':([85,87,180,188,],[125,125,125,125,]),'constantValueList':([87,],[134,]),'scope':([88,],[137,]),'pragmaParameter':([93,],[142,]),'classFeature':([94,162,163,166,206,208,209,249,302,307,337,338,341,342,359,363,],[146,146,146,146,146,146,146,146,336,146,336,336,146,146,336,146,]),'propertyDeclaration':([94,162,163,166,206,208,209,249,302,307,337,338,341,342,359,363,],[147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,]),'methodDeclaration':([94,162,163,166,206,208,209,249,302,307,337,338,341,342,359,363,],[148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,]),'referenceDeclaration':([94,162,163,166,206,208,209,249,302,307,337,338,341,342,359,363,],[149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,149,]),'propertyDeclaration_1':([94,162,163,166,206,208,209,249,302,307,337,338,341,342,359,363,],[150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,150,]),'propertyDeclaration_2':([94,162,163,166,206,208,209,249,302,307,337,338,341,342,359,363,],[151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,151,]),'propertyDeclaration_3':([94,162,163,166,206,208,209,249,302,307,337,338,341,342,359,363,],[152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,152,]),'propertyDeclaration_4':([94,162,163,166,206,208,209,249,302,307,337,338,341,342,359,363,],[153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,153,]),'propertyDeclaration_5':([94,162,163,166,206,208,209,249,302,307,337,338,341,342,359,363,],[154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,]),'propertyDeclaration_6':([94,162,163,166,206,208,209,249,302,307,337,338,341,342,359,363,],[155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,155,]),'propertyDeclaration_7':([94,162,163,166,206,208,209,249,302,307,337,338,341,342,359,363,],[156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,156,]),'propertyDeclaration_8':([94,162,163,166,206,208,209,249,302,307,337,338,341,342,359,363,],[157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,]),'objectRef':([94,159,162,163,166,206,208,209,234,249,284,289,302,307,321,337,338,341,342,359,363,],[160,201,160,160,160,160,160,160,285,160,323,285,160,160,285,160,160,160,160,160,160,]),'defaultFlavor':([137,],[182,]),'array':([139,198,239,317,324,350,351,],[185,237,292,347,352,365,366,]),'defaultValue':([139,185,191,198,202,232,237,239,240,292,],[186,219,231,236,242,274,288,291,294,330,]),'valueInitializerList':([140,170,193,212,],[189,211,233,251,]),'valueInitializer':([140,170,189,193,211,212,233,251,],[190,190,230,190,230,190,230,230,]),'methodName':([158,200,],[197,238,]),'propertyName':([158,200,],[198,239,]),'referenceName':([160,201,],[202,240,]),'initializer':([188,],[222,]),'referenceInitializer':([188,],[225,]),'objectHandle':([188,],[226,]),'metaElementList':([218,],[259,]),'metaElement':([218,313,],[260,346,]),'parameterList':([234,289,],[278,327,]),'parameter':([234,289,321,],[279,279,349,]),'parameter_1':([234,289,321,],[280,280,280,]),'parameter_2':([234,289,321,],[281,281,281,]),'parameter_3':([234,289,321,],[282,282,282,]),'parameter_4':([234,289,321,],[283,283,283,]),'associationFeatureList':([252,304,305,339,],[302,337,338,359,]),'flavorListWithComma':([258,],[311,]),'parameterName':([276,285,322,323,],[317,324,350,351,]),'associationFeature':([302,337,338,359,],[335,335,335,335,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> mofSpecification","S'",1,None,None,None),
+  ('mofSpecification -> mofProductionList','mofSpecification',1,'p_mofSpecification','mof_compiler.py',465),
+  ('mofProductionList -> empty','mofProductionList',1,'p_mofProductionList','mof_compiler.py',470),
+  ('mofProductionList -> mofProductionList mofProduction','mofProductionList',2,'p_mofProductionList','mof_compiler.py',471),
+  ('mofProduction -> compilerDirective','mofProduction',1,'p_mofProduction','mof_compiler.py',477),
+  ('mofProduction -> mp_createClass','mofProduction',1,'p_mofProduction','mof_compiler.py',478),
+  ('mofProduction -> mp_setQualifier','mofProduction',1,'p_mofProduction','mof_compiler.py',479),
+  ('mofProduction -> mp_createInstance','mofProduction',1,'p_mofProduction','mof_compiler.py',480),
+  ('mp_createClass -> classDeclaration','mp_createClass',1,'p_mp_createClass','mof_compiler.py',546),
+  ('mp_createClass -> assocDeclaration','mp_createClass',1,'p_mp_createClass','mof_compiler.py',547),
+  ('mp_createClass -> indicDeclaration','mp_createClass',1,'p_mp_createClass','mof_compiler.py',548),
+  ('mp_createInstance -> instanceDeclaration','mp_createInstance',1,'p_mp_createInstance','mof_compiler.py',669),
+  ('mp_setQualifier -> qualifierDeclaration','mp_setQualifier',1,'p_mp_setQualifier','mof_compiler.py',699),
+  ('compilerDirective -> # PRAGMA pragmaName ( pragmaParameter )','compilerDirective',6,'p_compilerDirective','mof_compiler.py',729),
+  ('pragmaName -> identifier','pragmaName',1,'p_pragmaName','mof_compiler.py',747),
+  ('pragmaParameter -> stringValue','pragmaParameter',1,'p_pragmaParameter','mof_compiler.py',752),
+  ('classDeclaration -> CLASS className { classFeatureList } ;','classDeclaration',6,'p_classDeclaration','mof_compiler.py',757),
+  ('classDeclaration -> CLASS className superClass { classFeatureList } ;','classDeclaration',7,'p_classDeclaration','mof_compiler.py',758),
+  ('classDeclaration -> CLASS className alias { classFeatureList } ;','classDeclaration',7,'p_classDeclaration','mof_compiler.py',759),
+  ('classDeclaration -> CLASS className alias superClass { classFeatureList } ;','classDeclaration',8,'p_classDeclaration','mof_compiler.py',760),
+  ('classDeclaration -> qualifierList CLASS className { classFeatureList } ;','classDeclaration',7,'p_classDeclaration','mof_compiler.py',761),
+  ('classDeclaration -> qualifierList CLASS className superClass { classFeatureList } ;','classDeclaration',8,'p_classDeclaration','mof_compiler.py',762),
+  ('classDeclaration -> qualifierList CLASS className alias { classFeatureList } ;','classDeclaration',8,'p_classDeclaration','mof_compiler.py',763),
+  ('classDeclaration -> qualifierList CLASS className alias superClass { classFeatureList } ;','classDeclaration',9,'p_classDeclaration','mof_compiler.py',764),
+  ('classFeatureList -> empty','classFeatureList',1,'p_classFeatureList','mof_compiler.py',817),
+  ('classFeatureList -> classFeatureList classFeature','classFeatureList',2,'p_classFeatureList','mof_compiler.py',818),
+  ('assocDeclaration -> [ ASSOCIATION qualifierListEmpty ] CLASS className { associationFeatureList } ;','assocDeclaration',10,'p_assocDeclaration','mof_compiler.py',827),
+  ('assocDeclaration -> [ ASSOCIATION qualifierListEmpty ] CLASS className superClass { associationFeatureList } ;','assocDeclaration',11,'p_assocDeclaration','mof_compiler.py',828),
+  ('assocDeclaration -> [ ASSOCIATION qualifierListEmpty ] CLASS className alias { associationFeatureList } ;','assocDeclaration',11,'p_assocDeclaration','mof_compiler.py',829),
+  ('assocDeclaration -> [ ASSOCIATION qualifierListEmpty ] CLASS className alias superClass { associationFeatureList } ;','assocDeclaration',12,'p_assocDeclaration','mof_compiler.py',830),
+  ('indicDeclaration -> [ INDICATION qualifierListEmpty ] CLASS className { classFeatureList } ;','indicDeclaration',10,'p_indicDeclaration','mof_compiler.py',839),
+  ('indicDeclaration -> [ INDICATION qualifierListEmpty ] CLASS className superClass { classFeatureList } ;','indicDeclaration',11,'p_indicDeclaration','mof_compiler.py',840),
+  ('indicDeclaration -> [ INDICATION qualifierListEmpty ] CLASS className alias { classFeatureList } ;','indicDeclaration',11,'p_indicDeclaration','mof_compiler.py',841),
+  ('indicDeclaration -> [ INDICATION qualifierListEmpty ] CLASS className alias superClass { classFeatureList } ;','indicDeclaration',12,'p_indicDeclaration','mof_compiler.py',842),
+  ('qualifierListEmpty -> empty','qualifierListEmpty',1,'p_qualifierListEmpty','mof_compiler.py',884),
+  ('qualifierListEmpty -> qualifierListEmpty , qualifier','qualifierListEmpty',3,'p_qualifierListEmpty','mof_compiler.py',885),
+  ('associationFeatureList -> empty','associationFeatureList',1,'p_associationFeatureList','mof_compiler.py',894),
+  ('associationFeatureList -> associationFeatureList associationFeature','associationFeatureList',2,'p_associationFeatureList','mof_compiler.py',895),
+  ('className -> identifier','className',1,'p_className','mof_compiler.py',904),
+  ('alias -> AS aliasIdentifier','alias',2,'p_alias','mof_compiler.py',909),
+  ('aliasIdentifier -> $ identifier','aliasIdentifier',2,'p_aliasIdentifier','mof_compiler.py',914),
+  ('superClass -> : className','superClass',2,'p_superClass','mof_compiler.py',919),
+  ('classFeature -> propertyDeclaration','classFeature',1,'p_classFeature','mof_compiler.py',924),
+  ('classFeature -> methodDeclaration','classFeature',1,'p_classFeature','mof_compiler.py',925),
+  ('classFeature -> referenceDeclaration','classFeature',1,'p_classFeature','mof_compiler.py',926),
+  ('associationFeature -> classFeature','associationFeature',1,'p_associationFeature','mof_compiler.py',932),
+  ('qualifierList -> [ qualifier qualifierListEmpty ]','qualifierList',4,'p_qualifierList','mof_compiler.py',937),
+  ('qualifier -> qualifierName','qualifier',1,'p_qualifier','mof_compiler.py',942),
+  ('qualifier -> qualifierName : flavorList','qualifier',3,'p_qualifier','mof_compiler.py',943),
+  ('qualifier -> qualifierName qualifierParameter','qualifier',2,'p_qualifier','mof_compiler.py',944),
+  ('qualifier -> qualifierName qualifierParameter : flavorList','qualifier',4,'p_qualifier','mof_compiler.py',945),
+  ('flavorList -> flavor','flavorList',1,'p_flavorList','mof_compiler.py',1002),
+  ('flavorList -> flavorList flavor','flavorList',2,'p_flavorList','mof_compiler.py',1003),
+  ('qualifierParameter -> ( constantValue )','qualifierParameter',3,'p_qualifierParameter','mof_compiler.py',1012),
+  ('qualifierParameter -> arrayInitializer','qualifierParameter',1,'p_qualifierParameter','mof_compiler.py',1013),
+  ('flavor -> ENABLEOVERRIDE','flavor',1,'p_flavor','mof_compiler.py',1024),
+  ('flavor -> DISABLEOVERRIDE','flavor',1,'p_flavor','mof_compiler.py',1025),
+  ('flavor -> RESTRICTED','flavor',1,'p_flavor','mof_compiler.py',1026),
+  ('flavor -> TOSUBCLASS','flavor',1,'p_flavor','mof_compiler.py',1027),
+  ('flavor -> TOINSTANCE','flavor',1,'p_flavor','mof_compiler.py',1028),
+  ('flavor -> TRANSLATABLE','flavor',1,'p_flavor','mof_compiler.py',1029),
+  ('propertyDeclaration -> propertyDeclaration_1','propertyDeclaration',1,'p_propertyDeclaration','mof_compiler.py',1035),
+  ('propertyDeclaration -> propertyDeclaration_2','propertyDeclaration',1,'p_propertyDeclaration','mof_compiler.py',1036),
+  ('propertyDeclaration -> propertyDeclaration_3','propertyDeclaration',1,'p_propertyDeclaration','mof_compiler.py',1037),
+  ('propertyDeclaration -> propertyDeclaration_4','propertyDeclaration',1,'p_propertyDeclaration','mof_compiler.py',1038),
+  ('propertyDeclaration -> propertyDeclaration_5','propertyDeclaration',1,'p_propertyDeclaration','mof_compiler.py',1039),
+  ('propertyDeclaration -> propertyDeclaration_6','propertyDeclaration',1,'p_propertyDeclaration','mof_compiler.py',1040),
+  ('propertyDeclaration -> propertyDeclaration_7','propertyDeclaration',1,'p_propertyDeclaration','mof_compiler.py',1041),
+  ('propertyDeclaration -> propertyDeclaration_8','propertyDeclaration',1,'p_propertyDeclaration','mof_compiler.py',1042),
+  ('propertyDeclaration_1 -> dataType propertyName ;','propertyDeclaration_1',3,'p_propertyDeclaration_1','mof_compiler.py',1048),
+  ('propertyDeclaration_2 -> dataType propertyName defaultValue ;','propertyDeclaration_2',4,'p_propertyDeclaration_2','mof_compiler.py',1053),
+  ('propertyDeclaration_3 -> dataType propertyName array ;','propertyDeclaration_3',4,'p_propertyDeclaration_3','mof_compiler.py',1058),
+  ('propertyDeclaration_4 -> dataType propertyName array defaultValue ;','propertyDeclaration_4',5,'p_propertyDeclaration_4','mof_compiler.py',1064),
+  ('propertyDeclaration_5 -> qualifierList dataType propertyName ;','propertyDeclaration_5',4,'p_propertyDeclaration_5','mof_compiler.py',1070),
+  ('propertyDeclaration_6 -> qualifierList dataType propertyName defaultValue ;','propertyDeclaration_6',5,'p_propertyDeclaration_6','mof_compiler.py',1076),
+  ('propertyDeclaration_7 -> qualifierList dataType propertyName array ;','propertyDeclaration_7',5,'p_propertyDeclaration_7','mof_compiler.py',1084),
+  ('propertyDeclaration_8 -> qualifierList dataType propertyName array defaultValue ;','propertyDeclaration_8',6,'p_propertyDeclaration_8','mof_compiler.py',1091),
+  ('referenceDeclaration -> objectRef referenceName ;','referenceDeclaration',3,'p_referenceDeclaration','mof_compiler.py',1100),
+  ('referenceDeclaration -> objectRef referenceName defaultValue ;','referenceDeclaration',4,'p_referenceDeclaration','mof_compiler.py',1101),
+  ('referenceDeclaration -> qualifierList objectRef referenceName ;','referenceDeclaration',4,'p_referenceDeclaration','mof_compiler.py',1102),
+  ('referenceDeclaration -> qualifierList objectRef referenceName defaultValue ;','referenceDeclaration',5,'p_referenceDeclaration','mof_compiler.py',1103),
+  ('methodDeclaration -> dataType methodName ( ) ;','methodDeclaration',5,'p_methodDeclaration','mof_compiler.py',1125),
+  ('methodDeclaration -> dataType methodName ( parameterList ) ;','methodDeclaration',6,'p_methodDeclaration','mof_compiler.py',1126),
+  ('methodDeclaration -> qualifierList dataType methodName ( ) ;','methodDeclaration',6,'p_methodDeclaration','mof_compiler.py',1127),
+  ('methodDeclaration -> qualifierList dataType methodName ( parameterList ) ;','methodDeclaration',7,'p_methodDeclaration','mof_compiler.py',1128),
+  ('propertyName -> identifier','propertyName',1,'p_propertyName','mof_compiler.py',1156),
+  ('referenceName -> identifier','referenceName',1,'p_referenceName','mof_compiler.py',1161),
+  ('methodName -> identifier','methodName',1,'p_methodName','mof_compiler.py',1166),
+  ('dataType -> DT_UINT8','dataType',1,'p_dataType','mof_compiler.py',1171),
+  ('dataType -> DT_SINT8','dataType',1,'p_dataType','mof_compiler.py',1172),
+  ('dataType -> DT_UINT16','dataType',1,'p_dataType','mof_compiler.py',1173),
+  ('dataType -> DT_SINT16','dataType',1,'p_dataType','mof_compiler.py',1174),
+  ('dataType -> DT_UINT32','dataType',1,'p_dataType','mof_compiler.py',1175),
+  ('dataType -> DT_SINT32','dataType',1,'p_dataType','mof_compiler.py',1176),
+  ('dataType -> DT_UINT64','dataType',1,'p_dataType','mof_compiler.py',1177),
+  ('dataType -> DT_SINT64','dataType',1,'p_dataType','mof_compiler.py',1178),
+  ('dataType -> DT_REAL32','dataType',1,'p_dataType','mof_compiler.py',1179),
+  ('dataType -> DT_REAL64','dataType',1,'p_dataType','mof_compiler.py',1180),
+  ('dataType -> DT_CHAR16','dataType',1,'p_dataType','mof_compiler.py',1181),
+  ('dataType -> DT_STR','dataType',1,'p_dataType','mof_compiler.py',1182),
+  ('dataType -> DT_BOOL','dataType',1,'p_dataType','mof_compiler.py',1183),
+  ('dataType -> DT_DATETIME','dataType',1,'p_dataType','mof_compiler.py',1184),
+  ('objectRef -> className REF','objectRef',2,'p_objectRef','mof_compiler.py',1190),
+  ('parameterList -> parameter','parameterList',1,'p_parameterList','mof_compiler.py',1195),
+  ('parameterList -> parameterList , parameter','parameterList',3,'p_parameterList','mof_compiler.py',1196),
+  ('parameter -> parameter_1','parameter',1,'p_parameter','mof_compiler.py',1205),
+  ('parameter -> parameter_2','parameter',1,'p_parameter','mof_compiler.py',1206),
+  ('parameter -> parameter_3','parameter',1,'p_parameter','mof_compiler.py',1207),
+  ('parameter -> parameter_4','parameter',1,'p_parameter','mof_compiler.py',1208),
+  ('parameter_1 -> dataType parameterName','parameter_1',2,'p_parameter_1','mof_compiler.py',1214),
+  ('parameter_1 -> dataType parameterName array','parameter_1',3,'p_parameter_1','mof_compiler.py',1215),
+  ('parameter_2 -> qualifierList dataType parameterName','parameter_2',3,'p_parameter_2','mof_compiler.py',1225),
+  ('parameter_2 -> qualifierList dataType parameterName array','parameter_2',4,'p_parameter_2','mof_compiler.py',1226),
+  ('parameter_3 -> objectRef parameterName','parameter_3',2,'p_parameter_3','mof_compiler.py',1237),
+  ('parameter_3 -> objectRef parameterName array','parameter_3',3,'p_parameter_3','mof_compiler.py',1238),
+  ('parameter_4 -> qualifierList objectRef parameterName','parameter_4',3,'p_parameter_4','mof_compiler.py',1248),
+  ('parameter_4 -> qualifierList objectRef parameterName array','parameter_4',4,'p_parameter_4','mof_compiler.py',1249),
+  ('parameterName -> identifier','parameterName',1,'p_parameterName','mof_compiler.py',1261),
+  ('array -> [ ]','array',2,'p_array','mof_compiler.py',1266),
+  ('array -> [ integerValue ]','array',3,'p_array','mof_compiler.py',1267),
+  ('defaultValue -> = initializer','defaultValue',2,'p_defaultValue','mof_compiler.py',1276),
+  ('initializer -> constantValue','initializer',1,'p_initializer','mof_compiler.py',1281),
+  ('initializer -> arrayInitializer','initializer',1,'p_initializer','mof_compiler.py',1282),
+  ('initializer -> referenceInitializer','initializer',1,'p_initializer','mof_compiler.py',1283),
+  ('arrayInitializer -> { constantValueList }','arrayInitializer',3,'p_arrayInitializer','mof_compiler.py',1289),
+  ('arrayInitializer -> { }','arrayInitializer',2,'p_arrayInitializer','mof_compiler.py',1290),
+  ('constantValueList -> constantValue','constantValueList',1,'p_constantValueList','mof_compiler.py',1299),
+  ('constantValueList -> constantValueList , constantValue','constantValueList',3,'p_constantValueList','mof_compiler.py',1300),
+  ('stringValueList -> stringValue','stringValueList',1,'p_stringValueList','mof_compiler.py',1364),
+  ('stringValueList -> stringValueList stringValue','stringValueList',2,'p_stringValueList','mof_compiler.py',1365),
+  ('constantValue -> integerValue','constantValue',1,'p_constantValue','mof_compiler.py',1374),
+  ('constantValue -> floatValue','constantValue',1,'p_constantValue','mof_compiler.py',1375),
+  ('constantValue -> charValue','constantValue',1,'p_constantValue','mof_compiler.py',1376),
+  ('constantValue -> stringValueList','constantValue',1,'p_constantValue','mof_compiler.py',1377),
+  ('constantValue -> booleanValue','constantValue',1,'p_constantValue','mof_compiler.py',1378),
+  ('constantValue -> nullValue','constantValue',1,'p_constantValue','mof_compiler.py',1379),
+  ('integerValue -> binaryValue','integerValue',1,'p_integerValue','mof_compiler.py',1386),
+  ('integerValue -> octalValue','integerValue',1,'p_integerValue','mof_compiler.py',1387),
+  ('integerValue -> decimalValue','integerValue',1,'p_integerValue','mof_compiler.py',1388),
+  ('integerValue -> hexValue','integerValue',1,'p_integerValue','mof_compiler.py',1389),
+  ('referenceInitializer -> objectHandle','referenceInitializer',1,'p_referenceInitializer','mof_compiler.py',1396),
+  ('referenceInitializer -> aliasIdentifier','referenceInitializer',1,'p_referenceInitializer','mof_compiler.py',1397),
+  ('objectHandle -> identifier','objectHandle',1,'p_objectHandle','mof_compiler.py',1412),
+  ('qualifierDeclaration -> QUALIFIER qualifierName qualifierType scope ;','qualifierDeclaration',5,'p_qualifierDeclaration','mof_compiler.py',1417),
+  ('qualifierDeclaration -> QUALIFIER qualifierName qualifierType scope defaultFlavor ;','qualifierDeclaration',6,'p_qualifierDeclaration','mof_compiler.py',1418),
+  ('qualifierName -> identifier','qualifierName',1,'p_qualifierName','mof_compiler.py',1489),
+  ('qualifierName -> ASSOCIATION','qualifierName',1,'p_qualifierName','mof_compiler.py',1490),
+  ('qualifierName -> INDICATION','qualifierName',1,'p_qualifierName','mof_compiler.py',1491),
+  ('qualifierType -> qualifierType_1','qualifierType',1,'p_qualifierType','mof_compiler.py',1497),
+  ('qualifierType -> qualifierType_2','qualifierType',1,'p_qualifierType','mof_compiler.py',1498),
+  ('qualifierType_1 -> : dataType array','qualifierType_1',3,'p_qualifierType_1','mof_compiler.py',1504),
+  ('qualifierType_1 -> : dataType array defaultValue','qualifierType_1',4,'p_qualifierType_1','mof_compiler.py',1505),
+  ('qualifierType_2 -> : dataType','qualifierType_2',2,'p_qualifierType_2','mof_compiler.py',1514),
+  ('qualifierType_2 -> : dataType defaultValue','qualifierType_2',3,'p_qualifierType_2','mof_compiler.py',1515),
+  ('scope -> , SCOPE ( metaElementList )','scope',5,'p_scope','mof_compiler.py',1524),
+  ('metaElementList -> metaElement','metaElementList',1,'p_metaElementList','mof_compiler.py',1540),
+  ('metaElementList -> metaElementList , metaElement','metaElementList',3,'p_metaElementList','mof_compiler.py',1541),
+  ('metaElement -> SCHEMA','metaElement',1,'p_metaElement','mof_compiler.py',1550),
+  ('metaElement -> CLASS','metaElement',1,'p_metaElement','mof_compiler.py',1551),
+  ('metaElement -> ASSOCIATION','metaElement',1,'p_metaElement','mof_compiler.py',1552),
+  ('metaElement -> INDICATION','metaElement',1,'p_metaElement','mof_compiler.py',1553),
+  ('metaElement -> QUALIFIER','metaElement',1,'p_metaElement','mof_compiler.py',1554),
+  ('metaElement -> PROPERTY','metaElement',1,'p_metaElement','mof_compiler.py',1555),
+  ('metaElement -> REFERENCE','metaElement',1,'p_metaElement','mof_compiler.py',1556),
+  ('metaElement -> METHOD','metaElement',1,'p_metaElement','mof_compiler.py',1557),
+  ('metaElement -> PARAMETER','metaElement',1,'p_metaElement','mof_compiler.py',1558),
+  ('metaElement -> ANY','metaElement',1,'p_metaElement','mof_compiler.py',1559),
+  ('defaultFlavor -> , FLAVOR ( flavorListWithComma )','defaultFlavor',5,'p_defaultFlavor','mof_compiler.py',1565),
+  ('flavorListWithComma -> flavor','flavorListWithComma',1,'p_flavorListWithComma','mof_compiler.py',1582),
+  ('flavorListWithComma -> flavorListWithComma , flavor','flavorListWithComma',3,'p_flavorListWithComma','mof_compiler.py',1583),
+  ('instanceDeclaration -> INSTANCE OF className { valueInitializerList } ;','instanceDeclaration',7,'p_instanceDeclaration','mof_compiler.py',1592),
+  ('instanceDeclaration -> INSTANCE OF className alias { valueInitializerList } ;','instanceDeclaration',8,'p_instanceDeclaration','mof_compiler.py',1593),
+  ('instanceDeclaration -> qualifierList INSTANCE OF className { valueInitializerList } ;','instanceDeclaration',8,'p_instanceDeclaration','mof_compiler.py',1594),
+  ('instanceDeclaration -> qualifierList INSTANCE OF className alias { valueInitializerList } ;','instanceDeclaration',9,'p_instanceDeclaration','mof_compiler.py',1595),
+  ('valueInitializerList -> valueInitializer','valueInitializerList',1,'p_valueInitializerList','mof_compiler.py',1689),
+  ('valueInitializerList -> valueInitializerList valueInitializer','valueInitializerList',2,'p_valueInitializerList','mof_compiler.py',1690),
+  ('valueInitializer -> identifier defaultValue ;','valueInitializer',3,'p_valueInitializer','mof_compiler.py',1699),
+  ('valueInitializer -> qualifierList identifier defaultValue ;','valueInitializer',4,'p_valueInitializer','mof_compiler.py',1700),
+  ('booleanValue -> FALSE','booleanValue',1,'p_booleanValue','mof_compiler.py',1714),
+  ('booleanValue -> TRUE','booleanValue',1,'p_booleanValue','mof_compiler.py',1715),
+  ('nullValue -> NULL','nullValue',1,'p_nullValue','mof_compiler.py',1721),
+  ('identifier -> IDENTIFIER','identifier',1,'p_identifier','mof_compiler.py',1726),
+  ('identifier -> ANY','identifier',1,'p_identifier','mof_compiler.py',1727),
+  ('identifier -> AS','identifier',1,'p_identifier','mof_compiler.py',1728),
+  ('identifier -> CLASS','identifier',1,'p_identifier','mof_compiler.py',1729),
+  ('identifier -> DISABLEOVERRIDE','identifier',1,'p_identifier','mof_compiler.py',1730),
+  ('identifier -> dataType','identifier',1,'p_identifier','mof_compiler.py',1731),
+  ('identifier -> ENABLEOVERRIDE','identifier',1,'p_identifier','mof_compiler.py',1732),
+  ('identifier -> FLAVOR','identifier',1,'p_identifier','mof_compiler.py',1733),
+  ('identifier -> INSTANCE','identifier',1,'p_identifier','mof_compiler.py',1734),
+  ('identifier -> METHOD','identifier',1,'p_identifier','mof_compiler.py',1735),
+  ('identifier -> OF','identifier',1,'p_identifier','mof_compiler.py',1736),
+  ('identifier -> PARAMETER','identifier',1,'p_identifier','mof_compiler.py',1737),
+  ('identifier -> PRAGMA','identifier',1,'p_identifier','mof_compiler.py',1738),
+  ('identifier -> PROPERTY','identifier',1,'p_identifier','mof_compiler.py',1739),
+  ('identifier -> QUALIFIER','identifier',1,'p_identifier','mof_compiler.py',1740),
+  ('identifier -> REFERENCE','identifier',1,'p_identifier','mof_compiler.py',1741),
+  ('identifier -> RESTRICTED','identifier',1,'p_identifier','mof_compiler.py',1742),
+  ('identifier -> SCHEMA','identifier',1,'p_identifier','mof_compiler.py',1743),
+  ('identifier -> SCOPE','identifier',1,'p_identifier','mof_compiler.py',1744),
+  ('identifier -> TOSUBCLASS','identifier',1,'p_identifier','mof_compiler.py',1745),
+  ('identifier -> TOINSTANCE','identifier',1,'p_identifier','mof_compiler.py',1746),
+  ('identifier -> TRANSLATABLE','identifier',1,'p_identifier','mof_compiler.py',1747),
+  ('empty -> <empty>','empty',0,'p_empty','mof_compiler.py',1753),
+]
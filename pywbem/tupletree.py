@@ -191,6 +191,122 @@ def xml_to_tupletree_sax(xml_string, meaning):
     return handler.root
 
 
+class CIMStreamContentHandler(CIMContentHandler):
+    """SAX handler for CIM XML that is received in pieces.
+
+    The handler builds the same tree of tuples as :class:`CIMContentHandler`,
+    except that elements with one of the specified names that are direct
+    children of an element with one of the specified parent names are
+    detached from the tree as soon as their end tag has been processed, and
+    are appended to the `completed` list.
+
+    This allows the caller to process these elements while the remainder
+    of the XML document is still arriving, and keeps the memory used for the
+    tree bounded by the size of the largest detached element.
+    """
+
+    def __init__(self, element_names, parent_names):
+        CIMContentHandler.__init__(self)
+        self.element_names = element_names
+        self.parent_names = parent_names
+        self.completed = []
+
+    def endElement(self, name):
+        if name in self.element_names and self.elements and \
+                self.elements[-1][0] in self.parent_names:
+            parent_kids = self.elements[-1][2]
+            if not parent_kids or parent_kids[-1] is not self.element:
+                raise ParseError(
+                    "Element %s is not the last child of its parent element "
+                    "%s at its end tag" % (name, self.elements[-1][0]))
+            self.completed.append(parent_kids.pop())
+        CIMContentHandler.endElement(self, name)
+
+
+class CIMStreamParser(object):
+    """
+    Incremental SAX parser for CIM-XML that is fed in pieces.
+
+    Each call to :meth:`feed` returns the tupletrees of the elements that
+    have been completed by the XML data fed so far (see
+    :class:`CIMStreamContentHandler`). :meth:`close` finishes the parsing and
+    returns the root of the remaining tupletree, i.e. without the elements
+    that have already been returned by :meth:`feed`.
+    """
+
+    def __init__(self, element_names, parent_names, meaning):
+        """
+        Parameters:
+
+          element_names (:term:`py:iterable` of :term:`string`):
+            Names of the XML elements to be returned by :meth:`feed`.
+
+          parent_names (:term:`py:iterable` of :term:`string`):
+            Names of the XML elements that are the parent of the elements to
+            be returned by :meth:`feed`.
+
+          meaning (:term:`string`):
+            Short text with meaning of the XML string, for messages in
+            exceptions.
+        """
+        self.meaning = meaning
+        self.handler = CIMStreamContentHandler(set(element_names),
+                                               set(parent_names))
+        self.parser = xml.sax.make_parser()
+        self.parser.setContentHandler(self.handler)
+
+    def _handle(self, func, *args):
+        """Call a parser method and convert SAX errors to ParseError."""
+        try:
+            func(*args)
+        except (xml.sax.SAXParseException, UnicodeEncodeError) as exc:
+            # Unlike xml_to_tupletree_sax(), the complete XML string is not
+            # available for improving the exception info.
+            org_tb = sys.exc_info()[2]
+            pe = ParseError("SAXParseException raised when parsing %s: %s" %
+                            (self.meaning, exc))
+            six.reraise(type(pe), pe, org_tb)  # ignore this call in traceback!
+
+    def feed(self, data):
+        """
+        Feed the next piece of the XML document to the parser.
+
+        Parameters:
+
+          data (:term:`byte string`): The next piece of the UTF-8 encoded XML
+            document. It does not need to end at an element or character
+            boundary.
+
+        Returns:
+
+          list of tupletree tuples for the elements that have been completed.
+
+        Raises:
+
+          pywbem.ParseError: Error detected by SAX parser.
+        """
+        self._handle(self.parser.feed, data)
+        completed = self.handler.completed
+        self.handler.completed = []
+        return completed
+
+    def close(self):
+        """
+        Finish parsing the XML document.
+
+        Returns:
+
+          tupletree tuple with the remaining parsed XML tree.
+
+        Raises:
+
+          pywbem.ParseError: Error detected by SAX parser (e.g. because the
+            XML document was incomplete).
+        """
+        self._handle(self.parser.close)
+        return self.handler.root
+
+
 # Patterns for check_invalid_utf8_sequences()
 _ILL_FORMED_UTF8_RE = re.compile(
     b'(\xED[\xA0-\xBF][\x80-\xBF])')    # U+D800...U+DFFF
@@ -25,3 +25,4 @@ from __future__ import absolute_import
 
 from ._wbemconnection_mock import *       # noqa: F403,F401
 from ._dmtf_cim_schema import *           # noqa: F403,F401
+from ._mockwbemserver import *            # noqa: F403,F401
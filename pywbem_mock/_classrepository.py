@@ -0,0 +1,183 @@
+#
+# (C) Copyright 2018 InovaDevelopment.com
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+Store for the CIM classes of one CIM namespace in the mock repository of
+:class:`~pywbem_mock.FakedWBEMConnection`, with a cached class hierarchy.
+"""
+
+from __future__ import absolute_import, print_function
+
+import six
+
+from pywbem._nocasedict import NocaseDict
+
+
+class ClassRepository(NocaseDict):
+    """
+    The CIM classes of one CIM namespace in the mock repository, as a
+    :class:`~pywbem.NocaseDict` with the class names as keys and the
+    :class:`~pywbem.CIMClass` objects as values.
+
+    In addition to the dictionary behavior, it caches the class hierarchy:
+    A map from each class to its direct subclasses is built on first use,
+    and the transitive subclasses and the superclass chain of a class are
+    computed on first use for that class. The caches are invalidated when
+    classes are added, replaced or removed.
+
+    The `superclass` attribute of the classes in the repository must not be
+    modified while they are in the repository, so that the caches remain
+    valid.
+    """
+
+    # _subclasses: Lower-cased superclass name (or None) to list of the names
+    #   of its direct subclasses, or None if not yet built.
+    # _deep_subclasses: Lower-cased class name (or None) to list of the names
+    #   of all its subclasses.
+    # _superclasses: Lower-cased class name to list of the names of its
+    #   superclasses, top first.
+    __slots__ = ('_subclasses', '_deep_subclasses', '_superclasses')
+
+    def __init__(self, *args, **kwargs):
+        self._invalidate()
+        super(ClassRepository, self).__init__(*args, **kwargs)
+
+    def __getstate__(self):
+        """
+        Return the state of the object for pickling. The caches are not
+        included.
+        """
+        return super(ClassRepository, self).__getstate__()
+
+    def __setstate__(self, state):
+        """
+        Set the state of the object when unpickling.
+        """
+        super(ClassRepository, self).__setstate__(state)
+        self._invalidate()
+
+    def __setitem__(self, key, value):
+        super(ClassRepository, self).__setitem__(key, value)
+        if self._subclasses is not None:
+            self._invalidate()
+
+    def __delitem__(self, key):
+        super(ClassRepository, self).__delitem__(key)
+        if self._subclasses is not None:
+            self._invalidate()
+
+    def clear(self):
+        super(ClassRepository, self).clear()
+        self._invalidate()
+
+    def _invalidate(self):
+        """Invalidate the cached class hierarchy."""
+        self._subclasses = None
+        self._deep_subclasses = None
+        self._superclasses = None
+
+    def _get_subclasses(self):
+        """
+        Return the map of direct subclasses, building it and resetting the
+        caches that depend on it if needed.
+        """
+        subclasses = self._subclasses
+        if subclasses is None:
+            subclasses = {}
+            for cl in six.itervalues(self._data):
+                superclass = cl.superclass
+                if superclass is not None:
+                    superclass = superclass.lower()
+                try:
+                    subclasses[superclass].append(cl.classname)
+                except KeyError:
+                    subclasses[superclass] = [cl.classname]
+            self._subclasses = subclasses
+            self._deep_subclasses = {}
+            self._superclasses = {}
+        return subclasses
+
+    def subclass_names(self, classname, deep_inheritance):
+        """
+        Return the names of the subclasses of a class.
+
+        Parameters:
+
+          classname (:term:`string`):
+            Name of the class, case-insensitively. `None` means the top of
+            the class hierarchy, i.e. the result are the names of the
+            classes without superclass and, if `deep_inheritance` is `True`,
+            their subclasses. The class does not need to exist in the
+            repository.
+
+          deep_inheritance (:class:`py:bool`):
+            If `True`, return the direct and indirect subclasses. Otherwise,
+            return only the direct subclasses.
+
+        Returns:
+
+          list of :term:`string`: The class names, as a new list that the
+          caller may modify. With `deep_inheritance`, the direct subclasses
+          come first, followed by the subclasses of each of them in turn.
+        """
+        subclasses = self._get_subclasses()
+        key = classname.lower() if classname is not None else None
+        if deep_inheritance:
+            return list(self._deep_subclass_names(key))
+        return list(subclasses.get(key, ()))
+
+    def _deep_subclass_names(self, key):
+        """
+        Return the cached list of the direct and indirect subclasses of the
+        class with the lower-cased name `key`.
+        """
+        try:
+            return self._deep_subclasses[key]
+        except KeyError:
+            pass
+        direct = self._subclasses.get(key, ())
+        result = list(direct)
+        for cn in direct:
+            result.extend(self._deep_subclass_names(cn.lower()))
+        self._deep_subclasses[key] = result
+        return result
+
+    def superclass_names(self, classname):
+        """
+        Return the names of the superclasses of a class, in order of
+        descending class hierarchy (i.e. the top class first).
+
+        Raises:
+
+          KeyError: The class or one of its superclasses does not exist in
+            the repository.
+        """
+        self._get_subclasses()
+        key = classname.lower()
+        try:
+            return list(self._superclasses[key])
+        except KeyError:
+            pass
+        superclass = self[classname].superclass
+        if superclass:
+            result = self.superclass_names(superclass)
+            result.append(superclass)
+        else:
+            result = []
+        self._superclasses[key] = result
+        return list(result)
@@ -0,0 +1,265 @@
+#
+# (C) Copyright 2018 InovaDevelopment.com
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+Indexed store for the CIM instances of one CIM namespace in the mock
+repository of :class:`~pywbem_mock.FakedWBEMConnection`.
+"""
+
+from __future__ import absolute_import, print_function
+
+import sys
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ordereddict import OrderedDict
+
+import six
+
+# The dict type used for the indexes. From Python 3.7 on, the standard dict
+# preserves insertion order and is faster than OrderedDict.
+if sys.version_info[0:2] >= (3, 7):
+    _OrderedDictType = dict  # pylint: disable=invalid-name
+else:
+    _OrderedDictType = OrderedDict  # pylint: disable=invalid-name
+
+
+class InstanceRepository(object):
+    """
+    The CIM instances of one CIM namespace in the mock repository, indexed
+    by their instance paths and by their class names, with a reverse index
+    of the values of their reference properties.
+
+    The instance paths are used as dictionary keys, so lookups compare them
+    like `==` of :class:`~pywbem.CIMInstanceName` does (i.e. case-insensitively
+    for names, including host and namespace). The instances are kept in the
+    order in which they were added.
+
+    Iterating over an object of this class, and `len()`, work as they did for
+    the list of instances that was used before, so that code that only reads
+    the instances does not depend on the data structure.
+
+    The instance paths of the instances in the repository must not be
+    modified while they are in the repository, and their properties must be
+    modified only with :meth:`update_properties`, so that the reference index
+    remains valid.
+    """
+
+    def __init__(self, instances=None):
+        """
+        Parameters:
+
+          instances (iterable of :class:`~pywbem.CIMInstance`):
+            Initial instances. The instances are stored without being copied.
+        """
+        # Instances by instance path
+        self._instances = _OrderedDictType()
+        # Instances by lower-cased class name, and within that by path
+        self._by_class = {}
+        # Referencing instances by referenced instance path (i.e. reference
+        # property value), and within that by tuple(referencing instance
+        # path, lower-cased reference property name). The values are
+        # tuple(referencing instance, reference property name).
+        self._refs = {}
+        if instances:
+            for inst in instances:
+                self.add(inst)
+
+    def __getstate__(self):
+        """
+        Return the state of the object for pickling. Only the instances are
+        included; the indexes are rebuilt when unpickling.
+        """
+        return {'instances': list(self._instances.values())}
+
+    def __setstate__(self, state):
+        """
+        Set the state of the object when unpickling.
+        """
+        self.__init__(state['instances'])
+
+    def __repr__(self):
+        return '%s(%d instances in %d classes)' % \
+            (self.__class__.__name__, len(self._instances),
+             len(self._by_class))
+
+    def __len__(self):
+        return len(self._instances)
+
+    def __iter__(self):
+        return six.itervalues(self._instances)
+
+    def __contains__(self, path):
+        return path in self._instances
+
+    def get(self, path, default=None):
+        """
+        Return the instance with the instance path `path`, or `default` if
+        the repository does not have such an instance.
+        """
+        return self._instances.get(path, default)
+
+    def add(self, instance):
+        """
+        Add an instance to the repository, replacing an instance with the
+        same instance path if one exists.
+
+        The instance is stored without being copied, and its `path` attribute
+        must be set.
+        """
+        path = instance.path
+        old_instance = self._instances.get(path, None)
+        if old_instance is not None:
+            self._remove_refs(old_instance)
+        self._instances[path] = instance
+        classname = path.classname.lower()
+        try:
+            self._by_class[classname][path] = instance
+        except KeyError:
+            class_insts = _OrderedDictType()
+            class_insts[path] = instance
+            self._by_class[classname] = class_insts
+        self._add_refs(instance)
+
+    def remove(self, path):
+        """
+        Remove the instance with the instance path `path` from the
+        repository and return it.
+
+        Raises:
+
+          KeyError: The repository does not have an instance with this path.
+        """
+        instance = self._instances.pop(path)
+        classname = instance.path.classname.lower()
+        class_insts = self._by_class[classname]
+        del class_insts[path]
+        if not class_insts:
+            del self._by_class[classname]
+        self._remove_refs(instance)
+        return instance
+
+    def update_properties(self, path, properties):
+        """
+        Update the properties of the instance with the instance path `path`
+        from the `properties` dictionary (see
+        :meth:`~pywbem.CIMInstance.update`), and update the reference index
+        accordingly.
+
+        Raises:
+
+          KeyError: The repository does not have an instance with this path.
+        """
+        instance = self._instances[path]
+        self._remove_refs(instance)
+        instance.update(properties)
+        self._add_refs(instance)
+
+    def clear(self):
+        """
+        Remove all instances from the repository.
+        """
+        self._instances.clear()
+        self._by_class.clear()
+        self._refs.clear()
+
+    def iter_classes(self, classnames):
+        """
+        Iterate through the instances of the specified classes.
+
+        Parameters:
+
+          classnames (iterable of :term:`string`):
+            Names of the creation classes of the instances, case-insensitively.
+            Subclasses are not included unless they are specified.
+
+        Returns:
+
+          iterator of :class:`~pywbem.CIMInstance`: The instances, grouped by
+          class in the order of `classnames` (with duplicate class names
+          ignored), and in the order they were added within each class.
+        """
+        seen = set()
+        for classname in classnames:
+            classname = classname.lower()
+            if classname in seen:
+                continue
+            seen.add(classname)
+            class_insts = self._by_class.get(classname, None)
+            if class_insts:
+                for inst in six.itervalues(class_insts):
+                    yield inst
+
+    def classnames(self):
+        """
+        Return the lower-cased names of the classes that have instances in
+        the repository, as a list.
+        """
+        return list(self._by_class)
+
+    def iter_references(self, path):
+        """
+        Iterate through the instances that reference the instance with the
+        instance path `path` in one of their reference properties.
+
+        The reference property values are compared with `path` like `==` of
+        :class:`~pywbem.CIMInstanceName` does, so they need to have the same
+        namespace as `path`.
+
+        Returns:
+
+          iterator of tuple(:class:`~pywbem.CIMInstance`, :term:`string`):
+          The referencing instance and the name of its reference property,
+          in the order in which the referencing instances were added. An
+          instance that references `path` in multiple properties is returned
+          once per property.
+        """
+        refs = self._refs.get(path, None)
+        if refs:
+            for item in list(six.itervalues(refs)):
+                yield item
+
+    @staticmethod
+    def _ref_props(instance):
+        """
+        Iterate through the names and values of the reference properties of
+        an instance that have a value.
+        """
+        for prop in six.itervalues(instance.properties):
+            if prop.type == 'reference' and prop.value is not None:
+                yield prop.name, prop.value
+
+    def _add_refs(self, instance):
+        """Add the reference properties of an instance to the index."""
+        for name, value in self._ref_props(instance):
+            try:
+                refs = self._refs[value]
+            except KeyError:
+                refs = _OrderedDictType()
+                self._refs[value] = refs
+            refs[(instance.path, name.lower())] = (instance, name)
+
+    def _remove_refs(self, instance):
+        """Remove the reference properties of an instance from the index."""
+        for name, value in self._ref_props(instance):
+            refs = self._refs.get(value, None)
+            if refs is None:
+                continue
+            refs.pop((instance.path, name.lower()), None)
+            if not refs:
+                del self._refs[value]
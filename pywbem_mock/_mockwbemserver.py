@@ -0,0 +1,773 @@
+#
+# (C) Copyright 2018 InovaDevelopment.com
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+The :class:`~pywbem_mock.MockWBEMServer` class is an HTTP server that serves
+the mock repository of a :class:`~pywbem_mock.FakedWBEMConnection` object to
+WBEM clients, using the CIM-XML protocol.
+
+While :class:`~pywbem_mock.FakedWBEMConnection` processes the operations
+in-process, without creating or parsing CIM-XML, a WBEM client that connects
+to a :class:`~pywbem_mock.MockWBEMServer` object (e.g. a
+:class:`~pywbem.WBEMConnection` object) goes through the complete CIM-XML and
+HTTP processing, as with a real WBEM server. This allows testing and
+benchmarking the full client stack (HTTP, connection pooling, compression,
+CIM-XML creation and parsing) locally, without a real WBEM server.
+
+Example:
+
+.. code-block:: python
+
+    import pywbem
+    from pywbem_mock import FakedWBEMConnection, MockWBEMServer
+
+    conn = FakedWBEMConnection()
+    conn.compile_mof_file('my_model.mof')
+
+    with MockWBEMServer(conn) as server:
+        server.start()
+        client = pywbem.WBEMConnection(server.url)
+        insts = client.EnumerateInstances('CIM_Foo')
+
+The requests of all clients are processed by the same
+:class:`~pywbem_mock.FakedWBEMConnection` object. The requests are received,
+parsed and responded to in separate threads, but the operations on the mock
+repository are serialized.
+"""
+
+from __future__ import absolute_import, print_function
+
+import sys
+import errno
+import re
+import time
+import logging
+import threading
+import six
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+from six.moves import http_client
+
+from pywbem import cim_xml, config, CIMError, CIMClassName, \
+    CIMInstance, CIMInstanceName, CIMParameter, CIMQualifierDeclaration, \
+    CIMType, Uint32, \
+    CIM_ERR_FAILED, CIM_ERR_NOT_SUPPORTED
+from pywbem.cim_obj import cimvalue
+from pywbem.cim_types import atomic_to_cim_xml
+from pywbem.cim_http import decode_content, gzip_content
+from pywbem.tupleparse import parse_cim
+from pywbem.tupletree import xml_to_tupletree_sax
+from pywbem.exceptions import ParseError
+from pywbem._version import __version__
+
+__all__ = ['MockWBEMServer']
+
+# CIM-XML protocol related versions returned in the responses
+IMPLEMENTED_CIM_VERSION = '2.0'
+IMPLEMENTED_DTD_VERSION = '2.4'
+IMPLEMENTED_PROTOCOL_VERSION = '1.4'
+
+# Names of all parameters of the intrinsic operations. Parameters that are
+# not specified in a request are passed as `None` to the
+# FakedWBEMConnection._fake_*() methods, like the client does for
+# FakedWBEMConnection.
+IPARAM_NAMES = (
+    'AssocClass', 'ClassName', 'ContinueOnError', 'DeepInheritance',
+    'EnumerationContext', 'FilterQuery', 'FilterQueryLanguage',
+    'IncludeClassOrigin', 'IncludeQualifiers', 'InstanceName', 'LocalOnly',
+    'MaxObjectCount', 'ModifiedClass', 'ModifiedInstance', 'NewClass',
+    'NewInstance', 'ObjectName', 'OperationTimeout', 'PropertyList',
+    'Query', 'QueryLanguage', 'QualifierDeclaration', 'QualifierName',
+    'ResultClass', 'ResultRole', 'ReturnQueryResultClass', 'Role')
+
+# Parameters of the intrinsic operations whose VALUE is converted to a CIM
+# data type. The tuple parser already converts some of the boolean
+# parameters.
+BOOLEAN_IPARAMS = ('ContinueOnError', 'DeepInheritance', 'IncludeClassOrigin',
+                   'IncludeQualifiers', 'LocalOnly', 'ReturnQueryResultClass')
+UINT32_IPARAMS = ('MaxObjectCount', 'OperationTimeout')
+
+# Intrinsic operations whose instances are returned as VALUE.NAMEDINSTANCE
+# elements, and as VALUE.INSTANCEWITHPATH elements, respectively. The
+# instances of other operations are returned as INSTANCE elements.
+NAMEDINSTANCE_METHODS = ('EnumerateInstances',)
+INSTANCEWITHPATH_METHODS = ('OpenEnumerateInstances', 'OpenReferenceInstances',
+                            'OpenAssociatorInstances', 'PullInstancesWithPath')
+
+# Intrinsic operations whose instance paths are returned as INSTANCEPATH
+# elements. The instance paths of other operations are returned as
+# INSTANCENAME elements.
+INSTANCEPATH_METHODS = ('OpenEnumerateInstancePaths',
+                        'OpenReferenceInstancePaths',
+                        'OpenAssociatorInstancePaths', 'PullInstancePaths')
+
+# Scopes of qualifier declarations in CIM-XML, which replace the ANY scope
+QUALIFIER_SCOPES = ('CLASS', 'ASSOCIATION', 'REFERENCE', 'PROPERTY', 'METHOD',
+                    'PARAMETER', 'INDICATION')
+
+# Pattern for findall() for the tokens in the Accept-Encoding header
+TOKEN_QUALITY_FINDALL_PATTERN = re.compile(
+    r'([^;, ]+)'
+    r'(?:; *q=([01](?:\.[0-9]*)?))?'
+    r'(?:, *)?')
+
+
+class ThreadedHTTPServer(socketserver.ThreadingMixIn,
+                         BaseHTTPServer.HTTPServer):
+    """Defines an HTTPServer class for the mock WBEM server"""
+    daemon_threads = True
+
+
+class MockRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """
+    A request handler for the standard Python HTTP server, with a handler
+    method for the HTTP POST method, that processes CIM-XML operation
+    requests using the mock repository of the mock WBEM server.
+    """
+
+    # Support persistent connections, as WBEM servers do
+    protocol_version = 'HTTP/1.1'
+
+    # pylint: disable=invalid-name
+    def do_POST(self):
+        """
+        This method will be called for each POST request to the mock WBEM
+        server.
+
+        It parses the CIM-XML operation request, performs the operation
+        on the mock repository and sends back the CIM-XML operation response.
+        """
+        server = self.server.mock_server
+
+        content_len = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(content_len)
+        content_encoding = self.headers.get('Content-Encoding', 'identity')
+
+        try:
+            body = decode_content(body, content_encoding)
+            tup_tree = self.parse_operation_request(body)
+        except ParseError as exc:
+            self.send_http_error(400, "request-not-well-formed", str(exc))
+            return
+
+        if tup_tree[0] == 'IMETHODCALL':
+            methodname = tup_tree[1]['NAME']
+            data = server.imethodcall(methodname, tup_tree[2], tup_tree[3])
+            resp_xml = cim_xml.IMETHODRESPONSE(methodname)
+            resp_xml.appendChildren(data)
+            resp_xml = cim_xml.SIMPLERSP(resp_xml)
+        else:
+            methodname = tup_tree[1]['NAME']
+            data = server.methodcall(methodname, tup_tree[2], tup_tree[3])
+            resp_xml = cim_xml.SIMPLERSP(
+                cim_xml.METHODRESPONSE(methodname, data))
+
+        resp_xml = cim_xml.CIM(
+            cim_xml.MESSAGE(resp_xml, self.msgid,
+                            IMPLEMENTED_PROTOCOL_VERSION),
+            IMPLEMENTED_CIM_VERSION, IMPLEMENTED_DTD_VERSION)
+        resp_body = '<?xml version="1.0" encoding="utf-8" ?>\n' + \
+                    resp_xml.toxml()
+        if isinstance(resp_body, six.text_type):
+            resp_body = resp_body.encode("utf-8")
+
+        server.delay_response(len(resp_body))
+
+        headers = []
+        if self.gzip_acceptable():
+            resp_body = gzip_content(resp_body)
+            headers.append(("Content-Encoding", "gzip"))
+
+        http_code = 200
+        self.send_response(http_code, http_client.responses.get(http_code, ''))
+        self.send_header("Content-Type", 'application/xml; charset="utf-8"')
+        self.send_header("Content-Length", str(len(resp_body)))
+        self.send_header("CIMOperation", "MethodResponse")
+        for header, value in headers:
+            self.send_header(header, value)
+        self.end_headers()
+        self.wfile.write(resp_body)
+
+    def parse_operation_request(self, request_str):
+        """
+        Parse a CIM-XML operation request message, set the message ID
+        in the `msgid` attribute, and return the parsed IMETHODCALL or
+        METHODCALL element.
+        """
+
+        # Parse the XML into a tuple tree (may raise ParseError):
+
+        tt_ = xml_to_tupletree_sax(request_str, "CIM-XML operation request")
+        tup_tree = parse_cim(tt_)
+
+        # Check the tuple tree
+
+        if tup_tree[0] != 'CIM':
+            raise ParseError('Expecting CIM element, got %s' %
+                             tup_tree[0])
+        tup_tree = tup_tree[2]
+
+        if tup_tree[0] != 'MESSAGE':
+            raise ParseError('Expecting MESSAGE element, got %s' %
+                             tup_tree[0])
+        self.msgid = tup_tree[1]['ID']
+        tup_tree = tup_tree[2]
+
+        if tup_tree[0] != 'SIMPLEREQ':
+            raise ParseError('Expecting SIMPLEREQ element, got %s' %
+                             tup_tree[0])
+        return tup_tree[2]
+
+    def gzip_acceptable(self):
+        """
+        Return a boolean indicating whether the client accepts the response
+        to be compressed with gzip.
+        """
+        accept_encoding = self.headers.get('Accept-Encoding', 'identity')
+        tq_list = re.findall(TOKEN_QUALITY_FINDALL_PATTERN, accept_encoding)
+        for token, quality in tq_list:
+            if token.lower() in ('gzip', 'x-gzip'):
+                return quality == '' or float(quality) > 0
+        return False
+
+    def send_http_error(self, http_code, cim_error=None,
+                        cim_error_details=None):
+        """
+        Send an HTTP response back to the WBEM client that indicates
+        an error at the HTTP level.
+        """
+        self.send_response(http_code, http_client.responses.get(http_code, ''))
+        self.send_header("CIMOperation", "MethodResponse")
+        if cim_error is not None:
+            self.send_header("CIMError", cim_error)
+        if cim_error_details is not None:
+            self.send_header("CIMErrorDetails", cim_error_details)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        self.log('%s: HTTP status %s; CIMError: %s, '
+                 'CIMErrorDetails: %s',
+                 (self._get_log_prefix(), http_code, cim_error,
+                  cim_error_details),
+                 logging.WARNING)
+
+    def log(self, format_, args, level=logging.INFO):
+        """
+        This function is called for anything that needs to get logged.
+        It logs to the logger of this mock WBEM server.
+        """
+        self.server.mock_server.logger.log(level, format_, *args)
+
+    # pylint: disable=redefined-builtin
+    def log_message(self, format, *args):
+        """
+        In the standard handler class, this function is called for anything
+        that needs to get logged (e.g. from :meth:`log_request`).
+
+        We override it in order to use our own log function.
+        """
+        self.log(format, args, logging.INFO)
+
+    def log_request(self, code='-', size='-'):
+        """
+        This function is called during :meth:`send_response`.
+
+        We override it to get a little more information logged in a somewhat
+        better format.
+        """
+        self.log('%s: HTTP status %s',
+                 (self._get_log_prefix(), code),
+                 logging.DEBUG)
+
+    def _get_log_prefix(self):
+        """Return the prefix components for a log entry"""
+        return '%s %s from %s' % \
+               (self.request_version, self.command, self.client_address[0])
+
+    def version_string(self):
+        """
+        Overrides the inherited method to add the pywbem_mock version.
+        """
+        return 'pywbem-mock-server/%s %s %s ' % \
+            (__version__, self.server_version, self.sys_version)
+
+
+class MockWBEMServer(object):
+    """
+    *New in pywbem 0.13 as experimental.*
+
+    A mock WBEM server that processes CIM-XML operation requests received
+    via HTTP using the mock repository of a
+    :class:`~pywbem_mock.FakedWBEMConnection` object.
+
+    The mock WBEM server supports the operations that
+    :class:`~pywbem_mock.FakedWBEMConnection` supports, including
+    InvokeMethod with the method callback functions registered in the
+    :class:`~pywbem_mock.FakedWBEMConnection` object. It supports
+    persistent HTTP connections and HTTP compression with gzip, but not
+    HTTPS or authentication.
+
+    The :attr:`~pywbem_mock.FakedWBEMConnection.response_delay` of the
+    :class:`~pywbem_mock.FakedWBEMConnection` object is applied to every
+    response. In addition, the time for transferring the response at a
+    limited bandwidth can be simulated.
+
+    The mock WBEM server must be stopped in order to free the TCP/IP port it
+    listens on. Using this class as a context manager ensures that the mock
+    WBEM server is stopped when leaving the context manager scope.
+    """
+
+    def __init__(self, conn, host='localhost', port=0, bandwidth=None):
+        """
+        Parameters:
+
+          conn (:class:`~pywbem_mock.FakedWBEMConnection`):
+            The faked connection whose mock repository is served.
+
+          host (:term:`string`):
+            IP address or host name at which the mock WBEM server can be
+            reached.
+
+          port (:term:`string` or :term:`integer`):
+            HTTP port at which the mock WBEM server can be reached.
+
+            0 means that a free port is selected by the operating system
+            when the mock WBEM server is started (see
+            :attr:`~pywbem_mock.MockWBEMServer.port`).
+
+          bandwidth (:term:`number`):
+            Simulated bandwidth for the responses, in Bytes per second. The
+            time needed for transferring the (uncompressed) response body at
+            this bandwidth is added to the response delay.
+
+            `None` means not to simulate a limited bandwidth.
+        """
+        self._conn = conn
+        self._host = host
+
+        if isinstance(port, (six.integer_types, six.string_types)):
+            self._port = int(port)  # Convert Python 2 long to int
+        else:
+            raise TypeError("Invalid type for port: %s" % type(port))
+
+        if bandwidth is not None and bandwidth <= 0:
+            raise ValueError("Invalid value for bandwidth: %r, must be a "
+                             "positive number" % bandwidth)
+        self._bandwidth = bandwidth
+
+        self._http_server = None  # ThreadedHTTPServer
+        self._http_thread = None  # Thread for the HTTP server
+
+        # Serializes the operations on the mock repository
+        self._lock = threading.RLock()
+
+        self._logger = logging.getLogger('pywbem_mock.server.%s' % id(self))
+
+    def __repr__(self):
+        """
+        Return a representation of the :class:`~pywbem_mock.MockWBEMServer`
+        object with all attributes, that is suitable for debugging.
+        """
+        return "%s(host=%r, port=%s, bandwidth=%r, started=%s, conn=%r)" % \
+               (self.__class__.__name__, self.host, self.port,
+                self.bandwidth, self.started, self.conn)
+
+    def __enter__(self):
+        """
+        Enter method when the class is used as a context manager.
+
+        Returns the mock WBEM server object.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Exit method when the class is used as a context manager.
+
+        Stops the mock WBEM server by calling
+        :meth:`~pywbem_mock.MockWBEMServer.stop`.
+        """
+        self.stop()
+        return False  # re-raise any exceptions
+
+    @property
+    def conn(self):
+        """
+        :class:`~pywbem_mock.FakedWBEMConnection`: The faked connection
+        whose mock repository is served.
+        """
+        return self._conn
+
+    @property
+    def host(self):
+        """
+        :term:`string`: IP address or host name at which the mock WBEM server
+        can be reached.
+        """
+        return self._host
+
+    @property
+    def port(self):
+        """
+        :term:`integer`: HTTP port at which the mock WBEM server can be
+        reached.
+
+        If the mock WBEM server was created with port 0, this is 0 until the
+        mock WBEM server is started, and the port selected by the operating
+        system afterwards.
+        """
+        return self._port
+
+    @property
+    def url(self):
+        """
+        :term:`string`: URL of the mock WBEM server, for use as the `url`
+        parameter of :class:`~pywbem.WBEMConnection`.
+        """
+        return 'http://%s:%s' % (self._host, self._port)
+
+    @property
+    def bandwidth(self):
+        """
+        :term:`number`: Simulated bandwidth for the responses, in Bytes per
+        second.
+
+        `None` means that no limited bandwidth is simulated.
+        """
+        return self._bandwidth
+
+    @property
+    def started(self):
+        """
+        :class:`py:bool`: Boolean indicating whether the mock WBEM server is
+        started.
+        """
+        return self._http_server is not None
+
+    @property
+    def logger(self):
+        """
+        :class:`py:logging.Logger`: Logger object for this mock WBEM server.
+
+        Each mock WBEM server object has its own separate logger object with
+        the name:
+
+          `'pywbem_mock.server.{id}'`
+
+        where `{id}` is a unique string for each mock WBEM server object.
+        """
+        return self._logger
+
+    def start(self):
+        """
+        Start the mock WBEM server thread, if it is not yet running.
+
+        The mock WBEM server must be stopped again in order to free the
+        TCP/IP port it listens on. The mock WBEM server can be stopped
+        explicitly using the :meth:`~pywbem_mock.MockWBEMServer.stop` method.
+        The mock WBEM server will be automatically stopped when the main
+        thread terminates (i.e. when the Python process terminates), or when
+        :class:`~pywbem_mock.MockWBEMServer` is used as a context manager
+        when leaving its scope.
+
+        Raises:
+
+          :exc:`~py:exceptions.OSError`:
+            with :attr:`~OSError.errno` =
+            :data:`py:errno.EADDRINUSE` when the port is already in use.
+        """
+        if self._http_server:
+            return
+
+        try:
+            server = ThreadedHTTPServer((self._host, self._port),
+                                        MockRequestHandler)
+        except Exception as exc:
+            # Linux+py2: socket.error; Linux+py3: OSError;
+            # Windows does not raise any exception.
+            if getattr(exc, 'errno', None) == errno.EADDRINUSE:
+                # Reraise with improved error message
+                msg = "Mock WBEM server port %s already in use" % \
+                      self._port
+                exc_type = OSError
+                six.reraise(exc_type, exc_type(errno.EADDRINUSE, msg),
+                            sys.exc_info()[2])
+            raise
+
+        # pylint: disable=attribute-defined-outside-init
+        server.mock_server = self
+        self._port = server.server_address[1]
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True  # Exit server thread upon main thread exit
+        self._http_server = server
+        self._http_thread = thread
+        thread.start()
+
+    def stop(self):
+        """
+        Stop the mock WBEM server thread, if it is running.
+        """
+        if self._http_server:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_server = None
+            self._http_thread = None
+
+    def delay_response(self, body_len):
+        """
+        Wait for the response delay of the faked connection and for the
+        time needed to transfer a response body with `body_len` Bytes at the
+        simulated bandwidth.
+
+        This method is called by the request handler threads. It is not
+        supposed to be called by the user.
+        """
+        # pylint: disable=protected-access
+        delay = self._conn._response_delay or 0
+        if self._bandwidth:
+            delay += float(body_len) / self._bandwidth
+        if delay:
+            time.sleep(delay)
+
+    def imethodcall(self, methodname, namespace, params):
+        """
+        Perform an intrinsic operation on the mock repository and return the
+        list of cim_xml elements for the IMETHODRESPONSE element.
+
+        This method is called by the request handler threads. It is not
+        supposed to be called by the user.
+
+        Parameters:
+
+          methodname (:term:`string`): Name of the intrinsic operation.
+
+          namespace (:term:`string`): Target namespace.
+
+          params (list of tuple(name, value)): The parsed IPARAMVALUE
+            elements.
+        """
+        iparams = dict.fromkeys(IPARAM_NAMES)
+        for name, value in params:
+            if isinstance(value, six.string_types):
+                if name in BOOLEAN_IPARAMS:
+                    value = cimvalue(value, 'boolean')
+                elif name in UINT32_IPARAMS:
+                    value = Uint32(value)
+            iparams[name] = value
+
+        # pylint: disable=protected-access
+        fake_method = getattr(self._conn, '_fake_' + methodname.lower(), None)
+        if fake_method is None or methodname.lower() == 'invokemethod':
+            return [self._error(CIMError(
+                CIM_ERR_NOT_SUPPORTED,
+                'Operation %s not supported by the mock WBEM server' %
+                methodname))]
+
+        try:
+            with self._lock:
+                result = fake_method(namespace, **iparams)
+            # The returned objects are copies, so they can be converted to
+            # CIM-XML without holding the lock.
+            return self._imethod_result(methodname, namespace, result)
+        except CIMError as exc:
+            return [self._error(exc)]
+        except Exception as exc:  # pylint: disable=broad-except
+            self._logger.exception("Operation %s failed", methodname)
+            return [self._error(CIMError(
+                CIM_ERR_FAILED, 'Operation %s failed: %s: %s' %
+                (methodname, exc.__class__.__name__, exc)))]
+
+    def methodcall(self, methodname, localobject, params):
+        """
+        Perform an InvokeMethod operation on the mock repository and return
+        the list of cim_xml elements for the METHODRESPONSE element.
+
+        This method is called by the request handler threads. It is not
+        supposed to be called by the user.
+
+        Parameters:
+
+          methodname (:term:`string`): Name of the CIM method.
+
+          localobject (:class:`~pywbem.CIMClassName` or
+            :class:`~pywbem.CIMInstanceName`): Target object, with namespace.
+
+          params (list of tuple(name, type, value)): The parsed PARAMVALUE
+            elements.
+        """
+        in_params = []
+        for name, paramtype, value in params:
+            if paramtype is None:
+                paramtype = 'string'
+            elif paramtype != 'reference' and \
+                    isinstance(value, (six.string_types, list)):
+                value = cimvalue(value, paramtype)
+            in_params.append(CIMParameter(name, paramtype, value=value))
+
+        try:
+            with self._lock:
+                # pylint: disable=protected-access
+                return_value, out_params = \
+                    self._conn._invoke_method_callback(methodname,
+                                                       localobject, in_params)
+        except CIMError as exc:
+            return [self._error(exc)]
+        except Exception as exc:  # pylint: disable=broad-except
+            self._logger.exception("Method %s failed", methodname)
+            return [self._error(CIMError(
+                CIM_ERR_FAILED, 'Method %s failed: %s: %s' %
+                (methodname, exc.__class__.__name__, exc)))]
+
+        data = []
+        if return_value is not None:
+            data.append(cim_xml.RETURNVALUE(
+                self._value(return_value),
+                param_type=self._cimtype(return_value)))
+        for param in out_params:
+            data.append(param.tocimxml(as_value=True))
+        return data
+
+    @staticmethod
+    def _error(exc):
+        """Return the cim_xml ERROR element for a CIMError exception."""
+        return cim_xml.ERROR(str(exc.status_code), exc.status_description)
+
+    @staticmethod
+    def _cimtype(value):
+        """
+        Return the CIM type name for the return value of a method callback
+        function. Integers that are not CIM integer objects are assumed to
+        be uint32.
+        """
+        if isinstance(value, CIMType):
+            return value.cimtype
+        if isinstance(value, bool):
+            return 'boolean'
+        if isinstance(value, six.string_types):
+            return 'string'
+        if isinstance(value, (CIMInstanceName, CIMClassName)):
+            return 'reference'
+        if isinstance(value, six.integer_types):
+            return 'uint32'
+        if isinstance(value, float):
+            return 'real64'
+        raise CIMError(CIM_ERR_FAILED, 'Unsupported return value type %s of '
+                       'method callback function' % type(value))
+
+    @staticmethod
+    def _value(value):
+        """Return the cim_xml element for a return value."""
+        if isinstance(value, (CIMInstanceName, CIMClassName)):
+            return cim_xml.VALUE_REFERENCE(value.tocimxml())
+        return cim_xml.VALUE(atomic_to_cim_xml(value))
+
+    def _imethod_result(self, methodname, namespace, result):
+        """
+        Return the list of cim_xml elements for the IMETHODRESPONSE element
+        from the result of a FakedWBEMConnection._fake_*() method.
+        """
+        if result is None:
+            return []
+        data = []
+        for name, _, value in result:
+            if name == 'IRETURNVALUE':
+                irv = cim_xml.IRETURNVALUE(None)
+                irv.appendChildren(
+                    [self._return_object(methodname, namespace, obj)
+                     for obj in value])
+                data.append(irv)
+            elif name == 'EndOfSequence':
+                data.append(cim_xml.PARAMVALUE(
+                    name, cim_xml.VALUE(value), 'boolean'))
+            else:
+                data.append(cim_xml.PARAMVALUE(
+                    name, cim_xml.VALUE(value), 'string'))
+        return data
+
+    def _path(self, path, namespace):
+        """
+        Return the cim_xml INSTANCEPATH or CLASSPATH element for an instance
+        or class path. A missing host or namespace is set from the faked
+        connection and the target namespace.
+        """
+        if path.host is None or path.namespace is None:
+            path = path.copy()
+            if path.host is None:
+                path.host = self._conn.host
+            if path.namespace is None:
+                path.namespace = namespace
+        return _cimxml_node(path)
+
+    def _return_object(self, methodname, namespace, obj):
+        """
+        Return the cim_xml element for an object in the IRETURNVALUE element
+        of the response for an intrinsic operation.
+        """
+        if isinstance(obj, CIMInstance):
+            if methodname in NAMEDINSTANCE_METHODS:
+                return cim_xml.VALUE_NAMEDINSTANCE(
+                    _cimxml_node(obj.path, ignore_namespace=True),
+                    _cimxml_node(obj, ignore_path=True))
+            if methodname in INSTANCEWITHPATH_METHODS:
+                return cim_xml.VALUE_INSTANCEWITHPATH(
+                    self._path(obj.path, namespace),
+                    _cimxml_node(obj, ignore_path=True))
+            return _cimxml_node(obj, ignore_path=True)
+        if isinstance(obj, CIMInstanceName):
+            if methodname in INSTANCEPATH_METHODS:
+                return self._path(obj, namespace)
+            return _cimxml_node(obj, ignore_namespace=True)
+        if isinstance(obj, CIMClassName):
+            return cim_xml.CLASSNAME(obj.classname)
+        if isinstance(obj, tuple):
+            # Result of the association operations, see
+            # FakedWBEMConnection._return_assoc_tuple()
+            obj = obj[2]
+            if isinstance(obj, tuple):
+                # Class-level Associators or References
+                return cim_xml.VALUE_OBJECTWITHPATH(
+                    self._path(obj[0], namespace), obj[1].tocimxml())
+            if isinstance(obj, CIMInstance):
+                return cim_xml.VALUE_OBJECTWITHPATH(
+                    self._path(obj.path, namespace),
+                    _cimxml_node(obj, ignore_path=True))
+            return cim_xml.OBJECTPATH(self._path(obj, namespace))
+        if isinstance(obj, CIMQualifierDeclaration) and 'ANY' in obj.scopes:
+            # The ANY scope of MOF is not allowed in CIM-XML
+            any_scope = obj.scopes['ANY']
+            obj = obj.copy()
+            obj.scopes = [(scope, any_scope or obj.scopes.get(scope, False))
+                          for scope in QUALIFIER_SCOPES]
+        # CIMClass, CIMQualifierDeclaration
+        return obj.tocimxml()
+
+
+def _cimxml_node(obj, **kwargs):
+    """
+    Return a cim_xml node for a CIMInstance, CIMInstanceName or CIMClassName
+    object, passing the keyword arguments to its tocimxml() method.
+
+    If :data:`pywbem.config.FAST_CIMXML_WRITER` is True, the CIM-XML is
+    created using the fast CIM-XML writer and is returned as a node that
+    contains the CIM-XML string unchanged.
+    """
+    if config.FAST_CIMXML_WRITER:
+        buf = []
+        obj._write_cimxml(buf, **kwargs)  # pylint: disable=protected-access
+        # pylint: disable=protected-access
+        return cim_xml._RawXML(u''.join(buf))
+    return obj.tocimxml(**kwargs)
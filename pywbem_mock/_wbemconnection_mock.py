@@ -28,19 +28,22 @@ For documentation, see mocksupport.rst.
 from __future__ import absolute_import, print_function
 
 from copy import deepcopy
+import os
 import uuid
 import time
 import sys
 import locale
 import traceback
 import re
+import hashlib
 from xml.dom import minidom
 from mock import Mock
 import six
+from six.moves import cPickle as pickle
 
 
 from pywbem import WBEMConnection, CIMClass, CIMClassName, \
-    CIMInstance, CIMInstanceName, CIMQualifierDeclaration, \
+    CIMInstance, CIMInstanceName, CIMProperty, CIMQualifierDeclaration, \
     CIMParameter, cimtype, CIMError, \
     CIM_ERR_NOT_FOUND, CIM_ERR_METHOD_NOT_FOUND, CIM_ERR_FAILED, \
     CIM_ERR_INVALID_SUPERCLASS, CIM_ERR_INVALID_PARAMETER, \
@@ -49,7 +52,10 @@ from pywbem import WBEMConnection, CIMClass, CIMClassName, \
     CIM_ERR_NOT_SUPPORTED, CIM_ERR_QUERY_LANGUAGE_NOT_SUPPORTED, \
     DEFAULT_NAMESPACE, MOFCompiler, MOFWBEMConnection
 from pywbem._nocasedict import NocaseDict
+from pywbem._version import __version__
 from ._dmtf_cim_schema import DMTFCIMSchema
+from ._classrepository import ClassRepository
+from ._instancerepository import InstanceRepository
 
 
 __all__ = ['FakedWBEMConnection', 'method_callback_interface']
@@ -62,6 +68,22 @@ _DEFAULT_MAX_OBJECT_COUNT = 100
 # Maximum Open... timeout if not set by request
 OPEN_MAX_TIMEOUT = 40
 
+# Default Open... timeout (in seconds) of the Fake Server if not specified by
+# request
+_DEFAULT_OPERATION_TIMEOUT = 40
+
+# Version of the format of the repository snapshot files written by
+# save_repository(). It must be increased when the format changes.
+_SNAPSHOT_FORMAT_VERSION = 1
+
+# Modules whose classes are pickled in repository snapshot files. Their source
+# is part of the key of the snapshot files of compile_dmtf_schema(), so that
+# development versions with changed classes (e.g. __slots__) do not load
+# incompatible snapshot files.
+_SNAPSHOT_MODULES = ('pywbem.cim_obj', 'pywbem.cim_types',
+                     'pywbem._nocasedict', 'pywbem_mock._classrepository',
+                     'pywbem_mock._instancerepository')
+
 # per DSP0200, the default behavior for EnumerateInstance DeepInheritance
 # if not set by server.  Default is True.
 DEFAULT_DEEP_INHERITANCE = True
@@ -70,6 +92,48 @@ DEFAULT_DEEP_INHERITANCE = True
 OUTPUT_FORMATS = ['mof', 'xml', 'repr']
 
 
+def _default_snapshot_dir():
+    """
+    Return the default directory for the repository snapshot files of
+    compile_dmtf_schema(): A pywbem_mock subdirectory of the user's cache
+    directory.
+    """
+    cache_dir = os.environ.get('XDG_CACHE_HOME') or \
+        os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_dir, 'pywbem_mock')
+
+
+def _snapshot_key(schema_mof, schema_mof_dir, namespace):
+    """
+    Return the key of the repository snapshot file for compiling the
+    specified MOF of a DMTF CIM schema into a namespace.
+
+    The key is a hash of the MOF, the namespace, the content of all MOF files
+    of the DMTF CIM schema (because the MOF compiler includes dependent
+    classes from there), and the source of the modules whose classes are
+    pickled in the snapshot file.
+    """
+    key_hash = hashlib.sha256()
+    key_hash.update(repr((schema_mof, namespace.lower())).encode('utf-8'))
+    for dir_path, dir_names, file_names in os.walk(schema_mof_dir):
+        dir_names.sort()
+        for file_name in sorted(file_names):
+            if not file_name.endswith('.mof'):
+                continue
+            file_path = os.path.join(dir_path, file_name)
+            key_hash.update(
+                os.path.relpath(file_path, schema_mof_dir).encode('utf-8'))
+            with open(file_path, 'rb') as fp:
+                key_hash.update(fp.read())
+    for module_name in _SNAPSHOT_MODULES:
+        module_file = sys.modules[module_name].__file__
+        if module_file.endswith(('.pyc', '.pyo')):
+            module_file = module_file[:-1]
+        with open(module_file, 'rb') as fp:
+            key_hash.update(fp.read())
+    return key_hash.hexdigest()
+
+
 # TODO: ks Future We have not considered that iq and ico are deprecated in
 # DSP0200 for get_instance, etc. We could  set up a default to ignore these
 # parameters for the operations in which they are deprecated and we
@@ -281,7 +345,8 @@ class FakedWBEMConnection(WBEMConnection):
         # namespace are class names, and the values in each sub-dictionary are
         # the CIM classes in that namespace, represented as CIMClass objects.
         # The dictionaries are NocaseDict since namespaces should be case
-        # insensitive.
+        # insensitive. The sub-dictionaries are ClassRepository objects, that
+        # also cache the class hierarchy of the namespace.
         self.classes = NocaseDict()
 
         # The CIM qualifier types in the mock repository.
@@ -291,11 +356,10 @@ class FakedWBEMConnection(WBEMConnection):
 
         # The CIM instances in the mock repository.
         # Because instances do not have a name, the format is slightly
-        # different: This is a dictionary of lists where the top level key is
-        # the CIM namespace name and the value is a list of CIM instances in
-        # that namespace, represented as CIMInstance objects.
-        # TODO: ks. FUTURE maybe we should really have a subdict per class but
-        #           it is not important for initial release.
+        # different: The top level key is the CIM namespace name and the
+        # value is an InstanceRepository object with the CIM instances in
+        # that namespace, represented as CIMInstance objects and indexed by
+        # instance path and by class name.
         self.instances = NocaseDict()
 
         self.methods = NocaseDict()
@@ -305,7 +369,9 @@ class FakedWBEMConnection(WBEMConnection):
         # Open Pull Contexts. The key for each context is an enumeration
         # context id.  The data is the total list of instances/names to
         # be returned and the current position in the list. Any context in
-        # this list is still open.
+        # this list is still open, unless its inter-operation timeout has
+        # expired. Expired contexts are removed by the next open, pull or
+        # close operation.
         self.enumeration_contexts = {}
 
         self._imethodcall = Mock(side_effect=self._mock_imethodcall)
@@ -483,7 +549,8 @@ class FakedWBEMConnection(WBEMConnection):
 
     def compile_dmtf_schema(self, schema_version, schema_root_dir, class_names,
                             use_experimental=False, namespace=None,
-                            verbose=False):
+                            verbose=False, use_snapshot=False,
+                            snapshot_dir=None):
         """
         Compile the classes defined by `class_names` and their dependent
         classes from the DMTF CIM schema version defined by
@@ -499,6 +566,16 @@ class FakedWBEMConnection(WBEMConnection):
         It automatically compiles all of the DMTF qualifier declarations that
         are in the files `qualifiers.mof` and `qualifiers_optional.mof`.
 
+        If the mock repository is empty when this method is called and
+        `use_snapshot` is `True`, the resulting mock repository is saved with
+        :meth:`save_repository` in a snapshot file in the `snapshot_dir`
+        directory. The snapshot file is identified by a hash of the MOF to be
+        compiled, the namespace, the content of the MOF files of the DMTF CIM
+        schema, and the source of the pywbem modules whose objects are saved.
+        Subsequent calls for the same classes, also in other processes, load
+        the snapshot file with :meth:`load_repository` instead of compiling
+        the MOF again.
+
         Parameters:
 
           schema_version (tuple of 3 integers (m, n, u):
@@ -550,6 +627,18 @@ class FakedWBEMConnection(WBEMConnection):
           verbose (:class:`py:bool`):
             If `True`, progress messages are output to stdout
 
+          use_snapshot (:class:`py:bool`):
+            If `True`, use a snapshot file of the mock repository as
+            described above. Default: `False`.
+
+          snapshot_dir (:term:`string`):
+            Directory for the snapshot files. It is created if it does not
+            exist. Since snapshot files are loaded with :mod:`py:pickle`,
+            this directory must not be writeable by untrusted users.
+
+            `None` means the ``pywbem_mock`` subdirectory of the user's cache
+            directory (``$XDG_CACHE_HOME`` or ``~/.cache``).
+
         Raises:
             ValueError: The schema cannot be retrieved from the DMTF web
               site, the schema_version is invalid, or a class name cannot
@@ -557,15 +646,165 @@ class FakedWBEMConnection(WBEMConnection):
             TypeError: The 'schema_version' is not a valid tuple with 3
               integer components
         """
+        if namespace is None:
+            namespace = self.default_namespace
+
         schema = DMTFCIMSchema(schema_version, schema_root_dir,
                                use_experimental=use_experimental,
                                verbose=verbose)
         schema_mof = schema.build_schema_mof(class_names)
         search_paths = schema.schema_mof_dir
+
+        snapshot_file = None
+        if use_snapshot and self._repository_is_empty():
+            if snapshot_dir is None:
+                snapshot_dir = _default_snapshot_dir()
+            key = _snapshot_key(schema_mof, schema.schema_mof_dir, namespace)
+            snapshot_file = os.path.join(
+                snapshot_dir, 'mock_repository_%s.pickle' % key[:16])
+            try:
+                if self.load_repository(snapshot_file, key=key):
+                    if verbose:
+                        print("Loaded mock repository snapshot: %s" %
+                              snapshot_file)
+                    return
+            except ValueError:
+                # Invalid snapshot file. It is replaced below.
+                pass
+
         self.compile_mof_string(schema_mof, namespace=namespace,
                                 search_paths=[search_paths],
                                 verbose=verbose)
 
+        if snapshot_file:
+            try:
+                if not os.path.isdir(snapshot_dir):
+                    os.makedirs(snapshot_dir)
+                self.save_repository(snapshot_file, key=key)
+            except (IOError, OSError):
+                # The snapshot is only an optimization for later calls
+                pass
+
+    def save_repository(self, snapshot_file, key=None):
+        """
+        Save the mock repository in a snapshot file, from which it can be
+        restored with :meth:`load_repository`, also in another process.
+
+        The snapshot file contains the CIM classes, CIM qualifier types
+        (declarations) and CIM instances of all namespaces of the mock
+        repository, and the method callback functions registered with
+        :meth:`add_method_callback`. The method callback functions are saved
+        by reference to their module and name (see :mod:`py:pickle`), so
+        they must be functions defined at the top level of a module.
+
+        The snapshot file is written to a temporary file that is then renamed,
+        so that other processes never see a partially written snapshot file.
+
+        Parameters:
+
+          snapshot_file (:term:`string`):
+            Path name of the snapshot file. An existing file is replaced.
+
+          key (:term:`string`):
+            Optional key that is stored in the snapshot file, and that
+            :meth:`load_repository` checks. It can be used to identify the
+            input from which the mock repository was built (e.g. a hash of
+            the compiled MOF), in order to detect stale snapshot files.
+
+        Raises:
+
+          IOError: The snapshot file cannot be written.
+
+          :exc:`py:pickle.PicklingError`: A method callback function cannot
+            be saved.
+        """
+        snapshot = {
+            'format_version': _SNAPSHOT_FORMAT_VERSION,
+            'pywbem_version': __version__,
+            'key': key,
+            'classes': self.classes,
+            'qualifiers': self.qualifiers,
+            'instances': self.instances,
+            'methods': self.methods,
+        }
+        tmp_file = '%s.%s.tmp' % (snapshot_file, os.getpid())
+        try:
+            with open(tmp_file, 'wb') as fp:
+                pickle.dump(snapshot, fp, pickle.HIGHEST_PROTOCOL)
+            # os.replace() does not exist on Python 2, and os.rename() does
+            # not replace an existing file on Windows.
+            getattr(os, 'replace', os.rename)(tmp_file, snapshot_file)
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+
+    def load_repository(self, snapshot_file, key=None):
+        """
+        Replace the mock repository with the content of a snapshot file that
+        was written by :meth:`save_repository`.
+
+        Loading a snapshot file is much faster than compiling the MOF from
+        which the mock repository was built.
+
+        The snapshot file is loaded with :mod:`py:pickle`, so it must be from
+        a trusted source.
+
+        Parameters:
+
+          snapshot_file (:term:`string`):
+            Path name of the snapshot file.
+
+          key (:term:`string`):
+            If not `None`, the snapshot file is loaded only if it was saved
+            with the same key.
+
+        Returns:
+
+          :class:`py:bool`: `True` if the snapshot file was loaded. `False`
+          if the snapshot file does not exist, or if it was saved with a
+          different key, snapshot format version or pywbem version. In these
+          cases, the mock repository remains unchanged.
+
+        Raises:
+
+          ValueError: The snapshot file is not a valid snapshot file.
+        """
+        if not os.path.isfile(snapshot_file):
+            return False
+        try:
+            with open(snapshot_file, 'rb') as fp:
+                snapshot = pickle.load(fp)
+            valid = snapshot['format_version'] == _SNAPSHOT_FORMAT_VERSION
+        except Exception as exc:  # pylint: disable=broad-except
+            raise ValueError('Invalid mock repository snapshot file %s: %s' %
+                             (snapshot_file, exc))
+        if not valid or snapshot['pywbem_version'] != __version__ or \
+                (key is not None and snapshot['key'] != key):
+            return False
+
+        self.classes = snapshot['classes']
+        self.qualifiers = snapshot['qualifiers']
+        self.instances = snapshot['instances']
+        self.methods = snapshot['methods']
+        self.enumeration_contexts = {}
+        return True
+
+    def _repository_is_empty(self):
+        """
+        Return `True` if the mock repository has no CIM classes, CIM
+        qualifier types, CIM instances and method callback functions in any
+        namespace.
+        """
+        for repo in (self.classes, self.qualifiers, self.instances):
+            for ns_repo in six.itervalues(repo):
+                if ns_repo:
+                    return False
+        for ns_methods in six.itervalues(self.methods):
+            for class_methods in six.itervalues(ns_methods):
+                if class_methods:
+                    return False
+        return True
+
     def add_cimobjects(self, objects, namespace=None):
         # pylint: disable=line-too-long
         """
@@ -630,7 +869,8 @@ class FakedWBEMConnection(WBEMConnection):
                     # The following generates an exception for each new ns
                     self.classes[namespace][cc.classname] = cc
                 except KeyError:
-                    self.classes[namespace] = NocaseDict({cc.classname: cc})
+                    self.classes[namespace] = \
+                        ClassRepository([(cc.classname, cc)])
 
             elif isinstance(obj, CIMInstance):
                 inst = deepcopy(obj)
@@ -644,13 +884,13 @@ class FakedWBEMConnection(WBEMConnection):
                     inst.path.host = None
                 try:
                     inst_repo = self._get_instance_repo(namespace)
-                    if self._find_instance(inst.path, inst_repo)[1] is not None:
+                    if self._find_instance(inst.path, inst_repo) is not None:
                         raise ValueError('The instance %s already exists in '
                                          'namespace %s' % (inst, namespace))
-                    self.instances[namespace].append(inst)
+                    inst_repo.add(inst)
                 except CIMError as ce:
                     if ce.status_code == CIM_ERR_INVALID_NAMESPACE:
-                        self.instances[namespace] = [inst]
+                        self.instances[namespace] = InstanceRepository([inst])
                     else:
                         raise CIMError(CIM_ERR_FAILED, 'Internal failure of '
                                        'add_cimobject operation. Rcvd '
@@ -819,7 +1059,8 @@ class FakedWBEMConnection(WBEMConnection):
                          len(objects_repo[namespace]), obj_type, cmt_end))
             if summary:
                 return
-            # instances are special because the inner struct is a list
+            # instances are special because the inner struct is an
+            # InstanceRepository
             if obj_type == 'Instances':
                 try:
                     insts = objects_repo[namespace]
@@ -885,7 +1126,10 @@ class FakedWBEMConnection(WBEMConnection):
         """
         repo.classes = deepcopy(self.classes)
         repo.qualifiers = deepcopy(self.qualifiers)
-        repo.instances = deepcopy(self.instances)
+        # The compile repo has a list of instances per namespace
+        repo.instances = NocaseDict()
+        for ns, inst_repo in six.iteritems(self.instances):
+            repo.instances[ns] = deepcopy(list(inst_repo))
 
     def _merge_repos(self, repo):
         """
@@ -902,7 +1146,8 @@ class FakedWBEMConnection(WBEMConnection):
                         self.classes[ns][cl.classname] = \
                             repo.classes[ns][cl.classname].copy()
                     except KeyError:
-                        self.classes[ns] = NocaseDict({cl.classname: cl})
+                        self.classes[ns] = \
+                            ClassRepository([(cl.classname, cl)])
         if repo.instances:
             self.instances.clear()
             for ns, insts in six.iteritems(repo.instances):
@@ -915,9 +1160,9 @@ class FakedWBEMConnection(WBEMConnection):
                                            IncludeClassOrigin=True)
                         inst.path = CIMInstanceName.from_instance(cc, inst, ns)
                     try:
-                        self.instances[ns].append(inst)
+                        self.instances[ns].add(inst)
                     except KeyError:
-                        self.instances[ns] = [inst]
+                        self.instances[ns] = InstanceRepository([inst])
         if repo.qualifiers:
             self.qualifiers.clear()
             for ns in repo.qualifiers:
@@ -1058,8 +1303,8 @@ class FakedWBEMConnection(WBEMConnection):
         and if it does, returns the handle to that repository. If the
         repo for namespace does not exist, it generates a CIM_Error
 
-        The class repository is a NocaseDict with class as key and
-        the CIMClass as value.
+        The class repository is a ClassRepository object (a NocaseDict)
+        with class as key and the CIMClass as value.
 
         Parameters:
 
@@ -1082,15 +1327,15 @@ class FakedWBEMConnection(WBEMConnection):
         and if it does, returns the handle to that repository. If the
         repo for namespace does not exist, it generates a CIM_Error
 
-        The instance repository is a list if instances within the
-        defined namespace
+        The instance repository is an InstanceRepository object with the
+        instances within the defined namespace
 
         Parameters:
 
           namespace(:term:`string`):
             String containing the name of the namespace to get
 
-        Returns: List of instances
+        Returns: InstanceRepository object
 
         Raises:
            CIM_Error, CIM_ERR_INVALID_NAMESPACE if this namespace
@@ -1101,7 +1346,7 @@ class FakedWBEMConnection(WBEMConnection):
             # namespace. Existence of the class repo should imply existence
             # of instance repo
             if self._get_class_repo(namespace):
-                self.instances[namespace] = []
+                self.instances[namespace] = InstanceRepository()
                 if namespace not in self.methods:
                     self.methods[namespace] = NocaseDict()
 
@@ -1147,16 +1392,9 @@ class FakedWBEMConnection(WBEMConnection):
         Returns in order of descending class hiearchy.
         """
         class_repo = self._get_class_repo(namespace)
-        superclass_names = []
-        if cn is not None:
-            cnwork = cn
-            while cnwork:
-                cnsuper = class_repo[cnwork].superclass
-                if cnsuper:
-                    superclass_names.append(cnsuper)
-                cnwork = cnsuper
-            superclass_names.reverse()
-        return superclass_names
+        if cn is None:
+            return []
+        return class_repo.superclass_names(cn)
 
     def _get_subclass_names(self, classname, namespace, deep_inheritance):
         """
@@ -1173,25 +1411,14 @@ class FakedWBEMConnection(WBEMConnection):
 
         Returns:
             list of strings with the names of all subclasses of `classname`.
+            The list is a new list that the caller may modify.
 
         """
         assert classname is None or isinstance(classname, six.string_types)
 
-        # retrieve first level of subclasses for which classname is superclass
-        rtn_classnames = [
-            cl.classname for cl in six.itervalues(self.classes[namespace])
-            if cl.superclass == classname]
-
-        # recurse for futher levels of class hiearchy
-        if deep_inheritance:
-            subclass_names = []
-            if rtn_classnames:
-                for cn in rtn_classnames:
-                    subclass_names.extend(
-                        self._get_subclass_names(cn, namespace,
-                                                 deep_inheritance))
-            rtn_classnames.extend(subclass_names)
-        return rtn_classnames
+        # The class repo caches the class hierarchy of the namespace
+        return self.classes[namespace].subclass_names(classname,
+                                                      deep_inheritance)
 
     def _get_class(self, classname, namespace, local_only=None,
                    include_qualifiers=None, include_classorigin=None,
@@ -1305,35 +1532,21 @@ class FakedWBEMConnection(WBEMConnection):
     @staticmethod
     def _find_instance(iname, inst_repo):
         """
-        Find an instance in the instance repo by iname and return the
-        index of that instance.
+        Find an instance in the instance repo by iname and return that
+        instance.
+
+        The lookup uses the index of the instance repo by instance path, so
+        its cost does not depend on the number of instances.
 
         Parameters:
 
           iname: CIMInstancename to find
 
-          inst_repo: the instance repo to search
-
-        Return (None, None if not found. Otherwise return tuple of
-               index, instance
+          inst_repo: the instance repo (InstanceRepository object) to search
 
-        Raises:
-
-          CIMError: Failed if repo invalid.
-        """
-        rtn_inst = None
-        rtn_index = None
-        for index, inst in enumerate(inst_repo):
-            if iname == inst.path:
-                if rtn_inst is not None:
-                    # TODO:ks Future Remove dup test since we should be
-                    # insuring no dups on instance creation
-                    raise CIMError(CIM_ERR_FAILED, 'Invalid Repository. '
-                                   'Multiple instances with same path %s'
-                                   % rtn_inst.path)
-                rtn_inst = inst
-                rtn_index = index
-        return(rtn_index, rtn_inst)
+        Return None if not found. Otherwise return the instance (not a copy).
+        """
+        return inst_repo.get(iname)
 
     def _get_instance(self, iname, namespace, property_list, local_only,
                       include_class_origin, include_qualifiers):
@@ -1342,9 +1555,9 @@ class FakedWBEMConnection(WBEMConnection):
         other instance methods that need to get an instance from the
         repository.
 
-        It attempts to get the instance, copies it, and filters it
-        for input parameters like localonly, includequalifiers, and
-        propertylist.
+        It attempts to get the instance, and returns a copy of it that is
+        filtered for input parameters like localonly, includequalifiers, and
+        propertylist (see _copy_instance()).
 
         Returns:
           CIMInstance copy from the repository with property_list filtered,
@@ -1354,24 +1567,15 @@ class FakedWBEMConnection(WBEMConnection):
         """
         inst_repo = self._get_instance_repo(namespace)
 
-        rtn_tup = self._find_instance(iname, inst_repo)
-        inst = rtn_tup[1]
+        inst = self._find_instance(iname, inst_repo)
 
         if inst is None:
             raise CIMError(CIM_ERR_NOT_FOUND,
                            'Instance not found in repository namespace %s. '
                            'Path=%s' % (namespace, iname))
-        rtn_inst = deepcopy(inst)
-
-        # If local_only remove properties where class_origin
-        # differs from class of target instance
-        if local_only:
-            for p in rtn_inst:
-                class_origin = rtn_inst.properties[p].class_origin
-                if class_origin and class_origin != inst.classname:
-                    del rtn_inst[p]
 
         # if not repo_lite test against class properties
+        class_pl = None
         if not self._repo_lite and local_only:
             # gets class propertylist which may be local only or all
             # superclasses
@@ -1386,18 +1590,90 @@ class FakedWBEMConnection(WBEMConnection):
 
             class_pl = cl.properties.keys()
 
-            for p in list(rtn_inst):
-                if p not in class_pl:
-                    del rtn_inst[p]
+        return self._copy_instance(inst, property_list, local_only, class_pl,
+                                   include_class_origin, include_qualifiers)
 
-        self._filter_properties(rtn_inst, property_list)
+    @staticmethod
+    def _copy_value(value):
+        """
+        Return a copy of a CIM value that does not share any mutable objects
+        with `value`. Values of immutable types are not copied.
+        """
+        if isinstance(value, list):
+            return [FakedWBEMConnection._copy_value(v) for v in value]
+        if isinstance(value, (CIMInstanceName, CIMInstance, CIMClass)):
+            return deepcopy(value)
+        return value
 
-        if not include_qualifiers:
-            self._remove_qualifiers(rtn_inst)
+    @staticmethod
+    def _copy_instance(inst, property_list, local_only, class_pl,
+                       include_class_origin, include_qualifiers):
+        """
+        Return a copy of an instance from the repository, filtered for the
+        input parameters like localonly, includequalifiers, and propertylist.
+
+        Only the properties and qualifiers that are returned are copied, so
+        the cost does not depend on the data that is filtered out. The copy
+        does not share any mutable objects with the instance in the
+        repository, so the caller may modify it.
+
+        Parameters:
 
-        if not include_class_origin:
-            self._remove_classorigin(rtn_inst)
-        return rtn_inst
+          inst (CIMInstance): The instance in the repository.
+
+          property_list (list of string): Names of the properties to return,
+            or None for all properties.
+
+          local_only (bool): If True, properties whose class_origin differs
+            from the class of the instance are not returned.
+
+          class_pl (list of string): Names of the properties of the class
+            to return, or None for all properties. The properties are
+            filtered by both property_list and class_pl.
+
+          include_class_origin (bool): If False, the class_origin attribute
+            of the properties is not returned.
+
+          include_qualifiers (bool): If False, no qualifiers are returned.
+        """
+        if property_list is not None:
+            property_list = set(p.lower() for p in property_list)
+        if class_pl is not None:
+            class_pl = set(p.lower() for p in class_pl)
+
+        props = []
+        for prop in six.itervalues(inst.properties):
+            # If local_only remove properties where class_origin
+            # differs from class of target instance
+            if local_only and prop.class_origin and \
+                    prop.class_origin != inst.classname:
+                continue
+            pname = prop.name.lower()
+            if class_pl is not None and pname not in class_pl:
+                continue
+            if property_list is not None and pname not in property_list:
+                continue
+            props.append(CIMProperty(
+                prop.name,
+                FakedWBEMConnection._copy_value(prop.value),
+                type=prop.type,
+                class_origin=prop.class_origin if include_class_origin
+                else None,
+                array_size=prop.array_size,
+                propagated=prop.propagated,
+                is_array=prop.is_array,
+                reference_class=prop.reference_class,
+                qualifiers=[deepcopy(q) for q in
+                            six.itervalues(prop.qualifiers)]
+                if include_qualifiers else None,
+                embedded_object=prop.embedded_object))
+
+        quals = [deepcopy(q) for q in six.itervalues(inst.qualifiers)] \
+            if include_qualifiers else None
+
+        # The path setter copies the path
+        return CIMInstance(inst.classname, properties=props,
+                           qualifiers=quals, path=inst.path)
 
     def _get_class_list_enums(self, classname, namespace):
         """ Get class list for the enumerateinstance methods. If conn.lite
@@ -1566,7 +1842,7 @@ class FakedWBEMConnection(WBEMConnection):
                            type(new_class))
 
         if namespace not in self.classes:
-            self.classes[namespace] = NocaseDict({})
+            self.classes[namespace] = ClassRepository()
             if namespace not in self.methods:
                 self.methods[namespace] = NocaseDict()
 
@@ -1726,11 +2002,11 @@ class FakedWBEMConnection(WBEMConnection):
         classnames.append(cname)
 
         # delete all instances and names in this class and subclasses
+        inst_repo = self.instances.get(namespace, None)
         for clname in classnames:
-            if self.instances:
-                inst_names = self.EnumerateInstanceNames(clname, namespace)
-                for iname in inst_names:
-                    self.DeleteInstance(iname)
+            if inst_repo:
+                for inst in list(inst_repo.iter_classes([clname])):
+                    inst_repo.remove(inst.path)
             del class_repo[clname]
 
     ##########################################################
@@ -1940,17 +2216,18 @@ class FakedWBEMConnection(WBEMConnection):
         try:
             # TODO:ks Future use internal function of repo to create namespace
             #         for this repo. ex. _set_instance
-            for inst in self.instances[namespace]:
-                if inst.path == new_instance.path:
-                    raise CIMError(CIM_ERR_ALREADY_EXISTS,
-                                   'NewInstance already exists. %s in '
-                                   'namespace %s.' %
-                                   (new_instance.path, namespace))
-            self.instances[namespace].append(new_instance)
+            inst_repo = self.instances[namespace]
         except KeyError:
-            self.instances[namespace] = [new_instance]
+            self.instances[namespace] = InstanceRepository([new_instance])
             if namespace not in self.methods:
                 self.methods[namespace] = NocaseDict()
+        else:
+            if new_instance.path in inst_repo:
+                raise CIMError(CIM_ERR_ALREADY_EXISTS,
+                               'NewInstance already exists. %s in '
+                               'namespace %s.' %
+                               (new_instance.path, namespace))
+            inst_repo.add(new_instance)
 
         # Create instance returns model path, path relative to namespace
         return self._make_tuple([deepcopy(new_instance.path)])
@@ -2021,12 +2298,11 @@ class FakedWBEMConnection(WBEMConnection):
         if modified_instance.path.namespace is None:
             mod_inst_path.namespace = namespace
 
-        orig_instance_tup = self._find_instance(mod_inst_path, inst_repo)
-        if orig_instance_tup[0] is None:
+        original_instance = self._find_instance(mod_inst_path, inst_repo)
+        if original_instance is None:
             raise CIMError(CIM_ERR_NOT_FOUND,
                            'Original Instance %s not found in namespace %s' %
                            (modified_instance.path, namespace))
-        original_instance = orig_instance_tup[1]
 
         # Remove duplicate properties from property_list
         if property_list:
@@ -2097,8 +2373,8 @@ class FakedWBEMConnection(WBEMConnection):
 
         # Modify the value of properties in the repo with those from
         # modified instance
-        index = orig_instance_tup[0]
-        inst_repo[index].update(modified_instance.properties)
+        inst_repo.update_properties(original_instance.path,
+                                    modified_instance.properties)
         return
 
     def _fake_getinstance(self, namespace, **params):
@@ -2160,22 +2436,9 @@ class FakedWBEMConnection(WBEMConnection):
                                ' Cannot delete instance %s' %
                                (iname.classname, namespace, iname))
 
-        del_inst = None
-        for enum_tup in enumerate(insts_repo):
-            index = enum_tup[0]
-            inst = enum_tup[1]
-            if iname == inst.path:
-                if del_inst is not None:
-                    raise CIMError(CIM_ERR_FAILED, 'Internal Error: Invalid '
-                                   ' Repository. Multiple instances with same '
-                                   ' path %s' % inst.path)
-                # TODO:ks Future remove this test for duplicate inst paths since
-                #       we test for dups on insertion
-                else:
-                    del insts_repo[index]
-                    del_inst = iname
-
-        if not del_inst:
+        try:
+            insts_repo.remove(iname)
+        except KeyError:
             raise CIMError(CIM_ERR_NOT_FOUND, 'Instance %s not found in '
                            'repository namespace %s' % (iname, namespace))
 
@@ -2192,6 +2455,22 @@ class FakedWBEMConnection(WBEMConnection):
 
             CIMError: CIM_ERR_INVALID_NAMESPACE
         """
+        insts, copy_inst = self._enum_instances(namespace, **params)
+
+        return self._make_tuple([copy_inst(inst) for inst in insts])
+
+    def _enum_instances(self, namespace, **params):
+        """
+        Common method for EnumerateInstances and OpenEnumerateInstances that
+        gets the instances from the repository without copying them.
+
+        Returns:
+
+            tuple(list of CIMInstance, function): The instances in the
+            repository (not copies), and a function that returns the copy of
+            such an instance that is to be returned to the client, filtered
+            for the input parameters.
+        """
         inst_repo = self._get_instance_repo(namespace)
 
         cname = params['ClassName']
@@ -2230,14 +2509,19 @@ class FakedWBEMConnection(WBEMConnection):
                     pl = class_pl
                 else:      # reduce pl to properties in class_properties
                     pl = [pc for pc in class_pl if pc in pl]
-        insts = [self._get_instance(inst.path, namespace,
-                                    pl,
-                                    None,  # LocalOnly never gets passed
-                                    params['IncludeClassOrigin'],
-                                    params['IncludeQualifiers'])
-                 for inst in inst_repo if inst.path.classname in clns]
+        ico = params['IncludeClassOrigin']
+        iq = params['IncludeQualifiers']
+
+        def copy_inst(inst):
+            """Return the filtered copy of a repository instance"""
+            return self._copy_instance(inst,
+                                       pl,
+                                       None,  # LocalOnly never gets passed
+                                       None,
+                                       ico,
+                                       iq)
 
-        return self._make_tuple(insts)
+        return list(inst_repo.iter_classes(clns)), copy_inst
 
     def _fake_enumerateinstancenames(self, namespace, **params):
         """
@@ -2247,6 +2531,19 @@ class FakedWBEMConnection(WBEMConnection):
             Get instance names for instances that match the path define
             by `ClassName` and returns a list of the names.
 
+        """
+        inst_paths = self._enum_instance_paths(namespace, **params)
+
+        rtn_paths = [deepcopy(path) for path in inst_paths]
+
+        return self._make_tuple(rtn_paths)
+
+    def _enum_instance_paths(self, namespace, **params):
+        """
+        Common method for EnumerateInstanceNames and
+        OpenEnumerateInstancePaths that returns the list of the instance
+        paths in the repository (not copies) of the instances of the class
+        in the 'ClassName' parameter and its subclasses.
         """
         cname = params['ClassName']
         assert isinstance(cname, CIMClassName)
@@ -2256,12 +2553,7 @@ class FakedWBEMConnection(WBEMConnection):
 
         inst_repo = self._get_instance_repo(namespace)
 
-        inst_paths = [inst.path for inst in inst_repo
-                      if inst.path.classname in clns]
-
-        rtn_paths = [deepcopy(path) for path in inst_paths]
-
-        return self._make_tuple(rtn_paths)
+        return [inst.path for inst in inst_repo.iter_classes(clns)]
 
     def _fake_execquery(self, namespace, **params):
         """
@@ -2282,12 +2574,14 @@ class FakedWBEMConnection(WBEMConnection):
     #####################################################################
 
     @staticmethod
-    def _appendpath_unique(list_, path):
-        """Append path to list if not already in list"""
-        for p in list_:
-            if p == path:
-                return
-        list_.append(path)
+    def _appendpath_unique(list_, path, paths_set):
+        """
+        Append path to list if not already in list. paths_set is the set of
+        the paths in list_, so that the test does not need to scan the list.
+        """
+        if path not in paths_set:
+            paths_set.add(path)
+            list_.append(path)
 
     def _return_assoc_tuple(self, objects):
         """
@@ -2434,21 +2728,19 @@ class FakedWBEMConnection(WBEMConnection):
 
         instname.namespace = namespace
         rtn_instpaths = []
+        rtn_instpaths_set = set()
         role = role.lower() if role else role
-        # TODO:ks FUTURE: Make list from _get_reference_classnames if classes
-        #       exist. Otherwise set list to insts_repo to search every instance
-        for inst in insts_repo:
-            for prop in six.itervalues(inst.properties):
-                if prop.type == 'reference':
-                    # does this prop instance name match target inst name
-                    if prop.value == instname:
-                        if result_class:
-                            if inst.classname not in result_classes:
-                                continue
-                        if role and prop.name.lower() != role:
-                            continue
-
-                        self._appendpath_unique(rtn_instpaths, inst.path)
+        # The reference index of the instance repo has the instances with
+        # reference properties whose value matches the target inst name
+        for inst, prop_name in insts_repo.iter_references(instname):
+            if result_class:
+                if inst.classname not in result_classes:
+                    continue
+            if role and prop_name.lower() != role:
+                continue
+
+            self._appendpath_unique(rtn_instpaths, inst.path,
+                                    rtn_instpaths_set)
 
         return rtn_instpaths
 
@@ -2507,6 +2799,7 @@ class FakedWBEMConnection(WBEMConnection):
 
         inst_name.namespace = namespace
         rtn_instpaths = []
+        rtn_instpaths_set = set()
         role = role.lower() if role else role
         result_role = result_role.lower() if result_role else result_role
 
@@ -2514,7 +2807,7 @@ class FakedWBEMConnection(WBEMConnection):
                                                   assoc_class, role)
         # Get associated instance names
         for ref_path in ref_paths:
-            inst = self._find_instance(ref_path, instance_repo)[1]
+            inst = self._find_instance(ref_path, instance_repo)
             for prop in six.itervalues(inst.properties):
                 if prop.type == 'reference':
                     if prop.value == inst_name:
@@ -2528,7 +2821,8 @@ class FakedWBEMConnection(WBEMConnection):
                             continue
                         if result_role and prop.name.lower() != result_role:
                             continue
-                        self._appendpath_unique(rtn_instpaths, prop.value)
+                        self._appendpath_unique(rtn_instpaths, prop.value,
+                                                rtn_instpaths_set)
 
         return rtn_instpaths
 
@@ -2719,39 +3013,88 @@ class FakedWBEMConnection(WBEMConnection):
 
         return [("IRETURNVALUE", {}, objs), enum_ctxt_tup, eos_tup]
 
-    def _open_response(self, objects, namespace, pull_type, **params):
+    @staticmethod
+    def _next_objects(context_data, max_obj_cnt):
+        """
+        Return the next max_obj_cnt objects of an enumeration context and
+        advance its position. Only these objects are passed through the
+        copy function of the context, so the cost of a pull does not depend
+        on the number of remaining objects.
+        """
+        objects = context_data['data']
+        pos = context_data['pos']
+        end = pos + max_obj_cnt
+        rtn_objs = objects[pos:end]
+        context_data['pos'] = min(end, len(objects))
+        copy_func = context_data['copy_func']
+        if copy_func is not None:
+            rtn_objs = [copy_func(obj) for obj in rtn_objs]
+        return rtn_objs
+
+    @staticmethod
+    def _set_context_expiration(context_data):
+        """
+        Set the expiration time of an enumeration context from its
+        inter-operation timeout, counting from now. A timeout of 0 means that
+        the context does not expire.
+        """
+        timeout = context_data['interoptimeout']
+        context_data['expires'] = time.time() + timeout if timeout else None
+
+    def _expire_enumeration_contexts(self):
+        """
+        Remove the enumeration contexts whose inter-operation timeout has
+        expired, so that contexts that are not closed by the client do not
+        accumulate.
+        """
+        now = time.time()
+        expired = [context_id for context_id, context_data
+                   in six.iteritems(self.enumeration_contexts)
+                   if context_data['expires'] is not None and
+                   context_data['expires'] < now]
+        for context_id in expired:
+            del self.enumeration_contexts[context_id]
+
+    def _open_response(self, objects, namespace, pull_type, copy_func=None,
+                       **params):
         """
         Build an open... response once the objects have been extracted from
         the repository.
+
+        If copy_func is not None, the objects are objects in the repository
+        and copy_func is called for each object when it is returned, to
+        create the copy that is returned to the client. This happens only
+        for the objects returned by this open operation and by each pull
+        operation, so the objects are not all copied upfront.
         """
+        self._expire_enumeration_contexts()
+
         max_obj_cnt = params['MaxObjectCount']
         if max_obj_cnt is None:
             max_obj_cnt = _DEFAULT_MAX_OBJECT_COUNT
 
-        default_server_timeout = 40
-        timeout = default_server_timeout if params['OperationTimeout'] is None \
+        timeout = _DEFAULT_OPERATION_TIMEOUT \
+            if params['OperationTimeout'] is None \
             else params['OperationTimeout']
 
-        if len(objects) <= max_obj_cnt:
+        context_data = {'pull_type': pull_type,
+                        'data': objects,
+                        'pos': 0,
+                        'copy_func': copy_func,
+                        'namespace': namespace,
+                        'interoptimeout': timeout}
+        rtn_objs = self._next_objects(context_data, max_obj_cnt)
+
+        if context_data['pos'] >= len(objects):
             eos = u'TRUE'
             context_id = ""
-            rtn_inst_names = objects
         else:
             eos = u'FALSE'
             context_id = self._create_contextid()
-            # TODO:ks Future. Use the timeout along with response delay. Then
-            # user could timeout pulls. This means adding timer test to
-            # pulls and close. Timer should be used to close old contexts
-            # also.
-            self.enumeration_contexts[context_id] = {'pull_type': pull_type,
-                                                     'data': objects,
-                                                     'namespace': namespace,
-                                                     'time': time.clock(),
-                                                     'interoptimeout': timeout}
-            rtn_inst_names = objects[0:max_obj_cnt]
-            del objects[0: max_obj_cnt]
-
-        return self._make_pull_imethod_resp(rtn_inst_names, eos, context_id)
+            self._set_context_expiration(context_data)
+            self.enumeration_contexts[context_id] = context_data
+
+        return self._make_pull_imethod_resp(rtn_objs, eos, context_id)
 
     def _pull_response(self, namespace, req_type, **params):
         """
@@ -2772,6 +3115,8 @@ class FakedWBEMConnection(WBEMConnection):
         self._get_instance_repo(namespace)
         context_id = params['EnumerationContext']
 
+        self._expire_enumeration_contexts()
+
         try:
             context_data = self.enumeration_contexts[context_id]
         except KeyError:
@@ -2785,21 +3130,19 @@ class FakedWBEMConnection(WBEMConnection):
                            '%s for EnumerationContext %s'
                            % (context_data['pull_type'], req_type, context_id))
 
-        objs_list = context_data['data']
-
         max_obj_cnt = params['MaxObjectCount']
         if not max_obj_cnt:
             max_obj_cnt = _DEFAULT_MAX_OBJECT_COUNT
 
-        if len(objs_list) <= max_obj_cnt:
+        rtn_objs_list = self._next_objects(context_data, max_obj_cnt)
+
+        if context_data['pos'] >= len(context_data['data']):
             eos = u'TRUE'
-            rtn_objs_list = objs_list
             del self.enumeration_contexts[context_id]
             context_id = ""
         else:
             eos = u'FALSE'
-            rtn_objs_list = objs_list[0: max_obj_cnt]
-            del objs_list[0: max_obj_cnt]
+            self._set_context_expiration(context_data)
 
         return self._make_pull_imethod_resp(rtn_objs_list, eos, context_id)
 
@@ -2834,10 +3177,11 @@ class FakedWBEMConnection(WBEMConnection):
         self._get_instance_repo(namespace)
 
         self._validate_open_params(**params)
-        result_t = self._fake_enumerateinstancenames(namespace, **params)
+        inst_paths = self._enum_instance_paths(namespace, **params)
 
-        return self._open_response(result_t[0][2], namespace,
-                                   'PullInstancePaths', **params)
+        return self._open_response(inst_paths, namespace,
+                                   'PullInstancePaths', copy_func=deepcopy,
+                                   **params)
 
     def _fake_openenumerateinstances(self, namespace, **params):
         """
@@ -2848,10 +3192,11 @@ class FakedWBEMConnection(WBEMConnection):
         self._get_instance_repo(namespace)
         self._validate_open_params(**params)
 
-        result_t = self._fake_enumerateinstances(namespace, **params)
+        insts, copy_inst = self._enum_instances(namespace, **params)
 
-        return self._open_response(result_t[0][2], namespace,
-                                   'PullInstancesWithPath', **params)
+        return self._open_response(insts, namespace,
+                                   'PullInstancesWithPath',
+                                   copy_func=copy_inst, **params)
 
     def _fake_openreferenceinstancepaths(self, namespace, **params):
         # pylint: disable=invalid-name
@@ -2982,6 +3327,8 @@ class FakedWBEMConnection(WBEMConnection):
 
         context_id = params['EnumerationContext']
 
+        self._expire_enumeration_contexts()
+
         try:
             context_data = self.enumeration_contexts[context_id]
             # This is probably relatively useless because pywbem handles
@@ -3017,6 +3364,28 @@ class FakedWBEMConnection(WBEMConnection):
         The return is espected to be the same as the return defined by
         WBEMConnection.InvokeMethod (ReturnValue, OutputParameters).
 
+        """
+        return_value, out_params = self._invoke_method_callback(
+            methodname, objectname, Params, **params)
+
+        # Map output params to NocaseDict to be compatible with return
+        # from _methodcall. The input list is just CIMParameters
+        output_params = NocaseDict()
+        for param in out_params:
+            output_params[param.name] = param.value
+
+        return (return_value, output_params)
+
+    def _invoke_method_callback(self, methodname, objectname, Params,
+                                **params):
+        # pylint: disable=invalid-name
+        """
+        Call the method callback function for an InvokeMethod request and
+        validate its result.
+
+        Returns a tuple of the return value and the list of output
+        parameters (as CIMParameter objects) returned by the callback
+        function.
         """
         if isinstance(objectname, (CIMInstanceName, CIMClassName)):
             localobject = deepcopy(objectname)
@@ -3156,10 +3525,4 @@ class FakedWBEMConnection(WBEMConnection):
                                '%s response type. Expected CIMParameter. '
                                % type(param))
 
-        # Map output params to NocaseDict to be compatible with return
-        # from _methodcall. The input list is just CIMParameters
-        output_params = NocaseDict()
-        for param in result[1]:
-            output_params[param.name] = param.value
-
-        return (result[0], output_params)
+        return (result[0], result[1])
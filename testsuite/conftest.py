@@ -0,0 +1,12 @@
+"""
+Pytest configuration for the pywbem testsuite.
+"""
+
+import sys
+
+# pylint: disable=invalid-name
+collect_ignore = []
+
+if sys.version_info[0:2] < (3, 6):
+    # Uses the async/await syntax and asynchronous generators
+    collect_ignore.append('test_async_operations.py')
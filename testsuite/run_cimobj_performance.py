@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+
+"""
+Memory and time benchmarks for CIM instances parsed from CIM-XML, and for
+the hashing and comparison of their instance paths.
+
+The CIM instance has the size of a typical CIM_LogicalDisk instance returned
+by a WBEM server. The memory is measured for the instances as parsed, and
+again after the qualifiers dictionaries of all properties have been accessed
+(which allocates them, as pywbem up to 0.12 did for every property).
+"""
+
+from __future__ import absolute_import, print_function
+import sys as _sys
+import gc
+import timeit
+
+import argparse as _argparse
+import six
+
+from pywbem import CIMInstance, CIMInstanceName, CIMDateTime, Uint16, \
+    Uint32, Uint64
+from pywbem._expatparse import parse_cimxml
+from pywbem.tupleparse import parse_any
+from pywbem.tupletree import xml_to_tupletree_sax
+
+TABLE_FORMAT = '%-45.45s %14s'
+
+
+def logical_disk():
+    """
+    Return a CIM instance with the properties of a typical CIM_LogicalDisk
+    instance.
+    """
+    keys = [
+        ('SystemCreationClassName', u'CIM_ComputerSystem'),
+        ('SystemName', u'host1.acme.com'),
+        ('CreationClassName', u'CIM_LogicalDisk'),
+        ('DeviceID', u'/dev/sda1'),
+    ]
+    props = keys + [
+        ('Name', u'/dev/sda1'),
+        ('ElementName', u'sda1'),
+        ('Caption', u'Logical disk sda1'),
+        ('Description', u'A logical disk of the storage system'),
+        ('InstallDate', CIMDateTime(u'20180101120000.000000+000')),
+        ('OperationalStatus', [Uint16(2)]),
+        ('StatusDescriptions', [u'OK']),
+        ('Status', u'OK'),
+        ('HealthState', Uint16(5)),
+        ('CommunicationStatus', Uint16(2)),
+        ('DetailedStatus', Uint16(1)),
+        ('OperatingStatus', Uint16(16)),
+        ('PrimaryStatus', Uint16(1)),
+        ('EnabledState', Uint16(2)),
+        ('RequestedState', Uint16(12)),
+        ('EnabledDefault', Uint16(2)),
+        ('TimeOfLastStateChange',
+         CIMDateTime(u'20180101120000.000000+000')),
+        ('AvailableRequestedStates', [Uint16(2), Uint16(3)]),
+        ('TransitioningToState', Uint16(12)),
+        ('Availability', Uint16(3)),
+        ('StatusInfo', Uint16(3)),
+        ('PowerManagementSupported', False),
+        ('ErrorCleared', False),
+        ('DataOrganization', Uint16(1)),
+        ('Purpose', u'Data'),
+        ('Access', Uint16(3)),
+        ('ErrorMethodology', u'None'),
+        ('BlockSize', Uint64(512)),
+        ('NumberOfBlocks', Uint64(1953525168)),
+        ('ConsumableBlocks', Uint64(1953525168)),
+        ('IsBasedOnUnderlyingRedundancy', False),
+        ('SequentialAccess', False),
+        ('ExtentStatus', [Uint16(2)]),
+        ('NoSinglePointOfFailure', False),
+        ('DataRedundancy', Uint16(1)),
+        ('PackageRedundancy', Uint16(0)),
+        ('DeltaReservation', Uint32(0)),
+        ('Primordial', False),
+        ('NameFormat', Uint16(12)),
+        ('NameNamespace', Uint16(8)),
+        ('ExtentDiscriminator', [u'SNIA:Composite']),
+    ]
+    path = CIMInstanceName('CIM_LogicalDisk', keybindings=keys)
+    return CIMInstance('CIM_LogicalDisk', properties=props, path=path)
+
+
+def parse_expat(xml_string):
+    """Parse the CIM-XML string with the expat-based parser"""
+    return parse_cimxml(xml_string, 'benchmark')
+
+
+def parse_tupletree(xml_string):
+    """Parse the CIM-XML string with the SAX-based tupletree parser"""
+    return parse_any(xml_to_tupletree_sax(xml_string, 'benchmark'))
+
+
+def memory_per_instance(xml_string, count, touch):
+    """
+    Return the memory in Bytes allocated per CIM instance, when parsing
+    `count` instances from the CIM-XML string. If `touch` is True, the
+    qualifiers dictionaries of the instances and properties are accessed.
+    Returns `None` if the tracemalloc module is not available.
+    """
+    try:
+        import tracemalloc
+    except ImportError:
+        return None
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    insts = [parse_expat(xml_string) for _ in six.moves.range(count)]
+    if touch:
+        for inst in insts:
+            _ = inst.qualifiers
+            for prop in inst.properties.values():
+                _ = prop.qualifiers
+    end = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del insts
+    return float(end - start) / count
+
+
+def run_benchmarks(number, count):
+    """Run the benchmarks and print the results"""
+    inst = logical_disk()
+    xml_string = inst.tocimxmlstr()
+    path = inst.path
+    path2 = path.copy()
+    paths = {path: inst}
+    assert isinstance(parse_expat(xml_string), CIMInstance)
+
+    print('CIM instance with %d properties, %d Bytes of CIM-XML' %
+          (len(inst.properties), len(xml_string)))
+    print(TABLE_FORMAT % ('Benchmark', 'Result'))
+
+    benchmarks = [
+        ('parse with expat (usec/instance)',
+         lambda: parse_expat(xml_string)),
+        ('parse with tupletree (usec/instance)',
+         lambda: parse_tupletree(xml_string)),
+        ('copy() (usec/instance)', inst.copy),
+        ('hash(path) (usec/path)', lambda: hash(path)),
+        ('path == path.copy() (usec/path)', lambda: path == path2),
+        ('dict lookup by path (usec/path)', lambda: paths[path2]),
+    ]
+    for desc, func in benchmarks:
+        best = min(timeit.repeat(func, number=number, repeat=3))
+        print(TABLE_FORMAT % (desc, '%.1f' % (best / number * 1e6)))
+
+    for desc, touch in (('memory as parsed (Bytes/instance)', False),
+                        ('memory with qualifiers (Bytes/instance)', True)):
+        mem = memory_per_instance(xml_string, count, touch)
+        if mem is None:
+            print('Memory: tracemalloc is not available')
+            break
+        print(TABLE_FORMAT % (desc, '%.0f' % mem))
+
+
+def main(prog):
+    """
+    Parse command line arguments and run the benchmarks.
+    """
+    argparser = _argparse.ArgumentParser(
+        prog=prog, description=__doc__)
+    argparser.add_argument(
+        '-n', '--number', dest='number', type=int, default=1000,
+        help='Number of calls per time measurement. Default: 1000')
+    argparser.add_argument(
+        '-c', '--count', dest='count', type=int, default=2000,
+        help='Number of instances for the memory measurement. '
+             'Default: 2000')
+    opts = argparser.parse_args()
+
+    run_benchmarks(opts.number, opts.count)
+
+    return 0
+
+
+if __name__ == '__main__':
+    _sys.exit(main('run_cimobj_performance.py'))
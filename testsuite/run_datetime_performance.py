@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+"""
+Microbenchmarks for the creation of CIMDateTime objects from CIM datetime
+strings, including the fast parsing path, the shared MinutesFromUTC objects
+and the cache of parsed strings (see pywbem.config.CIMDATETIME_CACHE_SIZE).
+"""
+
+from __future__ import absolute_import, print_function
+import sys as _sys
+import timeit
+
+import argparse as _argparse
+
+from pywbem import CIMDateTime, MinutesFromUTC, config
+from pywbem import cim_types
+from pywbem.tupleparse import unpack_string
+
+# pylint: disable=protected-access
+
+TIMESTAMP = u'20140924193040.654321+120'
+INTERVAL = u'12345678224455.654321:000'
+
+TABLE_FORMAT = '%-45.45s %12s'
+
+
+def parse_regex(dtarg):
+    """Parse a timestamp string with the regular expression"""
+    parts = cim_types._DATETIME_PATTERN.search(dtarg).groups()
+    offset = int(parts[8])
+    if parts[7] == '-':
+        offset = -offset
+    return cim_types.datetime(
+        int(parts[0]), int(parts[1]), int(parts[2]), int(parts[3]),
+        int(parts[4]), int(parts[5]), int(parts[6]),
+        cim_types._minutes_from_utc(offset))
+
+
+def set_cache_size(size):
+    """Set the size of the cache of parsed datetime strings"""
+    config.CIMDATETIME_CACHE_SIZE = size
+    cim_types._DATETIME_CACHE.clear()
+
+
+BENCHMARKS = [
+    # (description, cache size, function)
+    ('MinutesFromUTC(120)', 0,
+     lambda: MinutesFromUTC(120)),
+    ('_minutes_from_utc(120) (shared)', 0,
+     lambda: cim_types._minutes_from_utc(120)),
+    ('parse timestamp with regex', 0,
+     lambda: parse_regex(TIMESTAMP)),
+    ('parse timestamp with slices', 0,
+     lambda: cim_types._parse_datetime_fast(TIMESTAMP)),
+    ('CIMDateTime(timestamp string)', 0,
+     lambda: CIMDateTime(TIMESTAMP)),
+    ('CIMDateTime(timestamp string), cached', 1000,
+     lambda: CIMDateTime(TIMESTAMP)),
+    ('CIMDateTime(interval string)', 0,
+     lambda: CIMDateTime(INTERVAL)),
+    ('CIMDateTime(interval string), cached', 1000,
+     lambda: CIMDateTime(INTERVAL)),
+    ('unpack_string(timestamp, datetime)', 0,
+     lambda: unpack_string(TIMESTAMP, 'datetime')),
+    ('unpack_string(timestamp, datetime), cached', 1000,
+     lambda: unpack_string(TIMESTAMP, 'datetime')),
+]
+
+
+def run_benchmarks(number, repeat):
+    """Run the benchmarks and print the best time per call"""
+    print(TABLE_FORMAT % ('Benchmark', 'usec/call'))
+    saved_size = config.CIMDATETIME_CACHE_SIZE
+    try:
+        for desc, cache_size, func in BENCHMARKS:
+            set_cache_size(cache_size)
+            best = min(timeit.repeat(func, number=number, repeat=repeat))
+            print(TABLE_FORMAT % (desc, '%.3f' % (best / number * 1e6)))
+    finally:
+        set_cache_size(saved_size)
+
+
+def main(prog):
+    """
+    Parse command line arguments and run the benchmarks.
+    """
+    argparser = _argparse.ArgumentParser(
+        prog=prog, description=__doc__)
+    argparser.add_argument(
+        '-n', '--number', dest='number', type=int, default=100000,
+        help='Number of calls per measurement. Default: 100000')
+    argparser.add_argument(
+        '-r', '--repeat', dest='repeat', type=int, default=3,
+        help='Number of measurements, of which the best is shown. '
+             'Default: 3')
+    opts = argparser.parse_args()
+
+    run_benchmarks(opts.number, opts.repeat)
+
+    return 0
+
+
+if __name__ == '__main__':
+    _sys.exit(main('run_datetime_performance.py'))
@@ -19,7 +19,7 @@ from argparse import RawTextHelpFormatter
 import getpass as _getpass
 import re
 
-from pywbem import WBEMConnection, Error, Uint64
+from pywbem import WBEMConnection, Error, Uint64, AdaptiveMaxObjectCount
 
 # Pegasus class/namespace to use for test
 TEST_NAMESPACE = "test/TestProvider"
@@ -72,7 +72,18 @@ def run_pull_enum_instances(conn, max_object_count):
     return [len(insts_pulled), op_count]
 
 
-def run_single_test(conn, response_count, response_size, max_obj_cnt_array):
+def run_adaptive_iter_enum_instances(conn, adaptive):
+    """
+    Execute IterEnumerateInstances with an adaptive MaxObjectCount and
+    return the instance count and the MaxObjectCount of each request
+    """
+    insts = list(conn.IterEnumerateInstances(TEST_CLASSNAME,
+                                             MaxObjectCount=adaptive))
+    return [len(insts), adaptive.history]
+
+
+def run_single_test(conn, response_count, response_size, max_obj_cnt_array,
+                    target_time):
     """run a single test for a defined response_count and response size"""
 
     set_provider_parameters(conn, response_count, response_size)
@@ -94,9 +105,23 @@ def run_single_test(conn, response_count, response_size, max_obj_cnt_array):
                               max_obj_cnt, pull_result[1], pull_time,
                               inst_per_sec))
 
+    adaptive = AdaptiveMaxObjectCount(target_time=target_time)
+    pull_start_time = datetime.datetime.now()
+    pull_result = run_adaptive_iter_enum_instances(conn, adaptive)
+    pull_time = datetime.datetime.now() - pull_start_time
+    inst_per_sec = '%06.2f' % (pull_result[0] / pull_time.total_seconds())
+    sizes = pull_result[1]
+
+    print(TABLE_FORMAT % ('Adaptive', pull_result[0], response_size,
+                          max(sizes), len(sizes), pull_time, inst_per_sec))
 
-def run_tests(conn):
-    """Run test based on limits provided"""
+
+def run_tests(conn, target_time):
+    """
+    Run test based on limits provided, comparing fixed MaxObjectCount values
+    against an adaptive MaxObjectCount. For the adaptive case, the MaxObjCnt
+    column shows the largest MaxObjectCount that was used.
+    """
 
     print(TABLE_FORMAT % ('Operation', 'Response', 'RespSize', 'MaxObjCnt',
                           'Request', 'Time', 'inst/sec'))
@@ -105,7 +130,8 @@ def run_tests(conn):
     for response_size in [100, 1000, 10000]:
         for response_count in [1, 100, 1000, 10000, 100000]:
             pull_sizes = [1, 100, 1000]
-            run_single_test(conn, response_count, response_size, pull_sizes)
+            run_single_test(conn, response_count, response_size, pull_sizes,
+                            target_time)
 
 
 def main(prog):
@@ -210,6 +236,12 @@ Examples:
 
     general_arggroup = argparser.add_argument_group(
         'General options')
+    general_arggroup.add_argument(
+        '--target-time', dest='target_time', metavar='seconds', type=float,
+        default=1.0,
+        help='Target time of each open and pull request for the test\n'
+             'with an adaptive MaxObjectCount.\n'
+             'Default: 1.0')
     general_arggroup.add_argument(
         '-v', '--verbose', dest='verbose',
         action='store_true', default=False,
@@ -261,7 +293,7 @@ Examples:
                           x509=x509_dict, ca_certs=opts.ca_certs,
                           timeout=opts.timeout)
 
-    run_tests(conn)
+    run_tests(conn, opts.target_time)
 
     return 0
 
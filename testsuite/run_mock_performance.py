@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+
+"""
+Benchmarks for instance operations against the mock repository of
+pywbem_mock.FakedWBEMConnection, with a configurable number of instances.
+"""
+
+from __future__ import absolute_import, print_function
+import sys as _sys
+import time
+
+import argparse as _argparse
+import six
+
+from pywbem import CIMClass, CIMProperty, CIMQualifier, CIMInstance, \
+    CIMInstanceName, CIMQualifierDeclaration, Uint32
+from pywbem_mock import FakedWBEMConnection
+
+NAMESPACE = 'root/cimv2'
+
+TABLE_FORMAT = '%-45.45s %14s'
+
+
+def setup_conn(count, class_count):
+    """
+    Return a FakedWBEMConnection with a class hierarchy of three classes, and
+    `count` instances evenly distributed across the two subclasses, and an
+    association class with `count` / 2 instances that each associate a pair
+    of these instances.
+
+    In addition, `class_count` classes without instances are created as a
+    tree below the base class with four subclasses per class, to get a
+    class repository with a size similar to a CIM schema.
+    """
+    conn = FakedWBEMConnection(default_namespace=NAMESPACE)
+    conn.add_cimobjects([
+        CIMQualifierDeclaration('Key', 'boolean', value=False,
+                                scopes={'PROPERTY': True}),
+        CIMQualifierDeclaration('Association', 'boolean', value=False,
+                                scopes={'ASSOCIATION': True}),
+    ])
+    key = CIMProperty('Name', None, type='string',
+                      qualifiers=[CIMQualifier('Key', True)])
+    num = CIMProperty('Number', None, type='uint32')
+    conn.add_cimobjects([
+        CIMClass('PERF_Base', properties=[key, num]),
+        CIMClass('PERF_Sub1', superclass='PERF_Base'),
+        CIMClass('PERF_Sub2', superclass='PERF_Base'),
+        CIMClass(
+            'PERF_Assoc',
+            qualifiers=[CIMQualifier('Association', True)],
+            properties=[
+                CIMProperty('Antecedent', None, type='reference',
+                            reference_class='PERF_Base',
+                            qualifiers=[CIMQualifier('Key', True)]),
+                CIMProperty('Dependent', None, type='reference',
+                            reference_class='PERF_Base',
+                            qualifiers=[CIMQualifier('Key', True)]),
+            ]),
+    ])
+    classes = []
+    for i in six.moves.range(class_count):
+        superclass = 'PERF_Cls%d' % (i // 4 - 1) if i >= 4 else 'PERF_Base'
+        classes.append(CIMClass('PERF_Cls%d' % i, superclass=superclass))
+    conn.add_cimobjects(classes)
+    insts = []
+    for i in six.moves.range(count):
+        classname = 'PERF_Sub1' if i % 2 else 'PERF_Sub2'
+        name = 'inst%d' % i
+        path = CIMInstanceName(classname, keybindings={'Name': name},
+                               namespace=NAMESPACE)
+        insts.append(CIMInstance(classname, path=path,
+                                 properties={'Name': name,
+                                             'Number': Uint32(i)}))
+    for i in six.moves.range(0, count - 1, 2):
+        refs = {'Antecedent': insts[i].path, 'Dependent': insts[i + 1].path}
+        path = CIMInstanceName('PERF_Assoc', keybindings=refs,
+                               namespace=NAMESPACE)
+        insts.append(CIMInstance('PERF_Assoc', path=path, properties=refs))
+    conn.add_cimobjects(insts)
+    return conn
+
+
+def timed(func, number):
+    """Call func `number` times, and return the time per call in msec."""
+    start = time.time()
+    for _ in six.moves.range(number):
+        func()
+    return (time.time() - start) / number * 1000
+
+
+def run_benchmarks(count, class_count, number):
+    """Run the benchmarks and print the results"""
+
+    start = time.time()
+    conn = setup_conn(count, class_count)
+    setup_time = time.time() - start
+
+    print('Mock repository with %d instances and %d additional classes' %
+          (count, class_count))
+    print(TABLE_FORMAT % ('Benchmark', 'msec/call'))
+    print(TABLE_FORMAT % ('add_cimobjects (all instances)',
+                          '%.1f' % (setup_time * 1000)))
+
+    path = CIMInstanceName('PERF_Sub1', keybindings={'Name': 'inst1'},
+                           namespace=NAMESPACE)
+    new_inst = CIMInstance('PERF_Sub1', properties={'Name': 'new',
+                                                    'Number': Uint32(0)})
+    new_path = CIMInstanceName('PERF_Sub1', keybindings={'Name': 'new'},
+                               namespace=NAMESPACE)
+
+    def create_delete():
+        """Create and delete an instance"""
+        conn.CreateInstance(new_inst)
+        conn.DeleteInstance(new_path)
+
+    def open_pull_all():
+        """Open an enumeration and pull all instances"""
+        result = conn.OpenEnumerateInstances('PERF_Base', MaxObjectCount=100)
+        while not result.eos:
+            result = conn.PullInstancesWithPath(result.context,
+                                                MaxObjectCount=100)
+
+    def open_close():
+        """Open an enumeration and close it after the first response"""
+        result = conn.OpenEnumerateInstances('PERF_Base', MaxObjectCount=100)
+        conn.CloseEnumeration(result.context)
+
+    benchmarks = [
+        ('GetInstance', number,
+         lambda: conn.GetInstance(path)),
+        ('ModifyInstance', number,
+         lambda: conn.ModifyInstance(CIMInstance(
+             'PERF_Sub1', path=path,
+             properties={'Number': Uint32(42)}))),
+        ('CreateInstance + DeleteInstance', number, create_delete),
+        ('EnumerateInstanceNames(PERF_Sub1)', 1,
+         lambda: conn.EnumerateInstanceNames('PERF_Sub1')),
+        ('EnumerateInstances(PERF_Sub1)', 1,
+         lambda: conn.EnumerateInstances('PERF_Sub1')),
+        ('EnumerateInstances(PERF_Sub1, PropertyList)', 1,
+         lambda: conn.EnumerateInstances('PERF_Sub1',
+                                         PropertyList=['Number'])),
+        ('OpenEnumerateInstances + Pull all', 1, open_pull_all),
+        ('OpenEnumerateInstances + CloseEnumeration', 1, open_close),
+        ('ReferenceNames', number,
+         lambda: conn.ReferenceNames(path)),
+        ('AssociatorNames', number,
+         lambda: conn.AssociatorNames(path)),
+        ('Associators', number,
+         lambda: conn.Associators(path)),
+        ('EnumerateClassNames(DeepInheritance=True)', number,
+         lambda: conn.EnumerateClassNames(DeepInheritance=True)),
+        ('EnumerateClassNames(PERF_Cls0)', number,
+         lambda: conn.EnumerateClassNames(ClassName='PERF_Cls0')),
+    ]
+    for desc, num, func in benchmarks:
+        print(TABLE_FORMAT % (desc, '%.3f' % timed(func, num)))
+
+
+def main(prog):
+    """
+    Parse command line arguments and run the benchmarks.
+    """
+    argparser = _argparse.ArgumentParser(
+        prog=prog, description=__doc__)
+    argparser.add_argument(
+        '-c', '--count', dest='count', type=int, default=10000,
+        help='Number of instances in the mock repository. Default: 10000')
+    argparser.add_argument(
+        '-k', '--classes', dest='class_count', type=int, default=1500,
+        help='Number of additional classes in the mock repository. '
+        'Default: 1500')
+    argparser.add_argument(
+        '-n', '--number', dest='number', type=int, default=100,
+        help='Number of calls per measurement. Default: 100')
+    opts = argparser.parse_args()
+
+    run_benchmarks(opts.count, opts.class_count, opts.number)
+
+    return 0
+
+
+if __name__ == '__main__':
+    _sys.exit(main('run_mock_performance.py'))
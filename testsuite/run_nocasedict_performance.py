@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+
+"""
+Memory and lookup benchmarks for NocaseDict.
+
+The NocaseDict implementation of pywbem is compared against a reference
+implementation with the data layout that was used up to pywbem 0.12 (an
+OrderedDict with tuples of original key and value, and a __dict__ per
+object).
+"""
+
+from __future__ import absolute_import, print_function
+import sys as _sys
+import gc
+import timeit
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ordereddict import OrderedDict
+
+import argparse as _argparse
+import six
+
+from pywbem._nocasedict import NocaseDict
+
+# Property names of a typical CIM instance
+KEYS = ['CreationClassName', 'Name', 'ElementName', 'Caption',
+        'Description', 'InstallDate', 'OperationalStatus', 'StatusDescriptions',
+        'Status', 'HealthState', 'EnabledState', 'RequestedState']
+
+TABLE_FORMAT = '%-40.40s %14s %14s'
+
+
+class ReferenceNocaseDict(object):
+    """
+    The data layout and the lookup of NocaseDict up to pywbem 0.12, for
+    comparison.
+    """
+
+    def __init__(self, items=None):
+        self._data = OrderedDict()
+        self.allow_unnamed_keys = False
+        if items:
+            for item in items:
+                try:
+                    key = item.name
+                    value = item
+                except AttributeError:
+                    key, value = item
+                self[key] = value
+
+    def _real_key(self, key):
+        if isinstance(key, six.string_types):
+            return key.lower()
+        elif self.allow_unnamed_keys and key is None:
+            return None
+        raise TypeError("NocaseDict key %r must be a string, but is %s" %
+                        (key, type(key)))
+
+    def __getitem__(self, key):
+        k = self._real_key(key)
+        try:
+            return self._data[k][1]
+        except KeyError:
+            raise KeyError('Key %r not found' % key)
+
+    def __setitem__(self, key, value):
+        k = self._real_key(key)
+        self._data[k] = (key, value)
+
+    def __contains__(self, key):
+        return self._real_key(key) in self._data
+
+    def iteritems(self):
+        """Iterate through the items."""
+        for item in six.iteritems(self._data):
+            yield item[1]
+
+
+def memory_per_dict(dict_class, count):
+    """
+    Return the memory in Bytes allocated per dictionary, when creating
+    `count` dictionaries with the keys in KEYS. Returns `None` if the
+    tracemalloc module is not available.
+    """
+    try:
+        import tracemalloc
+    except ImportError:
+        return None
+    items = [(key, None) for key in KEYS]
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    dicts = [dict_class(items) for _ in six.moves.range(count)]
+    end = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del dicts
+    return float(end - start) / count
+
+
+def run_benchmarks(number, count):
+    """Run the benchmarks and print the results"""
+    items = [(key, None) for key in KEYS]
+    new = NocaseDict(items)
+    ref = ReferenceNocaseDict(items)
+
+    benchmarks = [
+        ('getitem (same case)', lambda d: d['ElementName']),
+        ('getitem (different case)', lambda d: d['elementname']),
+        ('contains', lambda d: 'Status' in d),
+        ('setitem (existing key)', lambda d: d.__setitem__('Name', 'x')),
+        ('iteritems', lambda d: list(d.iteritems())),
+        ('init from list', lambda d: d.__class__(items)),
+    ]
+
+    print(TABLE_FORMAT % ('Benchmark (usec/call)', 'NocaseDict',
+                          'Reference'))
+    for desc, func in benchmarks:
+        times = []
+        for obj in (new, ref):
+            best = min(timeit.repeat(lambda: func(obj), number=number,
+                                     repeat=3))
+            times.append('%.3f' % (best / number * 1e6))
+        print(TABLE_FORMAT % (desc, times[0], times[1]))
+
+    mem_new = memory_per_dict(NocaseDict, count)
+    mem_ref = memory_per_dict(ReferenceNocaseDict, count)
+    if mem_new is None:
+        print('Memory: tracemalloc is not available')
+    else:
+        print(TABLE_FORMAT % ('Memory (Bytes/dict, %d keys)' % len(KEYS),
+                              '%.0f' % mem_new, '%.0f' % mem_ref))
+
+
+def main(prog):
+    """
+    Parse command line arguments and run the benchmarks.
+    """
+    argparser = _argparse.ArgumentParser(
+        prog=prog, description=__doc__)
+    argparser.add_argument(
+        '-n', '--number', dest='number', type=int, default=100000,
+        help='Number of calls per time measurement. Default: 100000')
+    argparser.add_argument(
+        '-c', '--count', dest='count', type=int, default=10000,
+        help='Number of dictionaries for the memory measurement. '
+             'Default: 10000')
+    opts = argparser.parse_args()
+
+    run_benchmarks(opts.number, opts.count)
+
+    return 0
+
+
+if __name__ == '__main__':
+    _sys.exit(main('run_nocasedict_performance.py'))
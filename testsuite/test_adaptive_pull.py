@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+Test the AdaptiveMaxObjectCount class.
+"""
+
+from __future__ import print_function, absolute_import
+
+import pytest
+
+from pywbem import AdaptiveMaxObjectCount
+
+
+class TestAdaptiveMaxObjectCount(object):
+    """Test the adjustment of the MaxObjectCount."""
+
+    def test_init(self):
+        """Test the initial state."""
+        adaptive = AdaptiveMaxObjectCount(initial=20)
+        assert adaptive.max_object_count == 20
+        assert adaptive.history == []
+        assert adaptive.target_time == 1.0
+        assert adaptive.target_reply_len is None
+        assert 'max_object_count=20' in repr(adaptive)
+
+    @pytest.mark.parametrize(
+        'kwargs', [
+            dict(target_time=0),
+            dict(target_reply_len=0),
+            dict(minimum=0),
+            dict(minimum=10, maximum=5, initial=5),
+            dict(initial=20000),
+            dict(max_factor=1),
+        ])
+    def test_init_invalid(self, kwargs):
+        """Test invalid init parameters."""
+        with pytest.raises(ValueError):
+            AdaptiveMaxObjectCount(**kwargs)
+
+    def test_grow_to_target_time(self):
+        """Test that the count grows by at most max_factor to the target."""
+        adaptive = AdaptiveMaxObjectCount(target_time=1.0, initial=10)
+        # 1 ms per object: 1000 objects for the target time
+        assert adaptive.update(10, 0.01, 1000) == 40
+        assert adaptive.update(40, 0.04, 4000) == 160
+        assert adaptive.update(160, 0.16, 16000) == 640
+        assert adaptive.update(640, 0.64, 64000) == 1000
+        assert adaptive.update(1000, 1.0, 100000) == 1000
+        assert adaptive.history == [10, 40, 160, 640, 1000]
+
+    def test_shrink(self):
+        """Test that the count shrinks when the operations are too slow."""
+        adaptive = AdaptiveMaxObjectCount(target_time=1.0, initial=1000)
+        # 10 ms per object: 100 objects for the target time
+        assert adaptive.update(1000, 10.0, 1000) == 250
+        assert adaptive.update(250, 2.5, 1000) == 100
+
+    def test_server_time(self):
+        """Test that the fixed time is derived from the server time."""
+        adaptive = AdaptiveMaxObjectCount(target_time=1.0, initial=100,
+                                          max_factor=100)
+        # 0.5 s fixed time, 1 ms per object on the server
+        assert adaptive.update(100, 0.6, 1000, server_time=0.1) == 500
+
+    def test_target_reply_len(self):
+        """Test that the count is limited by the target reply size."""
+        adaptive = AdaptiveMaxObjectCount(target_reply_len=5000, initial=10)
+        assert adaptive.update(10, 0.001, 1000) == 40
+        assert adaptive.update(40, 0.004, 4000) == 50
+
+    def test_limits(self):
+        """Test that the count stays within minimum and maximum."""
+        adaptive = AdaptiveMaxObjectCount(initial=10, minimum=5, maximum=30)
+        assert adaptive.update(10, 0.001, 100) == 30
+        adaptive = AdaptiveMaxObjectCount(initial=10, minimum=5, maximum=30)
+        assert adaptive.update(10, 100.0, 100) == 5
+
+    def test_no_objects(self):
+        """Test that the count grows if no objects were returned."""
+        adaptive = AdaptiveMaxObjectCount(initial=10)
+        assert adaptive.update(0, 1.0, 100) == 40
+
+    def test_reset(self):
+        """Test that reset() restores the initial state."""
+        adaptive = AdaptiveMaxObjectCount(initial=10)
+        adaptive.update(10, 0.01, 1000)
+        adaptive.reset()
+        assert adaptive.max_object_count == 10
+        assert adaptive.history == []
@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+
+"""
+Tests for AsyncWBEMConnection (`_async_operations` in pywbem module), using
+a local HTTP server.
+"""
+
+from __future__ import absolute_import, print_function
+
+import asyncio
+import threading
+import time
+import zlib
+import pytest
+
+from six.moves import BaseHTTPServer, socketserver
+
+from pywbem import AsyncWBEMConnection, CIMInstanceName, CIMError, \
+    AuthError, TimeoutError, CIM_ERR_NOT_SUPPORTED, AdaptiveMaxObjectCount
+
+RESPONSE_HEAD = b"""<?xml version="1.0" encoding="utf-8" ?>
+<CIM CIMVERSION="2.0" DTDVERSION="2.0">
+<MESSAGE ID="1001" PROTOCOLVERSION="1.0">
+<SIMPLERSP>
+"""
+
+RESPONSE_TAIL = b"""</SIMPLERSP>
+</MESSAGE>
+</CIM>
+"""
+
+NAMED_INSTANCE = b"""<VALUE.NAMEDINSTANCE>
+<INSTANCENAME CLASSNAME="PyWBEM_Person">
+<KEYBINDING NAME="Name"><KEYVALUE VALUETYPE="string">%d</KEYVALUE></KEYBINDING>
+</INSTANCENAME>
+<INSTANCE CLASSNAME="PyWBEM_Person">
+<PROPERTY NAME="Name" TYPE="string"><VALUE>%d</VALUE></PROPERTY>
+</INSTANCE>
+</VALUE.NAMEDINSTANCE>
+"""
+
+INSTANCE_WITH_PATH = b"""<VALUE.INSTANCEWITHPATH>
+<INSTANCEPATH>
+<NAMESPACEPATH><HOST>fred</HOST>
+<LOCALNAMESPACEPATH><NAMESPACE NAME="root"/><NAMESPACE NAME="cimv2"/>
+</LOCALNAMESPACEPATH></NAMESPACEPATH>
+<INSTANCENAME CLASSNAME="PyWBEM_Person">
+<KEYBINDING NAME="Name"><KEYVALUE VALUETYPE="string">%d</KEYVALUE></KEYBINDING>
+</INSTANCENAME>
+</INSTANCEPATH>
+<INSTANCE CLASSNAME="PyWBEM_Person">
+<PROPERTY NAME="Name" TYPE="string"><VALUE>%d</VALUE></PROPERTY>
+</INSTANCE>
+</VALUE.INSTANCEWITHPATH>
+"""
+
+PULL_PARAMS = b"""\
+<PARAMVALUE NAME="EndOfSequence"><VALUE>%s</VALUE></PARAMVALUE>
+<PARAMVALUE NAME="EnumerationContext"><VALUE>%s</VALUE></PARAMVALUE>
+"""
+
+
+def imethod_response(method, body):
+    """Return a CIM-XML response for an intrinsic operation."""
+    return RESPONSE_HEAD + \
+        b'<IMETHODRESPONSE NAME="' + method.encode('ascii') + b'">\n' + \
+        body + b'</IMETHODRESPONSE>\n' + RESPONSE_TAIL
+
+
+def error_response(method, code):
+    """Return a CIM-XML response with an ERROR element."""
+    return imethod_response(method, b'<ERROR CODE="%d"/>\n' % code)
+
+
+class OperationHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """
+    HTTP request handler that returns responses for a few CIM operations,
+    depending on the CIMMethod header field of the request.
+
+    EnumerateInstances returns the number of instances set in the server.
+    The pull operations return two instances per response, on an
+    enumeration with four instances. If the server has `pull` set to False,
+    the pull operations fail with CIM_ERR_NOT_SUPPORTED.
+    """
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Respond to a POST request."""
+        length = int(self.headers.get('Content-length', 0))
+        self.rfile.read(length)
+        self.server.requests.append(self.headers)
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        if self.server.status != 200:
+            self.send_response(self.server.status)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        method = self.headers.get('CIMMethod')
+        if method == 'EnumerateInstances':
+            body = imethod_response(method, b'<IRETURNVALUE>\n' + b''.join(
+                [NAMED_INSTANCE % (i, i)
+                 for i in range(self.server.inst_count)]) +
+                                    b'</IRETURNVALUE>\n')
+        elif method in ('OpenEnumerateInstances', 'PullInstancesWithPath') \
+                and not self.server.pull:
+            body = error_response(method, CIM_ERR_NOT_SUPPORTED)
+        elif method == 'OpenEnumerateInstances':
+            body = imethod_response(
+                method, b'<IRETURNVALUE>\n' + INSTANCE_WITH_PATH % (0, 0) +
+                INSTANCE_WITH_PATH % (1, 1) + b'</IRETURNVALUE>\n' +
+                PULL_PARAMS % (b'FALSE', b'ctx1'))
+        elif method == 'PullInstancesWithPath':
+            body = imethod_response(
+                method, b'<IRETURNVALUE>\n' + INSTANCE_WITH_PATH % (2, 2) +
+                INSTANCE_WITH_PATH % (3, 3) + b'</IRETURNVALUE>\n' +
+                PULL_PARAMS % (b'TRUE', b''))
+        elif method == 'CloseEnumeration':
+            body = imethod_response(method, b'')
+        elif method == 'Reset':
+            body = RESPONSE_HEAD + \
+                b'<METHODRESPONSE NAME="Reset">\n' \
+                b'<RETURNVALUE PARAMTYPE="uint32"><VALUE>0</VALUE>' \
+                b'</RETURNVALUE>\n' \
+                b'<PARAMVALUE NAME="Count" PARAMTYPE="uint32"><VALUE>7' \
+                b'</VALUE></PARAMVALUE>\n' \
+                b'</METHODRESPONSE>\n' + RESPONSE_TAIL
+        else:
+            body = error_response(method, 6)
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/xml; charset="utf-8"')
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = zlib.compress(body)
+            self.send_header('Content-Encoding', 'deflate')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class ThreadingHTTPServer(socketserver.ThreadingMixIn,
+                          BaseHTTPServer.HTTPServer):
+    """HTTP server that handles each request in a separate thread."""
+    daemon_threads = True
+
+
+class TestAsyncOperations(object):
+    """
+    Test the operations of AsyncWBEMConnection against a local HTTP server.
+    """
+
+    def setup_method(self):
+        """Start the HTTP server and create an event loop."""
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), OperationHandler)
+        self.server.inst_count = 5
+        self.server.pull = True
+        self.server.status = 200
+        self.server.delay = 0
+        self.server.requests = []
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        self.url = 'http://127.0.0.1:%s' % self.server.server_address[1]
+        self.loop = asyncio.new_event_loop()
+
+    def teardown_method(self):
+        """Stop the HTTP server and close the event loop."""
+        self.loop.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def run(self, coro):
+        """Run a coroutine in the event loop of the test."""
+        return self.loop.run_until_complete(coro)
+
+    def test_enumerate_instances(self):
+        """Test concurrent EnumerateInstances operations."""
+        conn = AsyncWBEMConnection(self.url, ('user', 'pw'),
+                                   stats_enabled=True, timeout=10)
+
+        async def enumerate_all():
+            """Perform the operations concurrently."""
+            return await asyncio.gather(
+                *[conn.EnumerateInstances('PyWBEM_Person', 'root/cimv2')
+                  for _ in range(5)])
+
+        results = self.run(enumerate_all())
+
+        assert len(results) == 5
+        for instances in results:
+            assert len(instances) == 5
+            assert instances[4]['Name'] == u'4'
+            assert instances[0].path.namespace == 'root/cimv2'
+        headers = self.server.requests[0]
+        assert headers['CIMMethod'] == 'EnumerateInstances'
+        assert headers['Authorization'].startswith('Basic ')
+
+        stats = conn.statistics.get_op_statistic('EnumerateInstances')
+        assert stats.count == 5
+        assert stats.exception_count == 0
+        assert stats.avg_reply_len == conn.last_reply_len
+        assert conn.last_operation_time is not None
+
+    def test_compression(self):
+        """Test that a compressed response is decompressed."""
+        self.server.inst_count = 50
+        conn = AsyncWBEMConnection(self.url, compression=True,
+                                   stats_enabled=True, timeout=10)
+        instances = self.run(conn.EnumerateInstances('PyWBEM_Person'))
+        assert len(instances) == 50
+
+        stats = conn.statistics.get_op_statistic('EnumerateInstances')
+        assert stats.avg_reply_wire_len < stats.avg_reply_len / 2
+
+    def test_cim_error(self):
+        """Test that an ERROR element is raised as CIMError."""
+        conn = AsyncWBEMConnection(self.url, stats_enabled=True, timeout=10)
+        with pytest.raises(CIMError) as exc_info:
+            self.run(conn.GetInstance(
+                CIMInstanceName('PyWBEM_Person', {'Name': 'x'})))
+        assert exc_info.value.status_code == 6
+
+        stats = conn.statistics.get_op_statistic('GetInstance')
+        assert stats.count == 1
+        assert stats.exception_count == 1
+
+    def test_auth_error(self):
+        """Test that HTTP status 401 is raised as AuthError."""
+        self.server.status = 401
+        conn = AsyncWBEMConnection(self.url, ('user', 'pw'), timeout=10)
+        with pytest.raises(AuthError):
+            self.run(conn.EnumerateInstances('PyWBEM_Person'))
+
+    def test_timeout(self):
+        """Test that the timeout applies to the operation."""
+        self.server.delay = 2
+        conn = AsyncWBEMConnection(self.url, timeout=0.5)
+        with pytest.raises(TimeoutError):
+            self.run(conn.EnumerateInstances('PyWBEM_Person'))
+
+    def test_invoke_method(self):
+        """Test InvokeMethod."""
+        conn = AsyncWBEMConnection(self.url, timeout=10)
+        result = self.run(conn.InvokeMethod('Reset', 'PyWBEM_Person'))
+        assert result[0] == 0
+        assert result[1]['Count'] == 7
+
+    @pytest.mark.parametrize('pull', [True, False])
+    def test_iter_enumerate_instances(self, pull):
+        """
+        Test IterEnumerateInstances with pull operations, and with the
+        fallback to EnumerateInstances.
+        """
+        self.server.pull = pull
+        self.server.inst_count = 4
+        conn = AsyncWBEMConnection(self.url, use_pull_operations=None,
+                                   timeout=10)
+
+        async def collect():
+            """Collect the instances of the asynchronous generator."""
+            return [inst async for inst in
+                    conn.IterEnumerateInstances('PyWBEM_Person',
+                                                MaxObjectCount=2)]
+
+        instances = self.run(collect())
+        assert [inst['Name'] for inst in instances] == \
+            [u'0', u'1', u'2', u'3']
+        assert instances[3].path.namespace == 'root/cimv2'
+        if pull:
+            methods = ['OpenEnumerateInstances', 'PullInstancesWithPath']
+        else:
+            methods = ['OpenEnumerateInstances', 'EnumerateInstances']
+            assert instances[3].path.host == '127.0.0.1'
+        assert [r['CIMMethod'] for r in self.server.requests] == methods
+
+    def test_iter_adaptive(self):
+        """
+        Test that the Iter methods reject an AdaptiveMaxObjectCount object.
+        """
+        conn = AsyncWBEMConnection(self.url, use_pull_operations=True,
+                                   timeout=10)
+        with pytest.raises(ValueError):
+            conn.IterEnumerateInstances(
+                'PyWBEM_Person', MaxObjectCount=AdaptiveMaxObjectCount())
+        with pytest.raises(ValueError):
+            self.run(conn.IterQueryInstances(
+                'DMTF:FQL', 'Name > 0',
+                MaxObjectCount=AdaptiveMaxObjectCount()))
+        assert self.server.requests == []
+
+    def test_iter_close(self):
+        """
+        Test that closing the generator of IterEnumerateInstances closes an
+        open enumeration.
+        """
+        conn = AsyncWBEMConnection(self.url, use_pull_operations=True,
+                                   timeout=10)
+
+        async def first():
+            """Get the first instance and close the generator."""
+            gen = conn.IterEnumerateInstances('PyWBEM_Person',
+                                              MaxObjectCount=2)
+            inst = await gen.__anext__()
+            await gen.aclose()
+            return inst
+
+        inst = self.run(first())
+        assert inst['Name'] == u'0'
+        assert [r['CIMMethod'] for r in self.server.requests] == \
+            ['OpenEnumerateInstances', 'CloseEnumeration']
@@ -4,9 +4,16 @@
 
 from __future__ import absolute_import
 
+import socket
+import struct
+import threading
+import time
 import unittest
+import zlib
 
-from pywbem import cim_http
+from six.moves import BaseHTTPServer
+
+from pywbem import cim_http, Statistics, ParseError, ConnectionError
 
 
 class Parse_url(unittest.TestCase):  # pylint: disable=invalid-name
@@ -348,5 +355,214 @@ class Parse_url(unittest.TestCase):  # pylint: disable=invalid-name
             pass
 
 
+class KeepAliveHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """
+    HTTP/1.1 request handler for the connection pool tests, that counts the
+    TCP connections it sees and can be told to close the connection after
+    each response.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+        self.server.conn_count += 1
+        self.request_count = 0
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Respond to a POST request with a fixed body."""
+        length = int(self.headers.get('Content-length', 0))
+        self.rfile.read(length)
+        self.server.post_count += 1
+        self.request_count += 1
+        if self.request_count > 1 and \
+                self.server.mode in ('drop_reused', 'reset_reused'):
+            # Close the reused connection after reading the request,
+            # without a response
+            if self.server.mode == 'reset_reused':
+                self.connection.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_LINGER,
+                    struct.pack('ii', 1, 0))
+            self.close_connection = True
+            return
+        body = b'<CIM/>'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        if self.server.mode == 'close_header':
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+        if self.server.mode == 'close_silently':
+            self.close_connection = True
+
+    def finish(self):
+        BaseHTTPServer.BaseHTTPRequestHandler.finish(self)
+        self.server.closed_count += 1
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class HTTPConnectionPoolTests(unittest.TestCase):
+    """
+    Test wbem_request() with a pool of persistent HTTP connections.
+    """
+
+    def setUp(self):
+        self.server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0),
+                                                KeepAliveHandler)
+        self.server.conn_count = 0
+        self.server.closed_count = 0
+        self.server.post_count = 0
+        self.server.mode = 'keep_alive'
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        self.url = 'http://127.0.0.1:%s' % self.server.server_address[1]
+        self.statistics = Statistics(enable=True)
+        self.pool = cim_http.HTTPConnectionPool(2, self.statistics)
+
+    def tearDown(self):
+        self.pool.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _request(self, count, idempotent=False):
+        """Issue count requests using the pool."""
+        for _ in range(count):
+            body, _ = cim_http.wbem_request(
+                self.url, '<CIM/>', None, [('CIMOperation', 'MethodCall')],
+                timeout=10, conn_pool=self.pool, idempotent=idempotent)
+            self.assertEqual(body, b'<CIM/>')
+
+    def test_reuse(self):
+        """Test that subsequent requests reuse the same connection."""
+        self._request(3)
+        self.assertEqual(self.server.conn_count, 1)
+        self.assertEqual(self.statistics.conn_created_count, 1)
+        self.assertEqual(self.statistics.conn_reused_count, 2)
+        self.assertEqual(self.pool.size, 1)
+
+    def test_connection_close_header(self):
+        """Test that 'Connection: close' from the server is honored."""
+        self.server.mode = 'close_header'
+        self._request(3)
+        self.assertEqual(self.server.conn_count, 3)
+        self.assertEqual(self.statistics.conn_created_count, 3)
+        self.assertEqual(self.statistics.conn_reused_count, 0)
+        self.assertEqual(self.pool.size, 0)
+
+    def _wait_closed(self, count):
+        """Wait until the server has closed count connections."""
+        deadline = time.time() + 10
+        while self.server.closed_count < count:
+            self.assertLess(time.time(), deadline)
+            time.sleep(0.01)
+
+    def test_stale_connection(self):
+        """Test that idle connections closed by the server are replaced."""
+        self.server.mode = 'close_silently'
+        for i in range(3):
+            self._request(1)
+            # Make sure the pooled connection is detected as closed
+            self._wait_closed(i + 1)
+        self.assertEqual(self.server.conn_count, 3)
+        self.assertEqual(self.statistics.conn_created_count, 3)
+        self.assertEqual(self.statistics.conn_reused_count, 0)
+
+    def test_closed_after_request(self):
+        """
+        Test that a request that was sent completely on a reused connection
+        that the server then closed without a response is sent again only
+        if it is idempotent.
+        """
+        for mode in ('drop_reused', 'reset_reused'):
+            self.server.mode = mode
+            self.server.post_count = 0
+            self.pool.close()
+            self._request(1)
+            with self.assertRaises(ConnectionError):
+                self._request(1)
+            self.assertEqual(self.server.post_count, 2)
+
+            self._request(1)
+            self._request(1, idempotent=True)
+            self.assertEqual(self.server.post_count, 5)
+
+    def test_reconnected(self):
+        """Test that a reconnected connection is counted as created."""
+        client_sock, server_sock = socket.socketpair()
+
+        class Client(object):
+            # pylint: disable=too-few-public-methods
+            """Idle HTTP connection with a live socket."""
+            sock = client_sock
+
+            @staticmethod
+            def close():
+                """Close the socket."""
+                client_sock.close()
+
+        try:
+            self.pool.put('key', Client())
+            self.assertIsNotNone(self.pool.get('key'))
+            self.assertEqual(self.statistics.conn_reused_count, 1)
+            self.pool.reconnected()
+            self.assertEqual(self.statistics.conn_created_count, 1)
+            self.assertEqual(self.statistics.conn_reused_count, 0)
+        finally:
+            client_sock.close()
+            server_sock.close()
+
+    def test_close(self):
+        """Test that close() empties the pool."""
+        self._request(1)
+        self.assertEqual(self.pool.size, 1)
+        self.pool.close()
+        self.assertEqual(self.pool.size, 0)
+        self._request(1)
+        self.assertEqual(self.server.conn_count, 2)
+
+    def test_invalid_size(self):
+        """Test that an invalid pool size is rejected."""
+        with self.assertRaises(ValueError):
+            cim_http.HTTPConnectionPool(0)
+
+
+class ContentEncodingTests(unittest.TestCase):
+    """
+    Test the decoding and encoding of compressed HTTP bodies.
+    """
+
+    data = b'<CIM>' + b'<VALUE>abc</VALUE>' * 100 + b'</CIM>'
+
+    def test_gzip_roundtrip(self):
+        """Test that gzip_content() output is decoded by decode_content()."""
+        body = cim_http.gzip_content(self.data)
+        self.assertTrue(len(body) < len(self.data))
+        self.assertEqual(cim_http.decode_content(body, 'gzip'), self.data)
+        self.assertEqual(cim_http.decode_content(body, 'X-GZIP'), self.data)
+
+    def test_deflate(self):
+        """Test decoding of deflate in zlib format and in raw format."""
+        body = zlib.compress(self.data)
+        self.assertEqual(cim_http.decode_content(body, 'deflate'), self.data)
+        compobj = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+        body = compobj.compress(self.data) + compobj.flush()
+        self.assertEqual(cim_http.decode_content(body, 'deflate'), self.data)
+
+    def test_identity(self):
+        """Test that unencoded bodies are returned unchanged."""
+        self.assertEqual(cim_http.decode_content(self.data, None), self.data)
+        self.assertEqual(cim_http.decode_content(self.data, 'identity'),
+                         self.data)
+
+    def test_invalid(self):
+        """Test unsupported encodings and invalid encoded data."""
+        with self.assertRaises(ParseError):
+            cim_http.decode_content(self.data, 'br')
+        with self.assertRaises(ParseError):
+            cim_http.decode_content(self.data, 'gzip')
+
+
 if __name__ == '__main__':
     unittest.main()
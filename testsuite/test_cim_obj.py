@@ -13,6 +13,8 @@ import sys
 import re
 import inspect
 import os.path
+import copy
+import pickle
 from datetime import timedelta, datetime
 import warnings
 import unittest2 as unittest  # we use assertRaises(exc) introduced in py27
@@ -28,6 +30,7 @@ from pywbem import CIMInstance, CIMInstanceName, CIMClass, CIMClassName, \
     CIMQualifierDeclaration, Uint8, Uint16, Uint32, Uint64, Sint8, Sint16, \
     Sint32, Sint64, Real32, Real64, CIMDateTime, tocimobj, MinutesFromUTC, \
     __version__
+from pywbem import config
 from pywbem._nocasedict import NocaseDict
 from pywbem.cim_types import _Longint
 from pywbem.cim_obj import mofstr, MOF_INDENT, MAX_MOF_LINE
@@ -1619,6 +1622,74 @@ def test_CIMInstanceName_hash(testcase,
         assert hash1 != hash2
 
 
+@pytest.mark.parametrize(
+    "modify", [
+        lambda p: setattr(p, 'classname', 'CIM_Bar'),
+        lambda p: setattr(p, 'namespace', 'root/bar'),
+        lambda p: setattr(p, 'host', 'bar.com'),
+        lambda p: setattr(p, 'keybindings', {'Name': 'bar'}),
+        lambda p: p.keybindings.__setitem__('Name', 'bar'),
+        lambda p: p.__setitem__('Name2', 'foo'),
+        lambda p: p.keybindings.__delitem__('Name'),
+        lambda p: p.keybindings.clear(),
+        lambda p: p.update(Name='bar'),
+    ])
+def test_CIMInstanceName_hash_cached(modify):
+    """
+    Test that the cached hash value of CIMInstanceName and its comparison key
+    are invalidated by modifications.
+    """
+    path = CIMInstanceName('CIM_Foo', keybindings={'Name': 'foo'},
+                           namespace='root/foo', host='foo.com')
+    org_path = path.copy()
+    org_hash = hash(path)
+    assert hash(path) == org_hash
+    assert path == org_path
+
+    modify(path)
+
+    assert path != org_path
+    assert hash(path) != org_hash
+    assert hash(path) == hash(path.copy())
+    assert path == path.copy()
+
+
+def test_CIMInstanceName_hash_nested():
+    """
+    Test that the hash value and comparison of CIMInstanceName reflect
+    modifications of a CIMInstanceName used as a keybinding value.
+    """
+    ref = CIMInstanceName('CIM_Foo', keybindings={'Name': 'foo'})
+    path = CIMInstanceName('CIM_FooAssoc', keybindings={'Ref': ref})
+    org_path = CIMInstanceName('CIM_FooAssoc', keybindings={'Ref': ref.copy()})
+    org_hash = hash(path)
+    assert path == org_path
+    assert hash(path) == org_hash
+
+    ref['Name'] = 'bar'
+
+    assert path != org_path
+    assert hash(path) != org_hash
+    assert path == path.copy()
+    assert hash(path) == hash(path.copy())
+
+
+def test_CIMInstanceName_hash_pickled():
+    """
+    Test that the cached hash value of CIMInstanceName is not pickled.
+    """
+    path = CIMInstanceName('CIM_Foo', keybindings={'Name': 'foo'})
+    hash(path)
+    state = path.__getstate__()
+    assert state['_hash'] is None
+    assert state['_cmp_key'] is None
+    path2 = pickle.loads(pickle.dumps(path))
+    assert path2 == path
+    assert hash(path2) == hash(path)
+    path2['Name'] = 'bar'
+    assert path2 != path
+
+
 TESTCASES_CIMINSTANCENAME_REPR = [
 
     # Testcases for CIMInstanceName.__repr__() / repr()
@@ -2249,6 +2320,35 @@ def test_CIMInstanceName_tocimxmlstr(testcase,
     assert obj_xml_str == exp_xml_str
 
 
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_CIMINSTANCENAME_TOCIMXML)
+@pytest_extensions.simplified_test_function
+def test_CIMInstanceName_tocimxmlstr_fast(testcase,
+                                          obj, kwargs, exp_xml_str):
+    """
+    Test function for CIMInstanceName.tocimxmlstr() with the fast CIM-XML
+    writer.
+    """
+
+    saved_fast = config.FAST_CIMXML_WRITER
+    config.FAST_CIMXML_WRITER = True
+    try:
+
+        # The code to be tested
+        obj_xml_str = obj.tocimxmlstr(**kwargs)
+
+    finally:
+        config.FAST_CIMXML_WRITER = saved_fast
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    exp_xml_str = ''.join(exp_xml_str)
+    assert obj_xml_str == exp_xml_str
+
+
 TESTCASES_CIMINSTANCENAME_FROM_WBEM_URI = [
 
     # Testcases for CIMInstanceName.from_wbem_uri()
@@ -5893,6 +5993,34 @@ def test_CIMInstance_tocimxmlstr(testcase,
     assert obj_xml_str == exp_xml_str
 
 
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_CIMINSTANCE_TOCIMXML)
+@pytest_extensions.simplified_test_function
+def test_CIMInstance_tocimxmlstr_fast(testcase,
+                                      obj, kwargs, exp_xml_str):
+    """
+    Test function for CIMInstance.tocimxmlstr() with the fast CIM-XML writer.
+    """
+
+    saved_fast = config.FAST_CIMXML_WRITER
+    config.FAST_CIMXML_WRITER = True
+    try:
+
+        # The code to be tested
+        obj_xml_str = obj.tocimxmlstr(**kwargs)
+
+    finally:
+        config.FAST_CIMXML_WRITER = saved_fast
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    exp_xml_str = ''.join(exp_xml_str)
+    assert obj_xml_str == exp_xml_str
+
+
 class Test_CIMInstance_tomof(object):
     """
     Test CIMInstance.tomof().
@@ -7799,6 +7927,94 @@ class CIMPropertyAttrs(unittest.TestCase, CIMObjectMixin):
             self.assertIs(obj.name, None)
 
 
+class Test_CIMObject_slots(object):
+    """
+    Test the use of __slots__ and the lazily allocated qualifiers of the
+    CIM object classes that are created in large numbers.
+    """
+
+    @staticmethod
+    def objects():
+        """Return a list of CIM objects of the classes with __slots__"""
+        path = CIMInstanceName('CIM_Foo', keybindings={'Name': 'foo'},
+                               namespace='root/cimv2', host='woot.com')
+        qual = CIMQualifier('Key', True, propagated=True)
+        prop = CIMProperty('Name', 'foo', qualifiers=[qual])
+        inst = CIMInstance('CIM_Foo', properties=[prop], path=path)
+        return [path, qual, prop, inst]
+
+    def test_no_dict(self):
+        """Test that the objects have no __dict__"""
+        for obj in self.objects():
+            assert not hasattr(obj, '__dict__')
+            with pytest.raises(AttributeError):
+                obj.foo = 42
+
+    @pytest.mark.parametrize(
+        "protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, protocol):
+        """Test that the objects can be pickled and unpickled"""
+        for obj in self.objects():
+            obj2 = pickle.loads(pickle.dumps(obj, protocol))
+            assert obj2 == obj
+            assert type(obj2) is type(obj)
+
+    def test_deepcopy(self):
+        """Test that the objects can be deep-copied"""
+        for obj in self.objects():
+            assert copy.deepcopy(obj) == obj
+
+    def test_CIMInstanceName_deepcopy(self):
+        """Test that deep copies of instance paths are independent"""
+        ref = CIMInstanceName('CIM_Bar', keybindings={'Name': 'bar'})
+        dt = CIMDateTime('20180101000000.000000+000')
+        path = CIMInstanceName(
+            'CIM_Foo', keybindings=[('Ref', ref), ('Id', Uint32(42)),
+                                    ('Created', dt)],
+            namespace='root/cimv2', host='woot.com')
+        hash(path)
+
+        path2 = copy.deepcopy(path)
+        assert path2 == path
+        assert hash(path2) == hash(path)
+        assert list(path2.keybindings) == ['Ref', 'Id', 'Created']
+        assert path2['Ref'] == ref
+        assert path2['Ref'] is not ref
+        assert path2['Created'] is dt
+
+        path2['Ref'].keybindings['Name'] = 'baz'
+        path2['Id'] = Uint32(43)
+        assert ref['Name'] == 'bar'
+        assert path['Id'] == 42
+        assert path2 != path
+
+    @pytest.mark.parametrize(
+        "cls, args", [
+            (CIMProperty, ('Name', 'foo')),
+            (CIMInstance, ('CIM_Foo',)),
+        ])
+    def test_lazy_qualifiers(self, cls, args):
+        """Test the lazily allocated qualifiers dictionary"""
+        obj = cls(*args)
+        obj2 = cls(*args, qualifiers={})
+        # pylint: disable=protected-access
+        assert obj._qualifiers is None
+        assert obj == obj2
+        assert hash(obj) == hash(obj2)
+        assert obj._qualifiers is None
+
+        assert isinstance(obj.qualifiers, NocaseDict)
+        assert obj.qualifiers is obj.qualifiers
+        assert obj == obj2
+        assert hash(obj) == hash(obj2)
+
+        obj.qualifiers['Key'] = CIMQualifier('Key', True)
+        assert obj.qualifiers['key'].value is True
+        assert obj != obj2
+        assert obj.copy() == obj
+        assert obj.copy().qualifiers is not obj.qualifiers
+
+
 class CIMPropertyEquality(unittest.TestCase):
 
     def test_CIMProperty_eq(self):  # XXX: Migrate to pytest
@@ -11053,6 +11269,34 @@ def test_CIMProperty_tocimxmlstr(testcase,
     assert obj_xml_str == exp_xml_str
 
 
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_CIMPROPERTY_TOCIMXML)
+@pytest_extensions.simplified_test_function
+def test_CIMProperty_tocimxmlstr_fast(testcase,
+                                      obj, kwargs, exp_xml_str):
+    """
+    Test function for CIMProperty.tocimxmlstr() with the fast CIM-XML writer.
+    """
+
+    saved_fast = config.FAST_CIMXML_WRITER
+    config.FAST_CIMXML_WRITER = True
+    try:
+
+        # The code to be tested
+        obj_xml_str = obj.tocimxmlstr(**kwargs)
+
+    finally:
+        config.FAST_CIMXML_WRITER = saved_fast
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    exp_xml_str = ''.join(exp_xml_str)
+    assert obj_xml_str == exp_xml_str
+
+
 class Test_CIMProperty_tomof(object):
     """
     Test CIMProperty.tomof().
@@ -14856,6 +15100,34 @@ def test_CIMQualifier_tocimxmlstr(testcase,
     assert obj_xml_str == exp_xml_str
 
 
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_CIMQUALIFIER_TOCIMXML)
+@pytest_extensions.simplified_test_function
+def test_CIMQualifier_tocimxmlstr_fast(testcase,
+                                       obj, kwargs, exp_xml_str):
+    """
+    Test function for CIMQualifier.tocimxmlstr() with the fast CIM-XML writer.
+    """
+
+    saved_fast = config.FAST_CIMXML_WRITER
+    config.FAST_CIMXML_WRITER = True
+    try:
+
+        # The code to be tested
+        obj_xml_str = obj.tocimxmlstr(**kwargs)
+
+    finally:
+        config.FAST_CIMXML_WRITER = saved_fast
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    exp_xml_str = ''.join(exp_xml_str)
+    assert obj_xml_str == exp_xml_str
+
+
 class Test_CIMQualifier_tomof(object):  # pylint: disable=too-few-public-methods
     """
     Test CIMQualifier.tomof().
@@ -16045,6 +16317,34 @@ def test_CIMClassName_tocimxmlstr(testcase,
     assert obj_xml_str == exp_xml_str
 
 
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_CIMCLASSNAME_TOCIMXML)
+@pytest_extensions.simplified_test_function
+def test_CIMClassName_tocimxmlstr_fast(testcase,
+                                       obj, kwargs, exp_xml_str):
+    """
+    Test function for CIMClassName.tocimxmlstr() with the fast CIM-XML writer.
+    """
+
+    saved_fast = config.FAST_CIMXML_WRITER
+    config.FAST_CIMXML_WRITER = True
+    try:
+
+        # The code to be tested
+        obj_xml_str = obj.tocimxmlstr(**kwargs)
+
+    finally:
+        config.FAST_CIMXML_WRITER = saved_fast
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    exp_xml_str = ''.join(exp_xml_str)
+    assert obj_xml_str == exp_xml_str
+
+
 class Test_CIMClassName_from_wbem_uri(object):
     # pylint: disable=too-few-public-methods
     """
@@ -8,9 +8,17 @@ Unittest functions in cim_operations.
 from __future__ import print_function, absolute_import
 
 import os
+import threading
+import types
+import zlib
 import pytest
 
-from pywbem import WBEMConnection, CIMError
+from six.moves import BaseHTTPServer
+
+from pywbem import WBEMConnection, CIMError, CIMInstance, Uint32, \
+    AdaptiveMaxObjectCount
+from pywbem.cim_operations import pull_inst_result_tuple, \
+    pull_query_result_tuple
 
 from pywbem._recorder import LogOperationRecorder
 from pywbem._recorder import TestClientRecorder as MyTestClientRecorder
@@ -31,6 +39,19 @@ class TestCreateConnection(object):
         assert conn.x509 is None
         assert conn.use_pull_operations is False
         assert conn.stats_enabled is False
+        assert conn.conn_pool_size is None
+        assert conn.stream_instances is False
+        assert conn.compression is False
+        assert conn.compression_threshold is None
+
+    def test_conn_pool(self):  # pylint: disable=no-self-use
+        """Test creation of a connection with a connection pool"""
+        conn = WBEMConnection('http://localhost', conn_pool_size=4,
+                              stats_enabled=True)
+        assert conn.conn_pool_size == 4
+        # Closing a connection with an empty pool is a no-op
+        conn.close()
+        assert conn.statistics.conn_pool_size == 0
 
     @pytest.mark.parametrize(
         'attr_name, value', [
@@ -210,3 +231,368 @@ class TestGetRsltParams(object):
 
         exc = exec_info.value
         assert exc.status_code_name == 'CIM_ERR_INVALID_PARAMETER'
+
+
+ENUM_INST_RESPONSE_HEAD = b"""<?xml version="1.0" encoding="utf-8" ?>
+<CIM CIMVERSION="2.0" DTDVERSION="2.0">
+<MESSAGE ID="1001" PROTOCOLVERSION="1.0">
+<SIMPLERSP>
+<IMETHODRESPONSE NAME="EnumerateInstances">
+"""
+
+ENUM_INST_RESPONSE_INSTANCE = b"""<VALUE.NAMEDINSTANCE>
+<INSTANCENAME CLASSNAME="PyWBEM_Person">
+<KEYBINDING NAME="Name"><KEYVALUE VALUETYPE="string">%d</KEYVALUE></KEYBINDING>
+</INSTANCENAME>
+<INSTANCE CLASSNAME="PyWBEM_Person">
+<PROPERTY NAME="Name" TYPE="string"><VALUE>%d</VALUE></PROPERTY>
+</INSTANCE>
+</VALUE.NAMEDINSTANCE>
+"""
+
+ENUM_INST_RESPONSE_TAIL = b"""</IMETHODRESPONSE>
+</SIMPLERSP>
+</MESSAGE>
+</CIM>
+"""
+
+
+class EnumerateInstancesHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """
+    HTTP/1.1 request handler that returns an EnumerateInstances response
+    with the number of instances set in the server, using chunked transfer
+    encoding with one chunk per instance. The connection is closed after
+    the response.
+
+    If the server has compression enabled and the client accepts the gzip
+    content encoding, the response is compressed with gzip. The request
+    headers and the (decompressed) request body are stored in the server.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def _write_chunk(self, data):
+        if self._compobj is not None:
+            if data:
+                data = self._compobj.compress(data) + \
+                    self._compobj.flush(zlib.Z_SYNC_FLUSH)
+            else:
+                tail = self._compobj.flush()
+                self._compobj = None
+                self._write_chunk(tail)
+        self.wfile.write(('%x\r\n' % len(data)).encode('ascii') + data +
+                         b'\r\n')
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Respond to a POST request with an EnumerateInstances response."""
+        length = int(self.headers.get('Content-length', 0))
+        body = self.rfile.read(length)
+        if self.headers.get('Content-Encoding', None) == 'gzip':
+            body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+        self.server.request_headers = self.headers
+        self.server.request_body = body
+        self._compobj = None
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/xml; charset="utf-8"')
+        self.send_header('Transfer-Encoding', 'chunked')
+        if self.server.compression and \
+                'gzip' in self.headers.get('Accept-Encoding', ''):
+            self.send_header('Content-Encoding', 'gzip')
+            self._compobj = zlib.compressobj(6, zlib.DEFLATED,
+                                             16 + zlib.MAX_WBITS)
+        self.end_headers()
+        self._write_chunk(ENUM_INST_RESPONSE_HEAD)
+        if self.server.error:
+            self._write_chunk(b'<ERROR CODE="6" DESCRIPTION="Not found"/>\n')
+        else:
+            self._write_chunk(b'<IRETURNVALUE>\n')
+            for i in range(self.server.inst_count):
+                self._write_chunk(ENUM_INST_RESPONSE_INSTANCE % (i, i))
+            self._write_chunk(b'</IRETURNVALUE>\n')
+        self._write_chunk(ENUM_INST_RESPONSE_TAIL)
+        self._write_chunk(b'')
+        # Not waiting for further requests allows the server to be shut down
+        self.close_connection = True
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class TestStreamInstances(object):
+    """
+    Test streaming of the instances returned by EnumerateInstances, using
+    a local HTTP server.
+    """
+
+    def setup_method(self):
+        """Start the HTTP server."""
+        self.server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0),
+                                                EnumerateInstancesHandler)
+        self.server.inst_count = 5
+        self.server.error = False
+        self.server.compression = False
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        self.url = 'http://127.0.0.1:%s' % self.server.server_address[1]
+
+    def teardown_method(self):
+        """Stop the HTTP server."""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_stream(self):
+        """Test that streamed instances are the same as non-streamed ones."""
+        conn = WBEMConnection(self.url, stream_instances=True,
+                              stats_enabled=True, timeout=10)
+        result = conn.EnumerateInstances('PyWBEM_Person', 'root/cimv2')
+        assert isinstance(result, types.GeneratorType)
+        streamed = list(result)
+
+        conn2 = WBEMConnection(self.url, timeout=10)
+        instances = conn2.EnumerateInstances('PyWBEM_Person', 'root/cimv2')
+        assert isinstance(instances, list)
+
+        assert len(streamed) == 5
+        assert streamed == instances
+        assert streamed[0].path.namespace == 'root/cimv2'
+        assert streamed[4]['Name'] == u'4'
+        assert conn.last_reply_len == conn2.last_reply_len
+
+        stats = conn.statistics.get_op_statistic('EnumerateInstances')
+        assert stats.count == 1
+
+    def test_iter_stream(self):
+        """Test IterEnumerateInstances with streaming."""
+        conn = WBEMConnection(self.url, stream_instances=True, timeout=10)
+        insts = list(conn.IterEnumerateInstances('PyWBEM_Person',
+                                                 'root/cimv2'))
+        assert len(insts) == 5
+        assert insts[0].path.host == '127.0.0.1'
+
+    def test_stream_error(self):
+        """Test that an ERROR response is raised during the iteration."""
+        self.server.error = True
+        conn = WBEMConnection(self.url, stream_instances=True, timeout=10)
+        result = conn.EnumerateInstances('PyWBEM_Person', 'root/cimv2')
+        with pytest.raises(CIMError) as exc_info:
+            list(result)
+        assert exc_info.value.status_code == 6
+
+    def test_stream_close(self):
+        """
+        Test that a connection whose response has not been read completely
+        is not returned to the connection pool.
+        """
+        conn = WBEMConnection(self.url, stream_instances=True, timeout=10,
+                              conn_pool_size=1, stats_enabled=True)
+        result = conn.EnumerateInstances('PyWBEM_Person', 'root/cimv2')
+        next(result)
+        result.close()
+        assert conn.statistics.conn_pool_size == 0
+
+        list(conn.EnumerateInstances('PyWBEM_Person', 'root/cimv2'))
+        assert conn.statistics.conn_pool_size == 1
+        conn.close()
+
+    @pytest.mark.parametrize('stream', [False, True])
+    def test_compressed_reply(self, stream):
+        """Test that a gzip compressed response is decompressed."""
+        self.server.compression = True
+        self.server.inst_count = 50
+        conn = WBEMConnection(self.url, stream_instances=stream,
+                              compression=True, stats_enabled=True,
+                              timeout=10)
+        insts = list(conn.EnumerateInstances('PyWBEM_Person', 'root/cimv2'))
+        assert len(insts) == 50
+        assert insts[49]['Name'] == u'49'
+        assert self.server.request_headers['Accept-Encoding'] == \
+            'gzip, deflate'
+        assert 'Content-Encoding' not in self.server.request_headers
+
+        stats = conn.statistics.get_op_statistic('EnumerateInstances')
+        assert stats.avg_reply_len == conn.last_reply_len
+        assert stats.avg_reply_wire_len < stats.avg_reply_len / 2
+        # The uncompressed request body on the network includes the XML
+        # declaration
+        assert stats.avg_request_wire_len > stats.avg_request_len
+
+    def test_compressed_request(self):
+        """Test that request bodies above the threshold are compressed."""
+        conn = WBEMConnection(self.url, compression=True,
+                              compression_threshold=100, stats_enabled=True,
+                              timeout=10)
+        conn.EnumerateInstances('PyWBEM_Person', 'root/cimv2')
+        assert self.server.request_headers['Content-Encoding'] == 'gzip'
+        assert b'<IMETHODCALL NAME="EnumerateInstances">' in \
+            self.server.request_body
+
+        stats = conn.statistics.get_op_statistic('EnumerateInstances')
+        assert stats.avg_request_len == conn.last_request_len
+        assert stats.avg_request_wire_len < stats.avg_request_len
+
+        conn = WBEMConnection(self.url, compression=True,
+                              compression_threshold=100000, timeout=10)
+        conn.EnumerateInstances('PyWBEM_Person', 'root/cimv2')
+        assert 'Content-Encoding' not in self.server.request_headers
+
+    def test_no_compression(self):
+        """Test that compression is not advertised by default."""
+        self.server.compression = True
+        conn = WBEMConnection(self.url, timeout=10)
+        insts = conn.EnumerateInstances('PyWBEM_Person', 'root/cimv2')
+        assert len(insts) == 5
+        assert self.server.request_headers['Accept-Encoding'] == 'identity'
+
+
+class PullSessionConnection(WBEMConnection):
+    """
+    WBEMConnection whose open/pull/close operations for instances simulate
+    an enumeration session in memory, returning up to MaxObjectCount
+    instances per request.
+
+    The enumeration session is shared with shallow copies of the connection.
+    """
+
+    def __init__(self, inst_count, fail_at=None, stats_enabled=False):
+        super(PullSessionConnection, self).__init__(
+            'http://dummy', use_pull_operations=True,
+            stats_enabled=stats_enabled)
+        self.inst_count = inst_count
+        self.fail_at = fail_at
+        self.session = {'pulled': 0}
+        self.closed = []
+        self.max_object_counts = []
+
+    @property
+    def pulled(self):
+        """Number of instances returned so far in the session"""
+        return self.session['pulled']
+
+    def _pull_result(self, MaxObjectCount, op_name):
+        # pylint: disable=invalid-name
+        if self.pulled == self.fail_at:
+            raise CIMError(1, 'Failed pull')
+        op_stats = self.statistics.start_timer(op_name)
+        self.max_object_counts.append(MaxObjectCount)
+        insts = []
+        while len(insts) < MaxObjectCount and self.pulled < self.inst_count:
+            insts.append(CIMInstance('PyWBEM_Person',
+                                     properties={'Name': Uint32(self.pulled)}))
+            self.session['pulled'] += 1
+        self._last_reply_len = 100 * len(insts)
+        op_stats.stop_timer(0, self._last_reply_len)
+        eos = self.pulled >= self.inst_count
+        return pull_inst_result_tuple(insts, eos,
+                                      None if eos else ('ctx', 'root/cimv2'))
+
+    # pylint: disable=invalid-name,unused-argument
+    def OpenEnumerateInstances(self, ClassName, namespace=None,
+                               MaxObjectCount=None, **kwargs):
+        return self._pull_result(MaxObjectCount, 'OpenEnumerateInstances')
+
+    def PullInstancesWithPath(self, context, MaxObjectCount, **extra):
+        assert context is not None
+        return self._pull_result(MaxObjectCount, 'PullInstancesWithPath')
+
+    def OpenQueryInstances(self, FilterQueryLanguage, FilterQuery,
+                           namespace=None, MaxObjectCount=None, **kwargs):
+        result = self._pull_result(MaxObjectCount, 'OpenQueryInstances')
+        return pull_query_result_tuple(result.instances, result.eos,
+                                       result.context, None)
+
+    def PullInstances(self, context, MaxObjectCount, **extra):
+        assert context is not None
+        return self._pull_result(MaxObjectCount, 'PullInstances')
+
+    def CloseEnumeration(self, context, **extra):
+        self.closed.append(context)
+
+
+class TestIterPrefetch(object):
+    """Test the prefetch parameter of the Iter... methods."""
+
+    @pytest.mark.parametrize('prefetch', [None, 0, 1, 3])
+    def test_all(self, prefetch):
+        """Test that all instances are returned, in order."""
+        conn = PullSessionConnection(10)
+        insts = list(conn.IterEnumerateInstances('PyWBEM_Person',
+                                                 MaxObjectCount=1,
+                                                 prefetch=prefetch))
+        assert [i['Name'] for i in insts] == list(range(10))
+        assert conn.closed == []
+
+    def test_early_close(self):
+        """Test that the session is closed when the generator is closed."""
+        conn = PullSessionConnection(100)
+        insts = conn.IterEnumerateInstances('PyWBEM_Person',
+                                            MaxObjectCount=1, prefetch=2)
+        assert next(insts)['Name'] == 0
+        assert next(insts)['Name'] == 1
+        insts.close()
+        assert conn.closed == [('ctx', 'root/cimv2')]
+        # The pulls ahead of the consumer are bounded by prefetch
+        assert conn.pulled <= 2 + 2 + 1
+
+    def test_error(self):
+        """Test that a failed pull is raised and closes the session."""
+        conn = PullSessionConnection(10, fail_at=5)
+        insts = conn.IterEnumerateInstances('PyWBEM_Person',
+                                            MaxObjectCount=1, prefetch=2)
+        with pytest.raises(CIMError):
+            list(insts)
+        assert conn.closed == [('ctx', 'root/cimv2')]
+
+    def test_separate_conn(self):
+        """
+        Test that the prefetched pulls do not change the state of the
+        connection for the current operation, and that their statistics are
+        added to the statistics of the connection.
+        """
+        conn = PullSessionConnection(10, stats_enabled=True)
+        insts = conn.IterEnumerateInstances('PyWBEM_Person',
+                                            MaxObjectCount=1, prefetch=2)
+        assert next(insts)['Name'] == 0
+        # Reply length of the open operation with one instance
+        assert conn.last_reply_len == 100
+        conn._last_reply_len = 0  # pylint: disable=protected-access
+        assert len(list(insts)) == 9
+        assert conn.last_reply_len == 0
+        stats = conn.statistics
+        assert stats.get_op_statistic('OpenEnumerateInstances').count == 1
+        assert stats.get_op_statistic('PullInstancesWithPath').count == 9
+
+    def test_invalid(self):
+        """Test that a negative prefetch is rejected."""
+        conn = PullSessionConnection(10)
+        with pytest.raises(ValueError):
+            list(conn.IterEnumerateInstances('PyWBEM_Person', prefetch=-1))
+
+
+class TestIterAdaptive(object):
+    """Test an adaptive MaxObjectCount with the Iter... methods."""
+
+    @pytest.mark.parametrize('prefetch', [None, 2])
+    def test_adaptive(self, prefetch):
+        """Test that the MaxObjectCount of the tuner is used and updated."""
+        conn = PullSessionConnection(1000)
+        adaptive = AdaptiveMaxObjectCount(target_reply_len=20000, initial=5)
+        insts = list(conn.IterEnumerateInstances('PyWBEM_Person',
+                                                 MaxObjectCount=adaptive,
+                                                 prefetch=prefetch))
+        assert [i['Name'] for i in insts] == list(range(1000))
+        assert conn.max_object_counts == adaptive.history
+        assert adaptive.history[0] == 5
+        # 100 Bytes per instance limits the batch size to 200
+        assert max(adaptive.history) == 200
+
+    def test_adaptive_query(self):
+        """Test an adaptive MaxObjectCount with IterQueryInstances."""
+        conn = PullSessionConnection(1000)
+        adaptive = AdaptiveMaxObjectCount(target_reply_len=20000, initial=5)
+        result = conn.IterQueryInstances('DMTF:FQL', 'Name > 0',
+                                         MaxObjectCount=adaptive)
+        insts = list(result.generator)
+        assert [i['Name'] for i in insts] == list(range(1000))
+        assert conn.max_object_counts == adaptive.history
+        assert adaptive.history[0] == 5
+        assert max(adaptive.history) == 200
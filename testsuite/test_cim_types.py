@@ -14,6 +14,7 @@ from pywbem import CIMType, CIMInt, CIMFloat, Uint8, Uint16, Uint32, Uint64, \
     Sint8, Sint16, Sint32, Sint64, Real32, Real64, CIMDateTime, \
     MinutesFromUTC, CIMClass, CIMInstance, CIMInstanceName, CIMClassName, \
     cimtype, type_from_name
+from pywbem import cim_types, config
 
 import pytest_extensions
 
@@ -402,6 +403,65 @@ def test_datetime_init(datetime_init_tuple):
         assert str(obj) == exp_str
 
 
+@pytest.mark.parametrize(
+    "dtarg, exp_fast", [
+        ('20140924193040.654321+120', True),
+        ('20140924193040.654321-300', True),
+        ('12345678224455.654321:000', True),
+        ('20140924193040.654321|120', False),
+        ('20140924193040.654321+120 ', False),
+        ('12345678224455.654321:000xyz', False),
+    ])
+def test_datetime_parse_fast(dtarg, exp_fast):
+    """Test that the fast path parses like the regular expressions."""
+    # pylint: disable=protected-access
+    dtarg = six.text_type(dtarg)
+    fast_result = cim_types._parse_datetime_fast(dtarg)
+    assert (fast_result is not None) == exp_fast
+    result = cim_types._parse_datetime(dtarg)
+    if fast_result is not None:
+        assert fast_result == result
+    obj = CIMDateTime(dtarg)
+    assert (obj.datetime, obj.timedelta) == result
+
+
+def test_datetime_shared_tzinfo():
+    """Test that datetime strings with the same offset share the tzinfo."""
+    obj1 = CIMDateTime('20140924193040.654321-300')
+    obj2 = CIMDateTime('20150101000000.000000-300')
+    assert obj1.datetime.tzinfo is obj2.datetime.tzinfo
+    assert obj1.minutes_from_utc == -300
+
+
+def test_datetime_cache():
+    """Test the cache of parsed datetime strings."""
+    # pylint: disable=protected-access
+    saved_size = config.CIMDATETIME_CACHE_SIZE
+    try:
+        config.CIMDATETIME_CACHE_SIZE = 2
+        cim_types._DATETIME_CACHE.clear()
+        obj1 = CIMDateTime('20140924193040.654321+120')
+        obj2 = CIMDateTime('20140924193040.654321+120')
+        assert obj1.datetime is obj2.datetime
+        assert obj1 == obj2
+        CIMDateTime('12345678224455.654321:000')
+        CIMDateTime('20140924193040.654321+120')
+        CIMDateTime('20150101000000.000000+000')
+        # The least recently used string was removed
+        assert list(cim_types._DATETIME_CACHE.keys()) == \
+            [u'20140924193040.654321+120', u'20150101000000.000000+000']
+        with pytest.raises(ValueError):
+            CIMDateTime('20141324193040.654321+120')
+        assert len(cim_types._DATETIME_CACHE) == 2
+
+        config.CIMDATETIME_CACHE_SIZE = 0
+        obj3 = CIMDateTime('20140924193040.654321+120')
+        assert obj3.datetime is not obj1.datetime
+    finally:
+        config.CIMDATETIME_CACHE_SIZE = saved_size
+        cim_types._DATETIME_CACHE.clear()
+
+
 # TODO: Add testcases for get_local_utcoffset()
 # TODO: Add testcases for now()
 # TODO: Add testcases for fromtimestamp()
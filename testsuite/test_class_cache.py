@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+"""
+Test the ClassCache class and its use by WBEMConnection.
+"""
+
+from __future__ import print_function, absolute_import
+
+import time
+import pytest
+
+from pywbem import ClassCache, Statistics, WBEMConnection, CIMClass, \
+    CIMProperty, CIMClassName, ValueMapping
+from pywbem_mock import FakedWBEMConnection, MockWBEMServer
+
+# pylint: disable=redefined-outer-name
+
+TEST_MOF = """
+    Qualifier Description : string = null,
+        Scope(any),
+        Flavor(EnableOverride, ToSubclass, Translatable);
+    Qualifier ValueMap : string[],
+        Scope(property, method, parameter);
+    Qualifier Values : string[],
+        Scope(property, method, parameter),
+        Flavor(EnableOverride, ToSubclass, Translatable);
+
+    class CIM_Foo {
+        [ValueMap {"0", "1"}, Values {"Off", "On"}]
+        uint16 State;
+        string Name;
+    };
+
+    class CIM_FooSub : CIM_Foo {
+        string Sub;
+    };
+"""
+
+
+def op_count(conn, name):
+    """Return the number of operations with that name sent to the server."""
+    return conn.statistics.get_op_statistic(name).count
+
+
+class TestClassCache(object):
+    """Test the ClassCache class."""
+
+    def test_init(self):
+        # pylint: disable=no-self-use
+        """Test the init parameters and attributes."""
+        cache = ClassCache(10, ttl=5)
+        assert cache.maxsize == 10
+        assert cache.ttl == 5
+        assert len(cache) == 0  # pylint: disable=len-as-condition
+        assert repr(cache) == 'ClassCache(maxsize=10, ttl=5, size=0)'
+
+        with pytest.raises(ValueError):
+            ClassCache(0)
+        with pytest.raises(ValueError):
+            ClassCache(10, ttl=0)
+
+    def test_get_put_class(self):
+        # pylint: disable=no-self-use
+        """Test get_class() and put_class()."""
+        statistics = Statistics(enable=True)
+        cache = ClassCache(10, statistics=statistics)
+        klass = CIMClass('CIM_Foo', properties=[CIMProperty('P1', None,
+                                                            type='string')])
+
+        assert cache.get_class('root/cimv2', 'CIM_Foo', False) is None
+        cache.put_class(klass, 'root/cimv2', False, property_list=['p1'])
+        assert cache.get_class('root/cimv2', 'CIM_Foo', False) is None
+        cached = cache.get_class('Root/CIMV2', 'cim_foo', False,
+                                 property_list=['P1'])
+        assert cached == klass
+
+        # The cache stores and returns copies
+        cached.properties['P1'].value = 'x'
+        klass.properties['P1'].value = 'y'
+        assert cache.get_class('root/cimv2', 'CIM_Foo', False,
+                               property_list=['P1']).properties['P1'].value \
+            is None
+        assert statistics.class_cache_hits == 2
+        assert statistics.class_cache_misses == 2
+
+    def test_get_put_classes(self):
+        # pylint: disable=no-self-use
+        """Test get_classes() and put_classes()."""
+        cache = ClassCache(10)
+        classes = [CIMClass('CIM_B', superclass='CIM_A'),
+                   CIMClass('CIM_C', superclass='CIM_A')]
+
+        assert cache.get_classes('root/cimv2', 'CIM_A', True) is None
+        cache.put_classes(classes, 'root/cimv2', 'CIM_A', True)
+        assert len(cache) == 3
+        assert cache.get_classes('root/cimv2', 'cim_a', True) == classes
+        assert cache.get_classes('root/cimv2', 'CIM_A', False) is None
+        assert cache.get_class('root/cimv2', 'CIM_C') == classes[1]
+
+        cache.invalidate('root/other')
+        assert len(cache) == 3
+        cache.invalidate('ROOT/cimv2')
+        assert len(cache) == 0  # pylint: disable=len-as-condition
+
+    def test_lru(self):
+        # pylint: disable=no-self-use
+        """Test the LRU eviction."""
+        cache = ClassCache(2)
+        cache.put_class(CIMClass('CIM_A'), 'root/cimv2')
+        cache.put_class(CIMClass('CIM_B'), 'root/cimv2')
+        assert cache.get_class('root/cimv2', 'CIM_A') is not None
+        cache.put_class(CIMClass('CIM_C'), 'root/cimv2')
+        assert len(cache) == 2
+        assert cache.get_class('root/cimv2', 'CIM_B') is None
+        assert cache.get_class('root/cimv2', 'CIM_A') is not None
+        assert cache.get_class('root/cimv2', 'CIM_C') is not None
+
+        # An enumeration whose classes have been evicted is a miss
+        cache.put_classes([CIMClass('CIM_X'), CIMClass('CIM_Y')],
+                          'root/cimv2', None)
+        assert cache.get_classes('root/cimv2', None) is None
+
+        cache.clear()
+        assert len(cache) == 0  # pylint: disable=len-as-condition
+
+    def test_ttl(self):
+        # pylint: disable=no-self-use
+        """Test the expiration of entries."""
+        cache = ClassCache(10, ttl=0.1)
+        cache.put_class(CIMClass('CIM_A'), 'root/cimv2')
+        assert cache.get_class('root/cimv2', 'CIM_A') is not None
+        time.sleep(0.15)
+        assert cache.get_class('root/cimv2', 'CIM_A') is None
+        assert len(cache) == 0  # pylint: disable=len-as-condition
+
+
+@pytest.fixture
+def server():
+    """
+    Start a MockWBEMServer with the test model and stop it at the end.
+    """
+    faked_conn = FakedWBEMConnection()
+    faked_conn.compile_mof_string(TEST_MOF)
+    server = MockWBEMServer(faked_conn)
+    server.start()
+    yield server
+    server.stop()
+
+
+class TestWBEMConnectionClassCache(object):
+    """Test the class cache of WBEMConnection."""
+
+    def test_disabled(self, server):
+        # pylint: disable=no-self-use
+        """Test that classes are not cached by default."""
+        conn = WBEMConnection(server.url, stats_enabled=True)
+        assert conn.class_cache is None
+        conn.GetClass('CIM_Foo')
+        conn.GetClass('CIM_Foo')
+        assert op_count(conn, 'GetClass') == 2
+
+    def test_getclass(self, server):
+        # pylint: disable=no-self-use
+        """Test GetClass with the class cache."""
+        conn = WBEMConnection(server.url, stats_enabled=True,
+                              class_cache_size=10)
+        assert isinstance(conn.class_cache, ClassCache)
+
+        klass1 = conn.GetClass('CIM_FooSub', LocalOnly=False)
+        klass2 = conn.GetClass(CIMClassName('cim_foosub'), LocalOnly=False)
+        assert klass2 == klass1
+        assert klass2.path == CIMClassName('CIM_FooSub', host=conn.host,
+                                           namespace='root/cimv2')
+        assert op_count(conn, 'GetClass') == 1
+
+        # Different operation parameters are different entries
+        conn.GetClass('CIM_FooSub', LocalOnly=True)
+        conn.GetClass('CIM_FooSub', LocalOnly=False, PropertyList=['Sub'])
+        conn.GetClass('CIM_FooSub', LocalOnly=False, PropertyList='Sub')
+        assert op_count(conn, 'GetClass') == 3
+
+        # Additional operation parameters bypass the cache
+        conn.GetClass('CIM_FooSub', LocalOnly=False, Foo=None)
+        assert op_count(conn, 'GetClass') == 4
+
+        assert conn.statistics.class_cache_hits == 2
+        assert conn.statistics.class_cache_misses == 3
+
+        # ValueMapping uses the cached class
+        vm = ValueMapping.for_property(conn, 'root/cimv2', 'CIM_Foo',
+                                       'State')
+        ValueMapping.for_property(conn, 'root/cimv2', 'CIM_Foo', 'State')
+        assert vm.tovalues(1) == 'On'
+        assert op_count(conn, 'GetClass') == 5
+
+    def test_enumerateclasses(self, server):
+        # pylint: disable=no-self-use
+        """Test EnumerateClasses with the class cache."""
+        conn = WBEMConnection(server.url, stats_enabled=True,
+                              class_cache_size=10)
+
+        classes1 = conn.EnumerateClasses(DeepInheritance=True,
+                                         LocalOnly=False)
+        classes2 = conn.EnumerateClasses(DeepInheritance=True,
+                                         LocalOnly=False)
+        assert classes2 == classes1
+        assert op_count(conn, 'EnumerateClasses') == 1
+
+        # The enumerated classes are cached for GetClass
+        conn.GetClass('CIM_FooSub', LocalOnly=False)
+        assert op_count(conn, 'GetClass') == 0
+
+        conn.EnumerateClasses(ClassName='CIM_Foo', DeepInheritance=True,
+                              LocalOnly=False)
+        assert op_count(conn, 'EnumerateClasses') == 2
+
+    def test_invalidate(self, server):
+        # pylint: disable=no-self-use
+        """Test that class modifications invalidate the cache."""
+        conn = WBEMConnection(server.url, stats_enabled=True,
+                              class_cache_size=10)
+
+        conn.GetClass('CIM_Foo', LocalOnly=False)
+        new_class = CIMClass('CIM_Bar', superclass='CIM_Foo')
+        conn.CreateClass(new_class)
+        assert len(conn.class_cache) == 0  # pylint: disable=len-as-condition
+
+        conn.GetClass('CIM_Foo', LocalOnly=False)
+        conn.DeleteClass('CIM_Bar')
+        conn.GetClass('CIM_Foo', LocalOnly=False)
+        assert op_count(conn, 'GetClass') == 3
+
+        conn.class_cache.clear()
+        conn.GetClass('CIM_Foo', LocalOnly=False)
+        assert op_count(conn, 'GetClass') == 4
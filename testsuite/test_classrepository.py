@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""
+Test the ClassRepository class of the mock repository of pywbem_mock.
+"""
+
+from __future__ import print_function, absolute_import
+
+import copy
+import pickle
+import pytest
+
+from pywbem import CIMClass
+from pywbem_mock._classrepository import ClassRepository
+
+
+def make_repo():
+    """
+    Return a ClassRepository with the hierarchy:
+
+      CIM_A
+        CIM_B
+          CIM_D
+        CIM_C
+      CIM_X
+    """
+    classes = [CIMClass('CIM_A'), CIMClass('CIM_B', superclass='CIM_A'),
+               CIMClass('CIM_C', superclass='CIM_A'), CIMClass('CIM_X'),
+               CIMClass('CIM_D', superclass='cim_b')]
+    return ClassRepository([(cl.classname, cl) for cl in classes])
+
+
+class TestClassRepository(object):
+    """Test the ClassRepository class."""
+
+    def test_subclass_names(self):
+        """Test subclass_names() with and without deep inheritance."""
+        repo = make_repo()
+        assert repo.subclass_names(None, False) == ['CIM_A', 'CIM_X']
+        assert repo.subclass_names(None, True) == \
+            ['CIM_A', 'CIM_X', 'CIM_B', 'CIM_C', 'CIM_D']
+        assert repo.subclass_names('cim_a', False) == ['CIM_B', 'CIM_C']
+        assert repo.subclass_names('CIM_A', True) == \
+            ['CIM_B', 'CIM_C', 'CIM_D']
+        assert repo.subclass_names('CIM_D', True) == []
+        assert repo.subclass_names('CIM_Unknown', True) == []
+
+        # The result is a new list each time
+        names = repo.subclass_names('CIM_A', True)
+        names.append('CIM_A')
+        assert repo.subclass_names('CIM_A', True) == \
+            ['CIM_B', 'CIM_C', 'CIM_D']
+
+    def test_superclass_names(self):
+        """Test superclass_names()."""
+        repo = make_repo()
+        assert repo.superclass_names('CIM_D') == ['CIM_A', 'cim_b']
+        assert repo.superclass_names('CIM_A') == []
+        with pytest.raises(KeyError):
+            repo.superclass_names('CIM_Unknown')
+
+    def test_invalidate(self):
+        """Test that modifications of the repository update the caches."""
+        repo = make_repo()
+        assert repo.subclass_names('CIM_A', True) == \
+            ['CIM_B', 'CIM_C', 'CIM_D']
+        assert repo.superclass_names('CIM_D') == ['CIM_A', 'cim_b']
+
+        repo['CIM_E'] = CIMClass('CIM_E', superclass='CIM_C')
+        assert repo.subclass_names('CIM_A', True) == \
+            ['CIM_B', 'CIM_C', 'CIM_D', 'CIM_E']
+
+        repo['CIM_D'] = CIMClass('CIM_D', superclass='CIM_X')
+        assert repo.subclass_names('CIM_A', True) == \
+            ['CIM_B', 'CIM_C', 'CIM_E']
+        assert repo.superclass_names('CIM_D') == ['CIM_X']
+
+        del repo['CIM_E']
+        assert repo.subclass_names('CIM_C', False) == []
+
+        repo.clear()
+        assert repo.subclass_names(None, True) == []
+
+    @pytest.mark.parametrize(
+        "copy_func", [
+            copy.deepcopy,
+            lambda obj: pickle.loads(pickle.dumps(obj)),
+        ]
+    )
+    def test_copy(self, copy_func):
+        """Test that copies have their own caches."""
+        repo = make_repo()
+        assert repo.subclass_names('CIM_A', True) == \
+            ['CIM_B', 'CIM_C', 'CIM_D']
+        repo2 = copy_func(repo)
+        assert isinstance(repo2, ClassRepository)
+        assert repo2 == repo
+
+        del repo2['CIM_D']
+        assert repo2.subclass_names('CIM_A', True) == ['CIM_B', 'CIM_C']
+        assert repo.subclass_names('CIM_A', True) == \
+            ['CIM_B', 'CIM_C', 'CIM_D']
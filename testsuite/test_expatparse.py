@@ -0,0 +1,259 @@
+"""
+Test the direct CIM-XML parser in _expatparse.py, by comparing its results
+against the results of the tupletree based parser.
+"""
+
+from __future__ import absolute_import
+
+import os
+import pytest
+from pkg_resources import resource_filename
+
+from pywbem import tupletree, tupleparse, config, ParseError
+from pywbem._expatparse import parse_cimxml
+
+
+def tupletree_parse(xml_string):
+    """Parse the XML string using the tupletree based parser."""
+    return tupleparse.parse_cim(
+        tupletree.xml_to_tupletree_sax(xml_string, "Test XML"))
+
+
+def response(ireturnvalue_content, method='EnumerateInstances'):
+    """Return a CIM-XML response with the specified IRETURNVALUE content."""
+    return u'<?xml version="1.0" encoding="utf-8" ?>' \
+        u'<CIM CIMVERSION="2.0" DTDVERSION="2.0">' \
+        u'<MESSAGE ID="1001" PROTOCOLVERSION="1.0">' \
+        u'<SIMPLERSP><IMETHODRESPONSE NAME="%s">' \
+        u'<IRETURNVALUE>%s</IRETURNVALUE>' \
+        u'</IMETHODRESPONSE></SIMPLERSP></MESSAGE></CIM>' % \
+        (method, ireturnvalue_content)
+
+
+def test_files():
+    """Test the parsers with the XML files in the tupletree_ok directory."""
+    data_dir = resource_filename(__name__, 'tupletree_ok')
+    for fname in os.listdir(data_dir):
+        with open(os.path.join(data_dir, fname), 'rb') as fh:
+            xml_string = fh.read()
+        assert parse_cimxml(xml_string, "Test XML") == \
+            tupletree_parse(xml_string)
+
+
+TESTCASES_PARSE = [
+
+    # Testcases for parse_cimxml() whose result is compared to the result of
+    # the tupletree based parser.
+
+    # Each testcase is a tuple of:
+    # * desc: Short testcase description.
+    # * xml_str: CIM-XML string to be parsed.
+
+    (
+        "Instances with all kinds of properties and qualifiers",
+        response(
+            u'<VALUE.NAMEDINSTANCE>'
+            u'<INSTANCENAME CLASSNAME="CIM_Foo">'
+            u'<KEYBINDING NAME="Name">'
+            u'<KEYVALUE VALUETYPE="string">Fritz &amp; Cat</KEYVALUE>'
+            u'</KEYBINDING>'
+            u'<KEYBINDING NAME="Num">'
+            u'<KEYVALUE VALUETYPE="numeric">0x2A</KEYVALUE>'
+            u'</KEYBINDING>'
+            u'</INSTANCENAME>'
+            u'<INSTANCE CLASSNAME="CIM_Foo" xml:lang="en">'
+            u'<QUALIFIER NAME="Key" TYPE="boolean" TOSUBCLASS="false">'
+            u'<VALUE>true</VALUE></QUALIFIER>'
+            u'<PROPERTY NAME="Name" TYPE="string" CLASSORIGIN="CIM_Foo">'
+            u'<VALUE>Fritz &amp; Cat</VALUE></PROPERTY>'
+            u'<PROPERTY NAME="Empty" TYPE="string"><VALUE></VALUE></PROPERTY>'
+            u'<PROPERTY NAME="Null" TYPE="uint8"/>'
+            u'<PROPERTY NAME="Size" TYPE="uint64" PROPAGATED="true">'
+            u'<VALUE> 42 </VALUE></PROPERTY>'
+            u'<PROPERTY NAME="Time" TYPE="datetime">'
+            u'<VALUE>20140924193040.654437+060</VALUE></PROPERTY>'
+            u'<PROPERTY NAME="Ch" TYPE="char16"><VALUE>x</VALUE></PROPERTY>'
+            u'<PROPERTY NAME="R" TYPE="real32"><VALUE>4.5</VALUE></PROPERTY>'
+            u'<PROPERTY.ARRAY NAME="Ops" TYPE="uint16" ARRAYSIZE="3">'
+            u'<VALUE.ARRAY><VALUE>2</VALUE><VALUE.NULL/><VALUE>5</VALUE>'
+            u'</VALUE.ARRAY></PROPERTY.ARRAY>'
+            u'<PROPERTY.REFERENCE NAME="Ref" REFERENCECLASS="CIM_Bar">'
+            u'<VALUE.REFERENCE><INSTANCEPATH><NAMESPACEPATH>'
+            u'<HOST>woot.com</HOST><LOCALNAMESPACEPATH>'
+            u'<NAMESPACE NAME="root"/><NAMESPACE NAME="cimv2"/>'
+            u'</LOCALNAMESPACEPATH></NAMESPACEPATH>'
+            u'<INSTANCENAME CLASSNAME="CIM_Bar">'
+            u'<KEYVALUE VALUETYPE="string">b1</KEYVALUE>'
+            u'</INSTANCENAME></INSTANCEPATH></VALUE.REFERENCE>'
+            u'</PROPERTY.REFERENCE>'
+            u'<PROPERTY NAME="Emb" TYPE="string" EmbeddedObject="instance">'
+            u'<VALUE>&lt;INSTANCE CLASSNAME="CIM_Emb"&gt;'
+            u'&lt;PROPERTY NAME="P" TYPE="string"&gt;'
+            u'&lt;VALUE&gt;v&lt;/VALUE&gt;&lt;/PROPERTY&gt;'
+            u'&lt;/INSTANCE&gt;</VALUE></PROPERTY>'
+            u'</INSTANCE>'
+            u'</VALUE.NAMEDINSTANCE>\n'
+            u'<VALUE.NAMEDINSTANCE>'
+            u'<INSTANCENAME CLASSNAME="CIM_Foo"/>'
+            u'<INSTANCE CLASSNAME="CIM_Foo"/>'
+            u'</VALUE.NAMEDINSTANCE>'),
+    ),
+    (
+        "Instances with path from a pull operation",
+        u'<?xml version="1.0" encoding="utf-8" ?>'
+        u'<CIM CIMVERSION="2.0" DTDVERSION="2.0">'
+        u'<MESSAGE ID="1001" PROTOCOLVERSION="1.0">'
+        u'<SIMPLERSP><IMETHODRESPONSE NAME="OpenEnumerateInstances">'
+        u'<IRETURNVALUE><VALUE.INSTANCEWITHPATH><INSTANCEPATH>'
+        u'<NAMESPACEPATH><HOST>woot.com</HOST><LOCALNAMESPACEPATH>'
+        u'<NAMESPACE NAME="root"/></LOCALNAMESPACEPATH></NAMESPACEPATH>'
+        u'<INSTANCENAME CLASSNAME="CIM_Foo">'
+        u'<KEYBINDING NAME="Name"><KEYVALUE>a</KEYVALUE></KEYBINDING>'
+        u'</INSTANCENAME></INSTANCEPATH>'
+        u'<INSTANCE CLASSNAME="CIM_Foo"/>'
+        u'</VALUE.INSTANCEWITHPATH></IRETURNVALUE>'
+        u'<PARAMVALUE NAME="EndOfSequence" PARAMTYPE="boolean">'
+        u'<VALUE>TRUE</VALUE></PARAMVALUE>'
+        u'<PARAMVALUE NAME="EnumerationContext" PARAMTYPE="string">'
+        u'<VALUE></VALUE></PARAMVALUE>'
+        u'</IMETHODRESPONSE></SIMPLERSP></MESSAGE></CIM>',
+    ),
+    (
+        "Class with methods (parsed via tupleparse)",
+        response(
+            u'<CLASS NAME="CIM_Foo" SUPERCLASS="CIM_Base">'
+            u'<QUALIFIER NAME="Description" TYPE="string" TRANSLATABLE="true">'
+            u'<VALUE>A class</VALUE></QUALIFIER>'
+            u'<PROPERTY NAME="Name" TYPE="string"/>'
+            u'<PROPERTY.ARRAY NAME="Arr" TYPE="sint8"/>'
+            u'<PROPERTY.REFERENCE NAME="Ref" REFERENCECLASS="CIM_Bar"/>'
+            u'<METHOD NAME="Meth" TYPE="uint32">'
+            u'<PARAMETER NAME="P1" TYPE="string"/>'
+            u'<PARAMETER.REFERENCE NAME="P2" REFERENCECLASS="CIM_Bar"/>'
+            u'</METHOD>'
+            u'</CLASS>', method='GetClass'),
+    ),
+    (
+        "Class names and objects with path",
+        response(
+            u'<VALUE.OBJECTWITHPATH><CLASSPATH><NAMESPACEPATH>'
+            u'<HOST>woot.com</HOST><LOCALNAMESPACEPATH>'
+            u'<NAMESPACE NAME="root"/></LOCALNAMESPACEPATH></NAMESPACEPATH>'
+            u'<CLASSNAME NAME="CIM_Foo"/></CLASSPATH>'
+            u'<CLASS NAME="CIM_Foo"/></VALUE.OBJECTWITHPATH>'
+            u'<VALUE.OBJECTWITHPATH><INSTANCEPATH><NAMESPACEPATH>'
+            u'<HOST>woot.com</HOST><LOCALNAMESPACEPATH>'
+            u'<NAMESPACE NAME="root"/></LOCALNAMESPACEPATH></NAMESPACEPATH>'
+            u'<INSTANCENAME CLASSNAME="CIM_Foo"/></INSTANCEPATH>'
+            u'<INSTANCE CLASSNAME="CIM_Foo"/></VALUE.OBJECTWITHPATH>',
+            method='Associators'),
+    ),
+    (
+        "Qualifier declarations (parsed via tupleparse)",
+        response(
+            u'<QUALIFIER.DECLARATION NAME="Key" TYPE="boolean" ISARRAY="false">'
+            u'<SCOPE PROPERTY="true" REFERENCE="true"/>'
+            u'<VALUE>false</VALUE></QUALIFIER.DECLARATION>',
+            method='EnumerateQualifiers'),
+    ),
+    (
+        "Error response",
+        u'<?xml version="1.0" encoding="utf-8" ?>'
+        u'<CIM CIMVERSION="2.0" DTDVERSION="2.0">'
+        u'<MESSAGE ID="1001" PROTOCOLVERSION="1.0">'
+        u'<SIMPLERSP><IMETHODRESPONSE NAME="GetInstance">'
+        u'<ERROR CODE="6" DESCRIPTION="Not found"/>'
+        u'</IMETHODRESPONSE></SIMPLERSP></MESSAGE></CIM>',
+    ),
+    (
+        "Extrinsic method response",
+        u'<?xml version="1.0" encoding="utf-8" ?>'
+        u'<CIM CIMVERSION="2.0" DTDVERSION="2.0">'
+        u'<MESSAGE ID="1001" PROTOCOLVERSION="1.0">'
+        u'<SIMPLERSP><METHODRESPONSE NAME="Meth">'
+        u'<RETURNVALUE PARAMTYPE="uint32"><VALUE>0</VALUE></RETURNVALUE>'
+        u'<PARAMVALUE NAME="Out" TYPE="string"><VALUE>x</VALUE></PARAMVALUE>'
+        u'<PARAMVALUE NAME="Refs"><VALUE.REFARRAY><VALUE.REFERENCE>'
+        u'<CLASSNAME NAME="CIM_Foo"/></VALUE.REFERENCE><VALUE.NULL/>'
+        u'</VALUE.REFARRAY></PARAMVALUE>'
+        u'</METHODRESPONSE></SIMPLERSP></MESSAGE></CIM>',
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, xml_str",
+    TESTCASES_PARSE)
+def test_parse(desc, xml_str):
+    # pylint: disable=unused-argument
+    """Test parse_cimxml() against the tupletree based parser."""
+
+    exp_result = tupletree_parse(xml_str)
+
+    # Unicode and UTF-8 encoded input
+    assert parse_cimxml(xml_str, "Test XML") == exp_result
+    assert parse_cimxml(xml_str.encode('utf-8'), "Test XML") == exp_result
+
+
+TESTCASES_PARSE_ERROR = [
+
+    # Testcases for parse_cimxml() that raise ParseError.
+
+    # Each testcase is a tuple of:
+    # * desc: Short testcase description.
+    # * xml_str: CIM-XML string to be parsed.
+
+    (
+        "Ill-formed XML",
+        u'<CIM CIMVERSION="2.0" DTDVERSION="2.0">',
+    ),
+    (
+        "Unsupported CIMVERSION",
+        u'<CIM CIMVERSION="3.0" DTDVERSION="2.0">'
+        u'<MESSAGE ID="1001" PROTOCOLVERSION="1.0"><SIMPLERSP>'
+        u'<IMETHODRESPONSE NAME="GetInstance"/>'
+        u'</SIMPLERSP></MESSAGE></CIM>',
+    ),
+    (
+        "Missing required attribute",
+        response(u'<INSTANCE/>'),
+    ),
+    (
+        "Invalid child element",
+        response(u'<INSTANCE CLASSNAME="CIM_Foo"><VALUE>x</VALUE>'
+                 u'</INSTANCE>'),
+    ),
+    (
+        "Non-blank text content",
+        response(u'<INSTANCE CLASSNAME="CIM_Foo">text</INSTANCE>'),
+    ),
+    (
+        "Mixed child elements of IRETURNVALUE",
+        response(u'<CLASSNAME NAME="CIM_Foo"/>'
+                 u'<INSTANCENAME CLASSNAME="CIM_Foo"/>'),
+    ),
+    (
+        "Invalid property value",
+        response(u'<INSTANCE CLASSNAME="CIM_Foo">'
+                 u'<PROPERTY NAME="P" TYPE="uint8"><VALUE>256</VALUE>'
+                 u'</PROPERTY></INSTANCE>'),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, xml_str",
+    TESTCASES_PARSE_ERROR)
+def test_parse_error(desc, xml_str):
+    # pylint: disable=unused-argument
+    """Test parse_cimxml() with invalid CIM-XML."""
+
+    with pytest.raises(ParseError):
+        tupletree_parse(xml_str)
+    with pytest.raises(ParseError):
+        parse_cimxml(xml_str, "Test XML")
+
+
+def test_config_default():
+    """Test the default of the config variable selecting the parser."""
+    assert config.DIRECT_CIMXML_PARSER is False
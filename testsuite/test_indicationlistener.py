@@ -19,6 +19,7 @@ import errno
 import logging as _logging
 from time import time
 import datetime
+import zlib
 from random import randint
 import requests
 
@@ -168,7 +169,7 @@ class TestIndications(unittest.TestCase):
         LISTENER.start()
 
     # pylint: disable=unused-argument
-    def send_indications(self, send_count, http_port):
+    def send_indications(self, send_count, http_port, content_encoding=None):
         """
         Send the number of indications defined by the send_count attribute
         using the specified listener HTTP port.
@@ -178,6 +179,9 @@ class TestIndications(unittest.TestCase):
         indication instance and sends that instance using requests.
         The indication instance is modified for each indication count so
         that each carries its own sequence number.
+
+        If content_encoding is 'gzip' or 'deflate', the indications are
+        sent compressed with that content encoding.
         """
 
         # pylint: disable=global-variable-not-assigned
@@ -201,6 +205,8 @@ class TestIndications(unittest.TestCase):
                        'CIMProtocolVersion': cim_protocol_version}
             # We include accept-encoding because of requests issue.
             # He supplies it if we don't.  TODO try None
+            if content_encoding:
+                headers['Content-Encoding'] = content_encoding
 
             delta_time = time() - start_time
             rand_base = randint(1, 10000)
@@ -210,6 +216,13 @@ class TestIndications(unittest.TestCase):
                 msg_id = '%s' % (i + rand_base)
                 payload = create_indication_data(msg_id, i, delta_time,
                                                  cim_protocol_version)
+                if content_encoding == 'gzip':
+                    compobj = zlib.compressobj(6, zlib.DEFLATED,
+                                               16 + zlib.MAX_WBITS)
+                    payload = compobj.compress(payload.encode('utf-8')) + \
+                        compobj.flush()
+                elif content_encoding == 'deflate':
+                    payload = zlib.compress(payload.encode('utf-8'))
 
                 if VERBOSE:
                     print('headers=%s\n\npayload=%s' % (headers, payload))
@@ -242,6 +255,14 @@ class TestIndications(unittest.TestCase):
         """Test sending 100 indications"""
         self.send_indications(100, 50000)
 
+    def test_send_10_gzip(self):
+        """Test with sending 10 gzip compressed indications"""
+        self.send_indications(10, 50000, 'gzip')
+
+    def test_send_10_deflate(self):
+        """Test with sending 10 deflate compressed indications"""
+        self.send_indications(10, 50000, 'deflate')
+
     # Disabled the following tests, because in some environments it takes 30min.
     # def test_send_1000(self):
     #     """Test sending 1000 indications"""
@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+"""
+Test the InstanceRepository class of the mock repository of pywbem_mock.
+"""
+
+from __future__ import print_function, absolute_import
+
+import copy
+import pickle
+import pytest
+
+from pywbem import CIMInstance, CIMInstanceName, CIMProperty
+from pywbem_mock._instancerepository import InstanceRepository
+
+
+def make_inst(classname, name, namespace='root/cimv2'):
+    """Return a CIM instance with a path"""
+    path = CIMInstanceName(classname, keybindings={'Name': name},
+                           namespace=namespace)
+    return CIMInstance(classname, properties={'Name': name}, path=path)
+
+
+class TestInstanceRepository(object):
+    """Test the InstanceRepository class."""
+
+    def test_init(self):
+        """Test the initial content and the list-like behavior."""
+        insts = [make_inst('CIM_Foo', 'a'), make_inst('CIM_Bar', 'b'),
+                 make_inst('CIM_Foo', 'c')]
+        repo = InstanceRepository(insts)
+        assert len(repo) == 3
+        assert list(repo) == insts
+        assert 'InstanceRepository(3 instances in 2 classes)' == repr(repo)
+        assert len(InstanceRepository()) == 0
+
+    def test_get(self):
+        """Test the lookup by instance path."""
+        inst = make_inst('CIM_Foo', 'a')
+        repo = InstanceRepository([inst])
+
+        # Lookup is case-insensitive for the names, like CIMInstanceName ==
+        path = CIMInstanceName('cim_foo', keybindings={'NAME': 'a'},
+                               namespace='ROOT/cimv2')
+        assert path in repo
+        assert repo.get(path) is inst
+
+        for path in (CIMInstanceName('CIM_Foo', keybindings={'Name': 'A'},
+                                     namespace='root/cimv2'),
+                     CIMInstanceName('CIM_Foo', keybindings={'Name': 'a'}),
+                     CIMInstanceName('CIM_Bar', keybindings={'Name': 'a'},
+                                     namespace='root/cimv2')):
+            assert path not in repo
+            assert repo.get(path) is None
+            assert repo.get(path, 42) == 42
+
+    def test_add_replace(self):
+        """Test that add() replaces an instance with the same path."""
+        inst1 = make_inst('CIM_Foo', 'a')
+        inst2 = make_inst('CIM_Foo', 'a')
+        repo = InstanceRepository([inst1])
+        repo.add(inst2)
+        assert len(repo) == 1
+        assert repo.get(inst1.path) is inst2
+        assert list(repo.iter_classes(['CIM_Foo'])) == [inst2]
+
+    def test_remove(self):
+        """Test remove() and its effect on the class index."""
+        inst1 = make_inst('CIM_Foo', 'a')
+        inst2 = make_inst('CIM_Foo', 'b')
+        repo = InstanceRepository([inst1, inst2])
+
+        assert repo.remove(inst1.path.copy()) is inst1
+        assert list(repo) == [inst2]
+        assert repo.classnames() == ['cim_foo']
+        with pytest.raises(KeyError):
+            repo.remove(inst1.path)
+
+        repo.remove(inst2.path)
+        assert len(repo) == 0
+        assert repo.classnames() == []
+
+    def test_iter_classes(self):
+        """Test the iteration through the instances of classes."""
+        foo_a = make_inst('CIM_Foo', 'a')
+        bar_b = make_inst('CIM_Bar', 'b')
+        foo_c = make_inst('CIM_foo', 'c')
+        repo = InstanceRepository([foo_a, bar_b, foo_c])
+
+        assert list(repo.iter_classes(['CIM_FOO'])) == [foo_a, foo_c]
+        assert list(repo.iter_classes(['CIM_Bar', 'CIM_Foo', 'cim_bar'])) == \
+            [bar_b, foo_a, foo_c]
+        assert list(repo.iter_classes(['CIM_Baz'])) == []
+        assert sorted(repo.classnames()) == ['cim_bar', 'cim_foo']
+
+    def test_clear(self):
+        """Test clear()."""
+        repo = InstanceRepository([make_inst('CIM_Foo', 'a')])
+        repo.clear()
+        assert len(repo) == 0
+        assert list(repo.iter_classes(['CIM_Foo'])) == []
+
+    def test_deepcopy(self):
+        """Test that a deep copy has its own consistent indexes."""
+        inst = make_inst('CIM_Foo', 'a')
+        repo = InstanceRepository([inst])
+        repo2 = copy.deepcopy(repo)
+
+        inst2 = repo2.get(inst.path)
+        assert inst2 == inst
+        assert inst2 is not inst
+        assert list(repo2.iter_classes(['CIM_Foo'])) == [inst2]
+        repo2.remove(inst.path)
+        assert len(repo2) == 0
+        assert len(repo) == 1
+
+
+def make_assoc(name, antecedent, dependent, namespace='root/cimv2'):
+    """Return a CIM association instance with two references"""
+    path = CIMInstanceName('CIM_Dep', keybindings={'Name': name},
+                           namespace=namespace)
+    return CIMInstance(
+        'CIM_Dep', path=path,
+        properties=[CIMProperty('Name', name),
+                    CIMProperty('Antecedent', antecedent),
+                    CIMProperty('Dependent', dependent)])
+
+
+class TestInstanceRepositoryReferences(object):
+    """Test the reference index of the InstanceRepository class."""
+
+    def test_iter_references(self):
+        """Test that references are found for both ends."""
+        foo_a = make_inst('CIM_Foo', 'a')
+        foo_b = make_inst('CIM_Foo', 'b')
+        dep1 = make_assoc('1', foo_a.path, foo_b.path)
+        dep2 = make_assoc('2', foo_b.path, foo_a.path)
+        repo = InstanceRepository([foo_a, foo_b, dep1, dep2])
+
+        assert list(repo.iter_references(foo_a.path)) == \
+            [(dep1, 'Antecedent'), (dep2, 'Dependent')]
+        assert list(repo.iter_references(foo_b.path.copy())) == \
+            [(dep1, 'Dependent'), (dep2, 'Antecedent')]
+        assert list(repo.iter_references(dep1.path)) == []
+
+        # The referenced path must match including the namespace
+        path = foo_a.path.copy()
+        path.namespace = None
+        assert list(repo.iter_references(path)) == []
+
+    def test_same_target(self):
+        """Test an instance that references the same path twice."""
+        foo_a = make_inst('CIM_Foo', 'a')
+        dep = make_assoc('1', foo_a.path, foo_a.path)
+        repo = InstanceRepository([foo_a, dep])
+        assert list(repo.iter_references(foo_a.path)) == \
+            [(dep, 'Antecedent'), (dep, 'Dependent')]
+
+    def test_remove_replace(self):
+        """Test that remove() and add() maintain the reference index."""
+        foo_a = make_inst('CIM_Foo', 'a')
+        foo_b = make_inst('CIM_Foo', 'b')
+        foo_c = make_inst('CIM_Foo', 'c')
+        dep = make_assoc('1', foo_a.path, foo_b.path)
+        repo = InstanceRepository([foo_a, foo_b, foo_c, dep])
+
+        # Replace the association with one that references other instances
+        dep2 = make_assoc('1', foo_a.path, foo_c.path)
+        repo.add(dep2)
+        assert list(repo.iter_references(foo_a.path)) == \
+            [(dep2, 'Antecedent')]
+        assert list(repo.iter_references(foo_b.path)) == []
+        assert list(repo.iter_references(foo_c.path)) == \
+            [(dep2, 'Dependent')]
+
+        repo.remove(dep2.path)
+        for inst in (foo_a, foo_b, foo_c):
+            assert list(repo.iter_references(inst.path)) == []
+
+    def test_update_properties(self):
+        """Test that update_properties() maintains the reference index."""
+        foo_a = make_inst('CIM_Foo', 'a')
+        foo_b = make_inst('CIM_Foo', 'b')
+        dep = make_assoc('1', foo_a.path, foo_a.path)
+        repo = InstanceRepository([foo_a, foo_b, dep])
+
+        repo.update_properties(dep.path, {'Dependent': foo_b.path})
+        assert dep['Dependent'] == foo_b.path
+        assert list(repo.iter_references(foo_a.path)) == \
+            [(dep, 'Antecedent')]
+        assert list(repo.iter_references(foo_b.path)) == \
+            [(dep, 'Dependent')]
+
+        with pytest.raises(KeyError):
+            repo.update_properties(CIMInstanceName('CIM_Foo'), {})
+
+    def test_pickle(self):
+        """Test that pickling preserves the instances and the indexes."""
+        foo_a = make_inst('CIM_Foo', 'a')
+        foo_b = make_inst('CIM_Foo', 'b')
+        dep = make_assoc('1', foo_a.path, foo_b.path)
+        repo = InstanceRepository([foo_a, foo_b, dep])
+
+        repo2 = pickle.loads(pickle.dumps(repo, pickle.HIGHEST_PROTOCOL))
+        assert list(repo2) == [foo_a, foo_b, dep]
+        assert repo2.get(foo_b.path) == foo_b
+        assert list(repo2.iter_classes(['cim_foo'])) == [foo_a, foo_b]
+        dep2 = repo2.get(dep.path)
+        assert list(repo2.iter_references(foo_b.path)) == \
+            [(dep2, 'Dependent')]
@@ -0,0 +1,293 @@
+#!/usr/bin/env python
+"""
+Test the MockWBEMServer class of pywbem_mock, using a WBEMConnection that
+connects to it.
+"""
+
+from __future__ import print_function, absolute_import
+
+import time
+import logging
+import pytest
+import requests
+
+from pywbem import WBEMConnection, CIMInstance, CIMInstanceName, \
+    CIMParameter, CIMError, Uint32, HTTPError, CIM_ERR_NOT_FOUND, \
+    CIM_ERR_NOT_SUPPORTED
+from pywbem_mock import FakedWBEMConnection, MockWBEMServer
+
+# pylint: disable=redefined-outer-name
+
+TEST_MOF = """
+    Qualifier Key : boolean = false,
+        Scope(property, reference),
+        Flavor(DisableOverride, ToSubclass);
+    Qualifier Association : boolean = false,
+        Scope(association),
+        Flavor(DisableOverride, ToSubclass);
+    Qualifier Description : string = null,
+        Scope(any),
+        Flavor(EnableOverride, ToSubclass, Translatable);
+    Qualifier In : boolean = true,
+        Scope(parameter),
+        Flavor(DisableOverride, ToSubclass);
+    Qualifier Out : boolean = false,
+        Scope(parameter),
+        Flavor(DisableOverride, ToSubclass);
+
+    [Description ("Foo class")]
+    class CIM_Foo {
+        [Key] string InstanceID;
+        uint32 Num;
+        uint32 Method1([IN] uint32 Arg, [IN (false), OUT] string Result);
+    };
+
+    class CIM_FooSub : CIM_Foo {
+        string Sub;
+    };
+
+    [Association]
+    class CIM_FooAssoc {
+        [Key] CIM_Foo REF Antecedent;
+        [Key] CIM_Foo REF Dependent;
+    };
+
+    instance of CIM_Foo as $a { InstanceID = "a"; Num = 1; };
+    instance of CIM_FooSub as $b { InstanceID = "b"; Num = 2; Sub = "x"; };
+    instance of CIM_Foo as $c { InstanceID = "c"; Num = 3; };
+    instance of CIM_FooAssoc { Antecedent = $a; Dependent = $b; };
+"""
+
+
+def method1_callback(conn, methodname, objectname, **params):
+    # pylint: disable=unused-argument
+    """Method callback function for CIM_Foo.Method1"""
+    result = u'%s:%s' % (objectname.classname, params['Arg'].value)
+    return (Uint32(params['Arg'].value + 1),
+            [CIMParameter('Result', 'string', value=result)])
+
+
+@pytest.fixture
+def faked_conn():
+    """
+    Create a FakedWBEMConnection with the test model and return it.
+    """
+    # pylint: disable=protected-access
+    WBEMConnection._reset_logging_config()
+    conn = FakedWBEMConnection()
+    conn.compile_mof_string(TEST_MOF)
+    conn.add_method_callback('CIM_Foo', 'Method1', method1_callback)
+    return conn
+
+
+@pytest.fixture
+def server(faked_conn):
+    """
+    Start a MockWBEMServer for the faked connection and stop it at the end.
+    """
+    server = MockWBEMServer(faked_conn)
+    server.start()
+    yield server
+    server.stop()
+
+
+def mof_list(objs):
+    """
+    Return the MOF of CIM instances or classes, sorted. The MOF does not
+    contain the `propagated` attribute of properties, which is not
+    transported in CIM-XML responses for instances.
+    """
+    return sorted(obj.tomof() for obj in objs)
+
+
+class TestMockWBEMServer(object):
+    """Test the MockWBEMServer class."""
+
+    def test_attrs(self, faked_conn):
+        # pylint: disable=no-self-use
+        """Test the attributes and starting and stopping."""
+        server = MockWBEMServer(faked_conn, port='0', bandwidth=1000)
+        assert server.conn is faked_conn
+        assert server.host == 'localhost'
+        assert server.port == 0
+        assert server.bandwidth == 1000
+        assert server.started is False
+        assert isinstance(server.logger, logging.Logger)
+        assert repr(server).startswith('MockWBEMServer(host=')
+
+        with server:
+            server.start()
+            assert server.started is True
+            assert server.port != 0
+            assert server.url == 'http://localhost:%s' % server.port
+        assert server.started is False
+
+        with pytest.raises(ValueError):
+            MockWBEMServer(faked_conn, bandwidth=0)
+        with pytest.raises(TypeError):
+            MockWBEMServer(faked_conn, port=1.5)
+
+    @pytest.mark.parametrize("compression", [False, True])
+    def test_instance_operations(self, faked_conn, server, compression):
+        # pylint: disable=no-self-use
+        """Test the instance operations, with and without compression."""
+        conn = WBEMConnection(server.url, compression=compression)
+
+        insts = conn.EnumerateInstances('CIM_Foo')
+        assert mof_list(insts) == \
+            mof_list(faked_conn.EnumerateInstances('CIM_Foo'))
+        assert set(inst.path for inst in insts) == \
+            set(inst.path for inst in faked_conn.EnumerateInstances('CIM_Foo'))
+
+        paths = conn.EnumerateInstanceNames('CIM_Foo')
+        assert set(paths) == \
+            set(faked_conn.EnumerateInstanceNames('CIM_Foo'))
+
+        path = CIMInstanceName('CIM_FooSub', {'InstanceID': 'b'},
+                               namespace='root/cimv2')
+        inst = conn.GetInstance(path, PropertyList=['Sub'])
+        assert inst.path == path
+        assert inst.tomof() == \
+            faked_conn.GetInstance(path, PropertyList=['Sub']).tomof()
+
+        new_inst = CIMInstance('CIM_Foo', {'InstanceID': u'd',
+                                           'Num': Uint32(4)})
+        new_path = conn.CreateInstance(new_inst)
+        assert new_path.keybindings['InstanceID'] == 'd'
+        new_inst = conn.GetInstance(new_path)
+        new_inst['Num'] = Uint32(5)
+        conn.ModifyInstance(new_inst)
+        assert faked_conn.GetInstance(new_path)['Num'] == 5
+        conn.DeleteInstance(new_path)
+
+        with pytest.raises(CIMError) as exc_info:
+            conn.GetInstance(new_path)
+        assert exc_info.value.status_code == CIM_ERR_NOT_FOUND
+
+    def test_class_qualifier_operations(self, faked_conn, server):
+        # pylint: disable=no-self-use
+        """Test the class and qualifier declaration operations."""
+        conn = WBEMConnection(server.url)
+
+        assert set(conn.EnumerateClassNames(DeepInheritance=True)) == \
+            set(faked_conn.EnumerateClassNames(DeepInheritance=True))
+        assert mof_list(conn.EnumerateClasses(DeepInheritance=True)) == \
+            mof_list(faked_conn.EnumerateClasses(DeepInheritance=True))
+        assert conn.GetClass('CIM_FooSub', LocalOnly=False).tomof() == \
+            faked_conn.GetClass('CIM_FooSub', LocalOnly=False).tomof()
+
+        quals = conn.EnumerateQualifiers()
+        assert sorted(q.name for q in quals) == \
+            sorted(q.name for q in faked_conn.EnumerateQualifiers())
+        # The ANY scope is returned as all scopes
+        qual = conn.GetQualifier('Description')
+        assert qual.scopes['CLASS'] is True
+        assert qual.scopes['PARAMETER'] is True
+        assert 'ANY' not in qual.scopes
+
+        with pytest.raises(CIMError) as exc_info:
+            conn.GetClass('CIM_Blah')
+        assert exc_info.value.status_code == CIM_ERR_NOT_FOUND
+
+    def test_association_operations(self, faked_conn, server):
+        # pylint: disable=no-self-use
+        """Test the association operations."""
+        conn = WBEMConnection(server.url)
+        path = CIMInstanceName('CIM_Foo', {'InstanceID': 'a'},
+                               namespace='root/cimv2')
+
+        assert conn.ReferenceNames(path) == faked_conn.ReferenceNames(path)
+        assert conn.AssociatorNames(path) == faked_conn.AssociatorNames(path)
+        assert mof_list(conn.References(path)) == \
+            mof_list(faked_conn.References(path))
+        # The server sets the host in the paths of the returned instances
+        assert [inst.tomof() for inst in conn.Associators(path)] == \
+            [inst.tomof() for inst in faked_conn.Associators(path)]
+        assert [inst.path.keybindings for inst in conn.Associators(path)] == \
+            [inst.path.keybindings for inst in faked_conn.Associators(path)]
+
+        results = conn.References('CIM_Foo')
+        assert [(cln.classname, cl.classname) for cln, cl in results] == \
+            [('CIM_FooAssoc', 'CIM_FooAssoc')]
+
+    def test_pull_operations(self, faked_conn, server):
+        # pylint: disable=no-self-use
+        """Test the open and pull operations."""
+        conn = WBEMConnection(server.url)
+
+        result = conn.OpenEnumerateInstances('CIM_Foo', MaxObjectCount=2)
+        assert result.eos is False
+        insts = result.instances
+        result = conn.PullInstancesWithPath(result.context, 2)
+        assert result.eos is True
+        insts.extend(result.instances)
+        assert mof_list(insts) == \
+            mof_list(faked_conn.EnumerateInstances('CIM_Foo'))
+
+        result = conn.OpenEnumerateInstancePaths('CIM_Foo', MaxObjectCount=1)
+        assert result.eos is False
+        conn.CloseEnumeration(result.context)
+        assert not faked_conn.enumeration_contexts
+
+        paths = list(conn.IterEnumerateInstancePaths('CIM_Foo',
+                                                     MaxObjectCount=1))
+        assert len(paths) == 3
+
+        path = CIMInstanceName('CIM_FooSub', {'InstanceID': 'b'},
+                               namespace='root/cimv2')
+        refs = list(conn.IterReferenceInstancePaths(path))
+        assert [ref.classname for ref in refs] == ['CIM_FooAssoc']
+
+    def test_invokemethod(self, server):
+        # pylint: disable=no-self-use
+        """Test InvokeMethod."""
+        conn = WBEMConnection(server.url)
+        path = CIMInstanceName('CIM_Foo', {'InstanceID': 'a'},
+                               namespace='root/cimv2')
+
+        result = conn.InvokeMethod('Method1', path, [('Arg', Uint32(41))])
+        assert result == (42, {'Result': u'CIM_Foo:41'})
+        assert isinstance(result[0], Uint32)
+
+        result = conn.InvokeMethod('Method1', 'CIM_FooSub', Arg=Uint32(1))
+        assert result == (2, {'Result': u'CIM_FooSub:1'})
+
+        with pytest.raises(CIMError):
+            conn.InvokeMethod('Method2', path)
+
+    def test_unsupported(self, server):
+        # pylint: disable=no-self-use
+        """Test operations that the mock repository does not support."""
+        conn = WBEMConnection(server.url)
+        with pytest.raises(CIMError) as exc_info:
+            conn.ExecQuery('WQL', 'SELECT * FROM CIM_Foo')
+        assert exc_info.value.status_code == CIM_ERR_NOT_SUPPORTED
+
+    def test_invalid_request(self, server):
+        # pylint: disable=no-self-use
+        """Test that an invalid request is rejected at the HTTP level."""
+        response = requests.post(server.url + '/cimom', data='<CIM/>',
+                                 headers={'Content-Type': 'application/xml'})
+        assert response.status_code == 400
+        assert response.headers['CIMError'] == 'request-not-well-formed'
+
+        conn = WBEMConnection(server.url)
+        # pylint: disable=protected-access
+        conn._imethodcall_request = \
+            lambda *args, **kwargs: ([], '<CIM></CIM>')
+        with pytest.raises(HTTPError):
+            conn.EnumerateInstances('CIM_Foo')
+
+    def test_delay(self, faked_conn):
+        # pylint: disable=no-self-use
+        """Test the response delay and the simulated bandwidth."""
+        faked_conn.response_delay = 0.2
+        with MockWBEMServer(faked_conn, bandwidth=10000) as server:
+            server.start()
+            conn = WBEMConnection(server.url)
+            conn.GetClass('CIM_Foo')  # Establish the connection
+            start = time.time()
+            conn.GetClass('CIM_Foo')
+            duration = time.time() - start
+        reply_len = conn.last_reply_len
+        assert duration >= 0.2 + reply_len / 10000.0
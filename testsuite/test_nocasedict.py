@@ -5,6 +5,7 @@ Test the _nocasedict module.
 from __future__ import absolute_import
 
 import re
+import pickle
 import six
 try:
     from collections import OrderedDict
@@ -2453,3 +2454,25 @@ def test_unnamed_keys():
     del dic[None]
     assert None not in dic
     assert not dic
+
+
+def test_slots():
+    """
+    Test that NocaseDict objects have no __dict__, to save memory.
+    """
+    dic = NocaseDict([('Dog', 'Cat')])
+    assert not hasattr(dic, '__dict__')
+    with pytest.raises(AttributeError):
+        dic.foo = 'bar'  # pylint: disable=assigning-non-slot
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle(protocol):
+    """
+    Test that NocaseDict objects can be pickled with all protocols.
+    """
+    dic = NocaseDict([('Dog', 'Cat'), ('Budgie', 'Fish')])
+    dic2 = pickle.loads(pickle.dumps(dic, protocol))
+    assert dic2 == dic
+    assert list(dic2.keys()) == ['Dog', 'Budgie']
+    assert dic2['DOG'] == 'Cat'
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+
+"""
+Tests for WBEMServerPool (`_server_pool` in pywbem module), using local HTTP
+servers.
+"""
+
+from __future__ import absolute_import, print_function
+
+import threading
+import time
+import pytest
+
+from six.moves import BaseHTTPServer
+
+from pywbem import WBEMServerPool, WBEMConnection, CIMError, \
+    ConnectionError, TimeoutError
+
+from test_cim_operations import EnumerateInstancesHandler
+
+
+class DelayedHandler(EnumerateInstancesHandler):
+    """
+    EnumerateInstancesHandler that delays the response by the delay set in
+    the server, and records the number of concurrently active requests.
+    """
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Respond to a POST request after the delay."""
+        with self.server.lock:
+            self.server.active[0] += 1
+            self.server.max_active[0] = max(self.server.max_active[0],
+                                            self.server.active[0])
+        try:
+            time.sleep(self.server.delay)
+        finally:
+            with self.server.lock:
+                self.server.active[0] -= 1
+        EnumerateInstancesHandler.do_POST(self)
+
+
+class TestWBEMServerPool(object):
+    """
+    Test WBEMServerPool against a number of local HTTP servers.
+    """
+
+    def setup_method(self):
+        """Start the HTTP servers."""
+        lock = threading.Lock()
+        active = [0]
+        max_active = [0]
+        self.servers = []
+        self.urls = []
+        for i in range(4):
+            server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0),
+                                               DelayedHandler)
+            server.inst_count = i + 1
+            server.error = False
+            server.compression = False
+            server.delay = 0.2
+            server.lock = lock
+            server.active = active
+            server.max_active = max_active
+            thread = threading.Thread(target=server.serve_forever,
+                                      kwargs={'poll_interval': 0.05})
+            thread.daemon = True
+            thread.start()
+            self.servers.append(server)
+            self.urls.append('http://127.0.0.1:%s' % server.server_address[1])
+        self.max_active = max_active
+
+    def teardown_method(self):
+        """Stop the HTTP servers."""
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+
+    def test_map(self):
+        """Test that the results are returned for each server."""
+        pool = WBEMServerPool(self.urls, stats_enabled=True, timeout=10)
+        assert len(pool.connections) == 4
+
+        results = list(pool.map('EnumerateInstances', 'PyWBEM_Person',
+                                namespace='root/cimv2'))
+        assert len(results) == 4
+        for conn, result, exc in results:
+            assert exc is None
+            index = self.urls.index(conn.url)
+            assert len(result) == index + 1
+        assert self.max_active[0] == 4
+
+        stats = pool.statistics.get_op_statistic('EnumerateInstances')
+        assert stats.count == 4
+        assert stats.exception_count == 0
+
+    def test_max_workers(self):
+        """Test that the concurrency is limited by max_workers."""
+        pool = WBEMServerPool(self.urls, max_workers=2, timeout=10)
+        results = list(pool.map('EnumerateInstances', 'PyWBEM_Person'))
+        assert len(results) == 4
+        assert self.max_active[0] == 2
+
+    def test_errors(self):
+        """Test that exceptions are returned per server."""
+        self.servers[1].error = True
+        conns = [WBEMConnection(url, timeout=10) for url in self.urls]
+        conns.append(WBEMConnection('http://127.0.0.1:1', timeout=10))
+        pool = WBEMServerPool(conns)
+
+        results = dict((r.conn, r) for r in
+                       pool.map('EnumerateInstances', 'PyWBEM_Person'))
+        assert len(results) == 5
+        assert isinstance(results[conns[1]].exception, CIMError)
+        assert results[conns[1]].result is None
+        assert isinstance(results[conns[4]].exception, ConnectionError)
+        assert len(results[conns[3]].result) == 4
+
+    def test_timeout(self):
+        """Test that slow servers are timed out per server."""
+        self.servers[2].delay = 2
+        pool = WBEMServerPool(self.urls, timeout=1)
+
+        start = time.time()
+        results = list(pool.map('EnumerateInstances', 'PyWBEM_Person'))
+        assert time.time() - start < 2
+        assert [r.conn.url for r in results][-1] == self.urls[2]
+        assert isinstance(results[-1].exception, TimeoutError)
+        assert all(r.exception is None for r in results[:-1])
+
+    def test_timeout_busy(self):
+        """
+        Test that no operation is started on a connection whose operation
+        timed out and is still running.
+        """
+        self.servers[2].delay = 1.5
+        conns = [WBEMConnection(url, timeout=10) for url in self.urls]
+        pool = WBEMServerPool(conns, timeout=0.5)
+
+        results = list(pool.map('EnumerateInstances', 'PyWBEM_Person'))
+        assert isinstance(results[-1].exception, TimeoutError)
+
+        results = list(pool.map('EnumerateInstances', 'PyWBEM_Person'))
+        assert results[0].conn is conns[2]
+        assert isinstance(results[0].exception, TimeoutError)
+        assert 'not started' in str(results[0].exception)
+        assert all(r.exception is None for r in results[1:])
+        assert self.max_active[0] == 4
+
+        # The connection is used again when its operation has completed
+        time.sleep(1.5)
+        self.servers[2].delay = 0.2
+        results = list(pool.map('EnumerateInstances', 'PyWBEM_Person'))
+        assert all(r.exception is None for r in results)
+        assert len(results) == 4
+
+    def test_generator_result(self):
+        """Test that generator results are returned as lists."""
+        pool = WBEMServerPool(self.urls[0:1], use_pull_operations=False,
+                              timeout=10)
+        results = list(pool.map('IterEnumerateInstances', 'PyWBEM_Person'))
+        assert isinstance(results[0].result, list)
+        assert len(results[0].result) == 1
+
+    def test_invalid(self):  # pylint: disable=no-self-use
+        """Test invalid parameters."""
+        with pytest.raises(TypeError):
+            WBEMServerPool([42])
+        with pytest.raises(ValueError):
+            WBEMServerPool(['http://localhost'], max_workers=0)
+        pool = WBEMServerPool(['http://localhost'])
+        with pytest.raises(AttributeError):
+            pool.map('NoSuchOperation')
@@ -138,6 +138,27 @@ class StatisticsTests(unittest.TestCase):
         self.assertEqual(stats.min_time, float('inf'))
         self.assertEqual(stats.max_time, 0)
 
+    def test_measure_wire_len(self):
+        """Test the measured sizes of compressed HTTP bodies."""
+
+        statistics = Statistics()
+        statistics.enable()
+
+        stats = statistics.start_timer('EnumerateInstances')
+        stats.stop_timer(100, 2000, request_wire_len=80, reply_wire_len=150)
+        stats = statistics.start_timer('EnumerateInstances')
+        stats.stop_timer(100, 2000)
+
+        self.assertEqual(stats.count, 2)
+        self.assertEqual(stats.avg_request_len, 100)
+        self.assertEqual(stats.avg_reply_len, 2000)
+        self.assertEqual(stats.avg_request_wire_len, 90)
+        self.assertEqual(stats.avg_reply_wire_len, 1075)
+
+        stats.reset()
+        self.assertEqual(stats.avg_request_wire_len, 0)
+        self.assertEqual(stats.avg_reply_wire_len, 0)
+
     def test_measure_enabled_with_servertime(self):
         # pylint: disable=invalid-name
         """Test measuring time with enabled statistics."""
@@ -319,6 +340,117 @@ class StatisticsTests(unittest.TestCase):
             self.assertTrue(time_abs_delta(stats.max_time, duration) < delta,
                             "actual max duration: %r" % stats.max_time)
 
+    def test_connection_counters(self):
+        """Test the connection pool counters."""
+
+        statistics = Statistics()
+
+        # Disabled statistics do not count
+        statistics.count_connection(reused=False)
+        statistics.set_conn_pool_size(1)
+        self.assertEqual(statistics.conn_created_count, 0)
+        self.assertEqual(statistics.conn_reused_count, 0)
+        self.assertEqual(statistics.conn_pool_size, 0)
+
+        statistics.enable()
+        statistics.count_connection(reused=False)
+        statistics.count_connection(reused=True)
+        statistics.count_connection(reused=True)
+        statistics.set_conn_pool_size(1)
+        self.assertEqual(statistics.conn_created_count, 1)
+        self.assertEqual(statistics.conn_reused_count, 2)
+        self.assertEqual(statistics.conn_pool_size, 1)
+
+        self.assertIn('Connections: created 1, reused 2, pooled 1',
+                      statistics.formatted())
+
+    def test_class_cache_counters(self):
+        """Test the class cache counters."""
+
+        statistics = Statistics()
+
+        # Disabled statistics do not count
+        statistics.count_class_cache(hit=True)
+        self.assertEqual(statistics.class_cache_hits, 0)
+        self.assertEqual(statistics.class_cache_misses, 0)
+
+        statistics.enable()
+        statistics.count_class_cache(hit=False)
+        statistics.count_class_cache(hit=True)
+        statistics.count_class_cache(hit=True)
+        self.assertEqual(statistics.class_cache_hits, 2)
+        self.assertEqual(statistics.class_cache_misses, 1)
+        self.assertIn('Class cache: hits 2, misses 1',
+                      statistics.formatted())
+
+        total = Statistics(enable=True)
+        total.merge(statistics)
+        total.merge(statistics)
+        self.assertEqual(total.class_cache_hits, 4)
+        self.assertEqual(total.class_cache_misses, 2)
+
+    def test_merge(self):
+        """Test merging the statistics of several containers."""
+
+        statistics1 = Statistics(enable=True)
+        stats = statistics1.get_op_statistic('EnumerateInstances')
+        stats.record(0.5, 100, 1000, server_time=0.4)
+        stats.record(1.5, 300, 3000, exception=True)
+        statistics1.count_connection(reused=False)
+
+        statistics2 = Statistics(enable=True)
+        stats = statistics2.get_op_statistic('EnumerateInstances')
+        stats.record(1.0, 200, 2000, request_wire_len=50,
+                     reply_wire_len=500)
+        statistics2.get_op_statistic('GetInstance').record(0.1, 10, 20)
+        statistics2.count_connection(reused=True)
+
+        total = Statistics(enable=True)
+        total.merge(statistics1)
+        total.merge(statistics2)
+
+        stats = total.get_op_statistic('EnumerateInstances')
+        self.assertEqual(stats.count, 3)
+        self.assertEqual(stats.exception_count, 1)
+        self.assertEqual(stats.avg_time, 1.0)
+        self.assertEqual(stats.min_time, 0.5)
+        self.assertEqual(stats.max_time, 1.5)
+        self.assertEqual(stats.avg_request_len, 200)
+        self.assertEqual(stats.min_request_len, 100)
+        self.assertEqual(stats.max_reply_len, 3000)
+        self.assertEqual(stats.avg_reply_wire_len, 1500)
+        self.assertEqual(stats.max_server_time, 0.4)
+        self.assertEqual(total.get_op_statistic('GetInstance').count, 1)
+        self.assertEqual(total.conn_created_count, 1)
+        self.assertEqual(total.conn_reused_count, 1)
+
+        # The merged containers are not changed
+        self.assertEqual(
+            statistics1.get_op_statistic('EnumerateInstances').count, 2)
+
+    def test_max_object_count(self):
+        """Test recording the MaxObjectCount of open and pull operations."""
+
+        statistics = Statistics()
+        stats = statistics.get_op_statistic('PullInstancesWithPath')
+        stats.record_max_object_count(100)
+        self.assertEqual(stats.avg_max_object_count, 0)
+
+        statistics.enable()
+        stats = statistics.get_op_statistic('PullInstancesWithPath')
+        for count in (10, 40, 160, None):
+            stats.record_max_object_count(count)
+        self.assertEqual(stats.avg_max_object_count, 70)
+        self.assertEqual(stats.min_max_object_count, 10)
+        self.assertEqual(stats.max_max_object_count, 160)
+        self.assertIn('MaxObjectCount: avg 70, min 10, max 160 '
+                      'PullInstancesWithPath', statistics.formatted())
+
+        total = Statistics(enable=True)
+        total.merge(statistics)
+        stats = total.get_op_statistic('PullInstancesWithPath')
+        self.assertEqual(stats.max_max_object_count, 160)
+
 
 class StatisticsOutputTests(unittest.TestCase, RegexpMixin):
     """Test repr and report output from statistics class"""
@@ -0,0 +1,134 @@
+#
+# (C) Copyright 2018 IBM Corp.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+Test for the WBEMSubscriptionManager class in pywbem._subscription_manager.py
+that uses the pywbem_mock support package.
+"""
+from __future__ import absolute_import, print_function
+
+import pytest
+
+from pywbem import WBEMServer, WBEMSubscriptionManager, LogOperationRecorder
+import test_wbemserverclass
+
+SUBSCRIPTION_CLASSNAMES = ['CIM_ListenerDestinationCIMXML',
+                           'CIM_IndicationFilter',
+                           'CIM_IndicationSubscription',
+                           'CIM_ComputerSystem']
+
+
+def build_subscription_repo():
+    """
+    Build a mock repository with the classes and instances needed by the
+    subscription manager, with the Interop namespace 'interop'.
+    """
+    builder = test_wbemserverclass.TestServerClass()
+    conn = builder.build_class_repo('interop',
+                                    extra_classnames=SUBSCRIPTION_CLASSNAMES)
+    builder.build_obj_mgr_inst(conn, 'interop', 'MockSystem_WBEMServerTest',
+                               'MyFakeObjectManager')
+    builder.build_cimnamespace_insts(conn, 'interop',
+                                     'MockSystem_WBEMServerTest',
+                                     'MyFakeObjectManager', ['interop'])
+    return conn
+
+
+def path_key(paths):
+    """Return a set of the instance paths without host, for comparison"""
+    keys = set()
+    for path in paths:
+        path = path.copy()
+        path.host = None
+        keys.add(path)
+    return keys
+
+
+@pytest.mark.parametrize(
+    "use_recorder", [False, True])
+def test_add_server_recovers_owned(use_recorder, monkeypatch):
+    """
+    Test that add_server() of a new subscription manager with the same
+    subscription manager ID recovers exactly the owned destinations, filters
+    and subscriptions created by an earlier subscription manager, concurrently
+    and (if operation recorders are present) sequentially.
+    """
+    conn = build_subscription_repo()
+    server = WBEMServer(conn)
+
+    # Owned and not-owned objects of the subscription manager under test
+    sub_mgr = WBEMSubscriptionManager('fred')
+    server_id = sub_mgr.add_server(server)
+    owned_dests = sub_mgr.add_listener_destinations(
+        server_id, 'http://owned:5000')
+    dests = sub_mgr.add_listener_destinations(
+        server_id, 'http://notowned:5000', owned=False)
+    owned_filter = sub_mgr.add_filter(
+        server_id, 'root/cimv2', 'SELECT * FROM CIM_AlertIndication',
+        owned=True, filter_id='f1')
+    filter_ = sub_mgr.add_filter(
+        server_id, 'root/cimv2', 'SELECT * FROM CIM_ProcessIndication',
+        owned=False, name='pywbemfilter:notowned')
+    owned_subs = sub_mgr.add_subscriptions(
+        server_id, owned_filter.path, [owned_dests[0].path])
+    sub_mgr.add_subscriptions(
+        server_id, filter_.path, [dests[0].path], owned=False)
+
+    # Owned objects of another subscription manager
+    other_mgr = WBEMSubscriptionManager('other')
+    other_id = other_mgr.add_server(server)
+    other_dests = other_mgr.add_listener_destinations(
+        other_id, 'http://other:5000')
+    other_filter = other_mgr.add_filter(
+        other_id, 'root/cimv2', 'SELECT * FROM CIM_Indication',
+        owned=True, filter_id='f2')
+    other_mgr.add_subscriptions(
+        other_id, other_filter.path, [other_dests[0].path])
+
+    if use_recorder:
+        conn.add_operation_recorder(LogOperationRecorder('test'))
+    new_server = WBEMServer(conn)
+
+    run_counts = []
+    # pylint: disable=protected-access
+    run_concurrently = new_server._run_concurrently
+
+    def counting_run_concurrently(*args, **kwargs):
+        """Count the calls of WBEMServer._run_concurrently()"""
+        run_counts.append(1)
+        return run_concurrently(*args, **kwargs)
+
+    monkeypatch.setattr(new_server, '_run_concurrently',
+                        counting_run_concurrently)
+
+    new_mgr = WBEMSubscriptionManager('fred')
+    new_id = new_mgr.add_server(new_server)
+
+    # The enumerations and the retrieval of the owned instances are each
+    # performed concurrently
+    assert len(run_counts) == (0 if use_recorder else 2)
+    assert path_key(i.path for i in new_mgr.get_owned_destinations(new_id)) \
+        == path_key(i.path for i in owned_dests)
+    assert path_key(i.path for i in new_mgr.get_owned_filters(new_id)) \
+        == path_key([owned_filter.path])
+    assert path_key(i.path for i in new_mgr.get_owned_subscriptions(new_id)) \
+        == path_key(i.path for i in owned_subs)
+
+    # The recovered owned objects are complete instances
+    for inst in new_mgr.get_owned_filters(new_id):
+        assert inst['Query'] == 'SELECT * FROM CIM_AlertIndication'
@@ -244,6 +244,60 @@ class TestTupleTreeSax(unittest.TestCase):
                          % (path, pp.pformat(tree_sax), pp.pformat(tree_sax)))
 
 
+class TestCIMStreamParser(unittest.TestCase):
+    """Test the incremental CIMStreamParser"""
+
+    def setUp(self):
+        data_dir = resource_filename(__name__, 'tupletree_ok')
+        path = os.path.join(data_dir, 'Associators_StorageVolume_small.xml')
+        with open(path, 'rb') as fh:
+            self.xml_str = fh.read()
+
+    def test_feed(self):
+        """
+        Elements fed in small pieces are returned as soon as they are
+        complete, and are the same as in the complete tupletree.
+        """
+        parser = tupletree.CIMStreamParser(['VALUE.OBJECTWITHPATH'],
+                                           ['IRETURNVALUE'], 'Test XML')
+        completed = []
+        for i in range(0, len(self.xml_str), 17):
+            completed.extend(parser.feed(self.xml_str[i:i + 17]))
+        root = parser.close()
+
+        tree_sax = tupletree.xml_to_tupletree_sax(self.xml_str, 'Test XML')
+        ireturnvalue = tree_sax[2][0][2][1][2][0][2][0]
+        self.assertEqual(ireturnvalue[0], u'IRETURNVALUE')
+        exp_completed = [kid for kid in ireturnvalue[2]
+                         if isinstance(kid, tuple)]
+        self.assertEqual(len(completed), 1)
+        self.assertEqual(completed, exp_completed)
+
+        # The remaining tree no longer contains the completed elements
+        remaining = root[2][0][2][1][2][0][2][0]
+        self.assertEqual(remaining[0], u'IRETURNVALUE')
+        self.assertEqual([kid for kid in remaining[2]
+                          if isinstance(kid, tuple)], [])
+
+    def test_error(self):
+        """Incomplete XML raises ParseError when closing the parser."""
+        parser = tupletree.CIMStreamParser(['VALUE.OBJECTWITHPATH'],
+                                           ['IRETURNVALUE'], 'Test XML')
+        parser.feed(self.xml_str[:len(self.xml_str) // 2])
+        self.assertRaises(ParseError, parser.close)
+
+    def test_inconsistent_tree(self):
+        """
+        A detached element that is not the last child of its parent raises
+        ParseError.
+        """
+        handler = tupletree.CIMStreamContentHandler(['VALUE'], ['IRETURNVALUE'])
+        handler.startElement(u'IRETURNVALUE', {})
+        handler.startElement(u'VALUE', {})
+        del handler.elements[-1][2][:]
+        self.assertRaises(ParseError, handler.endElement, u'VALUE')
+
+
 class Test_check_invalid_utf8_sequences(object):
     # pylint: disable=too-few-public-methods
     """Tests for check_invalid_utf8_sequences()"""
@@ -781,3 +781,179 @@ class Test_ValueMapping(object):
         for item in vm.items():
             items.append(item)
         assert items == exp_items
+
+    def test_tovalues_many(self, element_kind, server_arg, integer_type):
+        # pylint: disable=redefined-outer-name
+        """Test tovalues_many() with singles, ranges, unclaimed"""
+        valuemap = ['0', '1', '2..4', '..6', '7..', '9', '..']
+        values = ['zero', 'one', 'two-four', 'five-six', 'seven-eight', 'nine',
+                  'unclaimed']
+
+        vm = self.setup_for_element(element_kind, server_arg, integer_type,
+                                    valuemap, values)
+
+        cimtype = type_from_name(integer_type)
+        element_values = [3, 0, 11, cimtype(3), 9, 6, 3, 1, 10]
+        assert vm.tovalues_many(element_values) == \
+            [vm.tovalues(v) for v in element_values]
+        assert vm.tovalues_many(iter([])) == []
+
+        with pytest.raises(TypeError):
+            vm.tovalues_many([1, 3, 3.0])
+        with pytest.raises(TypeError):
+            vm.tovalues_many([1, '1'])
+
+    def test_tovalues_many_outside(self, element_kind, server_arg,
+                                   integer_type):
+        # pylint: disable=redefined-outer-name
+        """Test tovalues_many() with a value outside of the ValueMap"""
+        valuemap = ['0', '2..4']
+        values = ['zero', 'two-four']
+
+        vm = self.setup_for_element(element_kind, server_arg, integer_type,
+                                    valuemap, values)
+
+        assert vm.tovalues_many([2, 0, 4]) == ['two-four', 'zero', 'two-four']
+        with pytest.raises(ValueError):
+            vm.tovalues_many([2, 0, 5])
+
+    def test_overlapping_ranges(self, element_kind, server_arg):
+        # pylint: disable=redefined-outer-name
+        """Test overlapping value ranges, which are searched in order"""
+        valuemap = ['10..20', '0..5', '4..12', '30..40']
+        values = ['ten-twenty', 'zero-five', 'four-twelve', 'thirty-forty']
+
+        vm = self.setup_for_element(element_kind, server_arg, 'uint8',
+                                    valuemap, values)
+
+        assert vm.tovalues(3) == 'zero-five'
+        assert vm.tovalues(5) == 'zero-five'
+        assert vm.tovalues(6) == 'four-twelve'
+        assert vm.tovalues(11) == 'ten-twenty'
+        assert vm.tovalues(35) == 'thirty-forty'
+        self.assertOutsideValueMap(vm, 25)
+
+    def test_unsorted_ranges(self, element_kind, server_arg):
+        # pylint: disable=redefined-outer-name
+        """Test non-overlapping value ranges that are not sorted"""
+        valuemap = ['30..40', '0..5', '10..20', '50', '..']
+        values = ['thirty-forty', 'zero-five', 'ten-twenty', 'fifty',
+                  'unclaimed']
+
+        vm = self.setup_for_element(element_kind, server_arg, 'uint8',
+                                    valuemap, values)
+
+        assert vm.tovalues(0) == 'zero-five'
+        assert vm.tovalues(5) == 'zero-five'
+        assert vm.tovalues(6) == 'unclaimed'
+        assert vm.tovalues(10) == 'ten-twenty'
+        assert vm.tovalues(21) == 'unclaimed'
+        assert vm.tovalues(40) == 'thirty-forty'
+        assert vm.tovalues(50) == 'fifty'
+        assert vm.tovalues(255) == 'unclaimed'
+
+        exp_items = [((30, 40), 'thirty-forty'), ((0, 5), 'zero-five'),
+                     ((10, 20), 'ten-twenty'), (50, 'fifty'),
+                     (None, 'unclaimed')]
+        assert list(vm.items()) == exp_items
+
+    def test_cache(self, element_kind, server_arg):
+        # pylint: disable=redefined-outer-name
+        """Test the process-wide cache of value mappings"""
+        ValueMapping.clear_cache()
+        valuemap = ['0', '1']
+        values = ['zero', 'one']
+
+        vm1 = self.setup_for_element(element_kind, server_arg, 'uint8',
+                                     valuemap, values)
+        get_class = self.conn.GetClass
+        create = getattr(ValueMapping, 'for_%s' % element_kind)
+        args = [NAMESPACE, 'c1', METHNAME if element_kind != 'property'
+                else PROPNAME.upper()]
+        if element_kind == 'parameter':
+            args.append(PARMNAME)
+        server = getattr(self, server_arg)
+
+        # Without the cache, a new value mapping is created
+        vm2 = create(server, *args)
+        assert vm2 is not vm1
+        assert get_class.call_count == 2
+
+        vm3 = create(server, *args, use_cache=True)
+        vm4 = create(server, *args, use_cache=True)
+        assert vm3.conn is self.conn
+        assert vm4.conn is self.conn
+        assert list(vm4.items()) == list(vm3.items())
+        assert get_class.call_count == 3
+
+        # Other connections to the same URL share the cache, and get value
+        # mappings that use their connection
+        conn = WBEMConnection('DUMMY')
+        conn.GetClass = get_class
+        vm5 = create(conn, *args, use_cache=True)
+        assert vm5.conn is conn
+        assert list(vm5.items()) == list(vm3.items())
+        assert get_class.call_count == 3
+
+        # The cache does not keep the connections
+        # pylint: disable=protected-access
+        for cached_vm in ValueMapping._cache.values():
+            assert cached_vm.conn is None
+
+        # Other namespaces and URLs do not
+        create(server, 'other', *args[1:], use_cache=True)
+        conn = WBEMConnection('other')
+        conn.GetClass = get_class
+        create(conn, *args, use_cache=True)
+        assert get_class.call_count == 5
+
+        ValueMapping.clear_cache()
+        create(server, *args, use_cache=True)
+        assert get_class.call_count == 6
+        ValueMapping.clear_cache()
+
+    def test_cache_invalidate(self, element_kind):
+        # pylint: disable=protected-access
+        """
+        Test that the cached value mappings of a namespace are removed when
+        a class is modified in that namespace.
+        """
+        ValueMapping.clear_cache()
+        self.setup_for_element(element_kind, 'conn', 'uint8', ['0', '1'],
+                               ['zero', 'one'])
+        get_class = self.conn.GetClass
+        create = getattr(ValueMapping, 'for_%s' % element_kind)
+        args = [NAMESPACE, 'c1', METHNAME if element_kind != 'property'
+                else PROPNAME]
+        if element_kind == 'parameter':
+            args.append(PARMNAME)
+
+        create(self.conn, *args, use_cache=True)
+        create(self.conn, 'other', *args[1:], use_cache=True)
+        assert get_class.call_count == 3
+
+        conn = WBEMConnection('DUMMY')
+        conn._imethodcall = Mock()
+        conn.ModifyClass(CIMClass('c1'), namespace=NAMESPACE)
+
+        create(self.conn, *args, use_cache=True)
+        create(self.conn, 'other', *args[1:], use_cache=True)
+        assert get_class.call_count == 4
+        ValueMapping.clear_cache()
+
+    def test_cache_maxsize(self, monkeypatch):
+        # pylint: disable=protected-access
+        """Test that the least recently used value mappings are removed."""
+        ValueMapping.clear_cache()
+        monkeypatch.setattr(ValueMapping, '_cache_maxsize', 2)
+        self.setup_for_element('property', 'conn', 'uint8', ['0', '1'],
+                               ['zero', 'one'])
+        get_class = self.conn.GetClass
+
+        for namespace in ('ns1', 'ns2', 'ns1', 'ns3', 'ns1', 'ns2'):
+            ValueMapping.for_property(self.conn, namespace, 'c1', PROPNAME,
+                                      use_cache=True)
+        # ns2 was removed when ns3 was added
+        assert get_class.call_count == 5
+        assert len(ValueMapping._cache) == 2
+        ValueMapping.clear_cache()
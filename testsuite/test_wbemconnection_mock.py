@@ -28,6 +28,7 @@ from __future__ import absolute_import, print_function
 
 import os
 import shutil
+import time
 from datetime import datetime
 import operator
 try:
@@ -48,6 +49,7 @@ from pywbem._nocasedict import NocaseDict
 from pywbem.cim_operations import pull_path_result_tuple
 
 from pywbem_mock import FakedWBEMConnection, DMTFCIMSchema
+from pywbem_mock._wbemconnection_mock import _snapshot_key
 
 from dmtf_mof_schema_def import TOTAL_QUALIFIERS, TOTAL_CLASSES, \
     install_test_dmtf_schema, DMTF_TEST_SCHEMA_VER
@@ -60,6 +62,12 @@ TEST_DIR = os.path.dirname(__file__)
 TESTSUITE_SCHEMA_DIR = os.path.join(TEST_DIR, 'schema')
 
 
+def snapshot_method_callback(conn, methodname, object_name, **params):
+    # pylint: disable=unused-argument
+    """Method callback function that can be saved in a repository snapshot"""
+    return 0, None
+
+
 # Temporarily set this because all of the fixtures generate this warning
 # for every use.  One alternative may be to prefix each fixture name with
 # an underscore
@@ -963,16 +971,13 @@ class TestRepoMethods(object):
                                 namespace=ns)
 
         # pylint: disable=protected-access
-        inst_tup = conn._find_instance(iname, inst_repo)
-        assert isinstance(inst_tup, tuple)
+        inst = conn._find_instance(iname, inst_repo)
 
         if exp_ok:
-            assert isinstance(inst_tup[0], six.integer_types)
-            assert isinstance(inst_tup[1], CIMInstance)
-            assert equal_model_path(iname, inst_tup[1].path)
+            assert isinstance(inst, CIMInstance)
+            assert equal_model_path(iname, inst.path)
         else:
-            assert inst_tup[0] is None
-            assert inst_tup[1] is None
+            assert inst is None
 
     @staticmethod
     def method2_callback(conn, methodname, object_name, **params):
@@ -1031,6 +1036,53 @@ class TestRepoMethods(object):
         with pytest.raises(ValueError):
             conn.display_repository(output_format='blah')
 
+    def test_save_load_repository(self, conn, tst_instances_mof, tmpdir):
+        # pylint: disable=no-self-use
+        """
+        Test save_repository() and load_repository().
+        """
+        ns = 'root/blah'
+        conn.compile_mof_string(tst_instances_mof, namespace=ns)
+        conn.add_method_callback('CIM_Foo', 'Fuzzy', snapshot_method_callback,
+                                 namespace=ns)
+        snapshot_file = str(tmpdir.join('repo.pickle'))
+        conn.save_repository(snapshot_file, key='key1')
+        assert os.listdir(str(tmpdir)) == ['repo.pickle']
+
+        conn2 = FakedWBEMConnection()
+        assert conn2.load_repository(snapshot_file, key='key2') is False
+        assert not conn2.classes
+
+        assert conn2.load_repository(snapshot_file, key='key1') is True
+        assert conn2.EnumerateClassNames(namespace=ns, DeepInheritance=True) \
+            == conn.EnumerateClassNames(namespace=ns, DeepInheritance=True)
+        assert conn2.EnumerateQualifiers(namespace=ns) == \
+            conn.EnumerateQualifiers(namespace=ns)
+        assert conn2.EnumerateInstances('CIM_Foo', namespace=ns) == \
+            conn.EnumerateInstances('CIM_Foo', namespace=ns)
+        assert conn2.methods[ns]['cim_foo']['fuzzy'] is \
+            snapshot_method_callback
+
+        # The class hierarchy of the loaded repository is maintained
+        conn2.add_cimobjects(CIMClass('CIM_Foo_sub3', superclass='CIM_Foo'),
+                             namespace=ns)
+        assert 'CIM_Foo_sub3' in conn2.EnumerateClassNames(
+            ClassName='CIM_Foo', DeepInheritance=True, namespace=ns)
+        assert 'CIM_Foo_sub3' not in conn.EnumerateClassNames(
+            ClassName='CIM_Foo', DeepInheritance=True, namespace=ns)
+
+        # Loading without key does not check the key
+        conn3 = FakedWBEMConnection()
+        assert conn3.load_repository(snapshot_file) is True
+
+        assert conn3.load_repository(str(tmpdir.join('none.pickle'))) is False
+
+        invalid_file = str(tmpdir.join('invalid.pickle'))
+        with open(invalid_file, 'wb') as fp:
+            fp.write(b'invalid')
+        with pytest.raises(ValueError):
+            conn3.load_repository(invalid_file)
+
         tst_file_name = 'test_wbemconnection_mock_repo.txt'
         tst_file = os.path.join(TEST_DIR, tst_file_name)
 
@@ -1318,10 +1370,12 @@ class TestRepoMethods(object):
         assert 'TST_FamilyCollection'
         assert len(clns) == 5
 
+        # The instances of TST_PersonSub are instances of the subclass
+        # TST_Personsub, because class names are case insensitive.
         inst_names = conn.EnumerateInstanceNames('TST_Person', namespace=ns)
-        assert len(inst_names) == 4
+        assert len(inst_names) == 8
         insts = conn.EnumerateInstances('TST_Person', namespace=ns)
-        assert len(inst_names) == 4
+        assert len(insts) == 8
 
         # Test for particular instances in the enum response
         for name in tst_person_instance_names:
@@ -1414,6 +1468,85 @@ class TestRepoMethods(object):
 
         assert set(rslt_classes) == set(exp_classes)
 
+    def test_compile_dmtf_schema_snapshot(self, conn, tmpdir):
+        # pylint: disable=no-self-use
+        """
+        Test that compile_dmtf_schema() saves a snapshot of the mock
+        repository in the snapshot directory and uses it for later calls with
+        the same classes.
+        """
+        ns = 'root/cimv2'
+        classnames = ['CIM_ElementConformsToProfile']
+        schema = DMTFCIMSchema(DMTF_TEST_SCHEMA_VER, TESTSUITE_SCHEMA_DIR)
+        snapshot_dir = str(tmpdir.join('snapshots'))
+
+        def snapshot_files(dir_path):
+            """Return the set of snapshot files in a directory"""
+            if not os.path.isdir(dir_path):
+                return set()
+            return set(fn for fn in os.listdir(dir_path)
+                       if fn.startswith('mock_repository_'))
+
+        schema_files = snapshot_files(schema.schema_mof_dir)
+
+        # Snapshots are not used by default
+        conn.compile_dmtf_schema(DMTF_TEST_SCHEMA_VER, TESTSUITE_SCHEMA_DIR,
+                                 class_names=classnames, namespace=ns,
+                                 snapshot_dir=snapshot_dir)
+        assert not snapshot_files(snapshot_dir)
+        exp_classnames = conn.EnumerateClassNames(DeepInheritance=True,
+                                                  namespace=ns)
+
+        conn1 = FakedWBEMConnection()
+        conn1.compile_dmtf_schema(DMTF_TEST_SCHEMA_VER, TESTSUITE_SCHEMA_DIR,
+                                  class_names=classnames, namespace=ns,
+                                  use_snapshot=True, snapshot_dir=snapshot_dir)
+        assert len(snapshot_files(snapshot_dir)) == 1
+        assert conn1.EnumerateClassNames(DeepInheritance=True,
+                                         namespace=ns) == exp_classnames
+
+        # A new connection loads the snapshot instead of compiling the MOF
+        conn2 = FakedWBEMConnection()
+        conn2.compile_mof_string = None
+        conn2.compile_dmtf_schema(DMTF_TEST_SCHEMA_VER, TESTSUITE_SCHEMA_DIR,
+                                  class_names=classnames, namespace=ns,
+                                  use_snapshot=True, snapshot_dir=snapshot_dir)
+        assert conn2.EnumerateClassNames(DeepInheritance=True,
+                                         namespace=ns) == exp_classnames
+
+        # With a non-empty repository, the MOF is compiled and no further
+        # snapshot file is created
+        conn3 = FakedWBEMConnection()
+        conn3.add_cimobjects(CIMClass('CIM_Foo'), namespace='interop')
+        conn3.compile_dmtf_schema(
+            DMTF_TEST_SCHEMA_VER, TESTSUITE_SCHEMA_DIR,
+            class_names=['CIM_RegisteredProfile'], namespace=ns,
+            use_snapshot=True, snapshot_dir=snapshot_dir)
+        assert 'CIM_RegisteredProfile' in conn3.EnumerateClassNames(
+            DeepInheritance=True, namespace=ns)
+        assert len(snapshot_files(snapshot_dir)) == 1
+
+        # Nothing is written into the schema directory
+        assert snapshot_files(schema.schema_mof_dir) == schema_files
+
+    def test_snapshot_key(self, tmpdir):
+        # pylint: disable=no-self-use
+        """
+        Test that the key of the snapshot files of compile_dmtf_schema()
+        depends on the content of the MOF files of the schema.
+        """
+        mof_dir = tmpdir.mkdir('mof')
+        mof_file = mof_dir.mkdir('Core').join('CIM_Foo.mof')
+        mof_file.write('class CIM_Foo { string P1; };')
+        schema_mof = '#pragma include ("Core/CIM_Foo.mof")'
+
+        key = _snapshot_key(schema_mof, str(mof_dir), 'root/cimv2')
+        assert _snapshot_key(schema_mof, str(mof_dir), 'root/CIMV2') == key
+        assert _snapshot_key(schema_mof, str(mof_dir), 'interop') != key
+
+        mof_file.write('class CIM_Foo { string P2; };')
+        assert _snapshot_key(schema_mof, str(mof_dir), 'root/cimv2') != key
+
     def test_compile_err(self, conn, capsys):
         # pylint: disable=no-self-use
         """
@@ -2142,6 +2275,45 @@ class TestInstanceOperations(object):
         assert set([x.lower() for x in props_exp]) ==  \
             set([x.lower() for x in inst.keys()])
 
+    def test_getinstance_copy(self, conn_lite):
+        # pylint: disable=no-self-use
+        """
+        Test that modifying the instances returned by GetInstance and
+        EnumerateInstances does not modify the instances in the repository.
+        """
+        ref = CIMInstanceName('CIM_Bar', {'InstanceID': 'bar'},
+                              namespace='root/cimv2')
+        path = CIMInstanceName('CIM_Foo', {'InstanceID': 'foo'},
+                               namespace='root/cimv2')
+        orig_inst = CIMInstance(
+            'CIM_Foo', path=path,
+            properties=[
+                CIMProperty('InstanceID', 'foo'),
+                CIMProperty('Ref', ref),
+                CIMProperty('Array', [Uint32(1), Uint32(2)],
+                            qualifiers=[CIMQualifier('Values', ['a', 'b'])]),
+            ],
+            qualifiers=[CIMQualifier('Description', 'foo')])
+        conn_lite.add_cimobjects(orig_inst, namespace='root/cimv2')
+
+        insts = [conn_lite.GetInstance(path, IncludeQualifiers=True)]
+        insts.extend(conn_lite.EnumerateInstances('CIM_Foo',
+                                                  IncludeQualifiers=True))
+        for inst in insts:
+            assert inst.path == path
+            assert inst.properties == orig_inst.properties
+            assert inst.qualifiers == orig_inst.qualifiers
+
+            inst['Ref'].keybindings['InstanceID'] = 'baz'
+            inst['Array'].append(Uint32(3))
+            inst.properties['Array'].qualifiers['Values'].value.append('c')
+            inst.qualifiers['Description'].value = 'bar'
+            del inst['InstanceID']
+
+        inst = conn_lite.GetInstance(path, IncludeQualifiers=True)
+        assert inst.properties == orig_inst.properties
+        assert inst.qualifiers == orig_inst.qualifiers
+
     @pytest.mark.parametrize(
         "ns", [None, 'root/blah'])
     def test_enumerateinstnames_lite(self, conn_lite, ns, tst_instances):
@@ -3294,6 +3466,46 @@ class TestPullOperations(object):
         else:
             assert False, 'Invalid test code %s' % test
 
+    @pytest.mark.parametrize(
+        "ns", [None, 'root/blah'])
+    def test_operationtimeout(self, conn, ns, tst_classes, tst_instances):
+        # pylint: disable=no-self-use
+        """
+        Test that enumeration contexts whose OperationTimeout has expired
+        are removed, and that OperationTimeout=0 means no timeout.
+        """
+        conn.add_cimobjects(tst_classes, namespace=ns)
+        conn.add_cimobjects(tst_instances, namespace=ns)
+
+        result1 = conn.OpenEnumerateInstances(
+            'CIM_Foo', namespace=ns, MaxObjectCount=1, OperationTimeout=10)
+        result2 = conn.OpenEnumerateInstancePaths(
+            'CIM_Foo', namespace=ns, MaxObjectCount=1, OperationTimeout=0)
+        assert len(result1.instances) == 1
+        assert len(conn.enumeration_contexts) == 2
+        context1 = conn.enumeration_contexts[result1.context[0]]
+        context2 = conn.enumeration_contexts[result2.context[0]]
+        assert context1['expires'] > time.time()
+        assert context2['expires'] is None
+
+        # A pull restarts the timeout
+        context1['expires'] = time.time() + 1
+        result1 = conn.PullInstancesWithPath(result1.context, MaxObjectCount=1)
+        assert len(result1.instances) == 1
+        assert context1['expires'] > time.time() + 5
+
+        # Let the first context expire
+        context1['expires'] = time.time() - 1
+        with pytest.raises(CIMError) as exec_info:
+            conn.PullInstancesWithPath(result1.context, MaxObjectCount=1)
+        exc = exec_info.value
+        assert exc.status_code_name == 'CIM_ERR_INVALID_ENUMERATION_CONTEXT'
+        assert list(conn.enumeration_contexts) == [result2.context[0]]
+
+        result2 = conn.PullInstancePaths(result2.context, MaxObjectCount=100)
+        assert result2.eos is True
+        assert conn.enumeration_contexts == {}
+
 
 class TestQualifierOperations(object):
     """
@@ -26,9 +26,12 @@ WBEMServe requires access to a WBEMServer.
 from __future__ import absolute_import, print_function
 
 import os
+import copy
+import time
 import pytest
 
-from pywbem import WBEMServer, ValueMapping, CIMInstance, CIMInstanceName
+from pywbem import WBEMServer, ValueMapping, CIMInstance, CIMInstanceName, \
+    CIMError, CIM_ERR_NOT_FOUND
 from pywbem._nocasedict import NocaseDict
 from dmtf_mof_schema_def import DMTF_TEST_SCHEMA_VER
 from pywbem_mock import FakedWBEMConnection
@@ -47,7 +50,7 @@ class BaseMethodsForTests(object):
     build the DMTF schema and to build individual instances.
     """
 
-    def build_class_repo(self, default_namespace):
+    def build_class_repo(self, default_namespace, extra_classnames=None):
         """
         Build the schema qualifier and class objects in the repository.
         This requires only that the leaf objects be defined in a mof
@@ -60,6 +63,8 @@ class BaseMethodsForTests(object):
                       'CIM_ObjectManager',
                       'CIM_RegisteredProfile',
                       'CIM_ElementConformsToProfile']
+        if extra_classnames:
+            classnames.extend(extra_classnames)
 
         conn.compile_dmtf_schema(DMTF_TEST_SCHEMA_VER,
                                  TESTSUITE_SCHEMA_DIR,
@@ -408,6 +413,278 @@ class TestServerClass(BaseMethodsForTests):
                                            namespace=tst_namespace,
                                            host=conn.host)
 
+    def build_discovery_repo(self, tst_namespace):
+        """
+        Build a mock repository with the CIM_ObjectManager, CIM_Namespace
+        and CIM_RegisteredProfile instances for the discovery tests.
+        """
+        system_name = 'Mock_Test_discovery'
+        object_manager_name = 'MyFakeObjectManager'
+        conn = self.build_class_repo(tst_namespace)
+        self.build_obj_mgr_inst(conn, tst_namespace, system_name,
+                                object_manager_name)
+        self.build_cimnamespace_insts(conn, tst_namespace, system_name,
+                                      object_manager_name,
+                                      [tst_namespace, 'root/cimv2'])
+        self.build_reg_profile_insts(conn, tst_namespace,
+                                     [('DMTF', 'Indications', '1.1.0'),
+                                      ('SNIA', 'Server', '1.2.0')])
+        return conn
+
+    @pytest.mark.parametrize(
+        "discovery_workers", [None, 1, 4])
+    @pytest.mark.parametrize(
+        "tst_namespace",
+        ['interop', 'root/interop', 'root/PG_Interop'])
+    def test_wbemserver_discover(self, tst_namespace, discovery_workers):
+        """
+        Test discover(), sequentially and concurrently.
+        """
+        conn = self.build_discovery_repo(tst_namespace)
+        conn.statistics.enable()
+        server = WBEMServer(conn, discovery_workers=discovery_workers)
+        assert server.discovery_workers == discovery_workers
+        assert server.discovery_cache_ttl is None
+
+        server.discover()
+
+        assert server._interop_ns == tst_namespace
+        assert set(server._namespaces) == set([tst_namespace, 'root/cimv2'])
+        assert server._namespace_classname == 'CIM_Namespace'
+        assert server._brand == "OpenPegasus"
+        assert server._version == "2.15.0"
+        assert len(server._profiles) == 2
+
+        # The operations on the worker connections are in the statistics
+        snapshot = dict(conn.statistics.snapshot())
+        assert snapshot['EnumerateInstances'].count == 3
+
+        # Nothing is left to be discovered
+        server.discover()
+        snapshot = dict(conn.statistics.snapshot())
+        assert snapshot['EnumerateInstances'].count == 3
+
+    def test_wbemserver_discover_not_found(self):
+        """
+        Test concurrent discover() without an Interop namespace.
+        """
+        conn = self.build_class_repo('root/cimv2')
+        server = WBEMServer(conn, discovery_workers=4)
+        with pytest.raises(CIMError) as exc_info:
+            server.discover()
+        assert exc_info.value.status_code == CIM_ERR_NOT_FOUND
+
+    def test_wbemserver_discovery_cache(self):
+        """
+        Test the discovery cache shared by WBEMServer objects.
+        """
+        tst_namespace = 'interop'
+        WBEMServer.clear_discovery_cache()
+        conn = self.build_discovery_repo(tst_namespace)
+        conn.statistics.enable()
+
+        server1 = WBEMServer(conn, discovery_cache_ttl=60)
+        assert server1.interop_ns == tst_namespace
+        assert server1.brand == "OpenPegasus"
+
+        # A new object gets the information from the cache
+        server2 = WBEMServer(conn, discovery_cache_ttl=60)
+        assert server2._interop_ns == tst_namespace
+        assert server2._brand == "OpenPegasus"
+        assert server2._profiles is None
+        snapshot = dict(conn.statistics.snapshot())
+        assert snapshot['EnumerateInstances'].count == 1
+        assert len(server2.profiles) == 2
+
+        # Changing the returned lists does not change the cache
+        server2.profiles.append('foo')
+        server2.namespaces.append('foo')
+        server6 = WBEMServer(conn, discovery_cache_ttl=60)
+        assert len(server6.profiles) == 2
+        assert 'foo' not in server6.namespaces
+
+        # Objects for another user do not share the cache
+        conn2 = copy.copy(conn)
+        conn2._set_creds(('otheruser', 'password'))
+        server7 = WBEMServer(conn2, discovery_cache_ttl=60)
+        assert server7._interop_ns is None
+        assert server7.interop_ns == tst_namespace
+
+        # Objects without a TTL do not use the cache
+        server3 = WBEMServer(conn)
+        assert server3._interop_ns is None
+
+        # Expired information is not used
+        WBEMServer._discovery_cache[(conn.url.lower(), None)] = \
+            (time.time() - 1, {'_interop_ns': 'expired'})
+        server4 = WBEMServer(conn, discovery_cache_ttl=60)
+        assert server4._interop_ns is None
+
+        WBEMServer.clear_discovery_cache()
+        server5 = WBEMServer(conn, discovery_cache_ttl=60)
+        assert server5._interop_ns is None
+
+        with pytest.raises(ValueError):
+            WBEMServer(conn, discovery_cache_ttl=0)
+        with pytest.raises(ValueError):
+            WBEMServer(conn, discovery_workers=0)
+
+    def add_inst(self, conn, namespace, class_name, property_values):
+        """
+        Build an instance of a class and add it to the repository.
+
+        Returns the instance path.
+        """
+        inst = self.inst_from_classname(conn, class_name,
+                                        namespace=namespace,
+                                        property_values=property_values,
+                                        strict=True,
+                                        include_null_properties=False,
+                                        include_path=True)
+        conn.add_cimobjects(inst, namespace=namespace)
+        return inst.path
+
+    @staticmethod
+    def add_assoc_inst(conn, namespace, class_name, ref_values):
+        """
+        Build an association instance whose keys are the specified
+        references and add it to the repository. The instance is built
+        directly because the mock repository does not propagate the Key
+        qualifiers of overridden references from the superclasses.
+        """
+        inst = CIMInstance(class_name, properties=ref_values)
+        inst.path = CIMInstanceName(class_name, keybindings=ref_values,
+                                    namespace=namespace)
+        conn.add_cimobjects(inst, namespace=namespace)
+
+    def build_scoping_repo(self, tst_namespace):
+        """
+        Build a mock repository with a Computer System profile using the
+        central class methodology, and Fan and Power Supply component
+        profiles using the scoping class methodology.
+
+        Returns a tuple of the connection, and a dictionary with the
+        profile paths and the lists of the expected central instance paths
+        by profile name.
+        """
+        conn = self.build_class_repo(
+            tst_namespace,
+            extra_classnames=['CIM_ReferencedProfile', 'CIM_ComputerSystem',
+                              'CIM_Fan', 'CIM_PowerSupply',
+                              'CIM_SystemDevice'])
+        self.build_reg_profile_insts(
+            conn, tst_namespace,
+            [('DMTF', 'Computer System', '1.0.0'),
+             ('DMTF', 'Fan', '1.0.0'),
+             ('DMTF', 'Power Supply', '1.0.0')])
+        profiles = {}
+        for inst in conn.EnumerateInstances('CIM_RegisteredProfile',
+                                            namespace=tst_namespace):
+            profiles[inst['RegisteredName']] = inst.path
+
+        central = {'Computer System': [], 'Fan': [], 'Power Supply': []}
+        for sys_name in ('sys1', 'sys2'):
+            sys_path = self.add_inst(
+                conn, tst_namespace, 'CIM_ComputerSystem',
+                {'CreationClassName': 'CIM_ComputerSystem',
+                 'Name': sys_name})
+            central['Computer System'].append(sys_path)
+            self.build_elementconformstoprofile_inst(
+                conn, tst_namespace, profiles['Computer System'], sys_path)
+            for class_name, profile_name in (('CIM_Fan', 'Fan'),
+                                             ('CIM_PowerSupply',
+                                              'Power Supply')):
+                for i in range(2):
+                    dev_path = self.add_inst(
+                        conn, tst_namespace, class_name,
+                        {'SystemCreationClassName': 'CIM_ComputerSystem',
+                         'SystemName': sys_name,
+                         'CreationClassName': class_name,
+                         'DeviceID': '%s-%s' % (profile_name, i)})
+                    central[profile_name].append(dev_path)
+                    self.add_assoc_inst(conn, tst_namespace,
+                                        'CIM_SystemDevice',
+                                        {'GroupComponent': sys_path,
+                                         'PartComponent': dev_path})
+
+        for profile_name in ('Fan', 'Power Supply'):
+            self.add_assoc_inst(conn, tst_namespace, 'CIM_ReferencedProfile',
+                                {'Antecedent': profiles[profile_name],
+                                 'Dependent': profiles['Computer System']})
+        return conn, profiles, central
+
+    @pytest.mark.parametrize(
+        "max_workers", [None, 1, 4])
+    def test_get_central_instances_bulk(self, max_workers):
+        """
+        Test get_central_instances_bulk() with the central and scoping class
+        methodologies.
+        """
+        tst_namespace = 'interop'
+        conn, profiles, central = self.build_scoping_repo(tst_namespace)
+        server = WBEMServer(conn)
+
+        def key(paths):
+            """Comparable representation of instance paths, without host"""
+            result = []
+            for path in paths:
+                path = path.copy()
+                path.host = None
+                result.append(str(path))
+            return sorted(result)
+
+        # Compare with get_central_instances()
+        fan_args = (profiles['Fan'], 'CIM_Fan', 'CIM_ComputerSystem',
+                    ['CIM_SystemDevice'])
+        ps_args = (profiles['Power Supply'], 'CIM_PowerSupply',
+                   'CIM_ComputerSystem', ['CIM_SystemDevice'])
+        assert key(server.get_central_instances(*fan_args)) == \
+            key(central['Fan'])
+
+        conn.statistics.enable()
+        results = server.get_central_instances_bulk(
+            [profiles['Computer System'], fan_args, ps_args],
+            max_workers=max_workers)
+
+        assert len(results) == 3
+        assert key(results[0]) == key(central['Computer System'])
+        assert key(results[1]) == key(central['Fan'])
+        assert key(results[2]) == key(central['Power Supply'])
+
+        # The central instances of the Computer System profile are
+        # determined only once, with the central methodology:
+        # 3 traversals from the profiles via CIM_ElementConformsToProfile,
+        # 2 via CIM_ReferencedProfile, and 2 per scoping instance and
+        # component profile via CIM_SystemDevice.
+        snapshot = dict(conn.statistics.snapshot())
+        assert snapshot['AssociatorNames'].count == 3 + 2 + 2 * 2
+        assert server.get_central_instances_bulk([]) == []
+
+    def test_get_central_instances_bulk_errors(self):
+        """
+        Test errors of get_central_instances_bulk().
+        """
+        tst_namespace = 'interop'
+        conn, profiles, _ = self.build_scoping_repo(tst_namespace)
+        server = WBEMServer(conn)
+
+        with pytest.raises(TypeError):
+            server.get_central_instances_bulk(['CIM_RegisteredProfile'])
+        with pytest.raises(ValueError):
+            server.get_central_instances_bulk([profiles['Fan']],
+                                              max_workers=0)
+
+        # Scoping class methodology parameters not specified
+        with pytest.raises(ValueError):
+            server.get_central_instances_bulk(
+                [profiles['Computer System'], profiles['Fan']],
+                max_workers=2)
+
+        # No central instances across the scoping path
+        with pytest.raises(ValueError):
+            server.get_central_instances_bulk(
+                [(profiles['Fan'], 'CIM_PowerSupply', 'CIM_ComputerSystem',
+                  ['CIM_ReferencedProfile'])], max_workers=2)
 
 # TODO Break up tests to do individual tests for each group of methds so we can
 #      test for errors, variations on what is in the repowith each method.